@@ -0,0 +1,45 @@
+"""Benchmark business-day computations of the PR workload analysis.
+
+Compares the per-row pandas.bdate_range approach with the numpy.busday_count based
+business_duration_days on a synthetic set of PRs. Their results are checked against
+per-row references in tests/unit/domains/github/test_pr_workload_analysis_service.py.
+
+Usage: python scripts/benchmark_business_days.py [num_prs]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import numpy as np
+import pandas as pd
+
+from domains.github.pr_workload_analysis_service import business_duration_days
+
+num_prs = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+rng = np.random.default_rng(42)
+
+created_at = pd.Timestamp("2023-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 2 * 365 * 86400, num_prs), "s")
+merged_at = created_at + pd.to_timedelta(rng.integers(0, 30 * 86400, num_prs), "s")
+prs = pd.DataFrame({"created_at": created_at, "merged_at": merged_at})
+
+
+def per_row_business_days(row: pd.Series) -> int:
+    """Previous approach: build a business-day range for every PR."""
+    return max(len(pd.bdate_range(start=row["created_at"].date(), end=row["merged_at"].date())) - 1, 0)
+
+
+start = time.perf_counter()
+per_row = prs.apply(per_row_business_days, axis=1)
+per_row_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+vectorized = business_duration_days(prs["created_at"], prs["merged_at"])
+vectorized_seconds = time.perf_counter() - start
+
+print(f"PRs: {num_prs:,}")
+print(f"Per-row bdate_range:   {per_row_seconds:8.3f}s")
+print(f"business_duration_days: {vectorized_seconds:8.3f}s ({per_row_seconds / vectorized_seconds:,.0f}x faster)")
+print(f"Mean business lead time: {vectorized.mean():.2f} days")
@@ -0,0 +1 @@
+# Cache domain package
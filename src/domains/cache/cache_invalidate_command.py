@@ -0,0 +1,110 @@
+"""Cache Invalidation Command.
+
+Removes cached data selectively instead of wiping the whole cache directory.
+
+FUNCTIONALITY:
+- Invalidate entries by tag (entries must carry every given tag)
+- Invalidate entries by key prefix (file names only, no content scan)
+- Clear the whole cache
+
+USAGE EXAMPLES:
+
+1. Refresh one project's JIRA data (pages, MCP adapter results, prompts):
+   python src/main.py cache invalidate --tag project:CWS
+
+2. Clear only JIRA page caches of a project:
+   python src/main.py cache invalidate --tag namespace:jira --tag project:CWS
+
+3. Clear one MCP adapter:
+   python src/main.py cache invalidate --tag adapter:SonarQube
+
+4. Clear GitHub pull request pages of a repository by key prefix
+   (page keys are "github" + the endpoint with "/" replaced by "_", then a params hash;
+   see GitHubApiClient.page_cache_prefix):
+   python src/main.py cache invalidate --prefix github_repos_my-org_my-repo_pulls
+
+5. Clear everything:
+   python src/main.py cache invalidate --all
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+
+from utils.cache_manager.cache_manager import CacheManager
+from utils.command.base_command import BaseCommand
+from utils.logging.logging_manager import LogManager
+
+
+class CacheInvalidateCommand(BaseCommand):
+    """Command to invalidate cache entries by tag or key prefix."""
+
+    @staticmethod
+    def get_name() -> str:
+        """Get the command name."""
+        return "invalidate"
+
+    @staticmethod
+    def get_description() -> str:
+        """Get the command description."""
+        return "Invalidate cached data by tag (e.g. project:CWS) or key prefix."
+
+    @staticmethod
+    def get_help() -> str:
+        """Get detailed help information."""
+        return (
+            "Removes cache entries carrying all given tags (namespace:jira, adapter:JIRA, project:CWS, "
+            "team:<name>) and/or whose key starts with a prefix, leaving the rest of the cache warm."
+        )
+
+    @staticmethod
+    def get_arguments(parser: ArgumentParser) -> None:
+        """Set up command line arguments."""
+        parser.add_argument(
+            "--tag",
+            action="append",
+            default=[],
+            help="Tag entries must carry; repeat to combine (e.g. --tag namespace:jira --tag project:CWS).",
+        )
+        parser.add_argument(
+            "--prefix",
+            type=str,
+            required=False,
+            help="Remove entries whose cache key starts with this prefix.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Clear the whole cache.",
+        )
+
+    @staticmethod
+    def main(args: Namespace):
+        """Main function to invalidate cache entries.
+
+        Args:
+            args (Namespace): Command-line arguments.
+        """
+        logger = LogManager.get_instance().get_logger("CacheInvalidateCommand")
+
+        if not (args.tag or args.prefix or args.all):
+            logger.error("Provide --tag, --prefix or --all")
+            sys.exit(1)
+
+        try:
+            cache = CacheManager.get_instance()
+
+            if args.all:
+                cache.clear_all()
+                print("✅ All cache entries cleared")
+                return
+
+            cleared = 0
+            if args.tag:
+                cleared += cache.invalidate_by_tags(args.tag)
+            if args.prefix:
+                cleared += cache.invalidate_by_prefix(args.prefix)
+
+            print(f"✅ Invalidated {cleared} cache entries")
+        except Exception as e:
+            logger.error(f"Failed to invalidate cache: {e}")
+            sys.exit(1)
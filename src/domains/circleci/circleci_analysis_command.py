@@ -9,6 +9,8 @@ from utils.command.base_command import BaseCommand
 from utils.env_loader import ensure_env_loaded, load_domain_env
 from utils.logging.logging_manager import LogManager
 
+from .circleci_api_client import DEFAULT_MAX_CONCURRENCY
+from .circleci_history_store import CircleCIHistoryStore
 from .circleci_service import CircleCIService
 
 
@@ -44,6 +46,9 @@ Examples:
   # Limited analysis for faster results
   python src/main.py circleci circleci-analyze --project-slug gh/org/repo --pipeline-limit 50
 
+  # Incremental analysis of the last 90 days; later runs only fetch new or unfinished pipelines
+  python src/main.py circleci circleci-analyze --project-slug gh/org/repo --history --since-days 90
+
 Setup:
   1. Add your CircleCI token to .env file:
      CIRCLECI_TOKEN=your_token_here
@@ -89,6 +94,29 @@ Setup:
             default=10,
             help="Maximum number of jobs to analyze per workflow (default: 10)",
         )
+        parser.add_argument(
+            "--max-concurrency",
+            type=int,
+            default=DEFAULT_MAX_CONCURRENCY,
+            help=f"Maximum CircleCI API requests in flight (default: {DEFAULT_MAX_CONCURRENCY})",
+        )
+        parser.add_argument(
+            "--history",
+            action="store_true",
+            help="Sync a local pipeline history and analyze it instead of exporting from scratch "
+            "(pipeline/workflow/job limits are ignored)",
+        )
+        parser.add_argument(
+            "--history-db",
+            type=str,
+            help="SQLite file of the local history (default: CIRCLECI_HISTORY_PATH or cache/circleci_history.sqlite3)",
+        )
+        parser.add_argument(
+            "--since-days",
+            type=int,
+            default=90,
+            help="Days of history to sync and analyze with --history (default: 90)",
+        )
         parser.add_argument(
             "--no-charts",
             action="store_true",
@@ -122,7 +150,9 @@ Setup:
 
         try:
             # Initialize service
-            service = CircleCIService(token, args.project_slug if args.project_slug else "")
+            service = CircleCIService(
+                token, args.project_slug if args.project_slug else "", max_concurrency=args.max_concurrency
+            )
 
             # Handle list projects option
             if args.list_projects:
@@ -148,7 +178,15 @@ Setup:
 
             else:
                 # Complete analysis
-                result = service.run_complete_analysis(args.output_dir)
+                history_store = CircleCIHistoryStore(args.history_db) if args.history or args.history_db else None
+                result = service.run_complete_analysis(
+                    args.output_dir,
+                    pipeline_limit=args.pipeline_limit,
+                    workflow_limit=args.workflow_limit,
+                    job_limit=args.job_limit,
+                    history_store=history_store,
+                    since_days=args.since_days,
+                )
 
                 CircleCIAnalysisCommand._print_complete_results(result)
                 logger.info("Complete analysis finished successfully")
@@ -244,6 +282,13 @@ Setup:
         print(f"   Workflows: {summary['total_workflows']}")
         print(f"   Jobs: {summary['total_jobs']}")
 
+        if result.get("sync"):
+            sync = result["sync"]
+            print("\\n🔄 History Sync:")
+            print(f"   New pipelines: {sync['new_pipelines']}")
+            print(f"   Unfinished pipelines refreshed: {sync['refreshed_pipelines']}")
+            print(f"   API requests: {sync['requests_made']}")
+
         print("\\n🐌 Top Performance Bottlenecks:")
         for i, bottleneck in enumerate(bottlenecks, 1):
             print(
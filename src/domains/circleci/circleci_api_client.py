@@ -0,0 +1,183 @@
+"""CircleCI API Client
+Paginated, concurrent access to the CircleCI v2 API within its rate limits
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.http.shared_budget import SharedRateBudget, budget_key
+from utils.logging.logging_manager import LogManager
+
+DEFAULT_BASE_URL = "https://circleci.com/api/v2"
+
+# Requests in flight at once; CircleCI throttles per token, the shared budget paces the rest
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Retries for throttled (429) and unavailable (5xx) responses; waits come from Retry-After
+# and X-RateLimit-* headers through the shared rate budget
+MAX_THROTTLE_RETRIES = 3
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CircleCIApiClient:
+    """CircleCI v2 API client with pagination and bounded concurrency
+
+    Every request reserves a slot in the shared rate budget and records the response's
+    rate limit headers, so concurrent workers (and other processes) back off together
+    when CircleCI signals throttling instead of sleeping a fixed time per call. At most
+    max_concurrency requests are in flight, even when callers nest thread pools.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: int = 30,
+    ):
+        """Initialize CircleCI API client
+
+        Args:
+            token: CircleCI API token
+            base_url: API root (default: https://circleci.com/api/v2)
+            max_concurrency: Maximum requests in flight
+            timeout: Request timeout in seconds
+        """
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.logger = LogManager.get_instance().get_logger("CircleCIApiClient")
+
+        self.session = requests.Session()
+        self.session.headers.update({"Circle-Token": token, "Accept": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.budget = SharedRateBudget.get_instance()
+        self.budget_key = budget_key(self.base_url, token)
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+        self.requests_made = 0
+        self.throttled_responses = 0
+
+    def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """GET an API endpoint, retrying throttled responses
+
+        Args:
+            endpoint: Path below the API root (e.g. "/pipeline/{id}/workflow")
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            self.budget.acquire(self.budget_key)
+            with self._slots:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            self.budget.record(self.budget_key, response.status_code, response.headers)
+
+            throttled = response.status_code in RETRY_STATUSES
+            with self._stats_lock:
+                self.requests_made += 1
+                self.throttled_responses += int(throttled)
+
+            if not throttled or attempt == MAX_THROTTLE_RETRIES:
+                break
+
+            if response.status_code != 429 and "Retry-After" not in response.headers:
+                # Server errors carry no rate limit headers; pause this key briefly before retrying
+                self.budget.block(self.budget_key, 2**attempt)
+            self.logger.warning(
+                f"CircleCI answered {response.status_code} for {endpoint}, retry {attempt + 1}/{MAX_THROTTLE_RETRIES}"
+            )
+
+        response.raise_for_status()
+        return response.json()
+
+    def iter_pages(self, endpoint: str, params: dict | None = None) -> Iterator[list[dict]]:
+        """Yield the items of every page of a paginated endpoint
+
+        Args:
+            endpoint: Paginated endpoint
+            params: Query parameters of the first page
+        """
+        params = dict(params or {})
+        while True:
+            data = self.get(endpoint, params)
+            items = data.get("items")
+            if not isinstance(items, list):
+                raise ValueError(f"Unexpected response format from {endpoint}: missing 'items' list")
+
+            yield items
+
+            next_page_token = data.get("next_page_token")
+            if not next_page_token or not items:
+                return
+            params["page-token"] = next_page_token
+
+    def paginate(self, endpoint: str, limit: int | None = None, params: dict | None = None) -> list[dict]:
+        """Fetch items of a paginated endpoint, following next_page_token
+
+        Args:
+            endpoint: Paginated endpoint
+            limit: Maximum number of items (None for all)
+            params: Query parameters of the first page
+
+        Returns:
+            Up to limit items in API order
+        """
+        items: list[dict] = []
+        for page in self.iter_pages(endpoint, params):
+            items.extend(page)
+            if limit is not None and len(items) >= limit:
+                return items[:limit]
+        return items
+
+    def map_concurrent(self, func: Callable[[T], R], items: list[T]) -> list[R | Exception]:
+        """Apply a function to items on a bounded thread pool
+
+        Args:
+            func: Function issuing API calls for one item
+            items: Inputs
+
+        Returns:
+            Result or raised exception per item, in input order
+        """
+        if not items:
+            return []
+
+        def _safe(item: T) -> R | Exception:
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items)), thread_name_prefix="circleci"
+        ) as executor:
+            return list(executor.map(_safe, items))
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get request statistics"""
+        return {
+            "requests_made": self.requests_made,
+            "throttled_responses": self.throttled_responses,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self.session.close()
@@ -0,0 +1,460 @@
+"""CircleCI History Store
+Local SQLite history of CircleCI pipelines, workflows and jobs for incremental exports
+and long-range analysis
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+from typing import Any
+
+from utils.logging.logging_manager import LogManager
+
+# Workflow statuses that never change again; jobs of such workflows are final too
+TERMINAL_WORKFLOW_STATUSES = frozenset({"success", "failed", "error", "canceled", "unauthorized", "not_run"})
+
+# Pipelines without workflows (filtered out or failed setup) are final after this long
+EMPTY_PIPELINE_GRACE_HOURS = 24
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pipelines (
+    id TEXT PRIMARY KEY,
+    project_slug TEXT NOT NULL,
+    number INTEGER,
+    state TEXT,
+    created_at TEXT,
+    complete INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pipelines_project ON pipelines (project_slug, number);
+CREATE INDEX IF NOT EXISTS idx_pipelines_created ON pipelines (project_slug, created_at);
+
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    pipeline_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    created_at TEXT,
+    duration_seconds INTEGER,
+    complete INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workflows_pipeline ON workflows (pipeline_id);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT NOT NULL,
+    workflow_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    duration_seconds INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (workflow_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_slug TEXT PRIMARY KEY,
+    watermark INTEGER,
+    synced_since TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+# Pipelines of one project created at or after a cutoff
+_WINDOW = "p.project_slug = ? AND p.created_at >= ?"
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class CircleCIHistoryStore:
+    """SQLite history of CircleCI pipelines, workflows and jobs keyed by ID
+
+    Once all workflows of a pipeline are terminal and their jobs were read, nothing in
+    that pipeline changes again, so it is marked complete and never fetched again. Later
+    exports only read pipelines newer than the stored watermark plus the incomplete ones,
+    and the analysis runs as SQL over the whole stored history.
+    """
+
+    def __init__(self, db_path: str | None = None):
+        """Initialize history store
+
+        Args:
+            db_path: SQLite file (default: CIRCLECI_HISTORY_PATH or cache/circleci_history.sqlite3)
+        """
+        self.logger = LogManager.get_instance().get_logger("CircleCIHistoryStore")
+        self.db_path = db_path or os.getenv(
+            "CIRCLECI_HISTORY_PATH",
+            os.path.join(os.path.dirname(__file__), "../../../cache/circleci_history.sqlite3"),
+        )
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sync_state)")}
+            if "watermark" not in columns:
+                # Rows of older files have no watermark; their projects get one full sync
+                conn.execute("ALTER TABLE sync_state ADD COLUMN watermark INTEGER")
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def is_pipeline_complete(pipeline: dict, workflows: list[dict], now: datetime | None = None) -> bool:
+        """Check whether a pipeline can no longer change
+
+        Args:
+            pipeline: Pipeline record
+            workflows: All workflow records of the pipeline
+            now: Reference time (default: current time)
+        """
+        if workflows:
+            return all(w.get("status") in TERMINAL_WORKFLOW_STATUSES for w in workflows)
+        if pipeline.get("state") == "errored":
+            return True
+
+        created_at = _parse_timestamp(pipeline.get("created_at"))
+        if created_at is None:
+            return False
+        now = now or datetime.now(created_at.tzinfo)
+        return (now - created_at).total_seconds() > EMPTY_PIPELINE_GRACE_HOURS * 3600
+
+    def get_coverage(self, project_slug: str) -> tuple[int | None, str | None]:
+        """Get the sync watermark and how far back the history is complete
+
+        The watermark is the newest pipeline number of the last sync that listed every
+        pipeline; pipelines stored by an interrupted sync do not move it, so the gap
+        below them is listed again.
+
+        Args:
+            project_slug: Project slug
+
+        Returns:
+            (watermark, synced_since as ISO timestamp), both None when no sync completed
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT watermark, synced_since FROM sync_state WHERE project_slug = ? AND watermark IS NOT NULL",
+                (project_slug,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def mark_synced(self, project_slug: str, since: datetime) -> None:
+        """Record that every pipeline created since a cutoff has been listed and stored
+
+        The watermark advances to the newest stored pipeline, which a complete listing
+        has covered. Call only after a listing that read to the end.
+
+        Args:
+            project_slug: Project slug
+            since: Cutoff of the completed sync (timezone aware)
+        """
+        since_iso = since.astimezone(UTC).isoformat()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO sync_state (project_slug, watermark, synced_since, synced_at) "
+                "SELECT ?, COALESCE(MAX(number), 0), ?, ? FROM pipelines WHERE project_slug = ? "
+                "ON CONFLICT (project_slug) DO UPDATE SET "
+                "watermark = MAX(COALESCE(watermark, 0), excluded.watermark), "
+                "synced_since = CASE WHEN watermark IS NULL THEN excluded.synced_since "
+                "ELSE MIN(synced_since, excluded.synced_since) END, "
+                "synced_at = excluded.synced_at",
+                (project_slug, since_iso, datetime.now(UTC).isoformat(), project_slug),
+            )
+
+    def get_pipeline_ids(self, project_slug: str) -> set[str]:
+        """Get the IDs of all stored pipelines of a project"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT id FROM pipelines WHERE project_slug = ?", (project_slug,)).fetchall()
+        return {row[0] for row in rows}
+
+    def get_incomplete_pipelines(self, project_slug: str, since: datetime) -> list[dict]:
+        """Get stored pipelines created since a cutoff that may still change, newest first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT data FROM pipelines p WHERE p.complete = 0 AND {_WINDOW} ORDER BY p.number DESC",
+                (project_slug, self._cutoff(since)),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_complete_workflow_ids(self, pipeline_ids: list[str]) -> set[str]:
+        """Get the IDs of terminal workflows whose jobs are fully stored"""
+        if not pipeline_ids:
+            return set()
+
+        placeholders = ", ".join("?" for _ in pipeline_ids)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT id FROM workflows WHERE complete = 1 AND pipeline_id IN ({placeholders})", pipeline_ids
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def upsert(
+        self,
+        project_slug: str,
+        pipelines: list[dict],
+        workflows: list[dict],
+        jobs: list[dict],
+        failed_pipeline_ids: set[str] | None = None,
+    ) -> int:
+        """Store fetched pipelines with their workflows and jobs
+
+        Args:
+            project_slug: Project slug
+            pipelines: Pipeline records
+            workflows: Workflow records fetched for these pipelines
+            jobs: Job records fetched for these workflows
+            failed_pipeline_ids: Pipelines whose workflows or jobs could not be fully read;
+                they stay incomplete and are fetched again next time
+
+        Returns:
+            Number of pipelines now marked complete
+        """
+        failed = failed_pipeline_ids or set()
+        workflows_by_pipeline: dict[str, list[dict]] = {}
+        for workflow in workflows:
+            workflows_by_pipeline.setdefault(workflow["pipeline_id"], []).append(workflow)
+
+        now = datetime.now().astimezone()
+        pipeline_rows = []
+        completed = 0
+        for pipeline in pipelines:
+            complete = pipeline["id"] not in failed and self.is_pipeline_complete(
+                pipeline, workflows_by_pipeline.get(pipeline["id"], []), now
+            )
+            completed += int(complete)
+            pipeline_rows.append(
+                (
+                    pipeline["id"],
+                    project_slug,
+                    pipeline.get("number"),
+                    pipeline.get("state"),
+                    pipeline.get("created_at"),
+                    int(complete),
+                    json.dumps(pipeline),
+                )
+            )
+
+        workflow_rows = [
+            (
+                w["id"],
+                w["pipeline_id"],
+                w.get("name"),
+                w.get("status"),
+                w.get("created_at"),
+                w.get("duration_seconds"),
+                int(w["pipeline_id"] not in failed and w.get("status") in TERMINAL_WORKFLOW_STATUSES),
+                json.dumps(w),
+            )
+            for w in workflows
+        ]
+        job_rows = [
+            (j["id"], j["workflow_id"], j.get("name"), j.get("status"), j.get("duration_seconds"), json.dumps(j))
+            for j in jobs
+            if j.get("id")
+        ]
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("INSERT OR REPLACE INTO pipelines VALUES (?, ?, ?, ?, ?, ?, ?)", pipeline_rows)
+            conn.executemany("INSERT OR REPLACE INTO workflows VALUES (?, ?, ?, ?, ?, ?, ?, ?)", workflow_rows)
+            conn.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)", job_rows)
+            conn.execute("COMMIT")
+
+        self.logger.info(
+            f"Stored {len(pipelines)} pipelines ({completed} complete), {len(workflows)} workflows, {len(jobs)} jobs"
+        )
+        return completed
+
+    def load(self, project_slug: str, since: datetime) -> tuple[list[dict], list[dict], list[dict]]:
+        """Load stored records of pipelines created since a cutoff
+
+        Args:
+            project_slug: Project slug
+            since: Oldest pipeline creation time
+
+        Returns:
+            (pipelines, workflows, jobs), newest pipeline first
+        """
+        params = (project_slug, self._cutoff(since))
+        with closing(self._connect()) as conn:
+            pipelines = conn.execute(
+                f"SELECT p.data FROM pipelines p WHERE {_WINDOW} ORDER BY p.number DESC", params
+            ).fetchall()
+            workflows = conn.execute(
+                f"SELECT w.data FROM workflows w JOIN pipelines p ON p.id = w.pipeline_id WHERE {_WINDOW} "
+                "ORDER BY p.number DESC, w.rowid",
+                params,
+            ).fetchall()
+            jobs = conn.execute(
+                "SELECT j.data FROM jobs j JOIN workflows w ON w.id = j.workflow_id "
+                f"JOIN pipelines p ON p.id = w.pipeline_id WHERE {_WINDOW} ORDER BY p.number DESC, j.rowid",
+                params,
+            ).fetchall()
+        return tuple([json.loads(row[0]) for row in rows] for rows in (pipelines, workflows, jobs))
+
+    def generate_analysis(self, project_slug: str, since: datetime) -> dict:
+        """Generate the performance analysis of CircleCIService.generate_analysis in SQL
+
+        Args:
+            project_slug: Project slug
+            since: Oldest pipeline creation time
+        """
+        params = (project_slug, self._cutoff(since))
+        workflow_join = f"FROM workflows w JOIN pipelines p ON p.id = w.pipeline_id WHERE {_WINDOW}"
+        job_join = (
+            f"FROM jobs j JOIN workflows w ON w.id = j.workflow_id JOIN pipelines p ON p.id = w.pipeline_id "
+            f"WHERE {_WINDOW}"
+        )
+
+        with closing(self._connect()) as conn:
+            total_pipelines = conn.execute(f"SELECT COUNT(*) FROM pipelines p WHERE {_WINDOW}", params).fetchone()[0]
+            total_workflows, avg_duration, successes, failures = conn.execute(
+                "SELECT COUNT(*), AVG(NULLIF(w.duration_seconds, 0)), "
+                "COALESCE(SUM(w.status = 'success'), 0), COALESCE(SUM(w.status = 'failed'), 0) "
+                f"{workflow_join}",
+                params,
+            ).fetchone()
+            total_jobs = conn.execute(f"SELECT COUNT(*) {job_join}", params).fetchone()[0]
+            job_rows = conn.execute(
+                "SELECT j.name, COUNT(*), SUM(j.duration_seconds), SUM(j.status = 'success') "
+                f"{job_join} AND j.duration_seconds > 0 GROUP BY j.name",
+                params,
+            ).fetchall()
+            slowest_rows = conn.execute(
+                f"SELECT j.data {job_join} AND j.duration_seconds > 0 ORDER BY j.duration_seconds DESC LIMIT 10",
+                params,
+            ).fetchall()
+
+        job_performance = {
+            name: {
+                "total_runs": runs,
+                "total_duration": total_duration,
+                "avg_duration": round(total_duration / runs),
+                "success_rate": round(job_successes / runs * 100),
+                "successes": job_successes,
+            }
+            for name, runs, total_duration, job_successes in job_rows
+        }
+
+        slowest_jobs = []
+        for (data,) in slowest_rows:
+            job = json.loads(data)
+            slowest_jobs.append(
+                {
+                    "name": job["name"],
+                    "duration_seconds": job["duration_seconds"],
+                    "duration_minutes": round(job["duration_seconds"] / 60, 2),
+                    "workflow": job["workflow_name"],
+                    "pipeline": job["pipeline_number"],
+                }
+            )
+
+        return {
+            "summary": {
+                "total_pipelines": total_pipelines,
+                "total_workflows": total_workflows,
+                "total_jobs": total_jobs,
+                "since": since.isoformat(),
+                "generated_at": datetime.now().isoformat(),
+            },
+            "pipeline_performance": {
+                "avg_duration": round(avg_duration or 0),
+                "success_rate": round(successes / total_workflows * 100) if total_workflows else 0,
+                "failure_rate": round(failures / total_workflows * 100) if total_workflows else 0,
+            },
+            "job_performance": job_performance,
+            "slowest_jobs": slowest_jobs,
+        }
+
+    def identify_bottlenecks(self, project_slug: str, since: datetime, limit: int = 5) -> list[dict]:
+        """Identify the slowest jobs by average duration in SQL
+
+        Args:
+            project_slug: Project slug
+            since: Oldest pipeline creation time
+            limit: Number of jobs to return
+
+        Returns:
+            Bottlenecks in the format of CircleCIService.identify_bottlenecks
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT j.name, AVG(j.duration_seconds) AS avg_duration, COUNT(*), SUM(j.status = 'success') "
+                "FROM jobs j JOIN workflows w ON w.id = j.workflow_id JOIN pipelines p ON p.id = w.pipeline_id "
+                f"WHERE {_WINDOW} AND j.duration_seconds > 0 "
+                "GROUP BY j.name ORDER BY avg_duration DESC LIMIT ?",
+                (project_slug, self._cutoff(since), limit),
+            ).fetchall()
+
+        bottlenecks = []
+        for name, avg_duration, runs, successes in rows:
+            avg_seconds = round(avg_duration)
+            bottlenecks.append(
+                {
+                    "job": name,
+                    "avg_duration_minutes": round(avg_seconds / 60, 2),
+                    "success_rate": round(successes / runs * 100),
+                    "total_runs": runs,
+                    "optimization_potential": "HIGH" if avg_seconds > 180 else "MEDIUM",
+                }
+            )
+        return bottlenecks
+
+    def duration_trends(self, project_slug: str, since: datetime, period: str = "week") -> list[dict]:
+        """Get workflow duration and success rate per day or week
+
+        Args:
+            project_slug: Project slug
+            since: Oldest pipeline creation time
+            period: "day" or "week" (weeks start on Monday)
+
+        Returns:
+            One entry per period, oldest first
+        """
+        if period not in ("day", "week"):
+            raise ValueError(f"Unsupported trend period: {period}")
+        bucket = "date(w.created_at)" if period == "day" else "date(w.created_at, 'weekday 0', '-6 days')"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {bucket} AS bucket, COUNT(*), AVG(NULLIF(w.duration_seconds, 0)), "
+                "SUM(w.status = 'success') "
+                f"FROM workflows w JOIN pipelines p ON p.id = w.pipeline_id WHERE {_WINDOW} "
+                "GROUP BY bucket ORDER BY bucket",
+                (project_slug, self._cutoff(since)),
+            ).fetchall()
+
+        return [
+            {
+                "period": bucket,
+                "workflows": count,
+                "avg_duration_seconds": round(avg_duration or 0),
+                "success_rate": round(successes / count * 100),
+            }
+            for bucket, count, avg_duration, successes in rows
+        ]
+
+    @staticmethod
+    def _cutoff(since: datetime) -> str:
+        # CircleCI timestamps are UTC ISO strings, which compare correctly as text
+        if since.tzinfo is not None:
+            since = since.astimezone(UTC)
+        return since.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def get_statistics(self, project_slug: str) -> dict[str, Any]:
+        """Get stored record counts of a project"""
+        with closing(self._connect()) as conn:
+            pipelines, complete = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(complete), 0) FROM pipelines WHERE project_slug = ?", (project_slug,)
+            ).fetchone()
+        return {"pipelines": pipelines, "complete_pipelines": complete, "db_path": self.db_path}
@@ -2,47 +2,119 @@
 Converts the Node.js CircleCI analysis script into Python service
 """
 
+import itertools
 import json
 import os
-import time
-from datetime import datetime
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import requests
 
+from domains.circleci.circleci_api_client import DEFAULT_MAX_CONCURRENCY, CircleCIApiClient
+from domains.circleci.circleci_history_store import CircleCIHistoryStore
 from utils.logging.logging_manager import LogManager
 
 
 class CircleCIService:
     """Service for analyzing CircleCI pipeline performance data"""
 
-    def __init__(self, token: str, project_slug: str = ""):
+    def __init__(
+        self,
+        token: str,
+        project_slug: str = "",
+        base_url: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         """Initialize CircleCI service
 
         Args:
             token: CircleCI API token
             project_slug: Project slug (e.g., 'gh/org/repo'), optional for listing projects
+            base_url: API root, e.g. a local fake server (default: https://circleci.com/api/v2)
+            max_concurrency: Maximum API requests in flight while exporting
         """
         self.token = token
         self.project_slug = project_slug
-        self.base_url = "https://circleci.com/api/v2"
-        self.session = requests.Session()
-        self.session.headers.update({"Circle-Token": token, "Accept": "application/json"})
+        self.client = CircleCIApiClient(token, base_url=base_url, max_concurrency=max_concurrency)
+        self.base_url = self.client.base_url
+        self.session = self.client.session
         self.logger = LogManager.get_instance().get_logger("CircleCIService")
 
     def _make_request(self, endpoint: str) -> dict:
         """Make API request to CircleCI"""
-        url = f"{self.base_url}{endpoint}"
-
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            return self.client.get(endpoint)
         except requests.RequestException as e:
-            self.logger.error(f"Failed to make request to {url}: {e}")
+            self.logger.error(f"Failed to make request to {self.base_url}{endpoint}: {e}")
             raise
 
+    @staticmethod
+    def _pipeline_record(pipeline: dict) -> dict:
+        return {
+            "id": pipeline.get("id"),
+            "number": pipeline.get("number"),
+            "state": pipeline.get("state"),
+            "created_at": pipeline.get("created_at"),
+            "updated_at": pipeline.get("updated_at"),
+            "vcs": {
+                "branch": pipeline.get("vcs", {}).get("branch"),
+                "commit": pipeline.get("vcs", {}).get("commit", {}).get("subject"),
+                "revision": pipeline.get("vcs", {}).get("revision"),
+            },
+            "trigger": pipeline.get("trigger"),
+        }
+
+    @staticmethod
+    def _workflow_record(workflow: dict, pipeline: dict) -> dict:
+        duration_seconds = None
+        if workflow.get("stopped_at") and workflow.get("created_at"):
+            start = datetime.fromisoformat(workflow["created_at"].replace("Z", "+00:00"))
+            stop = datetime.fromisoformat(workflow["stopped_at"].replace("Z", "+00:00"))
+            duration_seconds = int((stop - start).total_seconds())
+
+        return {
+            "id": workflow.get("id"),
+            "name": workflow.get("name"),
+            "status": workflow.get("status"),
+            "created_at": workflow.get("created_at"),
+            "stopped_at": workflow.get("stopped_at"),
+            "pipeline_id": pipeline["id"],
+            "pipeline_number": pipeline["number"],
+            "duration_seconds": duration_seconds,
+        }
+
+    @staticmethod
+    def _job_record(job: dict, workflow: dict) -> dict:
+        duration_seconds = None
+        if job.get("stopped_at") and job.get("started_at"):
+            start = datetime.fromisoformat(job["started_at"].replace("Z", "+00:00"))
+            stop = datetime.fromisoformat(job["stopped_at"].replace("Z", "+00:00"))
+            duration_seconds = int((stop - start).total_seconds())
+
+        return {
+            "id": job.get("id"),
+            "name": job.get("name"),
+            "status": job.get("status"),
+            "started_at": job.get("started_at"),
+            "stopped_at": job.get("stopped_at"),
+            "workflow_id": workflow["id"],
+            "workflow_name": workflow["name"],
+            "pipeline_number": workflow["pipeline_number"],
+            "duration_seconds": duration_seconds,
+            "resource_class": None,  # Would need to extract from config
+        }
+
+    def _fetch_workflows(self, pipeline: dict, limit: int | None = None) -> list[dict]:
+        items = self.client.paginate(f"/pipeline/{pipeline['id']}/workflow", limit=limit)
+        return [self._workflow_record(workflow, pipeline) for workflow in items]
+
+    def _fetch_jobs(self, workflow: dict, limit: int | None = None) -> list[dict]:
+        items = self.client.paginate(f"/workflow/{workflow['id']}/job", limit=limit)
+        return [self._job_record(job, workflow) for job in items]
+
     def list_projects(self) -> list[dict]:
         """List all projects accessible to the user by getting organizations and their pipelines.
 
@@ -127,34 +199,17 @@ class CircleCIService:
             return []
 
     def export_pipelines(self, limit: int = 100) -> list[dict]:
-        """Export pipeline data"""
+        """Export pipeline data, following pagination until limit pipelines are read"""
         self.logger.info("📊 Exporting pipeline data...")
 
         try:
-            data = self._make_request(f"/project/{self.project_slug}/pipeline")
+            items = self.client.paginate(f"/project/{self.project_slug}/pipeline", limit=limit)
+            pipelines = [self._pipeline_record(pipeline) for pipeline in items]
 
-            if not data.get("items") or not isinstance(data["items"], list):
+            if not pipelines:
                 self.logger.error("❌ No pipeline data found or invalid format")
                 return []
 
-            pipelines = []
-            for pipeline in data["items"][:limit]:
-                pipelines.append(
-                    {
-                        "id": pipeline.get("id"),
-                        "number": pipeline.get("number"),
-                        "state": pipeline.get("state"),
-                        "created_at": pipeline.get("created_at"),
-                        "updated_at": pipeline.get("updated_at"),
-                        "vcs": {
-                            "branch": pipeline.get("vcs", {}).get("branch"),
-                            "commit": pipeline.get("vcs", {}).get("commit", {}).get("subject"),
-                            "revision": pipeline.get("vcs", {}).get("revision"),
-                        },
-                        "trigger": pipeline.get("trigger"),
-                    }
-                )
-
             self.logger.info(f"✅ Exported {len(pipelines)} pipelines")
             return pipelines
 
@@ -163,84 +218,219 @@ class CircleCIService:
             return []
 
     def export_workflows(self, pipelines: list[dict], limit: int = 20) -> list[dict]:
-        """Export workflow data for pipelines"""
+        """Export workflow data for the first limit pipelines, fetched concurrently"""
         self.logger.info("🔄 Exporting workflow data...")
 
+        selected = pipelines[:limit]
         all_workflows = []
 
-        for pipeline in pipelines[:limit]:
-            try:
-                data = self._make_request(f"/pipeline/{pipeline['id']}/workflow")
-
-                for workflow in data.get("items", []):
-                    duration_seconds = None
-                    if workflow.get("stopped_at") and workflow.get("created_at"):
-                        start = datetime.fromisoformat(workflow["created_at"].replace("Z", "+00:00"))
-                        stop = datetime.fromisoformat(workflow["stopped_at"].replace("Z", "+00:00"))
-                        duration_seconds = int((stop - start).total_seconds())
-
-                    all_workflows.append(
-                        {
-                            "id": workflow.get("id"),
-                            "name": workflow.get("name"),
-                            "status": workflow.get("status"),
-                            "created_at": workflow.get("created_at"),
-                            "stopped_at": workflow.get("stopped_at"),
-                            "pipeline_id": pipeline["id"],
-                            "pipeline_number": pipeline["number"],
-                            "duration_seconds": duration_seconds,
-                        }
-                    )
-
-                # Rate limiting
-                time.sleep(0.1)
-
-            except Exception as e:
-                self.logger.warning(f"⚠️  Failed to get workflows for pipeline {pipeline['number']}: {e}")
+        for pipeline, result in zip(selected, self.client.map_concurrent(self._fetch_workflows, selected), strict=True):
+            if isinstance(result, Exception):
+                self.logger.warning(f"⚠️  Failed to get workflows for pipeline {pipeline['number']}: {result}")
+                continue
+            all_workflows.extend(result)
 
         self.logger.info(f"✅ Exported {len(all_workflows)} workflows")
         return all_workflows
 
     def export_jobs(self, workflows: list[dict], limit: int = 10) -> list[dict]:
-        """Export job data for workflows"""
+        """Export job data for the first limit workflows, fetched concurrently"""
         self.logger.info("⚙️  Exporting job data...")
 
+        selected = workflows[:limit]
         all_jobs = []
 
-        for workflow in workflows[:limit]:
-            try:
-                data = self._make_request(f"/workflow/{workflow['id']}/job")
-
-                for job in data.get("items", []):
-                    duration_seconds = None
-                    if job.get("stopped_at") and job.get("started_at"):
-                        start = datetime.fromisoformat(job["started_at"].replace("Z", "+00:00"))
-                        stop = datetime.fromisoformat(job["stopped_at"].replace("Z", "+00:00"))
-                        duration_seconds = int((stop - start).total_seconds())
-
-                    all_jobs.append(
-                        {
-                            "id": job.get("id"),
-                            "name": job.get("name"),
-                            "status": job.get("status"),
-                            "started_at": job.get("started_at"),
-                            "stopped_at": job.get("stopped_at"),
-                            "workflow_id": workflow["id"],
-                            "workflow_name": workflow["name"],
-                            "pipeline_number": workflow["pipeline_number"],
-                            "duration_seconds": duration_seconds,
-                            "resource_class": None,  # Would need to extract from config
-                        }
-                    )
+        for workflow, result in zip(selected, self.client.map_concurrent(self._fetch_jobs, selected), strict=True):
+            if isinstance(result, Exception):
+                self.logger.warning(f"⚠️  Failed to get jobs for workflow {workflow['id']}: {result}")
+                continue
+            all_jobs.extend(result)
+
+        self.logger.info(f"✅ Exported {len(all_jobs)} jobs")
+        return all_jobs
+
+    def export_pipeline_tree(
+        self,
+        pipeline_limit: int = 100,
+        workflow_limit: int | None = None,
+        job_limit: int | None = None,
+    ) -> tuple[list[dict], list[dict], list[dict]]:
+        """Export pipelines with their workflows and jobs in one pipelined pass
+
+        Workflow requests start as soon as each pipeline page arrives and job requests as
+        soon as each pipeline's workflows arrive, so the three levels overlap instead of
+        waiting for each other.
+
+        Args:
+            pipeline_limit: Maximum number of pipelines
+            workflow_limit: Maximum workflows per pipeline (None for all)
+            job_limit: Maximum jobs per workflow (None for all)
+
+        Returns:
+            (pipelines, workflows, jobs) in API order
+        """
+        self.logger.info(f"📊 Exporting up to {pipeline_limit} pipelines with workflows and jobs...")
+
+        pipelines, workflows, jobs, _, _ = self._export_tree(
+            self._iter_pipelines(limit=pipeline_limit), workflow_limit=workflow_limit, job_limit=job_limit
+        )
 
-                # Rate limiting
-                time.sleep(0.1)
+        self.logger.info(
+            f"✅ Exported {len(pipelines)} pipelines, {len(workflows)} workflows and {len(jobs)} jobs "
+            f"({self.client.get_statistics()['requests_made']} requests)"
+        )
+        return pipelines, workflows, jobs
+
+    def _iter_pipelines(
+        self,
+        limit: int | None = None,
+        newer_than: int | None = None,
+        since: datetime | None = None,
+        skip_ids: set[str] | None = None,
+    ) -> Iterator[dict]:
+        """Yield pipeline records newest first, reading pages only as far as needed
+
+        Args:
+            limit: Maximum number of pipelines
+            newer_than: Stop at the first pipeline with this number or lower
+            since: Stop at the first pipeline created before this time
+            skip_ids: Pipelines to pass over without yielding
+        """
+        count = 0
+        for page in self.client.iter_pages(f"/project/{self.project_slug}/pipeline"):
+            for item in page:
+                created_at = item.get("created_at")
+                if since and created_at and datetime.fromisoformat(created_at.replace("Z", "+00:00")) < since:
+                    return
+                if newer_than is not None and (item.get("number") or 0) <= newer_than:
+                    return
+                if skip_ids and item.get("id") in skip_ids:
+                    continue
+
+                yield self._pipeline_record(item)
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def _export_tree(
+        self,
+        pipeline_source: Iterable[dict],
+        *,
+        workflow_limit: int | None = None,
+        job_limit: int | None = None,
+        skip_job_workflows: set[str] | None = None,
+    ) -> tuple[list[dict], list[dict], list[dict], set[str], bool]:
+        """Fetch workflows and jobs of pipelines as they are produced
 
+        Args:
+            pipeline_source: Pipeline records; may issue API calls lazily
+            workflow_limit: Maximum workflows per pipeline (None for all)
+            job_limit: Maximum jobs per workflow (None for all)
+            skip_job_workflows: Workflows whose jobs are already known and not fetched again
+
+        Returns:
+            (pipelines, workflows, jobs, IDs of pipelines with failed requests,
+            whether the pipeline source was read to the end)
+        """
+        pipelines: list[dict] = []
+        workflow_futures: list[Future] = []
+        failed_pipeline_ids: set[str] = set()
+        source_complete = True
+        skip_job_workflows = skip_job_workflows or set()
+
+        with ThreadPoolExecutor(max_workers=self.client.max_concurrency, thread_name_prefix="circleci") as executor:
+
+            def _fetch_pipeline_tree(pipeline: dict) -> tuple[list[dict], list[tuple[dict, Future]]]:
+                workflows = self._fetch_workflows(pipeline, workflow_limit)
+                # Jobs are queued, not awaited, so workers never block on each other
+                return workflows, [
+                    (wf, executor.submit(self._fetch_jobs, wf, job_limit))
+                    for wf in workflows
+                    if wf["id"] not in skip_job_workflows
+                ]
+
+            try:
+                for pipeline in pipeline_source:
+                    pipelines.append(pipeline)
+                    workflow_futures.append(executor.submit(_fetch_pipeline_tree, pipeline))
             except Exception as e:
-                self.logger.warning(f"⚠️  Failed to get jobs for workflow {workflow['id']}: {e}")
+                source_complete = False
+                self.logger.error(f"❌ Error exporting pipelines after {len(pipelines)} pipelines: {e}")
+
+            all_workflows: list[dict] = []
+            all_jobs: list[dict] = []
+            for pipeline, future in zip(pipelines, workflow_futures, strict=True):
+                try:
+                    workflows, job_futures = future.result()
+                except Exception as e:
+                    failed_pipeline_ids.add(pipeline["id"])
+                    self.logger.warning(f"⚠️  Failed to get workflows for pipeline {pipeline['number']}: {e}")
+                    continue
 
-        self.logger.info(f"✅ Exported {len(all_jobs)} jobs")
-        return all_jobs
+                all_workflows.extend(workflows)
+                for workflow, job_future in job_futures:
+                    try:
+                        all_jobs.extend(job_future.result())
+                    except Exception as e:
+                        failed_pipeline_ids.add(pipeline["id"])
+                        self.logger.warning(f"⚠️  Failed to get jobs for workflow {workflow['id']}: {e}")
+
+        return pipelines, all_workflows, all_jobs, failed_pipeline_ids, source_complete
+
+    def sync_history(self, store: CircleCIHistoryStore, since: datetime) -> dict:
+        """Bring the local history of the project up to date
+
+        Only pipelines newer than the watermark of the last complete sync and stored
+        pipelines that were still running are fetched; jobs of workflows that were already
+        terminal are not read again.
+        The first sync (or a sync reaching further back than before) reads every pipeline
+        created since the cutoff.
+
+        Args:
+            store: History store
+            since: Oldest pipeline creation time to keep in sync (timezone aware)
+
+        Returns:
+            Sync statistics
+        """
+        watermark, synced_since = store.get_coverage(self.project_slug)
+        incomplete = store.get_incomplete_pipelines(self.project_slug, since)
+        # Pipelines stored by an interrupted sync may lie above the watermark; complete ones
+        # are final and unfinished ones are refreshed through `incomplete`
+        stored_ids = store.get_pipeline_ids(self.project_slug)
+        requests_before = self.client.get_statistics()["requests_made"]
+
+        if synced_since is not None and datetime.fromisoformat(synced_since) <= since:
+            self.logger.info(f"🔄 Syncing pipelines after #{watermark} and {len(incomplete)} unfinished pipelines...")
+            new_pipelines = self._iter_pipelines(newer_than=watermark, since=since, skip_ids=stored_ids)
+        else:
+            self.logger.info(f"🔄 Syncing all pipelines since {since.date().isoformat()}...")
+            new_pipelines = self._iter_pipelines(since=since, skip_ids=stored_ids)
+
+        pipelines, workflows, jobs, failed_ids, listed_all = self._export_tree(
+            itertools.chain(incomplete, new_pipelines),
+            skip_job_workflows=store.get_complete_workflow_ids([p["id"] for p in incomplete]),
+        )
+        completed = store.upsert(self.project_slug, pipelines, workflows, jobs, failed_ids)
+        if listed_all:
+            # Only a listing that reached the watermark (or the cutoff) may advance it
+            store.mark_synced(self.project_slug, since)
+        else:
+            self.logger.warning("⚠️  Pipeline listing was interrupted; the next sync lists the gap again")
+
+        stats = {
+            "new_pipelines": len(pipelines) - len(incomplete),
+            "refreshed_pipelines": len(incomplete),
+            "completed_pipelines": completed,
+            "workflows_fetched": len(workflows),
+            "jobs_fetched": len(jobs),
+            "requests_made": self.client.get_statistics()["requests_made"] - requests_before,
+        }
+        self.logger.info(
+            f"✅ Synced {stats['new_pipelines']} new and {stats['refreshed_pipelines']} unfinished pipelines "
+            f"({stats['requests_made']} requests)"
+        )
+        return stats
 
     def generate_analysis(self, pipelines: list[dict], workflows: list[dict], jobs: list[dict]) -> dict:
         """Generate performance analysis"""
@@ -521,19 +711,47 @@ class CircleCIService:
                 json.dump(data, f, indent=2)
             self.logger.info(f"✅ Saved {filename}")
 
-    def run_complete_analysis(self, output_dir: str = "./circleci-analysis") -> dict:
-        """Run complete CircleCI performance analysis"""
+    def run_complete_analysis(
+        self,
+        output_dir: str = "./circleci-analysis",
+        pipeline_limit: int = 100,
+        workflow_limit: int | None = None,
+        job_limit: int | None = None,
+        *,
+        history_store: CircleCIHistoryStore | None = None,
+        since_days: int = 90,
+    ) -> dict:
+        """Run complete CircleCI performance analysis
+
+        Args:
+            output_dir: Output directory for analysis results
+            pipeline_limit: Maximum number of pipelines to analyze
+            workflow_limit: Maximum workflows per pipeline (None for all)
+            job_limit: Maximum jobs per workflow (None for all)
+            history_store: Local history to sync and analyze instead of a one-off export;
+                the limits are ignored since stored pipelines must be complete
+            since_days: Days of history to analyze when a history store is used
+        """
         self.logger.info("🚀 Starting CircleCI performance analysis...")
 
-        # Export data
-        pipelines = self.export_pipelines()
-        workflows = self.export_workflows(pipelines)
-        jobs = self.export_jobs(workflows)
+        detailed_results: dict = {}
+        if history_store is not None:
+            # Sync the delta, then analyze the whole window in SQL
+            since = datetime.now(UTC) - timedelta(days=since_days)
+            detailed_results["sync"] = self.sync_history(history_store, since)
+            pipelines, workflows, jobs = history_store.load(self.project_slug, since)
+            analysis = history_store.generate_analysis(self.project_slug, since)
+            bottlenecks = history_store.identify_bottlenecks(self.project_slug, since)
+            detailed_results["duration_trends"] = history_store.duration_trends(self.project_slug, since)
+        else:
+            # Export data
+            pipelines, workflows, jobs = self.export_pipeline_tree(pipeline_limit, workflow_limit, job_limit)
+
+            # Generate analysis
+            analysis = self.generate_analysis(pipelines, workflows, jobs)
+            bottlenecks = self.identify_bottlenecks(analysis)
 
-        # Generate analysis
-        analysis = self.generate_analysis(pipelines, workflows, jobs)
         recommendations = self.generate_recommendations(analysis)
-        bottlenecks = self.identify_bottlenecks(analysis)
         optimization_plan = self.generate_optimization_plan(bottlenecks, analysis)
 
         # Save data
@@ -544,11 +762,13 @@ class CircleCIService:
         self.create_visualizations(workflows, jobs, charts_path)
 
         # Save detailed results
-        detailed_results = {
-            "bottlenecks": bottlenecks,
-            "optimization_plan": optimization_plan,
-            "analysis_date": datetime.now().isoformat(),
-        }
+        detailed_results.update(
+            {
+                "bottlenecks": bottlenecks,
+                "optimization_plan": optimization_plan,
+                "analysis_date": datetime.now().isoformat(),
+            }
+        )
 
         with open(os.path.join(output_dir, "detailed_analysis.json"), "w") as f:
             json.dump(detailed_results, f, indent=2)
@@ -560,4 +780,6 @@ class CircleCIService:
             "bottlenecks": bottlenecks,
             "optimization_plan": optimization_plan,
             "output_dir": output_dir,
+            "sync": detailed_results.get("sync"),
+            "duration_trends": detailed_results.get("duration_trends"),
         }
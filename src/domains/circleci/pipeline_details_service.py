@@ -2,12 +2,12 @@
 Service for extracting detailed information from a specific CircleCI pipeline
 """
 
-import time
 from datetime import datetime
 from typing import Any
 
 import requests
 
+from domains.circleci.circleci_api_client import DEFAULT_MAX_CONCURRENCY, CircleCIApiClient
 from utils.cache_manager.cache_manager import CacheManager
 from utils.data.json_manager import JSONManager
 from utils.logging.logging_manager import LogManager
@@ -16,18 +16,26 @@ from utils.logging.logging_manager import LogManager
 class PipelineDetailsService:
     """Service for extracting detailed information from a specific CircleCI pipeline"""
 
-    def __init__(self, token: str, project_slug: str):
+    def __init__(
+        self,
+        token: str,
+        project_slug: str,
+        base_url: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         """Initialize CircleCI Pipeline Details service
 
         Args:
             token: CircleCI API token
             project_slug: Project slug (e.g., 'gh/organization/repository-name')
+            base_url: API root, e.g. a local fake server (default: https://circleci.com/api/v2)
+            max_concurrency: Maximum API requests in flight
         """
         self.token = token
         self.project_slug = project_slug
-        self.base_url = "https://circleci.com/api/v2"
-        self.session = requests.Session()
-        self.session.headers.update({"Circle-Token": token, "Accept": "application/json"})
+        self.client = CircleCIApiClient(token, base_url=base_url, max_concurrency=max_concurrency)
+        self.base_url = self.client.base_url
+        self.session = self.client.session
         self.logger = LogManager.get_instance().get_logger("PipelineDetailsService")
         self.cache = CacheManager.get_instance()
 
@@ -37,9 +45,7 @@ class PipelineDetailsService:
 
         try:
             self.logger.debug(f"Making request to: {url}")
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            return self.client.get(endpoint, params)
         except requests.RequestException as e:
             self.logger.error(f"Failed to make request to {url}: {e}")
             if hasattr(e, "response") and e.response is not None:
@@ -141,10 +147,8 @@ class PipelineDetailsService:
         try:
             self.logger.info(f"🔄 Getting workflows for pipeline: {pipeline_id}")
 
-            workflow_data = self._make_request(f"/pipeline/{pipeline_id}/workflow")
             workflows = []
-
-            for workflow in workflow_data.get("items", []):
+            for workflow in self.client.paginate(f"/pipeline/{pipeline_id}/workflow"):
                 workflow_detail = {
                     "id": workflow.get("id"),
                     "name": workflow.get("name"),
@@ -161,13 +165,12 @@ class PipelineDetailsService:
                     stop = datetime.fromisoformat(workflow["stopped_at"].replace("Z", "+00:00"))
                     workflow_detail["duration_seconds"] = int((stop - start).total_seconds())
 
-                # Get jobs for this workflow
-                workflow_detail["jobs"] = self._get_workflow_jobs(workflow["id"], verbose)
-
                 workflows.append(workflow_detail)
 
-                # Rate limiting
-                time.sleep(0.1)
+            # Get jobs of all workflows concurrently
+            job_lists = self.client.map_concurrent(lambda wf: self._get_workflow_jobs(wf["id"], verbose), workflows)
+            for workflow_detail, jobs in zip(workflows, job_lists, strict=True):
+                workflow_detail["jobs"] = [] if isinstance(jobs, Exception) else jobs
 
             self.logger.info(f"✅ Found {len(workflows)} workflows")
             return workflows
@@ -179,10 +182,9 @@ class PipelineDetailsService:
     def _get_workflow_jobs(self, workflow_id: str, verbose: bool = False) -> list[dict]:
         """Get all jobs for a workflow with detailed information"""
         try:
-            job_data = self._make_request(f"/workflow/{workflow_id}/job")
             jobs = []
 
-            for job in job_data.get("items", []):
+            for job in self.client.paginate(f"/workflow/{workflow_id}/job"):
                 job_detail = {
                     "id": job.get("id"),
                     "name": job.get("name"),
@@ -199,18 +201,18 @@ class PipelineDetailsService:
                     stop = datetime.fromisoformat(job["stopped_at"].replace("Z", "+00:00"))
                     job_detail["duration_seconds"] = int((stop - start).total_seconds())
 
-                # Get detailed job information if verbose
-                if verbose:
-                    try:
-                        job_detail["details"] = self._get_job_details(job["job_number"])
-                    except Exception as e:
-                        self.logger.warning(f"⚠️  Could not get details for job {job['job_number']}: {e}")
-                        job_detail["details"] = {}
-
                 jobs.append(job_detail)
 
-                # Rate limiting
-                time.sleep(0.05)
+            # Get detailed job information if verbose (approval jobs have no job number)
+            if verbose:
+                numbered = [job for job in jobs if job.get("job_number") is not None]
+                details = self.client.map_concurrent(lambda j: self._get_job_details(j["job_number"]), numbered)
+                for job_detail, detail in zip(numbered, details, strict=True):
+                    if isinstance(detail, Exception):
+                        self.logger.warning(f"⚠️  Could not get details for job {job_detail['job_number']}: {detail}")
+                    job_detail["details"] = {} if isinstance(detail, Exception) else detail
+                for job_detail in jobs:
+                    job_detail.setdefault("details", {})
 
             return jobs
 
@@ -3,20 +3,104 @@
 import json
 import os
 import random
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import urljoin
 
 import requests
 
 from utils.cache_manager.cache_manager import CacheManager
+from utils.http.shared_budget import SharedRateBudget, budget_key
 from utils.logging.logging_manager import LogManager
 
 # Allow override via environment variable
 GRAPHQL_ENDPOINT = os.getenv("GITHUB_GRAPHQL_ENDPOINT", "https://api.github.com/graphql")
 
+# PR fields (with reviews and approvals) shared by the per-repository and batched queries
+PR_REVIEW_FIELDS_FRAGMENT = """
+fragment PullRequestReviewFields on PullRequest {
+  number
+  url
+  title
+  state
+  createdAt
+  mergedAt
+  updatedAt
+  closedAt
+  baseRefName
+  headRefName
+  author {
+    login
+  }
+  authorAssociation
+  isDraft
+  additions
+  deletions
+  changedFiles
+  commits {
+    totalCount
+  }
+  comments {
+    totalCount
+  }
+  reviewThreads {
+    totalCount
+  }
+  reviewDecision
+  reviews(first: 100) {
+    nodes {
+      state
+      submittedAt
+      author {
+        login
+      }
+    }
+  }
+  latestOpinionatedReviews(first: 100) {
+    nodes {
+      state
+      submittedAt
+      author {
+        login
+      }
+    }
+  }
+  reviewRequests(first: 100) {
+    nodes {
+      requestedReviewer {
+        __typename
+        ... on User {
+          login
+        }
+        ... on Team {
+          slug
+        }
+      }
+    }
+  }
+  timelineItems(first: 100, itemTypes: [PULL_REQUEST_COMMIT]) {
+    nodes {
+      __typename
+      ... on PullRequestCommit {
+        commit {
+          committedDate
+        }
+      }
+    }
+  }
+}
+"""
+
+# GitHub rejects GraphQL queries that could return more than this many nodes
+GRAPHQL_MAX_NODES = 500_000
+
+# Repositories packed into one batched query at most, and the point cost a batch aims for
+GRAPHQL_MAX_BATCH_REPOS = 20
+GRAPHQL_TARGET_BATCH_COST = 50
+
 
 class GitHubApiClient:
     """GitHub REST API client with rate limiting and caching."""
@@ -26,6 +110,10 @@ class GitHubApiClient:
         self.cache = CacheManager.get_instance()
         self.max_workers = max_workers
 
+        # Outcome of conditional (ETag) page requests: fresh cache, 304 revalidation, full download
+        self.cache_stats = {"hit": 0, "not_modified": 0, "miss": 0}
+        self._stats_lock = threading.Lock()
+
         self.base_url = os.getenv("GITHUB_BASE_URL", "https://api.github.com")
         self.api_version = os.getenv("GITHUB_API_VERSION", "2022-11-28")
 
@@ -40,6 +128,13 @@ class GitHubApiClient:
             "User-Agent": "PyToolkit-PR-Analyzer/1.0",
         }
 
+        # Quota shared with every other process using the same token
+        self.budget = SharedRateBudget.get_instance()
+        self.rest_budget_key = budget_key(self.base_url, self.token)
+        self.graphql_budget_key = f"{budget_key(GRAPHQL_ENDPOINT, self.token)}:graphql"
+        # Points charged by the last GraphQL query of each shape (rateLimit.cost), reserved for the next one
+        self.graphql_query_costs: dict[str, int] = {}
+
         # Separate headers for GraphQL (needs JSON accept)
         self.graphql_headers = {
             "Authorization": f"Bearer {self.token}",
@@ -61,6 +156,7 @@ class GitHubApiClient:
         variables: dict[str, Any],
         max_retries: int = 5,
         backoff_base: float = 1.0,
+        expected_cost: int | None = None,
     ) -> dict[str, Any]:
         """Execute a GraphQL POST request with retry/backoff.
 
@@ -69,6 +165,8 @@ class GitHubApiClient:
             variables: Variables dict
             max_retries: Maximum attempts
             backoff_base: Base seconds for exponential backoff
+            expected_cost: Points to reserve from the shared budget (default: the cost last
+                reported for the same query text, or 1 for a query not seen yet)
 
         Returns:
             Parsed JSON response ("data" object)
@@ -77,14 +175,21 @@ class GitHubApiClient:
         attempt = 0
         while attempt < max_retries:
             try:
+                self.budget.acquire(
+                    self.graphql_budget_key, cost=expected_cost or self.graphql_query_costs.get(query, 1)
+                )
                 resp = requests.post(
                     url,
                     headers=self.graphql_headers,
                     data=json.dumps({"query": query, "variables": variables}),
                     timeout=30,
                 )
+                self.budget.record(self.graphql_budget_key, resp.status_code, resp.headers)
                 if resp.status_code == 200:
                     payload = resp.json()
+                    rate_limit = (payload.get("data") or {}).get("rateLimit")
+                    if isinstance(rate_limit, dict) and rate_limit.get("cost"):
+                        self.graphql_query_costs[query] = int(rate_limit["cost"])
                     if "errors" in payload:
                         # Always surface full error list for visibility
                         self.logger.warning(
@@ -131,6 +236,7 @@ class GitHubApiClient:
         endpoint: str,
         cache_key: str | None = None,
         cache_expiration: int = 60,
+        revalidate: bool = False,
         **kwargs,
     ) -> Any:
         """Make a request to the GitHub API with caching and retry logic.
@@ -140,13 +246,29 @@ class GitHubApiClient:
             endpoint: API endpoint
             cache_key: Cache key for storing results
             cache_expiration: Cache expiration in minutes
+            revalidate: Store the response ETag/Last-Modified with the cached data and,
+                once the entry expires, revalidate it with a conditional request. A 304
+                reply reuses the cached data and does not count against the rate limit.
             **kwargs: Additional request parameters
 
         Returns:
             API response data
         """
+        headers = self.headers
+        validated: dict[str, Any] | None = None
+
+        if method == "GET" and cache_key and revalidate:
+            entry = self.cache.load_entry(cache_key)
+            if entry is not None:
+                validated, cached_at = entry
+                if datetime.now() - cached_at <= timedelta(minutes=cache_expiration):
+                    self._count_cache("hit")
+                    self.logger.debug(f"Using cached data for {endpoint}")
+                    return validated["data"]
+                headers = {**self.headers, **self._conditional_headers(validated)}
+
         # Try cache first for GET requests
-        if method == "GET" and cache_key:
+        elif method == "GET" and cache_key:
             cached_data = self.cache.load(cache_key, expiration_minutes=cache_expiration)
             if cached_data is not None:
                 self.logger.debug(f"Using cached data for {endpoint}")
@@ -156,10 +278,14 @@ class GitHubApiClient:
         max_retries = 5
         base_delay = 1
 
-        for attempt in range(max_retries):
+        # Waiting out the rate limit window is not a failed attempt, so attempts are counted by hand
+        attempt = 0
+        while attempt < max_retries:
             try:
                 self.logger.info(f"Making {method} request to {endpoint}")
-                response = requests.request(method, url, headers=self.headers, **kwargs)
+                self.budget.acquire(self.rest_budget_key)
+                response = requests.request(method, url, headers=headers, **kwargs)
+                self.budget.record(self.rest_budget_key, response.status_code, response.headers)
 
                 # Log rate limit info
                 remaining = response.headers.get("X-RateLimit-Remaining")
@@ -167,11 +293,28 @@ class GitHubApiClient:
                 if remaining and reset_time:
                     self.logger.debug(f"Rate limit remaining: {remaining}, resets at: {reset_time}")
 
+                if response.status_code == 304 and validated is not None:
+                    # Unchanged since cached: restart the entry's expiration and reuse it
+                    self.cache.save(cache_key, validated)
+                    self._count_cache("not_modified")
+                    self.logger.debug(f"Not modified, using cached data for {endpoint}")
+                    return validated["data"]
+
                 if response.status_code == 200:
                     data = response.json()
 
                     # Cache successful GET responses
-                    if method == "GET" and cache_key:
+                    if method == "GET" and cache_key and revalidate:
+                        self.cache.save(
+                            cache_key,
+                            {
+                                "data": data,
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            },
+                        )
+                        self._count_cache("miss")
+                    elif method == "GET" and cache_key:
                         self.cache.save(cache_key, data)
 
                     return data
@@ -185,7 +328,10 @@ class GitHubApiClient:
                         reset_timestamp = int(reset_time) if reset_time else time.time() + 3600
                         wait_time = max(1, reset_timestamp - int(time.time()) + 10)
                         self.logger.warning(f"Rate limit exceeded. Waiting {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        # The shared budget makes every process wait, this one included; if it could
+                        # not store the pause, wait here
+                        if not self.budget.block(self.rest_budget_key, wait_time):
+                            time.sleep(wait_time)
                         continue
                     else:
                         self.logger.error(f"Forbidden access to {endpoint}: {response.text}")
@@ -199,6 +345,7 @@ class GitHubApiClient:
                     delay = base_delay * (2**attempt) + random.uniform(0, 1)
                     self.logger.warning(f"Request failed with {response.status_code}. Retrying in {delay:.2f}s...")
                     time.sleep(delay)
+                    attempt += 1
                     continue
 
                 else:
@@ -212,9 +359,44 @@ class GitHubApiClient:
                 delay = base_delay * (2**attempt) + random.uniform(0, 1)
                 self.logger.warning(f"Request exception: {e}. Retrying in {delay:.2f}s...")
                 time.sleep(delay)
+                attempt += 1
 
         raise Exception(f"Failed to complete request to {endpoint} after {max_retries} attempts")
 
+    @staticmethod
+    def _conditional_headers(entry: dict[str, Any]) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cached entry's validators."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def page_cache_prefix(endpoint: str) -> str:
+        """Cache key prefix shared by every page of a paginated endpoint.
+
+        "/repos/my-org/my-repo/pulls" gives "github_repos_my-org_my-repo_pulls"; the
+        page keys append a hash of the request params, so the prefix can be passed
+        to `cache invalidate --prefix`.
+        """
+        return f"github{endpoint.replace('/', '_')}"
+
+    def _count_cache(self, outcome: str) -> None:
+        with self._stats_lock:
+            self.cache_stats[outcome] += 1
+
+    def log_cache_stats(self) -> None:
+        """Log how paginated requests of this run were served."""
+        with self._stats_lock:
+            stats = dict(self.cache_stats)
+        if any(stats.values()):
+            self.logger.info(
+                f"GitHub page cache: {stats['hit']} fresh hits, {stats['not_modified']} not modified (304), "
+                f"{stats['miss']} downloaded"
+            )
+
     def get_paginated_data(
         self,
         endpoint: str,
@@ -227,14 +409,16 @@ class GitHubApiClient:
         page = 1
         pages_fetched = 0
 
-        params = kwargs.get("params", {})
+        # Copy so the caller's dict is not mutated with page numbers
+        params = dict(kwargs.get("params") or {})
 
         while True:
             if max_pages and pages_fetched >= max_pages:
                 break
 
             params.update({"per_page": per_page, "page": page})
-            cache_key = f"{endpoint.replace('/', '_')}_page_{page}_{per_page}"
+            # Params are part of the key so e.g. state=open and state=all pages never collide
+            cache_key = self.cache.generate_cache_key(self.page_cache_prefix(endpoint), **params)
 
             try:
                 # Better progress logging for longer operations
@@ -248,6 +432,7 @@ class GitHubApiClient:
                     endpoint,
                     cache_key=cache_key,
                     cache_expiration=30,  # 30 minutes for paginated data
+                    revalidate=True,
                     params=params,
                 )
 
@@ -846,7 +1031,8 @@ class GitHubApiClient:
         Returns:
             List of enriched PR dictionaries with approval data
         """
-        query = """
+        query = (
+            """
         query($owner: String!, $name: String!, $pageSize: Int!, $cursor: String) {
           rateLimit { 
             cost 
@@ -867,80 +1053,14 @@ class GitHubApiClient:
                 endCursor
               }
               nodes {
-                number
-                url
-                title
-                state
-                createdAt
-                mergedAt
-                updatedAt
-                closedAt
-                baseRefName
-                headRefName
-                author {
-                  login
-                }
-                authorAssociation
-                isDraft
-                additions
-                deletions
-                changedFiles
-                commits {
-                  totalCount
-                }
-                comments {
-                  totalCount
-                }
-                reviewThreads {
-                  totalCount
-                }
-                reviewDecision
-                reviews(first: 100) {
-                  nodes {
-                    state
-                    submittedAt
-                    author {
-                      login
-                    }
-                  }
-                }
-                latestOpinionatedReviews(first: 100) {
-                  nodes {
-                    state
-                    submittedAt
-                    author {
-                      login
-                    }
-                  }
-                }
-                reviewRequests(first: 100) {
-                  nodes {
-                    requestedReviewer {
-                      __typename
-                      ... on User {
-                        login
-                      }
-                      ... on Team {
-                        slug
-                      }
-                    }
-                  }
-                }
-                timelineItems(first: 100, itemTypes: [PULL_REQUEST_COMMIT]) {
-                  nodes {
-                    __typename
-                    ... on PullRequestCommit {
-                      commit {
-                        committedDate
-                      }
-                    }
-                  }
-                }
+                ...PullRequestReviewFields
               }
             }
           }
         }
         """
+            + PR_REVIEW_FIELDS_FRAGMENT
+        )
 
         variables: dict[str, Any] = {
             "owner": owner,
@@ -1002,31 +1122,7 @@ class GitHubApiClient:
 
             self.logger.info(f"📄 Page {page_index + 1}: processing {len(nodes)} PR nodes")
 
-            batch: list[dict[str, Any]] = []
-            skipped_too_recent = 0
-            since_cutoff_reached = False
-
-            for node in nodes:
-                updated_at = node.get("updatedAt")
-                updated_dt = self._parse_timestamp(updated_at) if updated_at else None
-
-                # Apply date filtering (PRs are ordered by updatedAt DESC - newest first)
-                if since_cutoff and updated_dt and updated_dt < since_cutoff:
-                    # PR updated before since date - stop processing entirely
-                    self.logger.info(f"⏰ Since cutoff reached at PR #{node.get('number')} (updated: {updated_at})")
-                    since_cutoff_reached = True
-                    break
-
-                if until_cutoff and updated_dt and updated_dt > until_cutoff:
-                    # PR updated after until date - skip this PR but continue (we haven't reached our date range yet)
-                    skipped_too_recent += 1
-                    continue
-
-                # PR is within our date range (or no date filters applied)
-                batch.append(self._map_graphql_pr_with_approvers(owner, repo, node))
-
-            if skipped_too_recent > 0:
-                self.logger.info(f"⏭️  Skipped {skipped_too_recent} PRs that were too recent (after until date)")
+            batch, since_cutoff_reached = self._filter_review_nodes(owner, repo, nodes, since_cutoff, until_cutoff)
 
             if isinstance(batch, list):
                 all_prs.extend(batch)
@@ -1057,6 +1153,209 @@ class GitHubApiClient:
 
         return all_prs
 
+    def _filter_review_nodes(
+        self,
+        owner: str,
+        repo: str,
+        nodes: list[dict[str, Any]],
+        since_cutoff: datetime | None,
+        until_cutoff: datetime | None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Map one page of PR nodes (updatedAt DESC) that fall inside the update window.
+
+        Returns:
+            Mapped PRs and whether the since cutoff was reached (no further pages needed)
+        """
+        prs: list[dict[str, Any]] = []
+        skipped_too_recent = 0
+        since_cutoff_reached = False
+
+        for node in nodes:
+            updated_at = node.get("updatedAt")
+            updated_dt = self._parse_timestamp(updated_at) if updated_at else None
+
+            # Apply date filtering (PRs are ordered by updatedAt DESC - newest first)
+            if since_cutoff and updated_dt and updated_dt < since_cutoff:
+                # PR updated before since date - stop processing entirely
+                self.logger.info(f"⏰ Since cutoff reached at PR #{node.get('number')} (updated: {updated_at})")
+                since_cutoff_reached = True
+                break
+
+            if until_cutoff and updated_dt and updated_dt > until_cutoff:
+                # PR updated after until date - skip this PR but continue (we haven't reached our date range yet)
+                skipped_too_recent += 1
+                continue
+
+            # PR is within our date range (or no date filters applied)
+            prs.append(self._map_graphql_pr_with_approvers(owner, repo, node))
+
+        if skipped_too_recent > 0:
+            self.logger.info(f"⏭️  Skipped {skipped_too_recent} PRs that were too recent (after until date)")
+
+        return prs, since_cutoff_reached
+
+    # ----------------------- Batched GraphQL PR Fetch (Multi-Repository) -----------------------
+    def fetch_pull_requests_graphql_batched(
+        self,
+        repos: list[tuple[str, str]],
+        since_iso: str | None = None,
+        until_iso: str | None = None,
+        page_size: int = 100,
+        max_batch_size: int = GRAPHQL_MAX_BATCH_REPOS,
+        since_by_repo: dict[str, str | None] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch PRs with review data for many repositories using aliased GraphQL queries.
+
+        Several repositories are packed into one query (one alias per repository) and
+        each alias follows its own cursor, so quiet repositories cost a share of one
+        round trip instead of a full query each. The batch size adapts to the cost
+        reported by rateLimit and is halved when GitHub rejects a query as too large.
+
+        Args:
+            repos: (owner, name) pairs
+            since_iso: ISO timestamp; PRs updated before it are not fetched
+            until_iso: ISO timestamp; PRs updated after it are skipped
+            page_size: Number of PRs to fetch per repository and query
+            max_batch_size: Upper bound of repositories per query
+            since_by_repo: Per-repository since timestamps by "owner/name", overriding since_iso
+
+        Returns:
+            PRs (same shape as fetch_pull_requests_graphql_with_reviews) by "owner/name".
+            Repositories that could not be fully fetched are left out.
+        """
+        since_by_repo = since_by_repo or {}
+        until_cutoff = self._parse_timestamp(until_iso) if until_iso else None
+
+        # Every PR node can return up to 4 nested connections of 100 nodes
+        nodes_per_repo = page_size * (1 + 4 * 100)
+        batch_limit = max(1, min(max_batch_size, GRAPHQL_MAX_NODES // nodes_per_repo))
+        batch_size = batch_limit
+
+        results: dict[str, list[dict[str, Any]]] = {f"{owner}/{name}": [] for owner, name in repos}
+        cursors: dict[str, str | None] = dict.fromkeys(results)
+        since_cutoffs = {
+            full_name: self._parse_timestamp(since) if (since := since_by_repo.get(full_name, since_iso)) else None
+            for full_name in results
+        }
+        pending = list(results)
+        queries = 0
+        # Points per repository of the last batch; the query text changes with the batch size
+        cost_per_repo: float | None = None
+
+        self.logger.info(
+            f"Fetching PRs for {len(pending)} repositories via batched GraphQL (up to {batch_limit}/query)"
+        )
+
+        while pending:
+            batch = pending[:batch_size]
+            query, variables = self._build_batched_pr_query(batch, cursors, page_size)
+            expected_cost = max(1, round(cost_per_repo * len(batch))) if cost_per_repo else None
+            try:
+                raw = self.post_graphql(query, variables, expected_cost=expected_cost)
+            except Exception as e:
+                # Oversized queries tend to time out; the batch is retried smaller below
+                raw = {"errors": [{"message": str(e)}]}
+            queries += 1
+            data = raw.get("data") if isinstance(raw, dict) else None
+            errors = (raw.get("errors") if isinstance(raw, dict) else None) or []
+
+            if not data:
+                messages = " | ".join(str(e.get("message")) for e in errors if isinstance(e, dict))
+                if len(batch) > 1:
+                    # Also cap later batches, so cost-based growth does not retry a rejected size
+                    batch_limit = batch_size = max(1, len(batch) // 2)
+                    self.logger.warning(f"Batched GraphQL query failed ({messages}); retrying with {batch_size} repos")
+                    continue
+                self.logger.error(f"GraphQL query failed for {batch[0]}: {messages}")
+                pending.remove(batch[0])
+                del results[batch[0]]
+                continue
+
+            # Errors on one alias (e.g. unknown repository) only drop that repository
+            failed_aliases = {str(e["path"][0]) for e in errors if isinstance(e, dict) and e.get("path")}
+
+            for index, full_name in enumerate(batch):
+                owner, name = full_name.split("/", 1)
+                repo_data = data.get(f"r{index}")
+                if repo_data is None or f"r{index}" in failed_aliases:
+                    self.logger.error(f"GraphQL: repository data is None for {full_name}")
+                    pending.remove(full_name)
+                    del results[full_name]
+                    continue
+
+                pr_connection = repo_data.get("pullRequests") or {}
+                prs, since_cutoff_reached = self._filter_review_nodes(
+                    owner, name, pr_connection.get("nodes") or [], since_cutoffs[full_name], until_cutoff
+                )
+                results[full_name].extend(prs)
+
+                page_info = pr_connection.get("pageInfo") or {}
+                if since_cutoff_reached or not page_info.get("hasNextPage"):
+                    pending.remove(full_name)
+                    self.logger.debug(f"Batched GraphQL: {full_name} complete with {len(results[full_name])} PRs")
+                else:
+                    cursors[full_name] = page_info.get("endCursor")
+
+            rate_limit = data.get("rateLimit") or {}
+            cost = int(rate_limit.get("cost") or 0)
+            if cost:
+                cost_per_repo = cost / len(batch)
+                # Aim the next batch at the target point cost, using this batch's cost per repository
+                batch_size = max(1, min(batch_limit, int(GRAPHQL_TARGET_BATCH_COST * len(batch) / cost)))
+            self.logger.info(
+                f"📄 Batched query {queries}: {len(batch)} repos, cost={cost or '?'}, "
+                f"remaining={rate_limit.get('remaining', '?')}, {len(pending)} repos still pending"
+            )
+
+        self.logger.info(
+            f"✅ Batched GraphQL completed: {sum(len(prs) for prs in results.values())} PRs "
+            f"from {len(results)} repositories in {queries} queries"
+        )
+        return results
+
+    @staticmethod
+    def _build_batched_pr_query(
+        batch: list[str], cursors: dict[str, str | None], page_size: int
+    ) -> tuple[str, dict[str, Any]]:
+        """Build an aliased query (r0, r1, ...) fetching one PR page per repository."""
+        declarations = ["$pageSize: Int!"]
+        selections = []
+        variables: dict[str, Any] = {"pageSize": page_size}
+
+        for index, full_name in enumerate(batch):
+            owner, name = full_name.split("/", 1)
+            declarations.append(f"$owner{index}: String!, $name{index}: String!, $cursor{index}: String")
+            variables.update({f"owner{index}": owner, f"name{index}": name, f"cursor{index}": cursors.get(full_name)})
+            selections.append(
+                f"""
+          r{index}: repository(owner: $owner{index}, name: $name{index}) {{
+            pullRequests(
+              first: $pageSize,
+              after: $cursor{index},
+              orderBy: {{field: UPDATED_AT, direction: DESC}},
+              states: [OPEN, MERGED, CLOSED]
+            ) {{
+              totalCount
+              pageInfo {{
+                hasNextPage
+                endCursor
+              }}
+              nodes {{
+                ...PullRequestReviewFields
+              }}
+            }}
+          }}"""
+            )
+
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            "          rateLimit {\n            cost\n            remaining\n            resetAt\n            used\n          }"
+            + "".join(selections)
+            + "\n        }\n"
+            + PR_REVIEW_FIELDS_FRAGMENT
+        )
+        return query, variables
+
     # ----------------------- GraphQL PR Fetch (Fast Path) -----------------------
     def fetch_pull_requests_graphql(
         self,
@@ -1298,18 +1597,12 @@ class GitHubApiClient:
             f"✅ GraphQL completed: fetched {len(all_prs)} PRs for {owner}/{repo} in {page_index + 1} API calls"
         )
 
-        # Final rate limit check
-        if page_index > 0:  # Don't repeat if only one page
-            try:
-                final_rl = (
-                    self.post_graphql("query { rateLimit { remaining used } }", {}).get("data", {}).get("rateLimit", {})
-                )
-                if final_rl:
-                    fr_used = int(final_rl.get("used") or 0)
-                    fr_remaining = int(final_rl.get("remaining") or 0)
-                    self.logger.info(f"📊 Final Rate Limit: {fr_used}/{fr_used + fr_remaining} used")
-            except Exception:
-                pass
+        # Final rate limit as reported by the last page (no extra query needed)
+        final_rl = data.get("rateLimit") if page_index > 0 and isinstance(data, dict) else None
+        if isinstance(final_rl, dict):
+            fr_used = int(final_rl.get("used") or 0)
+            fr_remaining = int(final_rl.get("remaining") or 0)
+            self.logger.info(f"📊 Final Rate Limit: {fr_used}/{fr_used + fr_remaining} used")
 
         return all_prs
 
@@ -1507,6 +1800,7 @@ class GitHubApiClient:
         """Map a GraphQL PR node to REST-like schema with enhanced approver data.
 
         This method extends the basic mapping to include:
+        - reviews: List[Dict] - login, state and submitted_at of every fetched review
         - approvers: List[str] - unique reviewer logins who have APPROVED reviews
         - approvers_count: int - number of unique approvers
         - latest_approvals: List[Dict] - latest APPROVED review per reviewer
@@ -1604,6 +1898,14 @@ class GitHubApiClient:
         # Add new fields to PR dict
         pr_dict.update(
             {
+                "reviews": [
+                    {
+                        "login": (review.get("author") or {}).get("login"),
+                        "state": review.get("state"),
+                        "submitted_at": review.get("submittedAt"),
+                    }
+                    for review in reviews_nodes
+                ],
                 "approvers": approvers,
                 "approvers_count": approvers_count,
                 "latest_approvals": latest_approvals,
@@ -163,6 +163,12 @@ class PrAnalysisCommand(BaseCommand):
             default=6,
             help="Maximum concurrent API workers (default: 6)",
         )
+        parser.add_argument(
+            "--repo-workers",
+            type=int,
+            default=4,
+            help="Repositories fetched concurrently (default: 4)",
+        )
 
         # GraphQL acceleration flags
         parser.add_argument(
@@ -183,6 +189,23 @@ class PrAnalysisCommand(BaseCommand):
             default=100,
             help="GraphQL page size (50-100 recommended, default: 100)",
         )
+        parser.add_argument(
+            "--graphql-batch-size",
+            type=int,
+            default=0,
+            help="Pack up to N repositories into each GraphQL query, adapting to the query cost "
+            "(default: 0, one query per repository); requires approver data",
+        )
+        parser.add_argument(
+            "--pr-store",
+            action="store_true",
+            help="Sync PRs into the local PR history store (only PRs updated since the last sync are fetched, "
+            "in batched GraphQL queries) and analyze from it; requires approver data",
+        )
+        parser.add_argument(
+            "--pr-store-db",
+            help="PR history store SQLite file (default: GITHUB_PR_STORE_PATH or cache/github_pr_history.sqlite3)",
+        )
         parser.add_argument(
             "--review-rounds-mode",
             choices=["heuristic", "rest"],
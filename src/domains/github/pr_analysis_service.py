@@ -8,6 +8,7 @@ import os
 import statistics
 import time
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import Any
 
@@ -18,9 +19,14 @@ from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
 try:
-    from .github_api_client import GitHubApiClient  # type: ignore
+    from .github_api_client import GRAPHQL_MAX_BATCH_REPOS, GitHubApiClient  # type: ignore
+    from .pr_history_store import PrHistoryStore  # type: ignore
 except ImportError:  # Fallback if executed as a script
-    from domains.github.github_api_client import GitHubApiClient  # type: ignore
+    from domains.github.github_api_client import GRAPHQL_MAX_BATCH_REPOS, GitHubApiClient  # type: ignore
+    from domains.github.pr_history_store import PrHistoryStore  # type: ignore
+
+# Repositories fetched concurrently; network bound, paced by the shared rate budget
+DEFAULT_REPO_WORKERS = 4
 
 
 class PrAnalysisService:
@@ -68,6 +74,7 @@ class PrAnalysisService:
                 "output_files": self._get_output_files(args),
             }
 
+            self.github_client.log_cache_stats()
             self.logger.info("PR analysis completed successfully")
             return results
 
@@ -115,100 +122,201 @@ class PrAnalysisService:
             raise
 
     def _collect_pr_data(self, repos: list[dict[str, Any]], team_members: set, args: Namespace) -> list[dict[str, Any]]:
-        """Collect PR data from all target repositories."""
-        self.logger.info(f"📊 Collecting PR data from {len(repos)} repositories")
+        """Collect PR data from all target repositories.
+
+        Repositories are fetched concurrently (--repo-workers); the shared rate budget paces
+        the workers against the token's quota. Results are merged in repository order, so
+        the output does not depend on which repository finishes first.
+        """
+        repo_workers = max(1, min(getattr(args, "repo_workers", DEFAULT_REPO_WORKERS), len(repos) or 1))
+        self.logger.info(f"📊 Collecting PR data from {len(repos)} repositories with {repo_workers} worker(s)")
+
+        # Batched GraphQL: fetch every repository's PRs up front, several repositories per query
+        prefetched: dict[str, list[dict[str, Any]]] = {}
+        batch_size = getattr(args, "graphql_batch_size", 0)
+        graphql_with_approvers = getattr(args, "use_graphql", False) and getattr(args, "include_approvers", True)
+        if getattr(args, "pr_store", False) and not graphql_with_approvers:
+            self.logger.warning(
+                "--pr-store needs the GraphQL path with approver data; ignoring it with --use-rest/--no-approvers"
+            )
+        if getattr(args, "pr_store", False) and graphql_with_approvers:
+            prefetched = self._sync_pr_store(repos, args)
+        elif batch_size > 1 and graphql_with_approvers:
+            prefetched = self.github_client.fetch_pull_requests_graphql_batched(
+                [(self._repo_owner(repo, args), repo["name"]) for repo in repos],
+                args.since if getattr(args, "merged_window", False) is False else None,
+                getattr(args, "until", None),
+                getattr(args, "graphql_page_size", 50),
+                max_batch_size=batch_size,
+            )
+
+        repo_results: list[list[dict[str, Any]]] = [[] for _ in repos]
+        with ThreadPoolExecutor(max_workers=repo_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._collect_repo_pr_data,
+                    repo,
+                    team_members,
+                    args,
+                    index=index,
+                    total_repos=len(repos),
+                    prefetched_prs=prefetched.get(f"{self._repo_owner(repo, args)}/{repo['name']}"),
+                ): index
+                for index, repo in enumerate(repos, 1)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                repo_results[index - 1] = future.result()
+                self.logger.info(
+                    f"📦 Repositories completed: {completed}/{len(repos)} "
+                    f"({repos[index - 1].get('name', 'unknown')}: {len(repo_results[index - 1])} PRs)"
+                )
+
+        all_pr_data = [pr for repo_pr_data in repo_results for pr in repo_pr_data]
+        self.logger.info(f"Collected data for {len(all_pr_data)} PRs across all repositories")
+        return all_pr_data
+
+    def _collect_repo_pr_data(
+        self,
+        repo: dict[str, Any],
+        team_members: set,
+        args: Namespace,
+        *,
+        index: int,
+        total_repos: int,
+        prefetched_prs: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch, filter and process the PRs of one repository; failures yield no PRs.
 
-        all_pr_data = []
+        prefetched_prs, when given (batched GraphQL), replaces the per-repository fetch.
+        """
+        try:
+            repo_name = repo["name"]
+            owner = self._repo_owner(repo, args)
 
-        for i, repo in enumerate(repos, 1):
-            try:
-                repo_name = repo["name"]
-                owner = repo["owner"]["login"] if "owner" in repo else args.org
+            self.logger.info(f"📂 Processing repository {index}/{total_repos}: {owner}/{repo_name}")
 
-                self.logger.info(f"📂 Processing repository {i}/{len(repos)}: {owner}/{repo_name}")
+            # Fetch PRs via selected API path
+            if prefetched_prs is not None:
+                prs = prefetched_prs
+            elif getattr(args, "use_graphql", False):
+                self.logger.info(
+                    f"⚡ Using optimized GraphQL path (page_size={getattr(args, 'graphql_page_size', 50)}) for {owner}/{repo_name}"
+                )
+                self.logger.info("🔥 This will fetch ALL PR data in 1-2 API calls instead of hundreds!")
 
-                # Fetch PRs via selected API path
-                if getattr(args, "use_graphql", False):
-                    self.logger.info(
-                        f"⚡ Using optimized GraphQL path (page_size={getattr(args, 'graphql_page_size', 50)}) for {owner}/{repo_name}"
+                # Use enhanced GraphQL method with approvers if requested
+                if getattr(args, "include_approvers", True):
+                    self.logger.info("📊 Including approver data in GraphQL query")
+                    prs = self.github_client.fetch_pull_requests_graphql_with_reviews(
+                        owner,
+                        repo_name,
+                        args.since if getattr(args, "merged_window", False) is False else None,
+                        getattr(args, "until", None),
+                        getattr(args, "graphql_page_size", 50),
                     )
-                    self.logger.info("🔥 This will fetch ALL PR data in 1-2 API calls instead of hundreds!")
-
-                    # Use enhanced GraphQL method with approvers if requested
-                    if getattr(args, "include_approvers", True):
-                        self.logger.info("📊 Including approver data in GraphQL query")
-                        prs = self.github_client.fetch_pull_requests_graphql_with_reviews(
-                            owner,
-                            repo_name,
-                            args.since if getattr(args, "merged_window", False) is False else None,
-                            getattr(args, "until", None),
-                            getattr(args, "graphql_page_size", 50),
-                        )
-                    else:
-                        # Use basic GraphQL method without enhanced approver data
-                        prs = self.github_client.get_enriched_pull_requests_graphql(
-                            owner,
-                            repo_name,
-                            args.since if getattr(args, "merged_window", False) is False else None,
-                            getattr(args, "graphql_page_size", 50),
-                        )
                 else:
-                    self.logger.info(f"🐌 Using slower REST API for {owner}/{repo_name} (consider --use-graphql)")
-                    prs = self.github_client.get_pull_requests(owner, repo_name, args.state)
-                self.logger.info(f"✅ Fetched {len(prs)} PRs in {owner}/{repo_name}")
+                    # Use basic GraphQL method without enhanced approver data
+                    prs = self.github_client.get_enriched_pull_requests_graphql(
+                        owner,
+                        repo_name,
+                        args.since if getattr(args, "merged_window", False) is False else None,
+                        getattr(args, "graphql_page_size", 50),
+                    )
+            else:
+                self.logger.info(f"🐌 Using slower REST API for {owner}/{repo_name} (consider --use-graphql)")
+                prs = self.github_client.get_pull_requests(owner, repo_name, args.state)
+            self.logger.info(f"✅ Fetched {len(prs)} PRs in {owner}/{repo_name}")
 
-                if not prs:
-                    continue
+            if not prs:
+                return []
 
-                # Step 1: Apply date and merge filters before enrichment
-                filtered_prs = []
+            # Step 1: Apply date and merge filters before enrichment
+            filtered_prs = []
 
-                self.logger.info(f"Pre-filtering {len(prs)} PRs with date and merge criteria...")
+            self.logger.info(f"Pre-filtering {len(prs)} PRs with date and merge criteria...")
 
-                for i, pr in enumerate(prs, 1):
-                    if i % 100 == 0 or i == len(prs):
-                        self.logger.info(f"Pre-filtering progress: {i}/{len(prs)} PRs processed")
+            for i, pr in enumerate(prs, 1):
+                if i % 100 == 0 or i == len(prs):
+                    self.logger.info(f"Pre-filtering progress: {i}/{len(prs)} PRs processed")
 
-                    # Apply date filters early (before expensive API calls)
-                    created_at_str = pr.get("created_at", "")
-                    merged_at_str = pr.get("merged_at")
+                # Apply date filters early (before expensive API calls)
+                created_at_str = pr.get("created_at", "")
+                merged_at_str = pr.get("merged_at")
 
-                    created_at = self._parse_timestamp(created_at_str)
-                    merged_at = self._parse_timestamp(merged_at_str) if merged_at_str else None
+                created_at = self._parse_timestamp(created_at_str)
+                merged_at = self._parse_timestamp(merged_at_str) if merged_at_str else None
 
-                    if not self._passes_date_filters(created_at, merged_at, args):
-                        continue
+                if not self._passes_date_filters(created_at, merged_at, args):
+                    continue
 
-                    # Skip unmerged PRs unless explicitly included
-                    if not merged_at and not args.include_unmerged:
-                        continue
+                # Skip unmerged PRs unless explicitly included
+                if not merged_at and not args.include_unmerged:
+                    continue
 
-                    filtered_prs.append(pr)
+                filtered_prs.append(pr)
 
-                self.logger.info(
-                    f"After pre-filtering: {len(filtered_prs)} PRs need processing (reduced from {len(prs)} total PRs)"
-                )
+            self.logger.info(
+                f"After pre-filtering: {len(filtered_prs)} PRs need processing (reduced from {len(prs)} total PRs)"
+            )
 
-                if not filtered_prs:
-                    self.logger.info(f"No PRs found in {owner}/{repo_name} after filtering")
-                    continue
+            if not filtered_prs:
+                self.logger.info(f"No PRs found in {owner}/{repo_name} after filtering")
+                return []
 
-                # Step 2: Process filtered PRs with enrichment and progress tracking
-                # Note: if using GraphQL, PRs are already enriched
-                is_graphql = getattr(args, "use_graphql", False)
-                repo_pr_data = self._process_filtered_prs(
-                    filtered_prs, owner, repo_name, team_members, args, is_graphql
-                )
+            # Step 2: Process filtered PRs with enrichment and progress tracking
+            # Note: if using GraphQL, PRs are already enriched
+            is_graphql = getattr(args, "use_graphql", False)
+            repo_pr_data = self._process_filtered_prs(filtered_prs, owner, repo_name, team_members, args, is_graphql)
+
+            self.logger.info(f"Completed processing {owner}/{repo_name}: {len(repo_pr_data)} PRs added")
+            return repo_pr_data
 
-                all_pr_data.extend(repo_pr_data)
-                self.logger.info(f"Completed processing {owner}/{repo_name}: {len(repo_pr_data)} PRs added")
+        except Exception as e:
+            self.logger.error(f"Failed to process repository {repo.get('name', 'unknown')}: {e}")
+            return []
 
-            except Exception as e:
-                self.logger.error(f"Failed to process repository {repo.get('name', 'unknown')}: {e}")
-                continue
+    def _sync_pr_store(self, repos: list[dict[str, Any]], args: Namespace) -> dict[str, list[dict[str, Any]]]:
+        """Fetch PRs updated since each repository's watermark into the PR store and load the window from it.
 
-        self.logger.info(f"Collected data for {len(all_pr_data)} PRs across all repositories")
-        return all_pr_data
+        Returns:
+            Stored PRs of the analysis window by "owner/name"
+        """
+        store = PrHistoryStore(getattr(args, "pr_store_db", None))
+        window_since = args.since if getattr(args, "merged_window", False) is False else None
+        full_names = [f"{self._repo_owner(repo, args)}/{repo['name']}" for repo in repos]
+        since_by_repo = {full_name: store.get_sync_since(full_name, window_since) for full_name in full_names}
+
+        # Deltas are small, so they are always fetched in batches; until is applied when loading
+        batch_size = getattr(args, "graphql_batch_size", 0)
+        fetched = self.github_client.fetch_pull_requests_graphql_batched(
+            [tuple(full_name.split("/", 1)) for full_name in full_names],
+            page_size=getattr(args, "graphql_page_size", 50),
+            max_batch_size=batch_size if batch_size > 1 else GRAPHQL_MAX_BATCH_REPOS,
+            since_by_repo=since_by_repo,
+        )
+
+        for full_name in full_names:
+            if full_name in fetched:
+                # Review rounds come from the commit timeline; PRs mapped without one get the heuristic
+                self.github_client.apply_heuristic_review_rounds(
+                    [pr for pr in fetched[full_name] if pr.get("review_rounds") is None]
+                )
+                store.upsert(full_name, fetched[full_name], since_by_repo[full_name])
+            else:
+                self.logger.warning(f"Could not sync {full_name}; analyzing the PRs already stored")
+
+        self.logger.info(
+            f"PR store synced: {sum(len(prs) for prs in fetched.values())} updated PRs fetched for "
+            f"{len(fetched)}/{len(full_names)} repositories"
+        )
+        return {
+            full_name: store.load(full_name, window_since, getattr(args, "until", None)) for full_name in full_names
+        }
+
+    @staticmethod
+    def _repo_owner(repo: dict[str, Any], args: Namespace) -> str:
+        return repo["owner"]["login"] if "owner" in repo else args.org
 
     def _process_single_pr(
         self,
@@ -0,0 +1,209 @@
+"""GitHub PR History Store
+Local SQLite store of pull requests, reviews, approvals and review rounds for
+incremental PR analyses
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+from typing import Any
+
+from utils.logging.logging_manager import LogManager
+
+# Window start used when an analysis has no since date (whole repository history)
+HISTORY_START = "1970-01-01T00:00:00Z"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pull_requests (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_at TEXT,
+    merged_at TEXT,
+    state TEXT,
+    author TEXT,
+    review_rounds INTEGER,
+    synchronize_after_first_review INTEGER,
+    re_review_pushes INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (repo, number)
+);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_updated ON pull_requests (repo, updated_at);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    login TEXT,
+    state TEXT,
+    submitted_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_pr ON reviews (repo, number);
+
+CREATE TABLE IF NOT EXISTS approvals (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    login TEXT NOT NULL,
+    submitted_at TEXT,
+    PRIMARY KEY (repo, number, login)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    repo TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_since TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+def _iso(value: str) -> str:
+    # Stored as UTC ISO strings ending in Z (like GitHub's), which compare correctly as text
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class PrHistoryStore:
+    """SQLite store of PRs (as mapped by the GraphQL client) keyed by repository and number
+
+    PRs are fetched ordered by updatedAt, so everything updated after a repository's
+    watermark (the newest updatedAt stored) is a complete delta. A sync therefore only
+    fetches PRs updated since the watermark, as long as the stored history already
+    reaches back to the analysis window; otherwise the whole window is fetched once.
+    """
+
+    def __init__(self, db_path: str | None = None):
+        """Initialize PR history store
+
+        Args:
+            db_path: SQLite file (default: GITHUB_PR_STORE_PATH or cache/github_pr_history.sqlite3)
+        """
+        self.logger = LogManager.get_instance().get_logger("PrHistoryStore")
+        self.db_path = db_path or os.getenv(
+            "GITHUB_PR_STORE_PATH",
+            os.path.join(os.path.dirname(__file__), "../../../cache/github_pr_history.sqlite3"),
+        )
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def get_sync_since(self, repo: str, since_iso: str | None) -> str:
+        """Get the updatedAt cutoff a sync of a repository has to fetch from
+
+        Args:
+            repo: Repository as "owner/name"
+            since_iso: Start of the analysis window (None for the whole history)
+
+        Returns:
+            The watermark when the stored history covers the window, else the window start
+        """
+        window_start = _iso(since_iso or HISTORY_START)
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT watermark, synced_since FROM sync_state WHERE repo = ?", (repo,)).fetchone()
+        if row and row[1] <= window_start:
+            return max(row[0], window_start)
+        return window_start
+
+    def upsert(self, repo: str, prs: list[dict[str, Any]], synced_since: str) -> None:
+        """Store fetched PRs and advance the repository's watermark
+
+        Args:
+            repo: Repository as "owner/name"
+            prs: PRs updated since synced_since, as returned by the GraphQL client with approvers
+            synced_since: updatedAt cutoff the PRs were fetched from
+        """
+        pr_rows = []
+        review_rows = []
+        approval_rows = []
+        for pr in prs:
+            number = pr["number"]
+            pr_rows.append(
+                (
+                    repo,
+                    number,
+                    _iso(pr["updated_at"]),
+                    pr.get("created_at"),
+                    pr.get("merged_at"),
+                    pr.get("state"),
+                    (pr.get("user") or {}).get("login"),
+                    pr.get("review_rounds"),
+                    pr.get("synchronize_after_first_review"),
+                    pr.get("re_review_pushes"),
+                    json.dumps(pr),
+                )
+            )
+            review_rows.extend(
+                (repo, number, review.get("login"), review["state"], review.get("submitted_at"))
+                for review in pr.get("reviews") or []
+            )
+            approval_rows.extend(
+                (repo, number, approval["login"], approval.get("submitted_at"))
+                for approval in pr.get("latest_approvals") or []
+            )
+
+        watermark = max((row[2] for row in pr_rows), default=synced_since)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Reviews and approvals can be dismissed, so a refetched PR replaces all of them
+            refetched = [(repo, row[1]) for row in pr_rows]
+            conn.executemany("DELETE FROM reviews WHERE repo = ? AND number = ?", refetched)
+            conn.executemany("DELETE FROM approvals WHERE repo = ? AND number = ?", refetched)
+            conn.executemany("INSERT OR REPLACE INTO pull_requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", pr_rows)
+            conn.executemany("INSERT INTO reviews VALUES (?, ?, ?, ?, ?)", review_rows)
+            conn.executemany("INSERT OR REPLACE INTO approvals VALUES (?, ?, ?, ?)", approval_rows)
+            conn.execute(
+                "INSERT INTO sync_state (repo, watermark, synced_since, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (repo) DO UPDATE SET "
+                "watermark = MAX(watermark, excluded.watermark), "
+                "synced_since = MIN(synced_since, excluded.synced_since), synced_at = excluded.synced_at",
+                (repo, watermark, synced_since, datetime.now(UTC).isoformat()),
+            )
+            conn.execute("COMMIT")
+
+        self.logger.info(f"Stored {len(prs)} PRs for {repo} (watermark {watermark})")
+
+    def load(self, repo: str, since_iso: str | None = None, until_iso: str | None = None) -> list[dict[str, Any]]:
+        """Load stored PRs of a repository updated within a window, newest update first
+
+        Args:
+            repo: Repository as "owner/name"
+            since_iso: Oldest updatedAt (None for no lower bound)
+            until_iso: Newest updatedAt (None for no upper bound)
+        """
+        query = "SELECT data FROM pull_requests WHERE repo = ? AND updated_at >= ?"
+        params: list[Any] = [repo, _iso(since_iso or HISTORY_START)]
+        if until_iso:
+            query += " AND updated_at <= ?"
+            params.append(_iso(until_iso))
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " ORDER BY updated_at DESC, number DESC", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_statistics(self, repo: str) -> dict[str, Any]:
+        """Get stored record counts and sync state of a repository"""
+        with closing(self._connect()) as conn:
+            prs = conn.execute("SELECT COUNT(*) FROM pull_requests WHERE repo = ?", (repo,)).fetchone()[0]
+            reviews = conn.execute("SELECT COUNT(*) FROM reviews WHERE repo = ?", (repo,)).fetchone()[0]
+            approvals = conn.execute("SELECT COUNT(*) FROM approvals WHERE repo = ?", (repo,)).fetchone()[0]
+            state = conn.execute("SELECT watermark, synced_since FROM sync_state WHERE repo = ?", (repo,)).fetchone()
+        return {
+            "pull_requests": prs,
+            "reviews": reviews,
+            "approvals": approvals,
+            "watermark": state[0] if state else None,
+            "synced_since": state[1] if state else None,
+            "db_path": self.db_path,
+        }
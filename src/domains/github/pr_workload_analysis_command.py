@@ -144,6 +144,11 @@ class PrWorkloadAnalysisCommand(BaseCommand):
             help="Number of engineers on the team who can review PRs (default: 6)",
         )
 
+        parser.add_argument(
+            "--holidays",
+            help="File with holiday dates (YYYY-MM-DD, one per line) excluded from business-day metrics",
+        )
+
         # New flags for enhanced approver analysis compatibility
         parser.add_argument(
             "--include-approvers",
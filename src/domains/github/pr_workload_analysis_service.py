@@ -15,6 +15,7 @@ import matplotlib
 
 matplotlib.use("Agg")  # Set non-interactive backend before importing pyplot
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from utils.data.json_manager import JSONManager
@@ -23,27 +24,81 @@ from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
 
+def _utc_naive(values: pd.Series) -> pd.Series:
+    """Convert a datetime column to naive UTC so it maps onto numpy datetime64."""
+    if getattr(values.dtype, "tz", None) is not None:
+        return values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return values
+
+
+def business_duration_days(start: pd.Series, end: pd.Series, calendar: np.busdaycalendar | None = None) -> pd.Series:
+    """Elapsed business time between two datetime columns, in fractional days.
+
+    Weekends and calendar holidays count as zero; the first and last day count the hours
+    actually elapsed on them when they are business days. Computed column-wise with
+    numpy.busday_count. Rows with a missing timestamp, or ending before they start, are NaN.
+    """
+    calendar = calendar or np.busdaycalendar()
+    start = pd.to_datetime(_utc_naive(start))
+    end = pd.to_datetime(_utc_naive(end))
+    valid = (start.notna() & end.notna() & (end >= start)).to_numpy()
+
+    starts = start.to_numpy("datetime64[ns]")[valid]
+    ends = end.to_numpy("datetime64[ns]")[valid]
+    start_days = starts.astype("datetime64[D]")
+    end_days = ends.astype("datetime64[D]")
+    one_day = np.timedelta64(1, "D")
+    zero = np.timedelta64(0, "ns")
+    same_day = start_days == end_days
+
+    # Whole business days strictly between the first and the last day
+    full_days = np.where(
+        same_day,
+        0,
+        np.busday_count(start_days + one_day, np.maximum(end_days, start_days + one_day), busdaycal=calendar),
+    )
+    first_day = np.where(same_day, ends - starts, (start_days + one_day) - starts)
+    first_day = np.where(np.is_busday(start_days, busdaycal=calendar), first_day, zero)
+    last_day = np.where(~same_day & np.is_busday(end_days, busdaycal=calendar), ends - end_days, zero)
+
+    result = np.full(len(start), np.nan)
+    result[valid] = full_days + (first_day + last_day) / np.timedelta64(1, "D")
+    return pd.Series(result, index=start.index)
+
+
 class PrWorkloadAnalysisService:
     """Service for analyzing PR workload data and evaluating CODEOWNERS pressure."""
 
     def __init__(self):
         self.logger = LogManager.get_instance().get_logger("PrWorkloadAnalysisService")
+        # Weekend-only calendar until a holiday file is loaded (--holidays)
+        self.business_calendar = np.busdaycalendar()
 
-    def _calculate_business_days(self, start_date: pd.Timestamp, end_date: pd.Timestamp) -> int:
-        """Calculate the number of business days between two dates (excluding weekends)."""
-        if pd.isna(start_date) or pd.isna(end_date):
-            return 0
+    def _load_business_calendar(self, holidays_file: str | None) -> np.busdaycalendar:
+        """Build the business-day calendar, excluding holidays listed one date (YYYY-MM-DD) per line."""
+        if not holidays_file:
+            return np.busdaycalendar()
 
-        # Use pandas bdate_range to get business days
-        business_days = len(pd.bdate_range(start=start_date.date(), end=end_date.date()))
-        return max(business_days - 1, 0)  # Subtract 1 to get the count of days in between
+        with open(holidays_file, encoding="utf-8") as f:
+            dates = [line.split(",")[0].strip() for line in f if line.strip() and not line.startswith("#")]
+        holidays = pd.to_datetime(dates, errors="coerce").dropna()
+        self.logger.info(f"Loaded {len(holidays)} holidays from {holidays_file}")
+        return np.busdaycalendar(holidays=holidays.to_numpy().astype("datetime64[D]"))
 
     def _get_date_range_business_days(self, start_date: pd.Timestamp, end_date: pd.Timestamp) -> int:
-        """Get the number of business days in a date range."""
+        """Get the number of business days in a date range (both ends included)."""
         if pd.isna(start_date) or pd.isna(end_date):
             return 0
 
-        return len(pd.bdate_range(start=start_date.date(), end=end_date.date()))
+        start_day = np.datetime64(start_date.date(), "D")
+        end_day = np.datetime64(end_date.date(), "D") + np.timedelta64(1, "D")
+        return max(int(np.busday_count(start_day, end_day, busdaycal=self.business_calendar)), 0)
+
+    def _get_monthly_business_days(self, months: pd.Series) -> np.ndarray:
+        """Get the number of business days of each month in a Period[M] column."""
+        month_starts = months.dt.start_time.to_numpy().astype("datetime64[D]")
+        next_month_starts = (months + 1).dt.start_time.to_numpy().astype("datetime64[D]")
+        return np.busday_count(month_starts, next_month_starts, busdaycal=self.business_calendar)
 
     def _calculate_monthly_work_day_rate(self, month_period: pd.Period, pr_count: int) -> float:
         """Calculate PRs per work day for a specific month."""
@@ -164,6 +219,7 @@ class PrWorkloadAnalysisService:
         """
         try:
             self.logger.info("Starting PR workload analysis")
+            self.business_calendar = self._load_business_calendar(getattr(args, "holidays", None))
 
             # Step 1: Load and validate data
             pr_data = self._load_pr_data(args.file, args.date_format)
@@ -369,6 +425,20 @@ class PrWorkloadAnalysisService:
         df["pr_size"] = df.get("additions", 0) + df.get("deletions", 0)
         df["month_year"] = df["created_at"].dt.to_period("M")
 
+        # Business-time metrics (weekends and holidays excluded); NaN for unmerged/unreviewed PRs
+        if "merged_at" in df.columns:
+            df["lead_time_business_days"] = business_duration_days(
+                df["created_at"], df["merged_at"], self.business_calendar
+            )
+        if "time_to_first_review_seconds" in df.columns:
+            first_review_seconds = pd.to_numeric(df["time_to_first_review_seconds"], errors="coerce")
+            first_review_at = df["created_at"] + pd.to_timedelta(
+                first_review_seconds.where(first_review_seconds > 0), "s"
+            )
+            df["time_to_first_review_business_hours"] = (
+                business_duration_days(df["created_at"], first_review_at, self.business_calendar) * 24
+            )
+
         # Fill missing numeric values with 0
         numeric_fields = [
             "lead_time_days",
@@ -434,9 +504,8 @@ class PrWorkloadAnalysisService:
         )
 
         # Calculate work-days per PR creation rate (using business days)
-        monthly_stats["prs_per_work_day"] = monthly_stats.apply(
-            lambda row: self._calculate_monthly_work_day_rate(row["month_year"], row["pr_count"]),
-            axis=1,
+        monthly_stats["prs_per_work_day"] = monthly_stats["pr_count"] / np.maximum(
+            self._get_monthly_business_days(monthly_stats["month_year"]), 1
         )
 
         # Separate team member vs external trends
@@ -637,6 +706,15 @@ class PrWorkloadAnalysisService:
             "avg_time_to_first_review_hours": avg_time_to_first_review_hours,
             "median_time_to_first_review_hours": median_time_to_first_review_hours,
             "p95_time_to_first_review_hours": p95_time_to_first_review_hours,
+            "external_avg_lead_time_business_days": external_prs.get(
+                "lead_time_business_days", pd.Series(dtype=float)
+            ).mean(),
+            "external_median_lead_time_business_days": external_prs.get(
+                "lead_time_business_days", pd.Series(dtype=float)
+            ).median(),
+            "avg_time_to_first_review_business_hours": external_prs.get(
+                "time_to_first_review_business_hours", pd.Series(dtype=float)
+            ).mean(),
             "avg_review_rounds": avg_review_rounds,
             "avg_synchronize_events_after_review": avg_synchronize_events,
             "avg_re_review_pushes": avg_re_review_pushes,
@@ -1539,8 +1617,13 @@ class PrWorkloadAnalysisService:
             min_date = external_prs["created_at"].min()
             max_date = external_prs["created_at"].max()
 
-            # Create business day range
-            business_days = pd.bdate_range(start=min_date.date(), end=max_date.date())
+            # Create business day range (weekends and holidays excluded)
+            business_days = pd.bdate_range(
+                start=min_date.date(),
+                end=max_date.date(),
+                freq="C",
+                holidays=list(self.business_calendar.holidays),
+            )
 
             # Count PRs per work day
             external_prs_copy = external_prs.copy()
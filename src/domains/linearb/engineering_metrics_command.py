@@ -7,6 +7,7 @@ from utils.command.base_command import BaseCommand
 from utils.env_loader import ensure_linearb_env_loaded
 from utils.logging.logging_manager import LogManager
 
+from .linearb_api_client import DEFAULT_CHUNK_CONCURRENCY
 from .linearb_service import LinearBService
 
 
@@ -58,6 +59,10 @@ Examples:
   python src/main.py linearb engineering-metrics --time-range last-week \\
     --granularity 1d --filter-type contributor
 
+  # Yearly metrics fetched as concurrent monthly chunks (re-runs only fetch the open month)
+  python src/main.py linearb engineering-metrics --time-range 365-days \\
+    --granularity 1mo --chunk month
+
   # Save to custom output folder
   python src/main.py linearb engineering-metrics --time-range last-week \\
     --output-folder reports/engineering
@@ -128,6 +133,23 @@ Examples:
             help="Folder where the report will be saved (default: output)",
         )
 
+        parser.add_argument(
+            "--chunk",
+            type=str,
+            choices=["week", "month"],
+            help="Split long time ranges into week/month chunks fetched concurrently; "
+            "closed chunks are cached permanently. With the custom roll up only additive counts "
+            "are chunked; averages, percentiles and distinct counts (including cycle time, time to PR, "
+            "time to review and time to merge) still take one whole-range request",
+        )
+
+        parser.add_argument(
+            "--max-concurrency",
+            type=int,
+            default=DEFAULT_CHUNK_CONCURRENCY,
+            help=f"Maximum concurrent requests with --chunk (default: {DEFAULT_CHUNK_CONCURRENCY})",
+        )
+
     @staticmethod
     def main(args: Namespace):
         """Execute the engineering metrics command."""
@@ -74,6 +74,16 @@ Available time ranges:
             ),
         )
 
+        parser.add_argument(
+            "--chunk",
+            type=str,
+            choices=["week", "month"],
+            help="Split long time ranges into week/month chunks fetched concurrently; "
+            "closed chunks are cached permanently. With the custom roll up only additive counts "
+            "are chunked; averages, percentiles and distinct counts (including cycle time, time to PR, "
+            "time to review and time to merge) still take one whole-range request",
+        )
+
         parser.add_argument(
             "--output-file",
             type=str,
@@ -117,6 +127,7 @@ Available time ranges:
                 time_range=args.time_range,
                 pr_threshold=args.pr_threshold,
                 verbose=args.verbose,
+                chunk=args.chunk,
             )
 
             # Display summary in the specified format
@@ -37,6 +37,7 @@ class KnowledgeSharingMetricsService:
         time_range: str,
         pr_threshold: int = 5,
         verbose: bool = False,
+        chunk: str | None = None,
     ) -> dict[str, Any]:
         """Get knowledge sharing metrics for teams.
 
@@ -45,6 +46,7 @@ class KnowledgeSharingMetricsService:
             time_range: Time period (last-week, last-month, last-2-weeks, custom dates)
             pr_threshold: Minimum PRs for inclusion (default: 5)
             verbose: Enable detailed output
+            chunk: Fetch the range in concurrent week/month chunks (None for one request)
 
         Returns:
             Knowledge sharing metrics data
@@ -74,7 +76,7 @@ class KnowledgeSharingMetricsService:
                 return cached_data
 
             # Fetch PR metrics from LinearB API
-            metrics_data = self._fetch_pr_metrics(team_ids_int, start_date, end_date, pr_threshold)
+            metrics_data = self._fetch_pr_metrics(team_ids_int, start_date, end_date, pr_threshold, chunk=chunk)
 
             # Process metrics to calculate knowledge sharing indicators
             results = self._calculate_knowledge_sharing_metrics(
@@ -97,6 +99,7 @@ class KnowledgeSharingMetricsService:
         start_date: datetime,
         end_date: datetime,
         pr_threshold: int,
+        chunk: str | None = None,
     ) -> dict[str, Any]:
         """Fetch PR metrics from LinearB API.
 
@@ -105,6 +108,7 @@ class KnowledgeSharingMetricsService:
             start_date: Start date for metrics
             end_date: End date for metrics
             pr_threshold: Minimum PRs for inclusion
+            chunk: Fetch the range in concurrent week/month chunks (None for one request)
 
         Returns:
             Raw metrics data from LinearB API
@@ -133,14 +137,26 @@ class KnowledgeSharingMetricsService:
             self.logger.info(f"Fetching PR metrics for teams: {team_ids}")
             self.logger.info(f"Time range: {start_date} to {end_date}")
 
-            # Get metrics from LinearB API
-            metrics_data = self.linearb_client.get_metrics(
-                requested_metrics=requested_metrics,
-                time_ranges=time_ranges,
-                group_by=LinearBGroupBy.CONTRIBUTOR,
-                team_ids=team_ids,
-                roll_up=LinearBRollup.CUSTOM,
-            )
+            # Get metrics from LinearB API; with chunking, review and PR counts are summed
+            # across chunks while PRs reviewed (a distinct count) and the average review
+            # time are still computed over the whole range
+            if chunk:
+                metrics_data = self.linearb_client.get_metrics_chunked(
+                    requested_metrics=requested_metrics,
+                    time_ranges=time_ranges,
+                    group_by=LinearBGroupBy.CONTRIBUTOR,
+                    team_ids=team_ids,
+                    roll_up=LinearBRollup.CUSTOM,
+                    chunk=chunk,
+                )
+            else:
+                metrics_data = self.linearb_client.get_metrics(
+                    requested_metrics=requested_metrics,
+                    time_ranges=time_ranges,
+                    group_by=LinearBGroupBy.CONTRIBUTOR,
+                    team_ids=team_ids,
+                    roll_up=LinearBRollup.CUSTOM,
+                )
 
             self.logger.info(f"Retrieved metrics for {len(metrics_data)} contributors")
             return metrics_data
@@ -1,14 +1,26 @@
 """LinearB API Client for performance metrics and team analytics."""
 
+import calendar
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import requests  # type: ignore
 
 from utils.cache_manager.cache_manager import CacheManager
+from utils.http.shared_budget import SharedRateBudget, budget_key
 from utils.logging.logging_manager import LogManager
 
+# Requests in flight when a long time range is fetched in chunks
+DEFAULT_CHUNK_CONCURRENCY = 4
+
+# Chunks that ended at least this many days ago no longer change and are cached without expiration
+CLOSED_CHUNK_LAG_DAYS = 2
+
+# Fields identifying the entity of a metrics row
+_ENTITY_FIELDS = ("id", "name", "type")
+
 
 class LinearBApiClient:
     """Enhanced LinearB API client for retrieving performance metrics and team data."""
@@ -24,6 +36,8 @@ class LinearBApiClient:
             raise ValueError("LINEARB_API_KEY environment variable is required")
 
         self.headers = {"x-api-key": self.api_key, "Content-Type": "application/json"}
+        self.budget = SharedRateBudget.get_instance()
+        self.budget_key = budget_key(self.base_url, self.api_key)
 
         # Initialize helper classes
         self.metrics_manager = LinearBMetricsManager()
@@ -35,7 +49,7 @@ class LinearBApiClient:
         endpoint: str,
         data: dict | None = None,
         cache_key: str | None = None,
-        cache_expiration: int = 60,
+        cache_expiration: int | None = 60,
     ) -> dict[str, Any]:
         """Make a request to the LinearB API with enhanced caching and error handling.
 
@@ -44,7 +58,7 @@ class LinearBApiClient:
             endpoint: API endpoint
             data: Request payload for POST requests
             cache_key: Cache key for storing results
-            cache_expiration: Cache expiration in minutes
+            cache_expiration: Cache expiration in minutes (None: never expires)
 
         Returns:
             API response data
@@ -68,12 +82,15 @@ class LinearBApiClient:
             # Add timeout to prevent hanging
             timeout = 30  # 30 seconds timeout
 
+            if method.upper() not in ("GET", "POST"):
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            self.budget.acquire(self.budget_key)
             if method.upper() == "GET":
                 response = requests.get(url, headers=self.headers, timeout=timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=timeout)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                response = requests.post(url, headers=self.headers, json=data, timeout=timeout)
+            self.budget.record(self.budget_key, response.status_code, response.headers)
 
             # Enhanced error handling based on LinearB API behavior
             if response.status_code == 202:
@@ -189,7 +206,8 @@ class LinearBApiClient:
             param_str = "&".join([f"{k}={v}" for k, v in params.items()])
             endpoint += f"?{param_str}"
 
-        cache_key = f"linearb_teams_{hash(str(params))}"
+        # Content-addressed key: stable across processes, unlike the salted built-in hash()
+        cache_key = self.cache.generate_cache_key("linearb_teams", **params)
         return self._make_request("GET", endpoint, cache_key=cache_key, cache_expiration=120)
 
     def get_metrics(
@@ -201,6 +219,8 @@ class LinearBApiClient:
         contributor_ids: list[int] | None = None,
         repository_ids: list[int] | None = None,
         roll_up: str = "custom",
+        *,
+        cache_expiration: int | None = 60,
     ) -> dict[str, Any]:
         """Get performance metrics from LinearB.
 
@@ -212,6 +232,7 @@ class LinearBApiClient:
             contributor_ids: Optional list of contributor IDs to filter by
             repository_ids: Optional list of repository IDs to filter by
             roll_up: Roll up period (1d, 1w, 1mo, custom)
+            cache_expiration: Cache expiration in minutes (None: never expires)
 
         Returns:
             Metrics data
@@ -232,8 +253,143 @@ class LinearBApiClient:
         if repository_ids:
             payload["repository_ids"] = [str(rid) for rid in repository_ids]
 
-        cache_key = f"linearb_metrics_{hash(str(payload))}"
-        return self._make_request("POST", endpoint, data=payload, cache_key=cache_key, cache_expiration=60)
+        cache_key = self.cache.generate_cache_key("linearb_metrics", **payload)
+        return self._make_request(
+            "POST", endpoint, data=payload, cache_key=cache_key, cache_expiration=cache_expiration
+        )
+
+    def get_metrics_chunked(
+        self,
+        requested_metrics: list[dict[str, Any]],
+        time_ranges: list[dict[str, str]],
+        group_by: str = "team",
+        team_ids: list[int] | None = None,
+        contributor_ids: list[int] | None = None,
+        repository_ids: list[int] | None = None,
+        roll_up: str = "custom",
+        *,
+        chunk: str = "month",
+        max_concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    ) -> list[dict[str, Any]]:
+        """Get metrics for long time ranges by fetching week/month chunks concurrently.
+
+        With a 1d/1w/1mo roll up every chunk covers whole roll up periods, so the periods
+        of all chunks are simply concatenated. With the custom roll up (one period per time
+        range) only additive counts are fetched per chunk and summed. Averages, percentiles,
+        ratios and distinct counts cannot be rebuilt from per-chunk values and are fetched
+        in one request for the whole range. That includes the time metrics (cycle time,
+        time to PR, time to review, time to merge): percentiles of chunks cannot be
+        combined, and a count-weighted mean would need the number of branches behind each
+        chunk's value, which the response does not carry. For them chunking only helps
+        with the 1d/1w/1mo roll ups.
+
+        Chunks that ended at least CLOSED_CHUNK_LAG_DAYS ago are cached without expiration,
+        so a re-run only requests the chunk that is still open. The whole-range request
+        gets the same treatment only when the whole range is closed; a range reaching the
+        last few days is fetched again in full once its 60 minute cache expires.
+
+        Args:
+            requested_metrics: List of metrics to fetch
+            time_ranges: List of time ranges to query
+            group_by: Group by field (organization, team, contributor, repository, label)
+            team_ids: Optional list of team IDs to filter by
+            contributor_ids: Optional list of contributor IDs to filter by
+            repository_ids: Optional list of repository IDs to filter by
+            roll_up: Roll up period (1d, 1w, 1mo, custom)
+            chunk: Chunk size (week, month)
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            Time periods in the format returned by get_metrics, ordered by start date
+        """
+        if roll_up == LinearBRollup.CUSTOM:
+            additive_names = set(self.metrics_manager.get_additive_metrics())
+            chunked_metrics = [m for m in requested_metrics if m["name"] in additive_names]
+            whole_range_metrics = [m for m in requested_metrics if m["name"] not in additive_names]
+        else:
+            chunked_metrics, whole_range_metrics = requested_metrics, []
+
+        # (range index, time range, metrics, whether the range is a chunk)
+        requests_to_make: list[tuple[int, dict[str, str], list[dict[str, Any]], bool]] = []
+        for index, time_range in enumerate(time_ranges):
+            if chunked_metrics:
+                for chunk_range in self.time_helper.split_time_range(time_range, chunk, roll_up):
+                    requests_to_make.append((index, chunk_range, chunked_metrics, True))
+            if whole_range_metrics:
+                requests_to_make.append((index, time_range, whole_range_metrics, False))
+
+        self.logger.info(
+            f"Fetching {len(time_ranges)} time range(s) as {len(requests_to_make)} requests "
+            f"({chunk} chunks, up to {max_concurrency} concurrent)"
+        )
+
+        def _fetch(request: tuple[int, dict[str, str], list[dict[str, Any]], bool]) -> list[dict[str, Any]]:
+            _, time_range, metrics, _ = request
+            data = self.get_metrics(
+                requested_metrics=metrics,
+                time_ranges=[time_range],
+                group_by=group_by,
+                team_ids=team_ids,
+                contributor_ids=contributor_ids,
+                repository_ids=repository_ids,
+                roll_up=roll_up,
+                cache_expiration=None if self.time_helper.is_closed(time_range) else 60,
+            )
+            # 204 responses come back as {"detail": ..., "data": []}
+            return data if isinstance(data, list) else []
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="linearb") as executor:
+            results = list(executor.map(_fetch, requests_to_make))
+
+        if roll_up != LinearBRollup.CUSTOM:
+            periods = [period for periods_of_chunk in results for period in periods_of_chunk]
+            return sorted(periods, key=lambda period: period.get("after", ""))
+
+        merged = []
+        for index, time_range in enumerate(time_ranges):
+            chunk_periods = [
+                period
+                for (range_index, _, _, is_chunk), periods in zip(requests_to_make, results, strict=True)
+                if range_index == index and is_chunk
+                for period in periods
+            ]
+            whole_periods = [
+                period
+                for (range_index, _, _, is_chunk), periods in zip(requests_to_make, results, strict=True)
+                if range_index == index and not is_chunk
+                for period in periods
+            ]
+            merged.append(
+                {
+                    **time_range,
+                    "metrics": self._merge_metric_rows(
+                        [row for period in whole_periods for row in period.get("metrics", [])],
+                        [row for period in chunk_periods for row in period.get("metrics", [])],
+                    ),
+                }
+            )
+        return merged
+
+    @staticmethod
+    def _merge_metric_rows(base_rows: list[dict[str, Any]], additive_rows: list[dict[str, Any]]) -> list[dict]:
+        """Sum additive metric rows per entity on top of the rows fetched for the whole range."""
+        merged: dict[tuple, dict[str, Any]] = {}
+        for row in base_rows:
+            merged[tuple(row.get(field) for field in _ENTITY_FIELDS)] = dict(row)
+
+        for row in additive_rows:
+            entity = merged.setdefault(
+                tuple(row.get(field) for field in _ENTITY_FIELDS),
+                {field: row[field] for field in _ENTITY_FIELDS if field in row},
+            )
+            for key, value in row.items():
+                if key in _ENTITY_FIELDS or not isinstance(value, int | float):
+                    entity.setdefault(key, value)
+                    continue
+                current = entity.get(key)
+                entity[key] = value if current is None else current + value
+
+        return list(merged.values())
 
     def export_metrics(
         self,
@@ -347,7 +503,10 @@ class LinearBApiClient:
         aggregation: str = "default",
         group_by: str = "team",
         roll_up: str = "custom",
-    ) -> dict[str, Any]:
+        *,
+        chunk: str | None = None,
+        max_concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
         """Get performance metrics with simplified interface.
 
         Args:
@@ -356,6 +515,8 @@ class LinearBApiClient:
             aggregation: Aggregation type (default, p75, p50, avg)
             group_by: Group by field (organization, team, contributor, repository)
             roll_up: Roll up period (1d, 1w, 1mo, custom)
+            chunk: Fetch the range in concurrent week/month chunks (None for one request)
+            max_concurrency: Maximum requests in flight when chunking
 
         Returns:
             Performance metrics data
@@ -363,6 +524,17 @@ class LinearBApiClient:
         time_ranges = self.time_helper.parse_time_period(time_period)
         metrics = self.metrics_manager.get_default_performance_metrics(aggregation)
 
+        if chunk:
+            return self.get_metrics_chunked(
+                requested_metrics=metrics,
+                time_ranges=time_ranges,
+                group_by=group_by,
+                team_ids=team_ids,
+                roll_up=roll_up,
+                chunk=chunk,
+                max_concurrency=max_concurrency,
+            )
+
         return self.get_metrics(
             requested_metrics=metrics,
             time_ranges=time_ranges,
@@ -561,6 +733,62 @@ class LinearBTimeRangeHelper:
         else:
             raise ValueError(f"Unsupported time period format: {time_period}")
 
+    @staticmethod
+    def split_time_range(time_range: dict[str, str], chunk: str = "month", roll_up: str = "custom") -> list[dict]:
+        """Split a time range into consecutive week or month chunks.
+
+        For the custom and daily roll ups chunks follow the calendar (weeks start on
+        Monday, months on the 1st), so closed chunks keep the same boundaries and cache
+        keys from one run to the next. For weekly and monthly roll ups chunks are whole
+        roll up periods counted from the range start, so no period is split.
+
+        Both dates of a LinearB time range are inclusive (a one-day range has after ==
+        before), so chunks do not overlap: each one ends the day before the next starts
+        and no day is counted twice when chunk counts are summed.
+
+        Args:
+            time_range: Time range with 'after' and 'before' dates (YYYY-MM-DD)
+            chunk: Chunk size (week, month)
+            roll_up: Roll up period of the request (1d, 1w, 1mo, custom)
+
+        Returns:
+            Non-overlapping time ranges covering the input range
+        """
+        if chunk not in ("week", "month"):
+            raise ValueError(f"Unsupported chunk size: {chunk}. Use 'week' or 'month'")
+
+        start = datetime.strptime(time_range["after"], "%Y-%m-%d").date()
+        end = datetime.strptime(time_range["before"], "%Y-%m-%d").date()
+
+        def _add_months(day: date, months: int) -> date:
+            month_index = day.month - 1 + months
+            year, month = day.year + month_index // 12, month_index % 12 + 1
+            return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+        def _next_boundary(current: date, step: int) -> date:
+            if roll_up == LinearBRollup.WEEKLY:
+                return start + timedelta(weeks=(step + 1) * (4 if chunk == "month" else 1))
+            if roll_up == LinearBRollup.MONTHLY:
+                return _add_months(start, step + 1)
+            if chunk == "week":
+                return current + timedelta(days=7 - current.weekday())
+            return _add_months(current.replace(day=1), 1)
+
+        chunks = []
+        current, step = start, 0
+        while current <= end:
+            boundary = _next_boundary(current, step)
+            last_day = min(boundary - timedelta(days=1), end)
+            chunks.append({"after": current.strftime("%Y-%m-%d"), "before": last_day.strftime("%Y-%m-%d")})
+            current, step = boundary, step + 1
+        return chunks or [dict(time_range)]
+
+    @staticmethod
+    def is_closed(time_range: dict[str, str]) -> bool:
+        """Check whether a time range ended long enough ago that its metrics no longer change."""
+        before = datetime.strptime(time_range["before"], "%Y-%m-%d").date()
+        return before <= date.today() - timedelta(days=CLOSED_CHUNK_LAG_DAYS)
+
     @staticmethod
     def create_time_range(after: str, before: str) -> dict[str, str]:
         """Create a single time range dictionary.
@@ -756,6 +984,22 @@ class LinearBMetricsManager:
             cls.PM_CFR_ISSUES_DONE,
         ]
 
+    @classmethod
+    def get_additive_metrics(cls) -> list[str]:
+        """Get count metrics whose values over a range are the sum of their values over its parts.
+
+        Distinct counts (PRs reviewed, involved repositories) and state snapshots
+        (active/done branches) are excluded even though they are counts: a PR reviewed in
+        two chunks would be counted twice.
+        """
+        non_additive = {
+            cls.PR_REVIEWED,
+            cls.COMMIT_INVOLVED_REPOS,
+            cls.BRANCH_STATE_DONE,
+            cls.BRANCH_STATE_ACTIVE,
+        }
+        return [name for name in cls.get_metrics_count_only() if name not in non_additive]
+
 
 # Backward compatibility - Keep original class name as alias
 class LinearBMetrics(LinearBMetricsManager):
@@ -9,6 +9,7 @@ from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
 from .linearb_api_client import (
+    DEFAULT_CHUNK_CONCURRENCY,
     LinearBAggregation,
     LinearBApiClient,
     LinearBGroupBy,
@@ -84,6 +85,8 @@ class LinearBService:
                 aggregation=aggregation,
                 group_by=group_by,
                 roll_up=roll_up,
+                chunk=getattr(args, "chunk", None),
+                max_concurrency=getattr(args, "max_concurrency", DEFAULT_CHUNK_CONCURRENCY),
             )
 
             self.logger.info(f"Retrieved {len(metrics_data)} metric time periods")
@@ -98,6 +101,7 @@ class LinearBService:
                     "group_by": group_by,
                     "roll_up": roll_up,
                     "aggregation": aggregation,
+                    "chunk": getattr(args, "chunk", None),
                 },
                 "time_ranges": self.api_client.time_helper.parse_time_period(args.time_range),
             }
@@ -511,14 +515,27 @@ class LinearBService:
         try:
             self.logger.info("Fetching engineering metrics from LinearB API")
 
-            # Fetch all metrics in one API call
-            metrics_data = self.api_client.get_metrics(
-                requested_metrics=metrics,
-                time_ranges=time_ranges,
-                group_by=group_by,
-                team_ids=team_ids,
-                roll_up=roll_up,
-            )
+            chunk = getattr(args, "chunk", None)
+            if chunk:
+                # Long ranges: concurrent week/month chunks, closed chunks served from cache
+                metrics_data = self.api_client.get_metrics_chunked(
+                    requested_metrics=metrics,
+                    time_ranges=time_ranges,
+                    group_by=group_by,
+                    team_ids=team_ids,
+                    roll_up=roll_up,
+                    chunk=chunk,
+                    max_concurrency=getattr(args, "max_concurrency", DEFAULT_CHUNK_CONCURRENCY),
+                )
+            else:
+                # Fetch all metrics in one API call
+                metrics_data = self.api_client.get_metrics(
+                    requested_metrics=metrics,
+                    time_ranges=time_ranges,
+                    group_by=group_by,
+                    team_ids=team_ids,
+                    roll_up=roll_up,
+                )
 
             if not metrics_data:
                 self.logger.warning("No metrics data retrieved")
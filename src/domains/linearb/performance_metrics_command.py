@@ -6,6 +6,7 @@ from utils.command.base_command import BaseCommand
 from utils.env_loader import ensure_linearb_env_loaded
 from utils.logging.logging_manager import LogManager
 
+from .linearb_api_client import DEFAULT_CHUNK_CONCURRENCY
 from .linearb_service import LinearBService
 
 
@@ -47,6 +48,10 @@ Examples:
   python src/main.py linearb performance-metrics --granularity custom \\
     --time-range 2025-07-15,2025-07-22 --team-ids 41576
 
+  # Get a year of monthly performance as concurrent monthly chunks
+  python src/main.py linearb performance-metrics --granularity 1mo \\
+    --time-range 365-days --chunk month --max-concurrency 4
+
 Available team IDs:
   - 19767: Core Services Tribe
   - 41576: Farm Operations Team
@@ -85,6 +90,23 @@ Available aggregations: p75, avg, p50
             ),
         )
 
+        parser.add_argument(
+            "--chunk",
+            type=str,
+            choices=["week", "month"],
+            help="Split long time ranges into week/month chunks fetched concurrently; "
+            "closed chunks are cached permanently. With the custom roll up only additive counts "
+            "are chunked; averages, percentiles and distinct counts (including cycle time, time to PR, "
+            "time to review and time to merge) still take one whole-range request",
+        )
+
+        parser.add_argument(
+            "--max-concurrency",
+            type=int,
+            default=DEFAULT_CHUNK_CONCURRENCY,
+            help=f"Maximum concurrent requests with --chunk (default: {DEFAULT_CHUNK_CONCURRENCY})",
+        )
+
         parser.add_argument(
             "--filter-type",
             type=str,
@@ -1,8 +1,11 @@
 import os
 import uuid
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
+
 from domains.personal_finance.nfce.models.invoice_data import (
     EstablishmentData,
     InvoiceData,
@@ -12,6 +15,58 @@ from domains.personal_finance.nfce.utils.cnae_classifier import CNAEClassifier
 from utils.data.duckdb_manager import DuckDBManager
 from utils.logging.logging_manager import LogManager
 
+# Name under which batch rows are registered while a set-based statement runs
+_STAGING_TABLE = "staged"
+
+# Arrow schemas for staged batches; pinned so all-NULL columns still bind to the table types
+_ESTABLISHMENT_BATCH_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("cnpj", pa.string()),
+        ("business_name", pa.string()),
+        ("establishment_type", pa.string()),
+        ("address", pa.string()),
+        ("city", pa.string()),
+        ("state", pa.string()),
+        ("cnae_code", pa.string()),
+        ("cnpj_root", pa.string()),
+        ("branch_number", pa.string()),
+        ("is_main_office", pa.bool_()),
+    ]
+)
+_PRODUCT_BATCH_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("establishment_id", pa.string()),
+        ("product_code", pa.string()),
+        ("description", pa.string()),
+        ("unit", pa.string()),
+        ("occurrences", pa.int32()),
+    ]
+)
+_INVOICE_BATCH_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("access_key", pa.string()),
+        ("invoice_number", pa.string()),
+        ("series", pa.string()),
+        ("issuer_cnpj", pa.string()),
+        ("issue_date", pa.timestamp("us")),
+        ("total_amount", pa.float64()),
+        ("items_count", pa.int32()),
+    ]
+)
+_INVOICE_ITEM_BATCH_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("access_key", pa.string()),
+        ("product_id", pa.string()),
+        ("quantity", pa.float64()),
+        ("unit_price", pa.float64()),
+        ("total_amount", pa.float64()),
+    ]
+)
+
 
 class NFCeDatabaseManager:
     """Database manager for NFCe data storage and retrieval
@@ -97,105 +152,163 @@ class NFCeDatabaseManager:
         try:
             conn = self.db_manager.get_connection("nfce_db")
 
-            # Start transaction
-            conn.begin()
+            # Check if invoice already exists
+            if self._invoice_exists(conn, invoice_data.access_key):
+                self.logger.debug(f"Invoice {invoice_data.access_key} already exists, skipping")
+                self.stats["invoices_skipped"] += 1
+                return False
 
-            try:
-                # Check if invoice already exists
-                if self._invoice_exists(conn, invoice_data.access_key):
-                    self.logger.debug(f"Invoice {invoice_data.access_key} already exists, skipping")
-                    self.stats["invoices_skipped"] += 1
-                    conn.rollback()
-                    return False
-
-                # Store establishment first (required for foreign key)
-                establishment_id = None
-                if invoice_data.establishment:
-                    establishment_id = self._store_establishment(conn, invoice_data.establishment)
-
-                # If no establishment or establishment couldn't be stored (empty CNPJ), create minimal one
-                if establishment_id is None:
-                    # Create minimal establishment from access key to satisfy foreign key constraint
-                    cnpj_from_key = (
-                        invoice_data.access_key[6:20]
-                        if invoice_data.access_key and len(invoice_data.access_key) >= 20
-                        else "00000000000000"
-                    )
+            # Don't re-raise storage errors, just return False
+            return self._store_in_transaction(conn, invoice_data) is None
 
-                    # Create minimal EstablishmentData object
-                    from domains.personal_finance.nfce.models.invoice_data import (
-                        EstablishmentData,
-                    )
+        except Exception as e:
+            self.logger.error(f"Database error storing invoice: {e}", exc_info=True)
+            return False
 
-                    minimal_establishment = EstablishmentData(
-                        cnpj=cnpj_from_key,
-                        business_name="[Nome não informado]",
-                        trade_name=None,
-                        address=None,
-                        city=None,
-                        state=None,
-                        zip_code=None,
-                        state_registration=None,
-                        phone=None,
-                        email=None,
-                    )
-                    establishment_id = self._store_establishment(conn, minimal_establishment)
-
-                # Store/update products and get product IDs
-                product_mappings = {}
-                if invoice_data.items:
-                    for item in invoice_data.items:
-                        product_id = self._store_product(conn, item, establishment_id)
-                        if product_id:
-                            # Map item to product ID for later use
-                            key = (
-                                item.barcode or "",
-                                item.product_code or "",
-                                item.description,
-                            )
-                            product_mappings[key] = product_id
-
-                # Store main invoice record
-                invoice_id = self._store_invoice(conn, invoice_data, establishment_id)
-
-                # Store invoice items
-                if invoice_data.items:
-                    self._store_invoice_items(conn, invoice_data, product_mappings)
-
-                # Tax information removed in simplified schema
-                # if invoice_data.taxes:
-                #     pass  # Removed in simplified schema
-
-                # Log successful processing
-                self._log_processing_result(conn, invoice_data, "success", None, 0)
-
-                # Commit transaction
-                conn.commit()
+    def store_invoices_batch(self, invoices: list[InvoiceData]) -> dict[str, Any]:
+        """Store many invoices with set-based upserts in a single transaction
+
+        Establishments, products, invoices, items and processing log rows are staged as Arrow
+        tables and written with one statement per table instead of one round trip per row.
+        If the batch transaction fails, the invoices are retried one transaction each so the
+        error is reported against the invoice that caused it.
+
+        Args:
+            invoices: Complete invoice data objects
+
+        Returns:
+            Dictionary with "stored" and "skipped" access keys and "errors", one entry
+            (index, access_key, error) per invoice that could not be stored
+        """
+        report: dict[str, Any] = {"stored": [], "skipped": [], "errors": []}
 
-                self.stats["invoices_inserted"] += 1
-                self.logger.info(f"Successfully stored invoice {invoice_data.access_key}")
-                return True
+        try:
+            conn = self.db_manager.get_connection("nfce_db")
+            pending = self._filter_new_invoices(conn, invoices, report)
+            if not pending:
+                return report
 
+            conn.begin()
+            try:
+                batch_stats = self._store_batch_records(conn, [invoice for _, invoice in pending])
+                self._log_processing_results_batch(conn, [invoice for _, invoice in pending])
+                conn.commit()
             except Exception as e:
                 conn.rollback()
-                self.logger.error(
-                    f"Error storing invoice {invoice_data.access_key}: {e}",
-                    exc_info=True,
-                )
+                self.logger.warning(f"Bulk upsert of {len(pending)} invoices failed, storing one by one: {e}")
 
-                # Log failed processing
-                try:
-                    self._log_processing_result(conn, invoice_data, "error", str(e), 0)
-                    conn.commit()
-                except Exception as log_error:
-                    self.logger.error(f"Error logging processing result: {log_error}")
+                for index, invoice_data in pending:
+                    error = self._store_in_transaction(conn, invoice_data)
+                    if error is None:
+                        report["stored"].append(invoice_data.access_key)
+                    else:
+                        report["errors"].append({"index": index, "access_key": invoice_data.access_key, "error": error})
+                return report
 
-                # Don't re-raise, just return False
-                return False
+            for key, value in batch_stats.items():
+                self.stats[key] += value
+            self.stats["invoices_inserted"] += len(pending)
+            report["stored"].extend(invoice_data.access_key for _, invoice_data in pending)
+            self.logger.info(f"Stored {len(pending)} invoices in one batch")
 
         except Exception as e:
-            self.logger.error(f"Database error storing invoice: {e}", exc_info=True)
-            return False
+            self.logger.error(f"Database error storing invoice batch: {e}", exc_info=True)
+            reported = set(report["stored"]) | set(report["skipped"])
+            report["errors"].extend(
+                {"index": index, "access_key": invoice_data.access_key, "error": str(e)}
+                for index, invoice_data in enumerate(invoices)
+                if invoice_data.access_key not in reported
+            )
+
+        return report
+
+    def _store_in_transaction(self, conn, invoice_data: InvoiceData) -> str | None:
+        """Store one invoice and its related entities in its own transaction
+
+        Returns:
+            None if stored, the error message otherwise
+        """
+        conn.begin()
+
+        try:
+            self._store_invoice_records(conn, invoice_data)
+
+            # Log successful processing
+            self._log_processing_result(conn, invoice_data, "success", None, 0)
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(
+                f"Error storing invoice {invoice_data.access_key}: {e}",
+                exc_info=True,
+            )
+
+            # Log failed processing
+            try:
+                self._log_processing_result(conn, invoice_data, "error", str(e), 0)
+                conn.commit()
+            except Exception as log_error:
+                self.logger.error(f"Error logging processing result: {log_error}")
+
+            return str(e)
+
+        self.stats["invoices_inserted"] += 1
+        self.logger.info(f"Successfully stored invoice {invoice_data.access_key}")
+        return None
+
+    def _store_invoice_records(self, conn, invoice_data: InvoiceData) -> str:
+        """Store establishment, products, invoice and items for one invoice"""
+        # Store establishment first (required for foreign key)
+        establishment_id = None
+        if invoice_data.establishment:
+            establishment_id = self._store_establishment(conn, invoice_data.establishment)
+
+        # If no establishment or establishment couldn't be stored (empty CNPJ), create minimal one
+        if establishment_id is None:
+            minimal_establishment = self._minimal_establishment(invoice_data.access_key)
+            establishment_id = self._store_establishment(conn, minimal_establishment)
+
+        # Store/update products and get product IDs
+        product_mappings = {}
+        if invoice_data.items:
+            for item in invoice_data.items:
+                product_id = self._store_product(conn, item, establishment_id)
+                if product_id:
+                    # Map item to product ID for later use
+                    key = (
+                        item.barcode or "",
+                        item.product_code or "",
+                        item.description,
+                    )
+                    product_mappings[key] = product_id
+
+        # Store main invoice record
+        invoice_id = self._store_invoice(conn, invoice_data, establishment_id)
+
+        # Store invoice items
+        if invoice_data.items:
+            self._store_invoice_items(conn, invoice_data, product_mappings)
+
+        return invoice_id
+
+    def _minimal_establishment(self, access_key: str) -> EstablishmentData:
+        """Create minimal establishment from access key to satisfy foreign key constraint"""
+        cnpj_from_key = access_key[6:20] if access_key and len(access_key) >= 20 else "00000000000000"
+
+        return EstablishmentData(
+            cnpj=cnpj_from_key,
+            business_name="[Nome não informado]",
+            trade_name=None,
+            address=None,
+            city=None,
+            state=None,
+            zip_code=None,
+            state_registration=None,
+            phone=None,
+            email=None,
+        )
 
     def _invoice_exists(self, conn, access_key: str) -> bool:
         """Check if invoice already exists in database"""
@@ -228,70 +341,8 @@ class NFCeDatabaseManager:
             cnae_code = None
 
             if not existing or not existing[1]:  # New establishment or missing type
-                # Verificar cache de sessão primeiro
-                if establishment.cnpj in self._cnae_session_cache:
-                    self.logger.info(f"Using session cache for CNPJ: {establishment.cnpj}")
-                    cnae_data = self._cnae_session_cache[establishment.cnpj]
-                else:
-                    # Verificar se existe cache para a matriz da empresa (mesma raiz CNPJ)
-                    cnpj_root = establishment.cnpj[:8]  # Primeiros 8 dígitos (raiz da empresa)
-                    cached_root_data = None
-
-                    # Primeiro verificar session cache
-                    for cached_cnpj, cached_data in self._cnae_session_cache.items():
-                        if cached_cnpj.startswith(cnpj_root) and cached_data is not None:
-                            self.logger.info(
-                                f"Using related company session cache for CNPJ: {establishment.cnpj} (from {cached_cnpj})"
-                            )
-                            cached_root_data = cached_data
-                            break
-
-                    # Se não encontrou no session cache, verificar no banco de dados
-                    if not cached_root_data:
-                        db_related = conn.execute(
-                            "SELECT cnae_code, establishment_type FROM establishments WHERE cnpj LIKE ? AND cnae_code IS NOT NULL AND establishment_type != 'Outros' LIMIT 1",
-                            [f"{cnpj_root}%"],
-                        ).fetchone()
-
-                        if db_related:
-                            self.logger.info(
-                                f"Using related company database data for CNPJ: {establishment.cnpj} (CNAE: {db_related[0]})"
-                            )
-                            # Criar objeto similar ao retornado pela API
-                            cached_root_data = {
-                                "cnae_principal": db_related[0],
-                                "establishment_type": db_related[1],
-                            }
-
-                    if cached_root_data:
-                        cnae_data = cached_root_data
-                        # Salvar no cache de sessão para este CNPJ específico
-                        self._cnae_session_cache[establishment.cnpj] = cnae_data
-                    else:
-                        self.logger.info(f"Getting CNAE classification for CNPJ: {establishment.cnpj}")
-                        cnae_data = self.cnae_classifier.get_establishment_info(establishment.cnpj)
-
-                        # Salvar no cache de sessão
-                        self._cnae_session_cache[establishment.cnpj] = cnae_data
-
-                if cnae_data:
-                    establishment_type = cnae_data.get("establishment_type", "Outros")
-                    cnae_code = cnae_data.get("cnae_principal")
-
-                    # Update establishment data with API data if more complete
-                    if cnae_data.get("business_name") and not establishment.business_name:
-                        establishment.business_name = cnae_data["business_name"]
-                    if cnae_data.get("address") and not establishment.address:
-                        establishment.address = cnae_data["address"]
-                    if cnae_data.get("city") and not establishment.city:
-                        establishment.city = cnae_data["city"]
-                    if cnae_data.get("state") and not establishment.state:
-                        establishment.state = cnae_data["state"]
-                else:
-                    establishment_type = "Outros"
-                    self.logger.warning(
-                        f"Could not classify establishment type for CNPJ: {establishment.cnpj} - API returned None"
-                    )
+                cnae_data = self._get_cnae_data(conn, establishment.cnpj)
+                establishment_type, cnae_code = self._apply_cnae_data(establishment, cnae_data)
 
             if existing:
                 # Update existing establishment
@@ -376,6 +427,71 @@ class NFCeDatabaseManager:
             self.logger.error(f"Error storing establishment {establishment.cnpj}: {e}")
             raise
 
+    def _get_cnae_data(self, conn, cnpj: str) -> dict[str, Any] | None:
+        """Get CNAE classification from session cache, a related establishment or the CNAE API"""
+        # Verificar cache de sessão primeiro
+        if cnpj in self._cnae_session_cache:
+            self.logger.info(f"Using session cache for CNPJ: {cnpj}")
+            return self._cnae_session_cache[cnpj]
+
+        # Verificar se existe cache para a matriz da empresa (mesma raiz CNPJ)
+        cnpj_root = cnpj[:8]  # Primeiros 8 dígitos (raiz da empresa)
+        cached_root_data = None
+
+        # Primeiro verificar session cache
+        for cached_cnpj, cached_data in self._cnae_session_cache.items():
+            if cached_cnpj.startswith(cnpj_root) and cached_data is not None:
+                self.logger.info(f"Using related company session cache for CNPJ: {cnpj} (from {cached_cnpj})")
+                cached_root_data = cached_data
+                break
+
+        # Se não encontrou no session cache, verificar no banco de dados
+        if not cached_root_data:
+            db_related = conn.execute(
+                "SELECT cnae_code, establishment_type FROM establishments WHERE cnpj LIKE ? AND cnae_code IS NOT NULL AND establishment_type != 'Outros' LIMIT 1",
+                [f"{cnpj_root}%"],
+            ).fetchone()
+
+            if db_related:
+                self.logger.info(f"Using related company database data for CNPJ: {cnpj} (CNAE: {db_related[0]})")
+                # Criar objeto similar ao retornado pela API
+                cached_root_data = {
+                    "cnae_principal": db_related[0],
+                    "establishment_type": db_related[1],
+                }
+
+        if cached_root_data:
+            cnae_data = cached_root_data
+        else:
+            self.logger.info(f"Getting CNAE classification for CNPJ: {cnpj}")
+            cnae_data = self.cnae_classifier.get_establishment_info(cnpj)
+
+        # Salvar no cache de sessão para este CNPJ específico
+        self._cnae_session_cache[cnpj] = cnae_data
+        return cnae_data
+
+    def _apply_cnae_data(
+        self, establishment: EstablishmentData, cnae_data: dict[str, Any] | None
+    ) -> tuple[str, str | None]:
+        """Fill missing establishment fields from CNAE data and return (establishment_type, cnae_code)"""
+        if not cnae_data:
+            self.logger.warning(
+                f"Could not classify establishment type for CNPJ: {establishment.cnpj} - API returned None"
+            )
+            return "Outros", None
+
+        # Update establishment data with API data if more complete
+        if cnae_data.get("business_name") and not establishment.business_name:
+            establishment.business_name = cnae_data["business_name"]
+        if cnae_data.get("address") and not establishment.address:
+            establishment.address = cnae_data["address"]
+        if cnae_data.get("city") and not establishment.city:
+            establishment.city = cnae_data["city"]
+        if cnae_data.get("state") and not establishment.state:
+            establishment.state = cnae_data["state"]
+
+        return cnae_data.get("establishment_type", "Outros"), cnae_data.get("cnae_principal")
+
     def _store_product(self, conn, item: ProductData, establishment_id: str) -> str | None:
         """Store or update product data with deduplication within the same establishment"""
         if not item.description:
@@ -576,6 +692,434 @@ class NFCeDatabaseManager:
             self.logger.error(f"Error logging processing result: {e}")
             # Don't raise - this is just for audit
 
+    def _filter_new_invoices(
+        self, conn, invoices: list[InvoiceData], report: dict[str, Any]
+    ) -> list[tuple[int, InvoiceData]]:
+        """Select (index, invoice) pairs that still need storing, recording skips and errors in report"""
+        access_keys = list({invoice_data.access_key for invoice_data in invoices if invoice_data.access_key})
+        existing = self._execute_staged(
+            conn,
+            "SELECT i.access_key FROM invoices i JOIN staged s ON i.access_key = s.access_key",
+            [{"access_key": access_key} for access_key in access_keys],
+            pa.schema([("access_key", pa.string())]),
+        )
+        existing_keys = {row[0] for row in existing}
+
+        pending = []
+        seen = set()
+        for index, invoice_data in enumerate(invoices):
+            access_key = invoice_data.access_key
+            if not access_key:
+                report["errors"].append({"index": index, "access_key": access_key, "error": "Missing access_key"})
+            elif access_key in existing_keys or access_key in seen:
+                self.logger.debug(f"Invoice {access_key} already exists, skipping")
+                self.stats["invoices_skipped"] += 1
+                report["skipped"].append(access_key)
+            else:
+                seen.add(access_key)
+                pending.append((index, invoice_data))
+
+        return pending
+
+    def _store_batch_records(self, conn, invoices: list[InvoiceData]) -> dict[str, int]:
+        """Upsert establishments and products, then insert invoices and items for a batch
+
+        Returns:
+            Statistics increments, applied by the caller once the transaction commits
+        """
+        batch_stats = dict.fromkeys(self.stats, 0)
+
+        # Normalize copies so the caller's establishment objects are left untouched
+        invoice_establishments = []
+        for invoice_data in invoices:
+            establishment = invoice_data.establishment
+            normalized_cnpj = self._normalize_cnpj(establishment.cnpj) if establishment else None
+            if not normalized_cnpj:
+                establishment = self._minimal_establishment(invoice_data.access_key)
+                normalized_cnpj = self._normalize_cnpj(establishment.cnpj)
+            invoice_establishments.append(replace(establishment, cnpj=normalized_cnpj))
+
+        establishment_ids = self._upsert_establishments_batch(conn, invoice_establishments, batch_stats)
+        product_ids = self._upsert_products_batch(
+            conn,
+            [
+                (invoice_data, establishment_ids[est.cnpj])
+                for invoice_data, est in zip(invoices, invoice_establishments, strict=True)
+            ],
+            batch_stats,
+        )
+
+        invoice_rows = [
+            {
+                "id": self._generate_id(),
+                "access_key": invoice_data.access_key,
+                "invoice_number": invoice_data.invoice_number,
+                "series": invoice_data.series,
+                "issuer_cnpj": establishment.cnpj,
+                "issue_date": invoice_data.issue_date,
+                "total_amount": float(invoice_data.total_amount) if invoice_data.total_amount else None,
+                "items_count": invoice_data.items_count,
+            }
+            for invoice_data, establishment in zip(invoices, invoice_establishments, strict=True)
+        ]
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO invoices (
+                id, access_key, invoice_number, series, issuer_cnpj,
+                issue_date, total_amount, items_count
+            )
+            SELECT id, access_key, invoice_number, series, issuer_cnpj, issue_date, total_amount, items_count
+            FROM staged
+        """,
+            invoice_rows,
+            _INVOICE_BATCH_SCHEMA,
+        )
+
+        item_rows = [
+            {
+                "id": self._generate_id(),
+                "access_key": invoice_data.access_key,
+                "product_id": product_ids.get((invoice_index, item_index)),
+                "quantity": float(item.quantity) if item.quantity else None,
+                "unit_price": float(item.unit_price) if item.unit_price else None,
+                "total_amount": float(item.total_amount) if item.total_amount else None,
+            }
+            for invoice_index, invoice_data in enumerate(invoices)
+            for item_index, item in enumerate(invoice_data.items or [])
+        ]
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO invoice_items (id, access_key, product_id, quantity, unit_price, total_amount)
+            SELECT id, access_key, product_id, quantity, unit_price, total_amount FROM staged
+        """,
+            item_rows,
+            _INVOICE_ITEM_BATCH_SCHEMA,
+        )
+        batch_stats["items_inserted"] += len(item_rows)
+
+        return batch_stats
+
+    def _upsert_establishments_batch(
+        self, conn, establishments: list[EstablishmentData], batch_stats: dict[str, int]
+    ) -> dict[str, str]:
+        """Insert new establishments and update existing ones with one statement each
+
+        Repeated CNPJs are merged in order, later non-null values winning as they would with
+        one COALESCE update per invoice.
+
+        Returns:
+            Mapping of normalized CNPJ to establishment id
+        """
+        merged: dict[str, EstablishmentData] = {}
+        first_names: dict[str, str | None] = {}
+        for establishment in establishments:
+            current = merged.get(establishment.cnpj)
+            if current is None:
+                merged[establishment.cnpj] = replace(establishment)
+                first_names[establishment.cnpj] = establishment.business_name
+                continue
+
+            batch_stats["establishments_updated"] += 1
+            for field in ("business_name", "address", "city", "state"):
+                value = getattr(establishment, field)
+                if value is not None:
+                    setattr(current, field, value)
+
+        existing = {
+            row[0]: row[1:]
+            for row in self._execute_staged(
+                conn,
+                """
+                SELECT e.cnpj, e.id, e.establishment_type, e.cnae_code
+                FROM establishments e JOIN staged s ON e.cnpj = s.cnpj
+            """,
+                [{"cnpj": cnpj} for cnpj in merged],
+                pa.schema([("cnpj", pa.string())]),
+            )
+        }
+
+        establishment_ids = {}
+        new_rows = []
+        update_rows = []
+        groups: dict[str, dict[str, Any]] = {}
+
+        for cnpj, establishment in merged.items():
+            establishment_type = None
+            cnae_code = None
+            cnae_data = None
+            current = existing.get(cnpj)
+
+            if not current or not current[1]:  # New establishment or missing type
+                cnae_data = self._get_cnae_data(conn, cnpj)
+                establishment_type, cnae_code = self._apply_cnae_data(establishment, cnae_data)
+
+            row = {
+                "business_name": establishment.business_name,
+                "address": establishment.address,
+                "city": establishment.city,
+                "state": establishment.state,
+            }
+
+            if current:
+                establishment_ids[cnpj] = current[0]
+                update_rows.append(
+                    {
+                        **row,
+                        "id": current[0],
+                        "establishment_type": current[1] or establishment_type,
+                        "cnae_code": current[2] or cnae_code,
+                    }
+                )
+                batch_stats["establishments_updated"] += 1
+                continue
+
+            establishment_ids[cnpj] = self._generate_id()
+            is_main_office = cnpj[8:12] == "0001"
+            new_rows.append(
+                {
+                    **row,
+                    "id": establishment_ids[cnpj],
+                    "cnpj": cnpj,
+                    "establishment_type": establishment_type,
+                    "cnae_code": cnae_code,
+                    "cnpj_root": cnpj[:8],
+                    "branch_number": cnpj[8:12],
+                    "is_main_office": is_main_office,
+                }
+            )
+
+            # First new establishment names the group, the last main office found is recorded. As in
+            # the single-invoice path, the name is the first invoice's, completed from CNAE data
+            group_name = first_names[cnpj] or (cnae_data or {}).get("business_name") or cnpj
+            group = groups.setdefault(
+                cnpj[:8],
+                {
+                    "id": cnpj[:8],
+                    "company_name": group_name.split(" - ", maxsplit=1)[0],
+                    "main_office_cnpj": None,
+                },
+            )
+            if is_main_office:
+                group["main_office_cnpj"] = cnpj
+
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO establishments (
+                id, cnpj, business_name, establishment_type, address, city, state, cnae_code,
+                cnpj_root, branch_number, is_main_office, company_group_id
+            )
+            SELECT id, cnpj, business_name, establishment_type, address, city, state, cnae_code,
+                cnpj_root, branch_number, is_main_office, cnpj_root
+            FROM staged
+        """,
+            new_rows,
+            _ESTABLISHMENT_BATCH_SCHEMA,
+        )
+        batch_stats["establishments_inserted"] += len(new_rows)
+
+        self._execute_staged(
+            conn,
+            """
+            UPDATE establishments SET
+                business_name = COALESCE(s.business_name, establishments.business_name),
+                establishment_type = COALESCE(s.establishment_type, establishments.establishment_type),
+                address = COALESCE(s.address, establishments.address),
+                city = COALESCE(s.city, establishments.city),
+                state = COALESCE(s.state, establishments.state),
+                cnae_code = COALESCE(s.cnae_code, establishments.cnae_code)
+            FROM staged s
+            WHERE establishments.id = s.id
+        """,
+            update_rows,
+            _ESTABLISHMENT_BATCH_SCHEMA,
+        )
+
+        self._upsert_company_groups_batch(conn, list(groups.values()))
+
+        return establishment_ids
+
+    def _upsert_company_groups_batch(self, conn, group_rows: list[dict[str, Any]]) -> None:
+        """Create missing company groups and refresh counts of the existing ones"""
+        if not group_rows:
+            return
+
+        schema = pa.schema([("id", pa.string()), ("company_name", pa.string()), ("main_office_cnpj", pa.string())])
+
+        existing_groups = {
+            row[0]
+            for row in self._execute_staged(
+                conn, "SELECT g.id FROM company_groups g JOIN staged s ON g.id = s.id", group_rows, schema
+            )
+        }
+        new_groups = [row for row in group_rows if row["id"] not in existing_groups]
+        updated_groups = [row for row in group_rows if row["id"] in existing_groups]
+
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO company_groups (id, company_name, main_office_cnpj, total_establishments)
+            SELECT s.id, s.company_name, s.main_office_cnpj,
+                (SELECT COUNT(DISTINCT e.cnpj) FROM establishments e WHERE e.cnpj_root = s.id)
+            FROM staged s
+        """,
+            new_groups,
+            schema,
+        )
+        self._execute_staged(
+            conn,
+            """
+            UPDATE company_groups SET
+                updated_at = CURRENT_TIMESTAMP,
+                main_office_cnpj = COALESCE(s.main_office_cnpj, company_groups.main_office_cnpj),
+                total_establishments = (
+                    SELECT COUNT(DISTINCT e.cnpj) FROM establishments e WHERE e.cnpj_root = s.id
+                )
+            FROM staged s
+            WHERE company_groups.id = s.id
+        """,
+            updated_groups,
+            schema,
+        )
+
+        for row in new_groups:
+            self.logger.info(f"Created new company group: {row['company_name']} (CNPJ root: {row['id']})")
+
+    def _upsert_products_batch(
+        self, conn, invoices: list[tuple[InvoiceData, str]], batch_stats: dict[str, int]
+    ) -> dict[tuple[int, int], str]:
+        """Insert new products and bump occurrence counts of existing ones with one statement each
+
+        Products are keyed by (establishment_id, product_code); items without a product code
+        always create a new product, as in the single-invoice path.
+
+        Returns:
+            Mapping of (invoice index, item index) to product id
+        """
+        keyed: dict[tuple[str, str], dict[str, Any]] = {}
+        uncoded_rows = []
+        item_keys: dict[tuple[int, int], tuple[str, str] | str] = {}
+
+        for invoice_index, (invoice_data, establishment_id) in enumerate(invoices):
+            for item_index, item in enumerate(invoice_data.items or []):
+                if not item.description:
+                    continue
+
+                if not item.product_code:
+                    product_id = self._generate_id()
+                    uncoded_rows.append(
+                        {
+                            "id": product_id,
+                            "establishment_id": establishment_id,
+                            "product_code": None,
+                            "description": item.description,
+                            "unit": item.unit,
+                            "occurrences": 1,
+                        }
+                    )
+                    item_keys[(invoice_index, item_index)] = product_id
+                    continue
+
+                key = (establishment_id, item.product_code)
+                row = keyed.setdefault(
+                    key,
+                    {
+                        "id": None,
+                        "establishment_id": establishment_id,
+                        "product_code": item.product_code,
+                        "description": item.description,
+                        "unit": None,
+                        "occurrences": 0,
+                    },
+                )
+                row["occurrences"] += 1
+                if item.unit is not None:
+                    row["unit"] = item.unit
+                item_keys[(invoice_index, item_index)] = key
+
+        for establishment_id, product_code, product_id in self._execute_staged(
+            conn,
+            """
+            SELECT p.establishment_id, p.product_code, p.id
+            FROM products p
+            JOIN staged s ON p.establishment_id = s.establishment_id AND p.product_code = s.product_code
+        """,
+            list(keyed.values()),
+            _PRODUCT_BATCH_SCHEMA,
+        ):
+            keyed[(establishment_id, product_code)]["id"] = product_id
+
+        update_rows = [row for row in keyed.values() if row["id"] is not None]
+        new_rows = [row for row in keyed.values() if row["id"] is None]
+        for row in new_rows:
+            row["id"] = self._generate_id()
+        new_rows.extend(uncoded_rows)
+
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO products (id, establishment_id, product_code, description, unit, occurrence_count)
+            SELECT id, establishment_id, product_code, description, unit, occurrences FROM staged
+        """,
+            new_rows,
+            _PRODUCT_BATCH_SCHEMA,
+        )
+        self._execute_staged(
+            conn,
+            """
+            UPDATE products SET
+                unit = COALESCE(s.unit, products.unit),
+                occurrence_count = products.occurrence_count + s.occurrences
+            FROM staged s
+            WHERE products.id = s.id
+        """,
+            update_rows,
+            _PRODUCT_BATCH_SCHEMA,
+        )
+
+        batch_stats["products_inserted"] += len(new_rows)
+        batch_stats["products_updated"] += sum(row["occurrences"] for row in keyed.values()) - (
+            len(new_rows) - len(uncoded_rows)
+        )
+
+        return {position: key if isinstance(key, str) else keyed[key]["id"] for position, key in item_keys.items()}
+
+    def _log_processing_results_batch(self, conn, invoices: list[InvoiceData]) -> None:
+        """Log successful processing of a batch for audit trail
+
+        Errors are raised: a failed statement aborts the DuckDB transaction, so the batch is
+        rolled back and stored one invoice at a time instead.
+        """
+        self._execute_staged(
+            conn,
+            """
+            INSERT INTO processing_log (id, access_key, url, status, error_message, processing_time_ms)
+            SELECT id, access_key, url, 'success', NULL, 0 FROM staged
+        """,
+            [
+                {"id": self._generate_id(), "access_key": invoice_data.access_key, "url": invoice_data.source_url}
+                for invoice_data in invoices
+            ],
+            pa.schema([("id", pa.string()), ("access_key", pa.string()), ("url", pa.string())]),
+        )
+
+    def _execute_staged(self, conn, sql: str, rows: list[dict[str, Any]], schema: pa.Schema) -> list[tuple]:
+        """Run a statement with rows registered as an Arrow table named "staged"
+
+        Returns:
+            Fetched result rows, empty when there is nothing to stage
+        """
+        if not rows:
+            return []
+
+        conn.register(_STAGING_TABLE, pa.Table.from_pylist(rows, schema=schema))
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.unregister(_STAGING_TABLE)
+
     def _generate_id(self) -> str:
         """Generate unique ID using UUID4"""
         return str(uuid.uuid4())
@@ -624,7 +1168,7 @@ class NFCeDatabaseManager:
 
             if not result:
                 # Create new company group
-                company_name = business_name.split(" - ")[0]  # Take main business name before any "-"
+                company_name = business_name.split(" - ", maxsplit=1)[0]  # Take main business name before any "-"
 
                 conn.execute(
                     """
@@ -101,6 +101,19 @@ CREATE TABLE IF NOT EXISTS company_groups (
 -- Create index for company groups
 CREATE INDEX IF NOT EXISTS idx_company_groups_main_office ON company_groups (main_office_cnpj);
 
+-- Processing log table - Audit trail of stored and failed invoices
+CREATE TABLE IF NOT EXISTS processing_log (
+    id VARCHAR(36) PRIMARY KEY,
+    access_key VARCHAR(44),
+    url TEXT,
+    status VARCHAR(20) NOT NULL, -- success | error
+    error_message TEXT,
+    processing_time_ms INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_processing_log_access_key ON processing_log (access_key);
+
 -- Simple view for spending analysis with establishment types
 CREATE VIEW IF NOT EXISTS v_spending_summary AS
 SELECT
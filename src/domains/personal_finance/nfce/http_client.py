@@ -1,25 +1,71 @@
+import asyncio
+from urllib.parse import urlparse
+
 import requests
 
+from utils.http.async_rate_limited_client import DEFAULT_MAX_CONCURRENCY, AsyncRateLimitedHTTPClient
 from utils.http.rate_limited_client import RateLimitedHTTPClient
+from utils.http.rate_limiter import HostRateLimiter
+from utils.http.shared_budget import SharedRateBudget
 from utils.logging.logging_manager import LogManager
 
+# Text fragments expected somewhere in a valid NFCe page
+NFCE_INDICATORS = ("nota fiscal", "consumidor", "nfc-e", "nfce", "sefaz", "fazenda")
+
+
+def is_valid_nfce_content(html: str) -> bool:
+    """Check if HTML contains NFCe content"""
+    content = html.lower()
+    return any(indicator in content for indicator in NFCE_INDICATORS)
+
+
+def portal_sped_headers(base_url: str) -> dict[str, str]:
+    """Get Portal SPED specific headers added on top of the browser headers"""
+    return {
+        "Referer": base_url,
+        "Origin": base_url,
+        "Host": urlparse(base_url).netloc,
+    }
+
 
 class PortalSpedClient(RateLimitedHTTPClient):
     """Specialized HTTP client for Portal SPED MG"""
 
-    def __init__(self, rate_limit_seconds: float = 3.0, max_retries: int = 3):
-        super().__init__(rate_limit_seconds, max_retries)
+    def __init__(
+        self,
+        rate_limit_seconds: float = 3.0,
+        max_retries: int = 3,
+        burst: int = 1,
+        base_url: str = "https://portalsped.fazenda.mg.gov.br",
+        shared_budget: SharedRateBudget | None = None,
+    ):
+        """Initialize Portal SPED client
+
+        Args:
+            rate_limit_seconds: Nominal seconds between requests to the same host
+            max_retries: Maximum number of retries for failed requests
+            burst: Requests allowed back to back to an idle host
+            base_url: Portal base URL (overridable to point at a local server)
+            shared_budget: Optional cross-process budget so parallel runs share the portal's rate
+        """
+        super().__init__(
+            rate_limit_seconds,
+            max_retries,
+            rate_limiter=HostRateLimiter(1.0 / rate_limit_seconds, burst=burst),
+            shared_budget=shared_budget,
+        )
         self.logger = LogManager.get_instance().get_logger("PortalSpedClient")
 
         # Portal SPED specific configuration
-        self.base_url = "https://portalsped.fazenda.mg.gov.br"
+        self.base_url = base_url
         self.portal_session_started = False
 
-    def get_invoice_page(self, url: str) -> requests.Response:
+    def get_invoice_page(self, url: str, timeout: int = 30) -> requests.Response:
         """Get Portal SPED invoice page
 
         Args:
             url: Full Portal SPED URL
+            timeout: Request timeout in seconds
 
         Returns:
             Response object with invoice page content
@@ -31,7 +77,7 @@ class PortalSpedClient(RateLimitedHTTPClient):
             self.logger.info(f"Fetching invoice page: {url}")
 
             # Make request with Portal SPED specific headers
-            response = self.get(url, headers=self._get_portal_sped_headers())
+            response = self.get(url, timeout=timeout, headers=self._get_portal_sped_headers())
 
             # Check if we got a valid NFCe page
             if not self._is_valid_nfce_page(response):
@@ -46,30 +92,12 @@ class PortalSpedClient(RateLimitedHTTPClient):
     def _get_portal_sped_headers(self) -> dict[str, str]:
         """Get Portal SPED specific headers"""
         headers = self._get_browser_headers()
-        headers.update(
-            {
-                "Referer": self.base_url,
-                "Origin": self.base_url,
-                "Host": "portalsped.fazenda.mg.gov.br",
-            }
-        )
+        headers.update(portal_sped_headers(self.base_url))
         return headers
 
     def _is_valid_nfce_page(self, response: requests.Response) -> bool:
         """Check if response contains valid NFCe content"""
-        content = response.text.lower()
-
-        # Look for NFCe indicators
-        nfce_indicators = [
-            "nota fiscal",
-            "consumidor",
-            "nfc-e",
-            "nfce",
-            "sefaz",
-            "fazenda",
-        ]
-
-        return any(indicator in content for indicator in nfce_indicators)
+        return is_valid_nfce_content(response.text)
 
     def test_connection(self) -> bool:
         """Test connection to Portal SPED"""
@@ -98,9 +126,71 @@ class PortalSpedClient(RateLimitedHTTPClient):
         Returns:
             HTML content as string
         """
-        response = self.get_invoice_page(url)
+        response = self.get_invoice_page(url, timeout=timeout)
+        return response.text
+
+
+class AsyncPortalSpedClient(AsyncRateLimitedHTTPClient):
+    """Asyncio Portal SPED client fetching many NFCe pages from a single thread"""
+
+    def __init__(
+        self,
+        rate_limit_seconds: float = 3.0,
+        max_retries: int = 3,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        burst: int = 1,
+        base_url: str = "https://portalsped.fazenda.mg.gov.br",
+    ):
+        """Initialize async Portal SPED client
+
+        Args:
+            rate_limit_seconds: Nominal seconds between requests to the same host
+            max_retries: Maximum number of retries for failed requests
+            max_concurrency: Maximum requests in flight
+            burst: Requests allowed back to back to an idle host
+            base_url: Portal base URL (overridable to point at a local server)
+        """
+        super().__init__(
+            rate_limit_seconds,
+            max_retries,
+            max_concurrency=max_concurrency,
+            rate_limiter=HostRateLimiter(1.0 / rate_limit_seconds, burst=burst),
+        )
+        self.logger = LogManager.get_instance().get_logger("AsyncPortalSpedClient")
+        self.base_url = base_url
+
+    async def fetch_nfce_page(self, url: str, timeout: int = 30) -> str:
+        """Fetch NFCe page content
+
+        Args:
+            url: NFCe URL
+            timeout: Request timeout
+
+        Returns:
+            HTML content as string
+        """
+        if not url.startswith(self.base_url):
+            raise ValueError(f"URL must be from Portal SPED MG: {url}")
+
+        response = await self.get(url, timeout=timeout, headers=portal_sped_headers(self.base_url))
+        if not is_valid_nfce_content(response.text):
+            self.logger.warning(f"Response does not appear to be a valid NFCe page: {url}")
+
         return response.text
 
+    async def fetch_nfce_pages(self, urls: list[str], timeout: int = 30) -> dict[str, str | Exception]:
+        """Fetch many NFCe pages concurrently
+
+        Args:
+            urls: NFCe URLs
+            timeout: Request timeout
+
+        Returns:
+            Mapping of URL to HTML content, or to the exception that prevented fetching it
+        """
+        pages = await asyncio.gather(*(self.fetch_nfce_page(url, timeout) for url in urls), return_exceptions=True)
+        return dict(zip(urls, pages, strict=True))
+
 
 # Alias for backward compatibility
 NFCeHttpClient = PortalSpedClient
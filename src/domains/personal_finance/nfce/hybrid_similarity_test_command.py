@@ -6,8 +6,10 @@ from argparse import ArgumentParser, Namespace
 
 from utils.command.base_command import BaseCommand
 from utils.env_loader import ensure_env_loaded
+from utils.dependencies import RAPIDFUZZ_AVAILABLE
 from utils.logging.logging_manager import LogManager
 
+from .similarity.distance_backend import benchmark_backends
 from .similarity.enhanced_similarity_calculator import EnhancedSimilarityCalculator
 from .similarity.feature_extractor import FeatureExtractor
 
@@ -33,6 +35,8 @@ class HybridSimilarityTestCommand(BaseCommand):
         python src/main.py personal_finance nfce hybrid-similarity-test --compare-systems
         python src/main.py personal_finance nfce hybrid-similarity-test --test-samples
         python src/main.py personal_finance nfce hybrid-similarity-test --benchmark
+        python src/main.py personal_finance nfce hybrid-similarity-test --benchmark-workers --benchmark-size 2000
+        python src/main.py personal_finance nfce hybrid-similarity-test --benchmark-distance
         """
 
     @staticmethod
@@ -48,6 +52,22 @@ class HybridSimilarityTestCommand(BaseCommand):
             action="store_true",
             help="Benchmark against clean training data",
         )
+        parser.add_argument(
+            "--benchmark-workers",
+            action="store_true",
+            help="Benchmark parallel batch similarity scaling with 1/2/4/8 workers",
+        )
+        parser.add_argument(
+            "--benchmark-distance",
+            action="store_true",
+            help="Micro-benchmark per-pair cost of the available string distance backends",
+        )
+        parser.add_argument(
+            "--benchmark-size",
+            type=int,
+            default=2000,
+            help="Number of synthetic products used by --benchmark-workers",
+        )
         parser.add_argument(
             "--threshold",
             type=float,
@@ -93,8 +113,24 @@ class HybridSimilarityTestCommand(BaseCommand):
             if args.compare_systems:
                 HybridSimilarityTestCommand._compare_systems(enhanced_calc, feature_extractor, logger, args.threshold)
 
+            if args.benchmark_workers:
+                HybridSimilarityTestCommand._benchmark_worker_scaling(
+                    enhanced_calc, feature_extractor, logger, args.benchmark_size
+                )
+
+            if args.benchmark_distance:
+                HybridSimilarityTestCommand._benchmark_distance_backends(feature_extractor, logger, args.benchmark_size)
+
             # Default action if no specific test requested
-            if not any([args.test_samples, args.benchmark, args.compare_systems]):
+            if not any(
+                [
+                    args.test_samples,
+                    args.benchmark,
+                    args.compare_systems,
+                    args.benchmark_workers,
+                    args.benchmark_distance,
+                ]
+            ):
                 logger.info("No specific test requested. Running sample test...")
                 HybridSimilarityTestCommand._test_sample_pairs(enhanced_calc, feature_extractor, logger)
 
@@ -288,6 +324,72 @@ class HybridSimilarityTestCommand(BaseCommand):
         except Exception as e:
             logger.error(f"Error benchmarking: {e}")
 
+    @staticmethod
+    def _synthetic_descriptions(size: int) -> list[str]:
+        """Generate product descriptions with controlled near-duplicates for benchmarks"""
+        base_products = [
+            "BANANA PRATA",
+            "COCA COLA 600",
+            "QJO MUS FAT",
+            "MEXERICA PONKAN",
+            "CERV HEINEKEN 473ML",
+            "BOMBOM GAROTO 250G",
+            "LEITE INTEGRAL ITALAC 1L",
+            "ARROZ TIO JOAO 5KG",
+        ]
+        variants = ["", "KG", "UN", "TRAD", "ZERO", "PCT"]
+
+        return [
+            f"{base_products[i % len(base_products)]} {variants[(i // len(base_products)) % len(variants)]} {i % 97}"
+            for i in range(size)
+        ]
+
+    @staticmethod
+    def _benchmark_distance_backends(feature_extractor: FeatureExtractor, logger, size: int):
+        """Micro-benchmark per-pair Levenshtein cost of each available distance backend"""
+        logger.info("⏱️  Benchmarking string distance backends")
+
+        normalized = [
+            feature_extractor.extract(description).normalized_description
+            for description in HybridSimilarityTestCommand._synthetic_descriptions(min(size, 200))
+        ]
+        pairs = [(normalized[i], normalized[j]) for i in range(len(normalized)) for j in range(i + 1, len(normalized))]
+
+        print("\n" + "=" * 80)
+        print(f"⏱️  CUSTO POR PAR - LEVENSHTEIN ({len(pairs):,} pares)")
+        print("=" * 80)
+        for timing in benchmark_backends(pairs):
+            print(f"   {timing['backend']:<10} {timing['microseconds_per_pair']:.2f} µs/par")
+
+        if not RAPIDFUZZ_AVAILABLE:
+            print("   💡 Instale rapidfuzz (pip install -e '.[ml]') para usar o backend nativo")
+
+    @staticmethod
+    def _benchmark_worker_scaling(
+        enhanced_calc: EnhancedSimilarityCalculator,
+        feature_extractor: FeatureExtractor,
+        logger,
+        size: int,
+    ):
+        """Benchmark the shared-memory parallel path with 1/2/4/8 workers on synthetic products"""
+        logger.info(f"⏱️  Benchmarking parallel scaling with {size} synthetic products")
+
+        descriptions = HybridSimilarityTestCommand._synthetic_descriptions(size)
+        features_list = [feature_extractor.extract(description) for description in descriptions]
+
+        timings = enhanced_calc.benchmark_parallel_scaling(features_list)
+
+        print("\n" + "=" * 80)
+        print("⏱️  ESCALABILIDADE DO PROCESSAMENTO PARALELO")
+        print("=" * 80)
+        if timings:
+            print(f"   Produtos após filtros rápidos: {timings[0]['products']} de {len(features_list)}")
+        for timing in timings:
+            print(
+                f"   {timing['workers']} workers: {timing['seconds']:.2f}s | "
+                f"Speedup: {timing['speedup']:.2f}x | Matches: {timing['matches']}"
+            )
+
     @staticmethod
     def _compare_systems(
         enhanced_calc: EnhancedSimilarityCalculator,
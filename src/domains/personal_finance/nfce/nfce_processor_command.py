@@ -3,7 +3,9 @@
 
 from argparse import ArgumentParser, Namespace
 
+from domains.personal_finance.nfce.http_client import AsyncPortalSpedClient
 from domains.personal_finance.nfce.nfce_processor_service import NFCeService
+from domains.personal_finance.nfce.utils.html_parser import HTML_PARSERS
 from utils.command.base_command import BaseCommand
 from utils.env_loader import ensure_env_loaded
 from utils.logging.logging_manager import LogManager
@@ -51,6 +53,9 @@ Examples:
   
   # Process URLs and save to database with analysis
   python src/main.py personal_finance nfce processor --input urls.json --save-db --analysis --detect-similar
+  
+  # Fetch a large URL list from one thread with the asyncio client (up to 20 requests in flight)
+  python src/main.py personal_finance nfce processor --input urls.json --async-http --batch-size 20
 
 Input format (JSON file):
   {
@@ -110,12 +115,24 @@ Output format:
             default=10,
             help="Number of URLs to process concurrently (default: 10)",
         )
+        parser.add_argument(
+            "--async-http",
+            action="store_true",
+            help="Fetch URL lists from one thread with the asyncio client; --batch-size caps requests in flight "
+            "(needs the 'scraping' extra)",
+        )
         parser.add_argument(
             "--timeout",
             type=int,
             default=30,
             help="Request timeout in seconds (default: 30)",
         )
+        parser.add_argument(
+            "--html-parser",
+            choices=HTML_PARSERS,
+            default="html.parser",
+            help="HTML tree builder for NFCe pages; 'lxml' is faster and needs the 'scraping' extra (default: html.parser)",
+        )
 
         # Database options
         parser.add_argument(
@@ -160,6 +177,7 @@ Output format:
 
         # Get logger with component name
         logger = LogManager.get_instance().get_logger("NFCeCommand")
+        service = None
 
         try:
             logger.info("Starting NFCe processing command")
@@ -169,7 +187,10 @@ Output format:
 
             # Initialize standard NFCe service
             logger.info("Initializing NFCe service")
-            service = NFCeService()
+            service = NFCeService(
+                html_parser=args.html_parser,
+                async_http_client=AsyncPortalSpedClient(max_concurrency=args.batch_size) if args.async_http else None,
+            )
 
             # Warn about similarity features being disabled
             if args.detect_similar:
@@ -193,6 +214,7 @@ Output format:
                     batch_size=args.batch_size,
                     timeout=args.timeout,
                     force_refresh=args.force_refresh,
+                    save_to_db=args.save_db,
                 )
             else:  # args.url
                 logger.info(f"Processing single URL: {args.url}")
@@ -214,8 +236,8 @@ Output format:
                     logger.warning(f"Failed to generate analysis report: {e}")
                     result["analysis"] = {"error": f"Analysis generation failed: {e!s}"}
 
-            # Save to database if requested
-            if args.save_db:
+            # Save to database if requested (URL files are streamed to the database while processing)
+            if args.save_db and "database" not in result:
                 logger.info("Saving results to database")
                 try:
                     service.save_to_database(result)
@@ -283,6 +305,10 @@ Output format:
             print(f"Error: An unexpected error occurred - {e}")
             print("Please check the logs for more details.")
             exit(1)
+        finally:
+            # Release the worker pool and pooled HTTP connections on every exit path
+            if service is not None:
+                service.close()
 
     @staticmethod
     def _validate_arguments(args: Namespace, logger) -> None:
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """NFCe Service - Business logic for processing Brazilian electronic invoices (NFCe)"""
 
+import asyncio
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -12,7 +14,7 @@ import requests
 from domains.personal_finance.nfce.database.nfce_database_manager import (
     NFCeDatabaseManager,
 )
-from domains.personal_finance.nfce.http_client import NFCeHttpClient
+from domains.personal_finance.nfce.http_client import AsyncPortalSpedClient, NFCeHttpClient
 from domains.personal_finance.nfce.models.invoice_data import (
     ConsumerData,
     EstablishmentData,
@@ -26,17 +28,41 @@ from utils.data.json_manager import JSONManager
 from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
+# URLs queued per worker; bounds the work queue instead of submitting every URL up front
+QUEUE_DEPTH_PER_WORKER = 2
+
+# Invoices buffered before each streamed database write
+STORAGE_FLUSH_SIZE = 50
+
 
 class NFCeService:
     """Service for processing NFCe URLs and extracting invoice data"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: NFCeHttpClient | None = None,
+        html_parser: str = "html.parser",
+        async_http_client: AsyncPortalSpedClient | None = None,
+    ):
+        """Initialize NFCe service
+
+        Args:
+            http_client: Client for single URLs and the worker pool (default: Portal SPED client)
+            html_parser: BeautifulSoup tree builder used to parse pages
+            async_http_client: When given, URL lists are fetched with it from a single thread
+                instead of the worker pool
+        """
         self.logger = LogManager.get_instance().get_logger("NFCeService")
         self.cache = CacheManager.get_instance()
-        self.extractor = NFCeDataExtractor()
-        self.http_client = NFCeHttpClient()
+        self.extractor = NFCeDataExtractor(parser=html_parser)
+        self.http_client = http_client or NFCeHttpClient()
+        self.async_http_client = async_http_client
         self._db_manager = None  # Lazy-loaded when needed
 
+        # Worker pool kept alive across calls
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers = 0
+
     @property
     def db_manager(self):
         """Lazy-loaded database manager"""
@@ -221,6 +247,7 @@ class NFCeService:
         batch_size: int = 10,
         timeout: int = 30,
         force_refresh: bool = False,
+        save_to_db: bool = False,
     ) -> dict[str, Any]:
         """Process multiple NFCe URLs from a JSON file
 
@@ -229,6 +256,7 @@ class NFCeService:
             batch_size: Number of concurrent requests
             timeout: Request timeout in seconds
             force_refresh: Force refresh ignoring cache
+            save_to_db: Stream invoices to the database as they complete
 
         Returns:
             Dictionary with processing results
@@ -243,14 +271,37 @@ class NFCeService:
             urls = self._load_urls_from_file(input_file)
             self.logger.info(f"Loaded {len(urls)} URLs to process")
 
-            # Process URLs in batches
+            if not save_to_db:
+                return self._process_urls_batch(
+                    urls,
+                    batch_size=batch_size,
+                    timeout=timeout,
+                    force_refresh=force_refresh,
+                )
+
+            # Stream completed invoices to the database in small batches while the rest are fetched
+            database_summary = {"stored": 0, "skipped": 0, "errors": []}
+            buffer = []
+
+            def store_invoice(invoice_dict: dict[str, Any]) -> None:
+                buffer.append(invoice_dict)
+                if len(buffer) >= STORAGE_FLUSH_SIZE:
+                    self._store_invoice_dicts(buffer, database_summary)
+                    buffer.clear()
+
             results = self._process_urls_batch(
                 urls,
                 batch_size=batch_size,
                 timeout=timeout,
                 force_refresh=force_refresh,
+                on_invoice=store_invoice,
             )
 
+            if buffer:
+                self._store_invoice_dicts(buffer, database_summary)
+
+            self.logger.info(f"Saved {database_summary['stored']}/{len(results['invoices'])} invoices to database")
+            results["database"] = database_summary
             return results
 
         except Exception as e:
@@ -385,96 +436,197 @@ class NFCeService:
         batch_size: int = 10,
         timeout: int = 30,
         force_refresh: bool = False,
+        on_invoice: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
-        """Process URLs in batches using concurrent execution"""
-        total_processed = 0
-        successful = 0
-        failed = 0
-        all_invoices = []
-        all_errors = []
-
-        # Process URLs in batches
-        for i in range(0, len(urls), batch_size):
-            batch_urls = urls[i : i + batch_size]
-            self.logger.info(f"Processing batch {i // batch_size + 1} ({len(batch_urls)} URLs)")
-
-            # Use ThreadPoolExecutor for concurrent processing
-            with ThreadPoolExecutor(max_workers=batch_size) as executor:
-                # Submit all URLs in current batch
-                future_to_url = {
-                    executor.submit(self._process_single_url_internal, url, timeout, force_refresh): url
-                    for url in batch_urls
-                }
+        """Process URLs on the persistent worker pool, handling each result as soon as it completes
 
-                # Collect results as they complete
-                for future in as_completed(future_to_url):
-                    url = future_to_url[future]
-                    total_processed += 1
+        At most batch_size * QUEUE_DEPTH_PER_WORKER URLs are queued at a time; a new URL is
+        submitted whenever one finishes, so a slow page only occupies its own worker. With an
+        async HTTP client the URLs are fetched from a single thread instead (see _process_urls_async).
 
-                    try:
-                        result = future.result()
-                        if result.get("success", False):
-                            successful += 1
-                            all_invoices.append(result["invoice"])
-                        else:
-                            failed += 1
-                            all_errors.append(
-                                {
-                                    "url": url,
-                                    "error": result.get("error", "Unknown error"),
-                                }
-                            )
-
-                    except Exception as e:
-                        failed += 1
-                        all_errors.append({"url": url, "error": str(e)})
-                        self.logger.error(f"Exception processing {url}: {e}")
-
-        result = {
-            "total_processed": total_processed,
-            "successful": successful,
-            "failed": failed,
-            "invoices": all_invoices,
-            "processing_date": datetime.now().isoformat(),
-        }
+        Args:
+            urls: URLs to process
+            batch_size: Number of concurrent workers
+            timeout: Request timeout in seconds
+            force_refresh: Force refresh ignoring cache
+            on_invoice: Optional callback receiving each successful invoice dict as it completes
+        """
+        if self.async_http_client is not None:
+            return asyncio.run(self._process_urls_async(urls, timeout, force_refresh, on_invoice))
+
+        summary = self._new_batch_summary()
+        executor = self._get_executor(batch_size)
+        pending_urls = iter(urls)
+        in_flight = {}
+
+        def submit_next() -> bool:
+            url = next(pending_urls, None)
+            if url is None:
+                return False
+            in_flight[executor.submit(self._process_single_url_internal, url, timeout, force_refresh)] = url
+            return True
+
+        while len(in_flight) < batch_size * QUEUE_DEPTH_PER_WORKER and submit_next():
+            pass
+
+        # Collect results as they complete, topping the queue up after each one
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                url = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Exception processing {url}: {e}")
+                    result = {"success": False, "error": str(e)}
 
-        if all_errors:
-            result["errors"] = all_errors
+                self._record_url_result(summary, url, result, on_invoice)
+                submit_next()
 
-        self.logger.info(f"Batch processing completed: {successful}/{total_processed} successful")
-        return result
+            self.logger.info(f"Processed {summary['total_processed']}/{len(urls)} URLs")
 
-    def _process_single_url_internal(self, url: str, timeout: int, force_refresh: bool) -> dict[str, Any]:
-        """Internal method for processing a single URL (used in concurrent execution)"""
+        return self._finish_batch_summary(summary)
+
+    async def _process_urls_async(
+        self,
+        urls: list[str],
+        timeout: int,
+        force_refresh: bool,
+        on_invoice: Callable[[dict[str, Any]], None] | None,
+    ) -> dict[str, Any]:
+        """Fetch and process URLs from the calling thread with the async HTTP client
+
+        The client's max_concurrency caps requests in flight and its per-host limiter paces
+        them; each result is handled as soon as it completes.
+        """
+        summary = self._new_batch_summary()
+        client = self.async_http_client
+
+        async def process(url: str) -> tuple[str, dict[str, Any]]:
+            try:
+                result = self._load_cached_url_result(url, force_refresh)
+                if result is None:
+                    html_content = await client.fetch_nfce_page(url, timeout=timeout)
+                    result = self._build_url_result(url, html_content)
+            except Exception as e:
+                self.logger.error(f"Exception processing {url}: {e}")
+                result = {"success": False, "error": str(e)}
+            return url, result
+
+        self.logger.info(f"Fetching {len(urls)} URLs asynchronously (max {client.max_concurrency} in flight)")
         try:
-            # Check cache first
-            cache_key = f"nfce_url_{hash(url)}"
-            if not force_refresh:
-                cached_result = self.cache.load(cache_key, expiration_minutes=60)
-                if cached_result:
-                    return {"success": True, "invoice": cached_result, "cached": True}
+            for completed in asyncio.as_completed([process(url) for url in urls]):
+                url, result = await completed
+                self._record_url_result(summary, url, result, on_invoice)
+
+                if summary["total_processed"] % 10 == 0 or summary["total_processed"] == len(urls):
+                    self.logger.info(f"Processed {summary['total_processed']}/{len(urls)} URLs")
+        finally:
+            # The connection pool is bound to this event loop
+            await client.aclose()
+
+        return self._finish_batch_summary(summary)
+
+    @staticmethod
+    def _new_batch_summary() -> dict[str, Any]:
+        return {"total_processed": 0, "successful": 0, "failed": 0, "invoices": [], "errors": []}
+
+    @staticmethod
+    def _record_url_result(
+        summary: dict[str, Any],
+        url: str,
+        result: dict[str, Any],
+        on_invoice: Callable[[dict[str, Any]], None] | None,
+    ) -> None:
+        """Add one URL's outcome to a batch summary, streaming successful invoices to on_invoice"""
+        summary["total_processed"] += 1
+        if result.get("success", False):
+            summary["successful"] += 1
+            summary["invoices"].append(result["invoice"])
+            if on_invoice:
+                on_invoice(result["invoice"])
+        else:
+            summary["failed"] += 1
+            summary["errors"].append({"url": url, "error": result.get("error", "Unknown error")})
+
+    def _finish_batch_summary(self, summary: dict[str, Any]) -> dict[str, Any]:
+        errors = summary.pop("errors")
+        summary["processing_date"] = datetime.now().isoformat()
+        if errors:
+            summary["errors"] = errors
+
+        self.logger.info(f"Batch processing completed: {summary['successful']}/{summary['total_processed']} successful")
+        return summary
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Get the long-lived worker pool, recreating it only when the worker count changes"""
+        if self._executor is None or self._executor_workers != max_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nfce-worker")
+            self._executor_workers = max_workers
+        return self._executor
+
+    def _store_invoice_dicts(self, invoice_dicts: list[dict[str, Any]], summary: dict[str, Any]) -> None:
+        """Store processed invoice dicts in one database batch, accumulating the outcome in summary"""
+        try:
+            invoices = [self._dict_to_invoice_data(invoice_dict) for invoice_dict in invoice_dicts]
+            report = self.db_manager.store_invoices_batch([invoice for invoice in invoices if invoice.access_key])
 
-            # Extract access key
-            access_key = self._extract_access_key_from_url(url)
+            summary["stored"] += len(report["stored"])
+            summary["skipped"] += len(report["skipped"])
+            summary["errors"].extend(f"{error['access_key']}: {error['error']}" for error in report["errors"])
 
-            # Fetch and process
-            html_content = self.http_client.fetch_nfce_page(url, timeout=timeout)
-            invoice_data = self.extractor.extract_invoice_data(html_content, url)
-            invoice_data.access_key = access_key
+        except Exception as e:
+            self.logger.error(f"Error streaming invoices to database: {e}", exc_info=True)
+            summary["errors"].append(str(e))
 
-            # Convert to dict and cache
-            invoice_dict = invoice_data.to_dict()
-            self.cache.save(cache_key, invoice_dict)
+    def close(self) -> None:
+        """Shut down the worker pool and HTTP session, dropping URLs still queued"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.http_client.close()
 
-            return {
-                "success": invoice_data.scraping_success,
-                "invoice": invoice_dict,
-                "cached": False,
-            }
+    def _process_single_url_internal(self, url: str, timeout: int, force_refresh: bool) -> dict[str, Any]:
+        """Internal method for processing a single URL (used in concurrent execution)"""
+        try:
+            cached_result = self._load_cached_url_result(url, force_refresh)
+            if cached_result is not None:
+                return cached_result
+
+            html_content = self.http_client.fetch_nfce_page(url, timeout=timeout)
+            return self._build_url_result(url, html_content)
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _load_cached_url_result(self, url: str, force_refresh: bool) -> dict[str, Any] | None:
+        """Get the cached processing result of a URL, if any"""
+        if force_refresh:
+            return None
+
+        cached_result = self.cache.load(f"nfce_url_{hash(url)}", expiration_minutes=60)
+        if cached_result:
+            return {"success": True, "invoice": cached_result, "cached": True}
+        return None
+
+    def _build_url_result(self, url: str, html_content: str) -> dict[str, Any]:
+        """Extract and cache the invoice of a fetched NFCe page"""
+        invoice_data = self.extractor.extract_invoice_data(html_content, url)
+        invoice_data.access_key = self._extract_access_key_from_url(url)
+
+        # Convert to dict and cache
+        invoice_dict = invoice_data.to_dict()
+        self.cache.save(f"nfce_url_{hash(url)}", invoice_dict)
+
+        return {
+            "success": invoice_data.scraping_success,
+            "invoice": invoice_dict,
+            "cached": False,
+        }
+
     def _extract_access_key_from_url(self, url: str) -> str:
         """Extract access key from NFCe URL"""
         try:
@@ -729,7 +881,7 @@ class NFCeService:
                 self.logger.warning("No invoices to save to database")
                 return
 
-            saved_count = 0
+            invoice_batch = []
             for i, invoice_dict in enumerate(invoices):
                 try:
                     # Convert dict back to InvoiceData object
@@ -739,18 +891,19 @@ class NFCeService:
                         self.logger.warning(f"Invoice {i + 1} has no access_key, skipping database save")
                         continue
 
-                    result = self.db_manager.store_invoice_data(invoice_data)
-
-                    if result:
-                        saved_count += 1
-                    else:
-                        self.logger.warning(
-                            f"Invoice {i + 1} with access_key {invoice_data.access_key[-10:]}... was skipped (likely duplicate)"
-                        )
+                    invoice_batch.append(invoice_data)
 
                 except Exception as e:
                     self.logger.error(f"Error saving invoice {i + 1} to database: {e}", exc_info=True)
 
+            report = self.db_manager.store_invoices_batch(invoice_batch)
+            saved_count = len(report["stored"])
+
+            for access_key in report["skipped"]:
+                self.logger.warning(f"Invoice with access_key {access_key[-10:]}... was skipped (likely duplicate)")
+            for error in report["errors"]:
+                self.logger.error(f"Error saving invoice {error['access_key']} to database: {error['error']}")
+
             self.logger.info(f"Saved {saved_count}/{len(invoices)} invoices to database")
 
         except Exception as e:
@@ -784,8 +937,9 @@ class NFCeService:
 
             # Save to database (always save when importing)
             self.logger.info("Saving imported data to database")
-            saved_count = 0
             errors = []
+            invoice_batch = []
+            batch_positions = []
 
             for i, invoice_dict in enumerate(invoices):
                 try:
@@ -797,22 +951,25 @@ class NFCeService:
                         errors.append(f"Invoice {i + 1}: Missing access_key")
                         continue
 
-                    # Store in database
-                    result = self.db_manager.store_invoice_data(invoice_data)
-
-                    if result:
-                        saved_count += 1
-                        self.logger.debug(f"Imported invoice {i + 1}: {invoice_data.access_key[-10:]}...")
-                    else:
-                        self.logger.info(
-                            f"Invoice {i + 1} with access_key {invoice_data.access_key[-10:]}... already exists, skipped"
-                        )
+                    invoice_batch.append(invoice_data)
+                    batch_positions.append(i)
 
                 except Exception as e:
                     error_msg = f"Invoice {i + 1}: {e!s}"
                     errors.append(error_msg)
                     self.logger.error(f"Error importing invoice {i + 1}: {e}")
 
+            # Store in database
+            report = self.db_manager.store_invoices_batch(invoice_batch)
+            saved_count = len(report["stored"])
+
+            for access_key in report["skipped"]:
+                self.logger.info(f"Invoice with access_key {access_key[-10:]}... already exists, skipped")
+            for error in report["errors"]:
+                i = batch_positions[error["index"]]
+                errors.append(f"Invoice {i + 1}: {error['error']}")
+                self.logger.error(f"Error importing invoice {i + 1}: {error['error']}")
+
             result = {
                 "total_processed": len(invoices),
                 "successful": saved_count,
@@ -8,6 +8,8 @@ import numpy as np
 from utils.cache_manager.cache_manager import CacheManager
 from utils.logging.logging_manager import LogManager
 
+from .embedding_index import EmbeddingIndex, stack_embeddings
+
 
 @dataclass
 class EmbeddingConfig:
@@ -287,6 +289,42 @@ class AdvancedEmbeddingEngine:
         self.logger.info(f"Batch processing completed: {len(results)} embeddings")
         return results
 
+    def build_index(self, texts: list[str], use_ensemble: bool = True, use_ann: bool = False) -> EmbeddingIndex:
+        """Stack the embeddings of texts into an L2-normalized matrix for top-k searches
+
+        Args:
+            texts: Texts to index
+            use_ensemble: Whether to use ensemble approach
+            use_ann: Use an approximate nearest neighbour index (requires faiss)
+
+        Returns:
+            EmbeddingIndex whose item indices follow texts
+        """
+        results = self.get_embeddings_batch(texts, use_ensemble)
+        return EmbeddingIndex([result.ensemble_embedding for result in results], use_ann=use_ann)
+
+    def find_most_similar(
+        self,
+        query_texts: list[str],
+        index: EmbeddingIndex,
+        top_k: int = 10,
+        min_score: float | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Find the top-k indexed texts for each query with one blocked matrix product
+
+        Args:
+            query_texts: Texts to search for
+            index: Index built with build_index
+            top_k: Number of neighbours per query
+            min_score: Optional minimum cosine similarity
+
+        Returns:
+            One list of (index position, cosine similarity) per query, best first
+        """
+        results = self.get_embeddings_batch(query_texts)
+        queries = stack_embeddings([result.ensemble_embedding for result in results])
+        return index.search(queries, top_k=top_k, min_score=min_score)
+
     def _get_model_embedding(self, text: str, model_type: str) -> np.ndarray | None:
         """Get embedding from specific model type"""
         try:
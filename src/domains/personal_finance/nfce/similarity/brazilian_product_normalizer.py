@@ -3,11 +3,15 @@
 
 import re
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 from utils.cache_manager.cache_manager import CacheManager
 from utils.logging.logging_manager import LogManager
 
+# Maximum number of distinct product names whose normalization is kept in memory
+NORMALIZATION_MEMO_SIZE = 20000
+
 
 @dataclass
 class NormalizationResult:
@@ -381,6 +385,29 @@ class BrazilianProductNormalizer:
             "TUAS",
         }
 
+        self._compile_patterns()
+        self._memoized_normalize = lru_cache(maxsize=NORMALIZATION_MEMO_SIZE)(self._normalize_uncached)
+
+    def _compile_patterns(self):
+        """Compile brand, abbreviation and category dictionaries into single-pass alternation patterns
+
+        Alternatives are ordered longest first, so the brand found is the longest one starting at
+        the leftmost matching position.
+        """
+        brands = sorted(self.brazilian_brands, key=lambda brand: (-len(brand), brand))
+        self._brand_pattern = re.compile("|".join(map(re.escape, brands))) if brands else None
+
+        abbreviations = sorted(self.abbreviations, key=lambda abbr: (-len(abbr), abbr))
+        self._abbreviation_pattern = (
+            re.compile(r"\b(?:" + "|".join(map(re.escape, abbreviations)) + r")\b") if abbreviations else None
+        )
+
+        self._category_patterns = {
+            category: re.compile("|".join(map(re.escape, keywords)))
+            for category, keywords in self.category_keywords.items()
+            if keywords
+        }
+
     def normalize(self, product_name: str) -> NormalizationResult:
         """Perform comprehensive normalization of Brazilian product name
 
@@ -393,6 +420,16 @@ class BrazilianProductNormalizer:
         if not product_name or not product_name.strip():
             return self._create_empty_result(product_name)
 
+        # Memoized results are shared, so each caller gets its own lists
+        result = self._memoized_normalize(product_name)
+        return replace(
+            result,
+            category_hints=list(result.category_hints),
+            normalization_steps=list(result.normalization_steps),
+        )
+
+    def _normalize_uncached(self, product_name: str) -> NormalizationResult:
+        """Run the full normalization pipeline (memoized by normalize)"""
         # Check cache
         cache_key = f"normalize:{hash(product_name)}"
         cached_result = self.cache.load(cache_key, expiration_minutes=60)
@@ -534,14 +571,13 @@ class BrazilianProductNormalizer:
         """Extract brand information from text"""
         extracted_brand = None
 
-        # Check for known Brazilian brands
+        # Check for known Brazilian brands in a single pass
         words = text.split()
-        for brand in self.brazilian_brands:
-            if brand in text:
-                extracted_brand = brand
-                # Remove brand from text (keep first occurrence)
-                text = text.replace(brand, " ", 1)
-                break
+        brand_match = self._brand_pattern.search(text) if self._brand_pattern else None
+        if brand_match:
+            extracted_brand = brand_match.group(0)
+            # Remove brand from text (first occurrence only)
+            text = text[: brand_match.start()] + " " + text[brand_match.end() :]
 
         # If no known brand found, check for potential brand patterns
         if not extracted_brand:
@@ -564,13 +600,11 @@ class BrazilianProductNormalizer:
         return extracted_brand, text
 
     def _expand_abbreviations(self, text: str) -> str:
-        """Expand common Brazilian abbreviations"""
-        for abbr, expansion in self.abbreviations.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(abbr) + r"\b"
-            text = re.sub(pattern, expansion, text)
+        """Expand common Brazilian abbreviations (whole words only, single pass)"""
+        if not self._abbreviation_pattern:
+            return text
 
-        return text
+        return self._abbreviation_pattern.sub(lambda match: self.abbreviations[match.group(0)], text)
 
     def _remove_noise_words(self, text: str) -> str:
         """Remove noise words"""
@@ -607,14 +641,10 @@ class BrazilianProductNormalizer:
 
     def _extract_category_hints(self, original_text: str) -> list[str]:
         """Extract category hints from original text"""
-        hints = []
         text_lower = original_text.lower()
 
-        for category, keywords in self.category_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    hints.append(category)
-                    break  # One hint per category
+        # One hint per category
+        hints = [category for category, pattern in self._category_patterns.items() if pattern.search(text_lower)]
 
         return list(set(hints))  # Remove duplicates
 
@@ -721,11 +751,15 @@ class BrazilianProductNormalizer:
     def add_custom_brand(self, brand: str):
         """Add custom brand to the recognition list"""
         self.brazilian_brands.add(brand.upper())
+        self._compile_patterns()
+        self._memoized_normalize.cache_clear()
         self.logger.info(f"Added custom brand: {brand}")
 
     def add_custom_abbreviation(self, abbr: str, expansion: str):
         """Add custom abbreviation expansion"""
         self.abbreviations[abbr.upper()] = expansion.upper()
+        self._compile_patterns()
+        self._memoized_normalize.cache_clear()
         self.logger.info(f"Added custom abbreviation: {abbr} -> {expansion}")
 
     def get_normalization_statistics(self) -> dict:
@@ -738,4 +772,6 @@ class BrazilianProductNormalizer:
             "total_categories": len(self.category_keywords),
             "supported_units": ["ML", "L", "G", "KG", "UN", "PCT", "CX"],
             "noise_words_count": len(self.noise_words),
+            "memoized_results": self._memoized_normalize.cache_info().currsize,
+            "memo_hits": self._memoized_normalize.cache_info().hits,
         }
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Distance Backend - Pluggable string distance kernels for similarity scoring"""
+
+import time
+
+from utils.dependencies import RAPIDFUZZ_AVAILABLE, require_optional
+
+# Both backends compute the exact same integer edit distance, so scores derived from
+# them are identical; the tolerance only absorbs floating point rounding differences.
+SCORE_TOLERANCE = 1e-9
+
+
+class DistanceBackend:
+    """Pure-Python string distance kernels, used when no native implementation is installed"""
+
+    name = "python"
+
+    def levenshtein_distance(self, s1: str, s2: str) -> int:
+        """Calculate Levenshtein distance between two strings"""
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+
+        if len(s2) == 0:
+            return len(s1)
+
+        previous_row = list(range(len(s2) + 1))
+
+        for i, c1 in enumerate(s1):
+            current_row = [i + 1]
+
+            for j, c2 in enumerate(s2):
+                insertions = previous_row[j + 1] + 1
+                deletions = current_row[j] + 1
+                substitutions = previous_row[j] + (c1 != c2)
+                current_row.append(min(insertions, deletions, substitutions))
+
+            previous_row = current_row
+
+        return previous_row[-1]
+
+
+class RapidFuzzDistanceBackend(DistanceBackend):
+    """String distance kernels backed by rapidfuzz's C++ implementation"""
+
+    name = "rapidfuzz"
+
+    def __init__(self):
+        self._levenshtein = require_optional("rapidfuzz.distance.Levenshtein", "ml")
+
+    def levenshtein_distance(self, s1: str, s2: str) -> int:
+        """Calculate Levenshtein distance between two strings"""
+        return self._levenshtein.distance(s1, s2)
+
+
+def get_distance_backend(preferred: str = "auto") -> DistanceBackend:
+    """Return a distance backend by name.
+
+    Args:
+        preferred: "auto" (rapidfuzz when installed, Python otherwise), "rapidfuzz" or "python"
+
+    Returns:
+        DistanceBackend instance
+    """
+    if preferred == "python":
+        return DistanceBackend()
+
+    if preferred == "rapidfuzz" or (preferred == "auto" and RAPIDFUZZ_AVAILABLE):
+        return RapidFuzzDistanceBackend()
+
+    if preferred != "auto":
+        raise ValueError(f"Unknown distance backend: {preferred}")
+
+    return DistanceBackend()
+
+
+def benchmark_backends(pairs: list[tuple[str, str]], repeats: int = 3) -> list[dict]:
+    """Measure per-pair Levenshtein cost of every available backend
+
+    Args:
+        pairs: Description pairs to compare
+        repeats: Number of passes over the pairs per backend (the fastest pass is kept)
+
+    Returns:
+        One entry per backend with the best per-pair cost in microseconds
+    """
+    backends = [DistanceBackend()]
+    if RAPIDFUZZ_AVAILABLE:
+        backends.append(RapidFuzzDistanceBackend())
+
+    timings = []
+    for backend in backends:
+        best = float("inf")
+        for _ in range(max(1, repeats)):
+            started = time.perf_counter()
+            for s1, s2 in pairs:
+                backend.levenshtein_distance(s1, s2)
+            best = min(best, time.perf_counter() - started)
+
+        timings.append(
+            {
+                "backend": backend.name,
+                "pairs": len(pairs),
+                "microseconds_per_pair": (best / len(pairs)) * 1_000_000 if pairs else 0.0,
+            }
+        )
+
+    return timings
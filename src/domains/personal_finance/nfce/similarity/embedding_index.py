@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Embedding Index - L2-normalized embedding matrix with blocked top-k and threshold search"""
+
+from collections.abc import Iterator
+
+import numpy as np
+
+from utils.dependencies import FAISS_AVAILABLE, require_optional
+from utils.logging.logging_manager import LogManager
+
+# Rows per block when multiplying against the full matrix; bounds the score block to
+# DEFAULT_CHUNK_SIZE x n_items floats regardless of how many queries are searched.
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def stack_embeddings(embeddings: list[np.ndarray], dtype=np.float64) -> np.ndarray:
+    """Stack embeddings into a matrix, resizing zero placeholder vectors to the common dimension
+
+    Embedding helpers return fixed-size zero vectors for empty texts or model errors, which may not
+    match the model's real dimension. The dimension is taken from the non-zero embeddings (the
+    widest placeholder when every embedding is zero).
+    """
+    if not embeddings:
+        return np.zeros((0, 0), dtype=dtype)
+
+    real_dimensions = {np.shape(embedding)[0] for embedding in embeddings if np.any(embedding)}
+    if len(real_dimensions) > 1:
+        raise ValueError(f"Embeddings have different dimensions: {sorted(real_dimensions)}")
+    dimension = real_dimensions.pop() if real_dimensions else max(np.shape(embedding)[0] for embedding in embeddings)
+
+    rows = [embedding if np.any(embedding) else np.zeros(dimension) for embedding in embeddings]
+    return np.vstack(rows).astype(dtype, copy=False)
+
+
+class EmbeddingIndex:
+    """Cosine similarity index over a stacked, L2-normalized embedding matrix
+
+    Top-k queries and all-pairs threshold searches are answered with blocked matrix
+    multiplications instead of per-pair Python dot products. Zero vectors stay zero after
+    normalization and therefore score 0 against everything.
+
+    An approximate nearest neighbour index (faiss HNSW) can be enabled for very large
+    catalogs; it only affects search(), threshold searches are always exact.
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray | list[np.ndarray],
+        use_ann: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype=np.float32,
+    ):
+        self.logger = LogManager.get_instance().get_logger("EmbeddingIndex")
+        self.chunk_size = max(1, chunk_size)
+
+        matrix = embeddings if isinstance(embeddings, np.ndarray) else stack_embeddings(embeddings, dtype)
+        self.vectors = self.normalize(np.asarray(matrix, dtype=dtype))
+
+        self._ann_index = None
+        if use_ann:
+            if FAISS_AVAILABLE:
+                self._ann_index = self._build_ann_index(self.vectors)
+            else:
+                self.logger.warning("faiss not installed, falling back to exact search")
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    @staticmethod
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize rows, leaving zero rows untouched"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+    def search(
+        self, queries: np.ndarray, top_k: int = 10, min_score: float | None = None
+    ) -> list[list[tuple[int, float]]]:
+        """Find the top-k most similar items for one or many query embeddings
+
+        Args:
+            queries: Query embedding (1-D) or matrix of query embeddings (n_queries x dim)
+            top_k: Number of neighbours to return per query
+            min_score: Optional minimum cosine similarity
+
+        Returns:
+            One list of (item index, cosine similarity) per query, best first
+        """
+        query_matrix = self.normalize(np.atleast_2d(np.asarray(queries, dtype=self.vectors.dtype)))
+        top_k = min(top_k, len(self))
+
+        if top_k <= 0:
+            return [[] for _ in range(query_matrix.shape[0])]
+
+        if self._ann_index is not None:
+            scores, indices = self._ann_index.search(query_matrix.astype(np.float32), top_k)
+            return [
+                [
+                    (int(i), float(s))
+                    for i, s in zip(row_indices, row_scores, strict=True)
+                    if i >= 0 and (min_score is None or s >= min_score)
+                ]
+                for row_indices, row_scores in zip(indices, scores, strict=True)
+            ]
+
+        results = []
+        for start in range(0, query_matrix.shape[0], self.chunk_size):
+            block = query_matrix[start : start + self.chunk_size] @ self.vectors.T
+
+            if top_k < block.shape[1]:
+                candidates = np.argpartition(-block, top_k - 1, axis=1)[:, :top_k]
+            else:
+                candidates = np.tile(np.arange(block.shape[1]), (block.shape[0], 1))
+
+            candidate_scores = np.take_along_axis(block, candidates, axis=1)
+            order = np.argsort(-candidate_scores, axis=1, kind="stable")
+
+            for row_indices, row_scores in zip(
+                np.take_along_axis(candidates, order, axis=1),
+                np.take_along_axis(candidate_scores, order, axis=1),
+                strict=True,
+            ):
+                results.append(
+                    [
+                        (int(i), float(s))
+                        for i, s in zip(row_indices, row_scores, strict=True)
+                        if min_score is None or s >= min_score
+                    ]
+                )
+
+        return results
+
+    def iter_pairs_above(self, threshold: float) -> Iterator[tuple[int, int, float]]:
+        """Yield every pair (i, j), i < j, whose cosine similarity is at least threshold
+
+        The upper triangle of the similarity matrix is computed block by block, so memory
+        stays bounded by chunk_size x n_items.
+        """
+        n_items = len(self)
+        for start in range(0, n_items, self.chunk_size):
+            stop = min(start + self.chunk_size, n_items)
+            block = self.vectors[start:stop] @ self.vectors[start:].T
+
+            # Keep strictly upper-triangular entries (j > i)
+            rows, cols = np.nonzero(np.triu(block >= threshold, k=1))
+            for row, col in zip(rows, cols, strict=True):
+                yield start + int(row), start + int(col), float(block[row, col])
+
+    def _build_ann_index(self, vectors: np.ndarray):
+        """Build an HNSW inner-product index over the normalized vectors"""
+        faiss = require_optional("faiss", "ml")
+
+        index = faiss.IndexHNSWFlat(vectors.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        self.logger.info(f"Built approximate index over {vectors.shape[0]} embeddings")
+
+        return index
@@ -8,6 +8,7 @@ import numpy as np
 from utils.cache_manager.cache_manager import CacheManager
 from utils.logging.logging_manager import LogManager
 
+from .embedding_index import DEFAULT_CHUNK_SIZE, EmbeddingIndex, stack_embeddings
 from .feature_extractor import ProductFeatures
 
 
@@ -250,6 +251,10 @@ class EmbeddingSimilarity:
     ) -> list[EmbeddingResult]:
         """Calculate similarity for all pairs in a batch.
 
+        Pairs are scored block by block with matrix products. Manhattan distance has no
+        matrix-product form, so it is only computed for pairs whose cosine and Euclidean
+        terms alone could still reach the threshold.
+
         Args:
             features_list: List of product features
             threshold: Minimum similarity threshold
@@ -262,46 +267,49 @@ class EmbeddingSimilarity:
 
         # Get all embeddings at once
         descriptions = [features.original_description for features in features_list]
-        embeddings = self.get_embeddings_batch(descriptions)
+        matrix = stack_embeddings(self.get_embeddings_batch(descriptions))
 
         results = []
+        n_items = matrix.shape[0]
 
-        # Calculate similarity for all pairs
-        for i in range(len(features_list)):
-            for j in range(i + 1, len(features_list)):
-                embedding1 = embeddings[i]
-                embedding2 = embeddings[j]
-
-                # Calculate similarity
-                cosine_sim = self._cosine_similarity(embedding1, embedding2)
-                euclidean_dist = self._euclidean_distance(embedding1, embedding2)
-                manhattan_dist = self._manhattan_distance(embedding1, embedding2)
-
-                # Normalize distances
-                normalized_euclidean = self._normalize_distance(euclidean_dist, max_distance=2.0)
-                normalized_manhattan = self._normalize_distance(manhattan_dist, max_distance=4.0)
-
-                # Calculate final score
-                final_score = (
-                    cosine_sim * self.weights["cosine"]
-                    + normalized_euclidean * self.weights["euclidean"]
-                    + normalized_manhattan * self.weights["manhattan"]
-                )
+        for start in range(0, n_items, DEFAULT_CHUNK_SIZE):
+            stop = min(start + DEFAULT_CHUNK_SIZE, n_items)
+            cosine, euclidean = self._cosine_and_euclidean(matrix[start:stop], matrix[start:])
+
+            # Upper bound of the final score assuming a perfect Manhattan term
+            normalized_euclidean = self._normalize_distances(euclidean, max_distance=2.0)
+            upper_bound = (
+                cosine * self.weights["cosine"]
+                + normalized_euclidean * self.weights["euclidean"]
+                + self.weights["manhattan"]
+            )
+            rows, cols = np.nonzero(np.triu(upper_bound >= threshold, k=1))
+            if rows.size == 0:
+                continue
+
+            manhattan = np.abs(matrix[start + rows] - matrix[start + cols]).sum(axis=1)
+            normalized_manhattan = self._normalize_distances(manhattan, max_distance=4.0)
+            final_scores = (
+                cosine[rows, cols] * self.weights["cosine"]
+                + normalized_euclidean[rows, cols] * self.weights["euclidean"]
+                + normalized_manhattan * self.weights["manhattan"]
+            )
 
-                # Only include results above threshold
-                if final_score >= threshold:
-                    result = EmbeddingResult(
-                        product1_description=features_list[i].original_description,
-                        product2_description=features_list[j].original_description,
-                        cosine_similarity=cosine_sim,
-                        euclidean_distance=euclidean_dist,
-                        manhattan_distance=manhattan_dist,
-                        normalized_cosine=cosine_sim,
-                        normalized_euclidean=normalized_euclidean,
-                        normalized_manhattan=normalized_manhattan,
-                        final_score=final_score,
+            for k in np.flatnonzero(final_scores >= threshold):
+                row, col = rows[k], cols[k]
+                results.append(
+                    EmbeddingResult(
+                        product1_description=features_list[start + row].original_description,
+                        product2_description=features_list[start + col].original_description,
+                        cosine_similarity=float(cosine[row, col]),
+                        euclidean_distance=float(euclidean[row, col]),
+                        manhattan_distance=float(manhattan[k]),
+                        normalized_cosine=float(cosine[row, col]),
+                        normalized_euclidean=float(normalized_euclidean[row, col]),
+                        normalized_manhattan=float(normalized_manhattan[k]),
+                        final_score=float(final_scores[k]),
                     )
-                    results.append(result)
+                )
 
         return results
 
@@ -323,39 +331,98 @@ class EmbeddingSimilarity:
         Returns:
             List of (ProductFeatures, similarity_score) tuples
         """
-        if not candidate_features:
-            return []
+        return self.find_similar_products_batch([target_features], candidate_features, top_k, threshold)[0]
+
+    def find_similar_products_batch(
+        self,
+        target_features: list[ProductFeatures],
+        candidate_features: list[ProductFeatures],
+        top_k: int = 10,
+        threshold: float = 0.5,
+    ) -> list[list[tuple[ProductFeatures, float]]]:
+        """Find the most similar candidates for many target products at once.
+
+        Targets are scored in blocks against the stacked candidate matrix and the top-k
+        of each row is selected with argpartition.
+
+        Args:
+            target_features: Target products
+            candidate_features: List of candidate products
+            top_k: Number of top results to return per target
+            threshold: Minimum similarity threshold
+
+        Returns:
+            One list of (ProductFeatures, similarity_score) tuples per target, best first
+        """
+        if not candidate_features or not target_features:
+            return [[] for _ in target_features]
 
         # Get embeddings
-        target_embedding = self.get_embedding(target_features.original_description)
-        candidate_descriptions = [f.original_description for f in candidate_features]
-        candidate_embeddings = self.get_embeddings_batch(candidate_descriptions)
+        target_matrix = stack_embeddings(self.get_embeddings_batch([f.original_description for f in target_features]))
+        candidate_matrix = stack_embeddings(
+            self.get_embeddings_batch([f.original_description for f in candidate_features])
+        )
 
-        similarities = []
+        # Keep the Manhattan broadcast (block x candidates x dim) bounded
+        block_size = max(1, DEFAULT_CHUNK_SIZE * 64 // max(1, candidate_matrix.shape[0]))
 
-        # Calculate similarity with all candidates
-        for i, candidate_embedding in enumerate(candidate_embeddings):
-            cosine_sim = self._cosine_similarity(target_embedding, candidate_embedding)
-            euclidean_dist = self._euclidean_distance(target_embedding, candidate_embedding)
-            manhattan_dist = self._manhattan_distance(target_embedding, candidate_embedding)
+        matches = []
+        for start in range(0, target_matrix.shape[0], block_size):
+            scores = self._combined_scores(target_matrix[start : start + block_size], candidate_matrix)
 
-            # Normalize distances
-            normalized_euclidean = self._normalize_distance(euclidean_dist, max_distance=2.0)
-            normalized_manhattan = self._normalize_distance(manhattan_dist, max_distance=4.0)
+            for row_scores in scores:
+                selected = np.flatnonzero(row_scores >= threshold)
+                if selected.size > top_k:
+                    selected = selected[np.argpartition(-row_scores[selected], top_k - 1)[:top_k]]
 
-            # Calculate final score
-            final_score = (
-                cosine_sim * self.weights["cosine"]
-                + normalized_euclidean * self.weights["euclidean"]
-                + normalized_manhattan * self.weights["manhattan"]
-            )
+                selected = selected[np.argsort(-row_scores[selected], kind="stable")]
+                matches.append([(candidate_features[i], float(row_scores[i])) for i in selected])
+
+        return matches
+
+    def build_index(self, features_list: list[ProductFeatures], use_ann: bool = False) -> EmbeddingIndex:
+        """Build a cosine similarity index over product embeddings for repeated top-k searches.
+
+        Args:
+            features_list: Products to index
+            use_ann: Use an approximate nearest neighbour index (requires faiss)
+
+        Returns:
+            EmbeddingIndex whose item indices follow features_list
+        """
+        descriptions = [features.original_description for features in features_list]
+        return EmbeddingIndex(self.get_embeddings_batch(descriptions), use_ann=use_ann)
+
+    def _combined_scores(self, queries: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Weighted cosine/Euclidean/Manhattan score matrix between query and candidate rows"""
+        cosine, euclidean = self._cosine_and_euclidean(queries, candidates)
+        manhattan = np.abs(queries[:, None, :] - candidates[None, :, :]).sum(axis=2)
+
+        return (
+            cosine * self.weights["cosine"]
+            + self._normalize_distances(euclidean, max_distance=2.0) * self.weights["euclidean"]
+            + self._normalize_distances(manhattan, max_distance=4.0) * self.weights["manhattan"]
+        )
+
+    def _cosine_and_euclidean(self, queries: np.ndarray, candidates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Cosine similarity and Euclidean distance matrices from a single matrix product"""
+        dots = queries @ candidates.T
+        query_norms = np.linalg.norm(queries, axis=1)
+        candidate_norms = np.linalg.norm(candidates, axis=1)
+        norm_products = np.outer(query_norms, candidate_norms)
+
+        cosine = np.divide(dots, norm_products, out=np.zeros_like(dots), where=norm_products > 0)
+        # Two zero vectors are considered identical, as in _cosine_similarity
+        cosine[np.outer(query_norms == 0, candidate_norms == 0)] = 1.0
+
+        squared = query_norms[:, None] ** 2 + candidate_norms[None, :] ** 2 - 2 * dots
+        euclidean = np.sqrt(np.maximum(squared, 0.0))
 
-            if final_score >= threshold:
-                similarities.append((candidate_features[i], final_score))
+        return cosine, euclidean
 
-        # Sort by similarity score (descending) and return top_k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+    def _normalize_distances(self, distances: np.ndarray, max_distance: float) -> np.ndarray:
+        """Vectorized _normalize_distance"""
+        return np.where(distances >= max_distance, 0.0, 1.0 - distances / max_distance)
 
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors"""
@@ -3,11 +3,15 @@
 
 import math
 import multiprocessing as mp
+import pickle
+import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from multiprocessing.shared_memory import SharedMemory
 
 from utils.logging.logging_manager import LogManager
 
+from .distance_backend import get_distance_backend
 from .feature_extractor import ProductFeatures
 from .hybrid_similarity_engine import HybridSimilarityEngine
 
@@ -88,6 +92,7 @@ class EnhancedSimilarityCalculator:
         similarity_threshold: float = 0.60,
         use_hybrid: bool = True,
         sbert_model: str = "rufimelo/Legal-BERTimbau-large",
+        distance_backend: str = "auto",
     ):
         """Initialize enhanced similarity calculator
 
@@ -95,10 +100,12 @@ class EnhancedSimilarityCalculator:
             similarity_threshold: Optimal threshold for similarity matching
             use_hybrid: Whether to use hybrid SBERT + rules approach
             sbert_model: SBERT model name for Portuguese embeddings
+            distance_backend: String distance backend ("auto", "rapidfuzz" or "python")
         """
         self.logger = LogManager.get_instance().get_logger("EnhancedSimilarityCalculator")
         self.similarity_threshold = similarity_threshold
         self.use_hybrid = use_hybrid
+        self.distance_backend = get_distance_backend(distance_backend)
 
         # Initialize hybrid engine
         if use_hybrid:
@@ -347,65 +354,116 @@ class EnhancedSimilarityCalculator:
         threshold: float,
         max_workers: int = None,
     ) -> list[EnhancedSimilarityResult]:
-        """Calculate similarity using parallel processing"""
+        """Calculate similarity using parallel processing.
+
+        The feature list is serialized once into a shared memory block that every
+        worker attaches to on startup, so tasks only carry a (start, stop) row range
+        and results come back as index pairs without the product features.
+        """
         if max_workers is None:
             max_workers = min(mp.cpu_count(), 8)  # Limit to 8 to avoid overwhelming
 
         self.logger.info(f"Using parallel processing with {max_workers} workers")
 
-        # Split features into chunks for parallel processing
-        chunk_size = max(10, len(features_list) // (max_workers * 4))
-        chunks = [features_list[i : i + chunk_size] for i in range(0, len(features_list), chunk_size)]
-
-        self.logger.info(f"Split into {len(chunks)} chunks of ~{chunk_size} products each")
-
-        # Prepare arguments for parallel processing
-        args_list = []
-        for i, chunk in enumerate(chunks):
-            # Each chunk compares against all features that come after it
-            remaining_features = features_list[i * chunk_size :]
-            if remaining_features:
-                args_list.append(
-                    (
-                        chunk,
-                        remaining_features,
-                        threshold,
-                        self.use_hybrid,
-                        "paraphrase-multilingual-MiniLM-L12-v2",
-                        self.similarity_threshold,
-                    )
-                )
+        row_ranges = _balanced_row_ranges(len(features_list), max_workers * 4)
+        self.logger.info(f"Split into {len(row_ranges)} row ranges of ~equal comparison count")
+
+        payload = pickle.dumps(features_list, protocol=pickle.HIGHEST_PROTOCOL)
+        shared_block = SharedMemory(create=True, size=len(payload))
+        shared_block.buf[: len(payload)] = payload
+        del payload
 
         results = []
         processed_chunks = 0
 
-        # Process chunks in parallel
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            future_to_chunk = {
-                executor.submit(_calculate_similarity_chunk, args): i for i, args in enumerate(args_list)
-            }
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_similarity_worker,
+                initargs=(
+                    shared_block.name,
+                    shared_block.size,
+                    threshold,
+                    self.use_hybrid,
+                    "paraphrase-multilingual-MiniLM-L12-v2",
+                    self.similarity_threshold,
+                    self.distance_backend.name,
+                ),
+            ) as executor:
+                futures = [executor.submit(_calculate_similarity_rows, row_range) for row_range in row_ranges]
+
+                for future in as_completed(futures):
+                    try:
+                        chunk_results = future.result()
+                        results.extend(
+                            replace(result, product1=features_list[i], product2=features_list[j])
+                            for i, j, result in chunk_results
+                        )
+                        processed_chunks += 1
+
+                        percentage = (processed_chunks / len(row_ranges)) * 100
+                        self.logger.info(
+                            f"Completed chunk {processed_chunks}/{len(row_ranges)} ({percentage:.1f}%) - "
+                            f"Found {len(chunk_results)} matches, Total: {len(results)}"
+                        )
+
+                    except Exception as e:
+                        self.logger.error(f"Error processing chunk: {e}")
+        finally:
+            shared_block.close()
+            shared_block.unlink()
 
-            for future in as_completed(future_to_chunk):
-                try:
-                    chunk_results = future.result()
-                    results.extend(chunk_results)
-                    processed_chunks += 1
+        results.sort(key=lambda x: (x.final_score, x.confidence_score), reverse=True)
 
-                    percentage = (processed_chunks / len(args_list)) * 100
-                    self.logger.info(
-                        f"Completed chunk {processed_chunks}/{len(args_list)} ({percentage:.1f}%) - "
-                        f"Found {len(chunk_results)} matches, Total: {len(results)}"
-                    )
+        self.logger.info(f"Parallel processing complete: {len(results)} matches found")
+        return results
 
-                except Exception as e:
-                    self.logger.error(f"Error processing chunk: {e}")
+    def benchmark_parallel_scaling(
+        self,
+        features_list: list[ProductFeatures],
+        threshold: float = None,
+        worker_counts: tuple[int, ...] = (1, 2, 4, 8),
+    ) -> list[dict]:
+        """Measure wall time of the parallel path for different worker counts
 
-        # Sort and deduplicate results
-        results = self._deduplicate_results(results)
-        results.sort(key=lambda x: (x.final_score, x.confidence_score), reverse=True)
+        Runs what calculate_batch_similarity runs in parallel mode: the list is reduced
+        with the fast filters once (not timed), and workers skip pairs failing the quick
+        dissimilarity check, so the timings cover the filtered pairwise scoring only.
 
-        self.logger.info(f"Parallel processing complete: {len(results)} unique matches found")
-        return results
+        Args:
+            features_list: Features to compare
+            threshold: Minimum similarity threshold to include in results
+            worker_counts: Worker counts to benchmark
+
+        Returns:
+            One entry per worker count with elapsed seconds, speedup over the first entry, products
+            compared after fast filtering and matches found
+        """
+        if threshold is None:
+            threshold = self.similarity_threshold
+
+        filtered_features = self._apply_fast_filters(features_list, threshold)
+        self.logger.info(f"Benchmark: {len(filtered_features)} of {len(features_list)} products after fast filtering")
+
+        timings = []
+        for workers in worker_counts:
+            started = time.perf_counter()
+            matches = self._calculate_parallel(filtered_features, threshold, max_workers=workers)
+            elapsed = time.perf_counter() - started
+
+            baseline = timings[0]["seconds"] if timings else elapsed
+            timings.append(
+                {
+                    "workers": workers,
+                    "seconds": elapsed,
+                    "speedup": baseline / elapsed if elapsed > 0 else 0.0,
+                    "products": len(filtered_features),
+                    "matches": len(matches),
+                }
+            )
+            self.logger.info(f"Benchmark: {workers} workers -> {elapsed:.2f}s ({len(matches)} matches)")
+
+        return timings
 
     def _calculate_sequential(
         self, features_list: list[ProductFeatures], threshold: float
@@ -457,8 +515,7 @@ class EnhancedSimilarityCalculator:
             return True
 
         # Check 2: No common tokens at all
-        tokens1, tokens2 = set(feat1.tokens), set(feat2.tokens)
-        if not tokens1.intersection(tokens2):
+        if not feat1.token_set & feat2.token_set:
             return True
 
         # Check 3: Very different categories
@@ -483,23 +540,6 @@ class EnhancedSimilarityCalculator:
 
         return False
 
-    def _deduplicate_results(self, results: list[EnhancedSimilarityResult]) -> list[EnhancedSimilarityResult]:
-        """Remove duplicate pairs from results"""
-        seen = set()
-        unique_results = []
-
-        for result in results:
-            # Create a normalized pair key
-            desc1 = result.product1.normalized_description
-            desc2 = result.product2.normalized_description
-            pair_key = tuple(sorted([desc1, desc2]))
-
-            if pair_key not in seen:
-                seen.add(pair_key)
-                unique_results.append(result)
-
-        return unique_results
-
     def find_duplicates(
         self, features_list: list[ProductFeatures], duplicate_threshold: float = None
     ) -> list[EnhancedSimilarityResult]:
@@ -537,37 +577,41 @@ class EnhancedSimilarityCalculator:
 
     # Traditional similarity methods (inherited from original SimilarityCalculator)
     def _jaccard_similarity(self, features1: ProductFeatures, features2: ProductFeatures) -> float:
-        """Calculate Jaccard similarity based on token sets"""
-        set1 = set(features1.tokens)
-        set2 = set(features2.tokens)
+        """Calculate Jaccard similarity based on token sets.
+
+        Jaccard = |A ∩ B| / |A ∪ B|
+        """
+        set1 = features1.token_set
+        set2 = features2.token_set
 
         if not set1 and not set2:
             return 1.0
+
         if not set1 or not set2:
             return 0.0
 
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
+        intersection = set1 & set2
+        union = set1 | set2
 
         return len(intersection) / len(union)
 
     def _cosine_similarity(self, features1: ProductFeatures, features2: ProductFeatures) -> float:
-        """Calculate cosine similarity based on token frequency vectors"""
-        all_tokens = set(features1.tokens + features2.tokens)
+        """Calculate cosine similarity based on token frequency vectors.
 
-        if not all_tokens:
-            return 1.0
+        Cosine = (A · B) / (||A|| × ||B||)
+        """
+        counts1 = features1.token_counts
+        counts2 = features2.token_counts
 
-        # Build frequency vectors
-        vector1 = [features1.tokens.count(token) for token in all_tokens]
-        vector2 = [features2.tokens.count(token) for token in all_tokens]
+        if not counts1 and not counts2:
+            return 1.0
 
-        # Calculate dot product
-        dot_product = sum(v1 * v2 for v1, v2 in zip(vector1, vector2))
+        # Only shared tokens contribute to the dot product
+        dot_product = sum(count * counts2[token] for token, count in counts1.items() if token in counts2)
 
         # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(v * v for v in vector1))
-        magnitude2 = math.sqrt(sum(v * v for v in vector2))
+        magnitude1 = math.sqrt(sum(v * v for v in counts1.values()))
+        magnitude2 = math.sqrt(sum(v * v for v in counts2.values()))
 
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
@@ -590,53 +634,30 @@ class EnhancedSimilarityCalculator:
         return 1.0 - (distance / max_length)
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein distance between two strings"""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = list(range(len(s2) + 1))
-
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-
-            previous_row = current_row
-
-        return previous_row[-1]
+        """Calculate Levenshtein distance between two strings using the configured backend"""
+        return self.distance_backend.levenshtein_distance(s1, s2)
 
     def _token_overlap_similarity(self, features1: ProductFeatures, features2: ProductFeatures) -> float:
-        """Calculate token overlap similarity with position weighting"""
-        tokens1 = features1.tokens
-        tokens2 = features2.tokens
+        """Calculate token overlap similarity.
 
-        if not tokens1 and not tokens2:
+        Share of unique tokens present in both products.
+        """
+        set1 = features1.token_set
+        set2 = features2.token_set
+
+        if not set1 and not set2:
             return 1.0
-        if not tokens1 or not tokens2:
-            return 0.0
 
-        # Simple overlap calculation
-        overlap_count = 0
-        total_tokens = len(set(tokens1 + tokens2))
+        if not set1 or not set2:
+            return 0.0
 
-        for token in set(tokens1):
-            if token in tokens2:
-                overlap_count += 1
+        total_tokens = len(set1 | set2)
 
-        return overlap_count / total_tokens if total_tokens > 0 else 0.0
+        return len(set1 & set2) / total_tokens if total_tokens > 0 else 0.0
 
     def _get_matching_tokens(self, features1: ProductFeatures, features2: ProductFeatures) -> list[str]:
         """Get list of matching tokens between two products"""
-        set1 = set(features1.tokens)
-        set2 = set(features2.tokens)
-        return list(set1.intersection(set2))
+        return list(features1.token_set & features2.token_set)
 
     def _get_matching_bigrams(self, features1: ProductFeatures, features2: ProductFeatures) -> list[str]:
         """Get list of matching bigrams between two products"""
@@ -676,7 +697,7 @@ class EnhancedSimilarityCalculator:
 
         # Core key matching bonus
         if features1.core_key and features2.core_key:
-            core_similarity = self._jaccard_similarity_text(features1.core_key, features2.core_key)
+            core_similarity = self._jaccard_similarity_sets(features1.core_key_tokens, features2.core_key_tokens)
             if core_similarity > 0.7:
                 score += self.bonuses["core_key_match"]
 
@@ -696,48 +717,86 @@ class EnhancedSimilarityCalculator:
 
         return score
 
-    def _jaccard_similarity_text(self, text1: str, text2: str) -> float:
-        """Calculate Jaccard similarity between two text strings"""
-        if not text1 and not text2:
-            return 1.0
-        if not text1 or not text2:
-            return 0.0
-
-        set1 = set(text1.split())
-        set2 = set(text2.split())
-
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
+    def _jaccard_similarity_sets(self, set1: frozenset[str], set2: frozenset[str]) -> float:
+        """Calculate Jaccard similarity between two precomputed word sets"""
+        intersection = set1 & set2
+        union = set1 | set2
 
         return len(intersection) / len(union) if union else 0.0
 
 
-def _calculate_similarity_chunk(args) -> list[EnhancedSimilarityResult]:
-    """Helper function for parallel similarity calculation
-    This needs to be a top-level function for multiprocessing to work
-    """
-    (
-        features_chunk,
-        other_features,
-        threshold,
-        use_hybrid,
-        sbert_model,
-        similarity_threshold,
-    ) = args
-
-    # Initialize calculator for this process
-    calc = EnhancedSimilarityCalculator(
+# Per-process state for the parallel path, populated once by _init_similarity_worker
+_worker_features: list[ProductFeatures] = []
+_worker_calculator: EnhancedSimilarityCalculator | None = None
+_worker_threshold: float = 0.0
+
+
+def _balanced_row_ranges(n_items: int, n_chunks: int) -> list[tuple[int, int]]:
+    """Split rows of the upper-triangular comparison matrix into ranges with ~equal pair counts"""
+    total_pairs = n_items * (n_items - 1) // 2
+    target = max(1, total_pairs // max(1, n_chunks))
+
+    ranges = []
+    start = 0
+    pairs = 0
+    for row in range(n_items - 1):
+        pairs += n_items - 1 - row
+        if pairs >= target:
+            ranges.append((start, row + 1))
+            start = row + 1
+            pairs = 0
+
+    if start < n_items - 1:
+        ranges.append((start, n_items - 1))
+
+    return ranges
+
+
+def _init_similarity_worker(
+    shared_name: str,
+    payload_size: int,
+    threshold: float,
+    use_hybrid: bool,
+    sbert_model: str,
+    similarity_threshold: float,
+    distance_backend: str,
+) -> None:
+    """Attach to the shared feature block and build the calculator once per worker process"""
+    global _worker_features, _worker_calculator, _worker_threshold  # noqa: PLW0603
+
+    shared_block = SharedMemory(name=shared_name, track=False)
+    try:
+        _worker_features = pickle.loads(shared_block.buf[:payload_size])
+    finally:
+        shared_block.close()
+
+    _worker_threshold = threshold
+    _worker_calculator = EnhancedSimilarityCalculator(
         similarity_threshold=similarity_threshold,
         use_hybrid=use_hybrid,
         sbert_model=sbert_model,
+        distance_backend=distance_backend,
     )
 
+
+def _calculate_similarity_rows(row_range: tuple[int, int]) -> list[tuple[int, int, EnhancedSimilarityResult]]:
+    """Compare rows [start, stop) against every later row of the shared feature list.
+
+    This needs to be a top-level function for multiprocessing to work. Results are
+    returned without their product features; the parent reattaches them by index.
+    """
+    start, stop = row_range
+    features = _worker_features
+    calc = _worker_calculator
+
     results = []
-    for feat1 in features_chunk:
-        for feat2 in other_features:
-            if feat1 != feat2:  # Avoid self-comparison
-                result = calc.calculate_similarity(feat1, feat2)
-                if result.final_score >= threshold:
-                    results.append(result)
+    for i in range(start, stop):
+        for j in range(i + 1, len(features)):
+            if calc._quick_dissimilarity_check(features[i], features[j]):
+                continue
+
+            result = calc.calculate_similarity(features[i], features[j])
+            if result.final_score >= _worker_threshold:
+                results.append((i, j, replace(result, product1=None, product2=None)))
 
     return results
@@ -2,7 +2,9 @@
 """Feature Extractor - Extract meaningful features from normalized product descriptions"""
 
 import re
+from collections import Counter
 from dataclasses import dataclass
+from functools import cached_property
 
 from utils.logging.logging_manager import LogManager
 
@@ -43,6 +45,21 @@ class ProductFeatures:
     core_key: str  # Most important words for matching
     variant_key: str  # Secondary words for variant detection
 
+    @cached_property
+    def token_set(self) -> frozenset[str]:
+        """Unique tokens, built once per product"""
+        return frozenset(self.tokens)
+
+    @cached_property
+    def token_counts(self) -> Counter:
+        """Token frequencies, built once per product (treat as read-only)"""
+        return Counter(self.tokens)
+
+    @cached_property
+    def core_key_tokens(self) -> frozenset[str]:
+        """Unique words of the core key, built once per product"""
+        return frozenset(self.core_key.split())
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         return {
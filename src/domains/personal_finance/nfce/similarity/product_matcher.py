@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Product Matcher - Main component that orchestrates product similarity detection and matching"""
 
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 
 from utils.cache_manager.cache_manager import CacheManager
@@ -11,6 +12,57 @@ from .product_normalizer import ProductNormalizer
 from .similarity_calculator import SimilarityCalculator, SimilarityResult
 
 
+class DisjointSet:
+    """Union-find structure over product indices with path compression and union by size.
+
+    Each root also accumulates the similarity scores of the edges merged into its
+    component, so group statistics are available without keeping the edge list.
+    """
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.scores: dict[int, list[float]] = {}
+
+    def find(self, node: int) -> int:
+        """Return the root of a node, compressing the path along the way"""
+        root = node
+        while self.parent[root] != root:
+            root = self.parent[root]
+
+        while self.parent[node] != root:
+            self.parent[node], node = root, self.parent[node]
+
+        return root
+
+    def union(self, node1: int, node2: int, score: float) -> int:
+        """Merge the components of two nodes and record the edge score on the resulting root"""
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+
+        if root1 != root2:
+            if self.size[root1] < self.size[root2]:
+                root1, root2 = root2, root1
+
+            self.parent[root2] = root1
+            self.size[root1] += self.size[root2]
+
+            merged_scores = self.scores.pop(root2, None)
+            if merged_scores:
+                self.scores.setdefault(root1, []).extend(merged_scores)
+
+        self.scores.setdefault(root1, []).append(score)
+        return root1
+
+    def components(self) -> list[tuple[list[int], list[float]]]:
+        """Return (member indices, edge scores) per component, ordered by smallest member index"""
+        members: dict[int, list[int]] = {}
+        for node in range(len(self.parent)):
+            members.setdefault(self.find(node), []).append(node)
+
+        return [(indices, self.scores.get(root, [])) for root, indices in members.items()]
+
+
 @dataclass
 class MatchGroup:
     """Data class representing a group of similar products"""
@@ -111,17 +163,20 @@ class ProductMatcher:
 
         # Step 1: Extract features for all products
         self.logger.info("Extracting features from products...")
-        features_list = self._extract_features_from_products(products)
+        product_indices, features_list = self._extract_indexed_features(products)
 
-        # Step 2: Calculate similarity between all products
+        # Step 2: Stream similarity scores between all products
         self.logger.info("Calculating similarity scores...")
-        similarity_results = self.similarity_calculator.calculate_batch_similarity(
-            features_list, threshold=self.thresholds["minimum"]
+        similarity_stream = (
+            (product_indices[i], product_indices[j], result)
+            for i, j, result in self.similarity_calculator.iter_batch_similarity(
+                features_list, threshold=self.thresholds["minimum"]
+            )
         )
 
-        # Step 3: Group products by similarity
+        # Step 3: Group products by similarity as results are produced
         self.logger.info("Grouping similar products...")
-        matching_results = self._group_products_by_similarity(products, similarity_results)
+        matching_results = self._group_products_by_similarity(products, similarity_stream)
 
         # Step 4: Cache results
         if self.cache_enabled:
@@ -250,10 +305,16 @@ class ProductMatcher:
 
     def _extract_features_from_products(self, products: list[dict]) -> list[ProductFeatures]:
         """Extract features from all products in the list"""
+        _, features_list = self._extract_indexed_features(products)
+        return features_list
+
+    def _extract_indexed_features(self, products: list[dict]) -> tuple[list[int], list[ProductFeatures]]:
+        """Extract features and keep the position of the originating product for each of them"""
+        product_indices = []
         features_list = []
         errors = 0
 
-        for product in products:
+        for index, product in enumerate(products):
             description = product.get("description", "")
             if not description:
                 self.logger.warning(f"Product missing description: {product}")
@@ -262,6 +323,7 @@ class ProductMatcher:
 
             try:
                 features = self.feature_extractor.extract(description)
+                product_indices.append(index)
                 features_list.append(features)
             except Exception as e:
                 self.logger.error(f"Error extracting features from '{description}': {e}")
@@ -270,55 +332,36 @@ class ProductMatcher:
         if errors > 0:
             self.logger.warning(f"Failed to extract features from {errors} products")
 
-        return features_list
+        return product_indices, features_list
 
     def _group_products_by_similarity(
-        self, products: list[dict], similarity_results: list[SimilarityResult]
+        self, products: list[dict], similarity_results: Iterable[tuple[int, int, SimilarityResult]]
     ) -> MatchingResults:
-        """Group products into similarity groups"""
-        # Create adjacency graph of similar products
-        product_graph: dict[int, set] = {}
-        for i in range(len(products)):
-            product_graph[i] = set()
-
-        # Add edges for similar products
-        for result in similarity_results:
-            # Find indices of products in similarity result
-            desc1 = result.product1.original_description
-            desc2 = result.product2.original_description
-
-            idx1 = self._find_product_index(products, desc1)
-            idx2 = self._find_product_index(products, desc2)
+        """Group products into similarity groups.
 
-            if idx1 is not None and idx2 is not None:
-                product_graph[idx1].add(idx2)
-                product_graph[idx2].add(idx1)
-
-        # Find connected components (groups)
-        visited: set = set()
-        groups = []
+        Args:
+            products: Products being analyzed
+            similarity_results: Stream of (product index, product index, SimilarityResult) edges.
+                It is consumed once and never materialized.
+        """
+        disjoint_set = DisjointSet(len(products))
 
-        for i in range(len(products)):
-            if i not in visited:
-                group = self._dfs_group(product_graph, i, visited)
-                groups.append(group)
+        for idx1, idx2, result in similarity_results:
+            disjoint_set.union(idx1, idx2, result.final_score)
 
         # Create MatchGroup objects
         duplicate_groups: list[MatchGroup] = []
         similar_groups: list[MatchGroup] = []
         singleton_products = []
 
-        for group_indices in groups:
+        for group_indices, group_similarities in disjoint_set.components():
             if len(group_indices) == 1:
                 # Singleton product
-                idx = list(group_indices)[0]
-                singleton_products.append(products[idx])
+                singleton_products.append(products[group_indices[0]])
             else:
                 # Multi-product group
                 group_products = [products[i] for i in group_indices]
-
-                # Calculate average similarity within group
-                group_similarities = self._calculate_group_similarities(group_indices, similarity_results, products)
+                group_similarities.sort(reverse=True)
 
                 avg_similarity = sum(group_similarities) / len(group_similarities) if group_similarities else 0
 
@@ -326,7 +369,7 @@ class ProductMatcher:
                 representative = self._choose_representative_product(group_products, group_similarities)
 
                 match_group = MatchGroup(
-                    group_id=f"group_{len(duplicate_groups + similar_groups)}",
+                    group_id=f"group_{len(duplicate_groups) + len(similar_groups)}",
                     representative_product=representative,
                     products=group_products,
                     similarity_scores=group_similarities,
@@ -359,48 +402,6 @@ class ProductMatcher:
             largest_group_size=largest_group_size,
         )
 
-    def _find_product_index(self, products: list[dict], description: str) -> int | None:
-        """Find the index of a product by its description"""
-        for i, product in enumerate(products):
-            if product.get("description", "") == description:
-                return i
-        return None
-
-    def _dfs_group(self, graph: dict[int, set], start: int, visited: set) -> set:
-        """Depth-first search to find connected components"""
-        group = set()
-        stack = [start]
-
-        while stack:
-            node = stack.pop()
-            if node not in visited:
-                visited.add(node)
-                group.add(node)
-                stack.extend(graph[node] - visited)
-
-        return group
-
-    def _calculate_group_similarities(
-        self,
-        group_indices: set,
-        similarity_results: list[SimilarityResult],
-        products: list[dict],
-    ) -> list[float]:
-        """Calculate similarities within a group"""
-        similarities = []
-
-        for result in similarity_results:
-            desc1 = result.product1.original_description
-            desc2 = result.product2.original_description
-
-            idx1 = self._find_product_index(products, desc1)
-            idx2 = self._find_product_index(products, desc2)
-
-            if idx1 in group_indices and idx2 in group_indices:
-                similarities.append(result.final_score)
-
-        return similarities
-
     def _choose_representative_product(self, group_products: list[dict], similarities: list[float]) -> str:
         """Choose the most representative product from a group"""
         if not group_products:
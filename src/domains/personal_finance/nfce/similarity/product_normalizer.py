@@ -3,9 +3,13 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 
 from utils.logging.logging_manager import LogManager
 
+# Maximum number of distinct descriptions whose normalization is kept in memory
+NORMALIZATION_MEMO_SIZE = 20000
+
 
 class ProductNormalizer:
     """Normalize product descriptions for better matching and comparison.
@@ -462,6 +466,10 @@ class ProductNormalizer:
             ],
         }
 
+        # normalize() is called several times per description (FeatureExtractor.extract calls it
+        # directly and again through extract_features), so results are memoized per instance
+        self._memoized_normalize = lru_cache(maxsize=NORMALIZATION_MEMO_SIZE)(self._normalize_uncached)
+
     def normalize(self, description: str, preserve_brand: bool = True) -> str:
         """Main normalization method that applies all transformations.
 
@@ -475,6 +483,10 @@ class ProductNormalizer:
         if not description:
             return ""
 
+        return self._memoized_normalize(description, preserve_brand)
+
+    def _normalize_uncached(self, description: str, preserve_brand: bool) -> str:
+        """Apply all normalization steps (memoized by normalize)"""
         self.logger.debug(f"Normalizing: '{description}'")
 
         # Step 1: Basic cleaning
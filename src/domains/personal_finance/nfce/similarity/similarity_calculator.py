@@ -2,10 +2,12 @@
 """Similarity Calculator - Calculate similarity scores between products using various algorithms"""
 
 import math
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from utils.logging.logging_manager import LogManager
 
+from .distance_backend import get_distance_backend
 from .feature_extractor import ProductFeatures
 
 
@@ -55,12 +57,15 @@ class SimilarityCalculator:
     to produce a robust similarity score for product matching.
     """
 
-    def __init__(self, similarity_threshold: float = 0.60):
+    def __init__(self, similarity_threshold: float = 0.60, distance_backend: str = "auto"):
         self.logger = LogManager.get_instance().get_logger("SimilarityCalculator")
 
         # Optimal similarity threshold (determined through training)
         self.similarity_threshold = similarity_threshold
 
+        # String distance kernels (native rapidfuzz when installed, pure Python otherwise)
+        self.distance_backend = get_distance_backend(distance_backend)
+
         # Algorithm weights for final score calculation
         self.weights = {
             "jaccard": 0.3,
@@ -134,8 +139,8 @@ class SimilarityCalculator:
 
         Jaccard = |A ∩ B| / |A ∪ B|
         """
-        set1 = set(features1.tokens)
-        set2 = set(features2.tokens)
+        set1 = features1.token_set
+        set2 = features2.token_set
 
         if not set1 and not set2:
             return 1.0
@@ -143,8 +148,8 @@ class SimilarityCalculator:
         if not set1 or not set2:
             return 0.0
 
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
+        intersection = set1 & set2
+        union = set1 | set2
 
         return len(intersection) / len(union)
 
@@ -153,22 +158,18 @@ class SimilarityCalculator:
 
         Cosine = (A · B) / (||A|| × ||B||)
         """
-        # Create frequency vectors for all unique tokens
-        all_tokens = set(features1.tokens + features2.tokens)
+        counts1 = features1.token_counts
+        counts2 = features2.token_counts
 
-        if not all_tokens:
+        if not counts1 and not counts2:
             return 1.0
 
-        # Build frequency vectors
-        vector1 = [features1.tokens.count(token) for token in all_tokens]
-        vector2 = [features2.tokens.count(token) for token in all_tokens]
-
-        # Calculate dot product
-        dot_product = sum(v1 * v2 for v1, v2 in zip(vector1, vector2))
+        # Only shared tokens contribute to the dot product
+        dot_product = sum(count * counts2[token] for token, count in counts1.items() if token in counts2)
 
         # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(v * v for v in vector1))
-        magnitude2 = math.sqrt(sum(v * v for v in vector2))
+        magnitude1 = math.sqrt(sum(v * v for v in counts1.values()))
+        magnitude2 = math.sqrt(sum(v * v for v in counts2.values()))
 
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
@@ -195,58 +196,30 @@ class SimilarityCalculator:
         return 1.0 - (distance / max_length)
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein distance between two strings"""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = list(range(len(s2) + 1))
-
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-
-            previous_row = current_row
-
-        return previous_row[-1]
+        """Calculate Levenshtein distance between two strings using the configured backend"""
+        return self.distance_backend.levenshtein_distance(s1, s2)
 
     def _token_overlap_similarity(self, features1: ProductFeatures, features2: ProductFeatures) -> float:
-        """Calculate token overlap similarity with position weighting.
+        """Calculate token overlap similarity.
 
-        Gives higher weight to matching tokens in similar positions.
+        Share of unique tokens present in both products.
         """
-        tokens1 = features1.tokens
-        tokens2 = features2.tokens
+        set1 = features1.token_set
+        set2 = features2.token_set
 
-        if not tokens1 and not tokens2:
+        if not set1 and not set2:
             return 1.0
 
-        if not tokens1 or not tokens2:
+        if not set1 or not set2:
             return 0.0
 
-        # Simple overlap calculation
-        overlap_count = 0
-        total_tokens = len(set(tokens1 + tokens2))
-
-        for token in set(tokens1):
-            if token in tokens2:
-                overlap_count += 1
+        total_tokens = len(set1 | set2)
 
-        return overlap_count / total_tokens if total_tokens > 0 else 0.0
+        return len(set1 & set2) / total_tokens if total_tokens > 0 else 0.0
 
     def _get_matching_tokens(self, features1: ProductFeatures, features2: ProductFeatures) -> list[str]:
         """Get list of matching tokens between two products"""
-        set1 = set(features1.tokens)
-        set2 = set(features2.tokens)
-
-        return list(set1.intersection(set2))
+        return list(features1.token_set & features2.token_set)
 
     def _get_matching_bigrams(self, features1: ProductFeatures, features2: ProductFeatures) -> list[str]:
         """Get list of matching bigrams between two products"""
@@ -294,7 +267,7 @@ class SimilarityCalculator:
 
         # Core key matching bonus
         if features1.core_key and features2.core_key:
-            core_similarity = self._jaccard_similarity_text(features1.core_key, features2.core_key)
+            core_similarity = self._jaccard_similarity_sets(features1.core_key_tokens, features2.core_key_tokens)
             if core_similarity > 0.7:
                 base_score += self.bonuses["core_key_match"]
 
@@ -308,19 +281,10 @@ class SimilarityCalculator:
         # Ensure score is between 0 and 1
         return max(0.0, min(1.0, base_score))
 
-    def _jaccard_similarity_text(self, text1: str, text2: str) -> float:
-        """Calculate Jaccard similarity between two text strings"""
-        if not text1 and not text2:
-            return 1.0
-
-        if not text1 or not text2:
-            return 0.0
-
-        set1 = set(text1.split())
-        set2 = set(text2.split())
-
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
+    def _jaccard_similarity_sets(self, set1: frozenset[str], set2: frozenset[str]) -> float:
+        """Calculate Jaccard similarity between two precomputed word sets"""
+        intersection = set1 & set2
+        union = set1 | set2
 
         return len(intersection) / len(union) if union else 0.0
 
@@ -339,9 +303,37 @@ class SimilarityCalculator:
         if threshold is None:
             threshold = self.similarity_threshold
 
+        results = list(self.iter_batch_similarity(features_list, threshold))
+
+        # Sort by similarity score (descending)
+        results.sort(key=lambda x: x.final_score, reverse=True)
+
+        self.logger.info(f"Found {len(results)} similar pairs above threshold {threshold}")
+
+        return results
+
+    def iter_batch_similarity(
+        self, features_list: list[ProductFeatures], threshold: float = None
+    ) -> Iterator[tuple[int, int, SimilarityResult]]:
+        """Stream similarity results for all pairs in a batch of features.
+
+        Unlike calculate_batch_similarity, results are yielded as they are computed
+        (in pair order, unsorted) so callers can consume them without holding the
+        full result list in memory.
+
+        Args:
+            features_list: List of ProductFeatures to compare
+            threshold: Minimum similarity threshold to include in results
+
+        Yields:
+            Tuples of (index1, index2, SimilarityResult) for pairs above threshold,
+            where the indices refer to positions in features_list
+        """
+        if threshold is None:
+            threshold = self.similarity_threshold
+
         self.logger.info(f"Calculating batch similarity for {len(features_list)} products (threshold: {threshold})")
 
-        results = []
         total_comparisons = len(features_list) * (len(features_list) - 1) // 2
         processed = 0
 
@@ -350,20 +342,13 @@ class SimilarityCalculator:
                 result = self.calculate_similarity(features_list[i], features_list[j])
 
                 if result.final_score >= threshold:
-                    results.append(result)
+                    yield i, j, result
 
                 processed += 1
 
                 if processed % 1000 == 0:
                     self.logger.debug(f"Processed {processed}/{total_comparisons} comparisons")
 
-        # Sort by similarity score (descending)
-        results.sort(key=lambda x: x.final_score, reverse=True)
-
-        self.logger.info(f"Found {len(results)} similar pairs above threshold {threshold}")
-
-        return results
-
     def find_duplicates(
         self, features_list: list[ProductFeatures], duplicate_threshold: float = None
     ) -> list[SimilarityResult]:
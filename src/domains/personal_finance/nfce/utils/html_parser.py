@@ -1,8 +1,12 @@
 import re
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from typing import Any
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
 
 from domains.personal_finance.nfce.models.invoice_data import (
     ConsumerData,
@@ -11,15 +15,105 @@ from domains.personal_finance.nfce.models.invoice_data import (
     ProductData,
     TaxData,
 )
+from utils.dependencies import LXML_AVAILABLE
 from utils.logging.logging_manager import LogManager
 
+# BeautifulSoup tree builders accepted by NFCeDataExtractor
+HTML_PARSERS = ("html.parser", "lxml")
+
+
+def _has_class(tag: Tag, class_name: str) -> bool:
+    """Match a class the way BeautifulSoup's class_ filter does (single class or exact attribute value)"""
+    classes = tag.get("class")
+    if not classes:
+        return False
+    return class_name in classes or " ".join(classes) == class_name
+
+
+class _PageIndex:
+    """Index of a parsed NFCe page built with a single walk over the tree
+
+    Tags are bucketed by name and text nodes kept in document order, so the extractor's
+    whole-page lookups (panels, tables, label text) become list scans over small buckets
+    instead of repeated find_all() traversals. Results keep document order, matching the
+    find_all() calls they replace.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self._tags: dict[str, list[Tag]] = defaultdict(list)
+        self._strings: list[NavigableString] = []
+
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                self._tags[node.name].append(node)
+            elif isinstance(node, NavigableString):
+                self._strings.append(node)
+
+        self._texts: dict[int, str] = {}
+        self._panel_titles: list[tuple[Tag, str | None]] | None = None
+        self._page_text: str | None = None
+
+    def tags(self, name: str, class_name: str | None = None) -> list[Tag]:
+        """All tags with the given name (and class), in document order"""
+        tags = self._tags.get(name, [])
+        if class_name is None:
+            return tags
+        return [tag for tag in tags if _has_class(tag, class_name)]
+
+    def find(self, name: str, class_name: str | None = None) -> Tag | None:
+        """First tag with the given name (and class)"""
+        return next(iter(self.tags(name, class_name)), None)
+
+    def text(self, tag: Tag) -> str:
+        """get_text() of a tag, computed once per tag"""
+        key = id(tag)
+        if key not in self._texts:
+            self._texts[key] = tag.get_text()
+        return self._texts[key]
+
+    def strings_containing(self, fragment: str) -> list[NavigableString]:
+        """Text nodes containing fragment, like find_all(string=lambda t: t and fragment in t)"""
+        return [string for string in self._strings if string and fragment in string]
+
+    def panels(self, title_fragment: str) -> list[Tag]:
+        """Bootstrap panels whose title (first h4.panel-title) contains title_fragment"""
+        if self._panel_titles is None:
+            self._panel_titles = []
+            for panel in self.tags("div", "panel panel-default"):
+                panel_title = panel.find("h4", class_="panel-title")
+                self._panel_titles.append((panel, panel_title.get_text() if panel_title else None))
+
+        return [panel for panel, title in self._panel_titles if title and title_fragment in title]
+
+    @property
+    def page_text(self) -> str:
+        """get_text() of the whole page, computed once"""
+        if self._page_text is None:
+            self._page_text = self.soup.get_text()
+        return self._page_text
+
 
 class NFCeDataExtractor:
     """Extracts structured data from Portal SPED NFCe HTML pages"""
 
-    def __init__(self):
+    def __init__(self, parser: str = "html.parser"):
+        """Initialize extractor
+
+        Args:
+            parser: BeautifulSoup tree builder, "html.parser" or "lxml" (faster, needs lxml installed)
+        """
+        if parser not in HTML_PARSERS:
+            raise ValueError(f"Unknown HTML parser: {parser}")
+        if parser == "lxml" and not LXML_AVAILABLE:
+            raise ValueError("lxml is not installed, use the 'html.parser' parser")
+
+        self.parser = parser
         self.logger = LogManager.get_instance().get_logger("NFCeDataExtractor")
 
+        # Page index of the document being extracted, per thread (extractors are shared by workers)
+        self._local = threading.local()
+
         # Portuguese-based CSS selectors for NFCe pages
         # These use actual Portuguese terms found on Portal SPED pages
         self.portuguese_selectors = {
@@ -120,7 +214,8 @@ class NFCeDataExtractor:
             InvoiceData object with extracted information
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, self.parser)
+            self._local.index = _PageIndex(soup)
 
             # Create invoice data object
             invoice_data = InvoiceData(
@@ -187,22 +282,17 @@ class NFCeDataExtractor:
     def _extract_from_invoice_table(self, soup: BeautifulSoup) -> tuple[str | None, str | None, str | None]:
         """Extract invoice data from the specific table structure in "Informações gerais da Nota" section"""
         try:
-            # First, try to find the specific section "Informações gerais da Nota"
-            info_section = None
+            index = self._index(soup)
 
-            # Look for the panel with "Informações gerais da Nota"
-            panels = soup.find_all("div", class_="panel panel-default")
-            for panel in panels:
-                panel_title = panel.find("h4", class_="panel-title")
-                if panel_title and "Informações gerais da Nota" in panel_title.get_text():
-                    info_section = panel
-                    break
+            # First, try to find the specific section "Informações gerais da Nota"
+            info_section = next(iter(index.panels("Informações gerais da Nota")), None)
 
             # If we found the specific section, search only within it
-            search_area = info_section if info_section else soup
-
             # Find table containing the headers "Modelo", "Série", "Número", "Data Emissão"
-            tables = search_area.find_all("table", class_="table table-hover")
+            if info_section:
+                tables = info_section.find_all("table", class_="table table-hover")
+            else:
+                tables = index.tags("table", "table table-hover")
 
             for table in tables:
                 # Check if this table has the expected headers
@@ -271,7 +361,7 @@ class NFCeDataExtractor:
         """
         try:
             # Look for the main table at the top with the NFCe header
-            main_table = soup.find("table", class_="table text-center")
+            main_table = self._index(soup).find("table", "table text-center")
             if not main_table:
                 return None
 
@@ -339,15 +429,7 @@ class NFCeDataExtractor:
         """Extract establishment data from the specific "Emitente" table in "Informações gerais da Nota" section"""
         try:
             # First, try to find the specific section "Informações gerais da Nota"
-            info_section = None
-
-            # Look for the panel with "Informações gerais da Nota"
-            panels = soup.find_all("div", class_="panel panel-default")
-            for panel in panels:
-                panel_title = panel.find("h4", class_="panel-title")
-                if panel_title and "Informações gerais da Nota" in panel_title.get_text():
-                    info_section = panel
-                    break
+            info_section = next(iter(self._index(soup).panels("Informações gerais da Nota")), None)
 
             if not info_section:
                 return None
@@ -416,15 +498,7 @@ class NFCeDataExtractor:
         """Extract financial data from the specific "Valor total do serviço" table in "Informações gerais da Nota" section"""
         try:
             # First, try to find the specific section "Informações gerais da Nota"
-            info_section = None
-
-            # Look for the panel with "Informações gerais da Nota"
-            panels = soup.find_all("div", class_="panel panel-default")
-            for panel in panels:
-                panel_title = panel.find("h4", class_="panel-title")
-                if panel_title and "Informações gerais da Nota" in panel_title.get_text():
-                    info_section = panel
-                    break
+            info_section = next(iter(self._index(soup).panels("Informações gerais da Nota")), None)
 
             if not info_section:
                 return None
@@ -485,54 +559,51 @@ class NFCeDataExtractor:
         """Extract consumer data from the specific "Consumidor" table"""
         try:
             # Look for the panel with "Consumidor"
-            panels = soup.find_all("div", class_="panel panel-default")
-            for panel in panels:
-                panel_title = panel.find("h4", class_="panel-title")
-                if panel_title and "Consumidor" in panel_title.get_text():
-                    # Find the table in this panel
-                    table = panel.find("table", class_="table table-hover")
-                    if not table:
-                        continue
+            for panel in self._index(soup).panels("Consumidor"):
+                # Find the table in this panel
+                table = panel.find("table", class_="table table-hover")
+                if not table:
+                    continue
 
-                    # Check if this table has the expected headers for consumer data
-                    headers = table.find_all("th")
-                    header_texts = [th.get_text().strip() for th in headers]
+                # Check if this table has the expected headers for consumer data
+                headers = table.find_all("th")
+                header_texts = [th.get_text().strip() for th in headers]
 
-                    if "Nome / Razão Social" in header_texts and "UF" in header_texts:
-                        # Find the indices of our target columns
-                        nome_idx = header_texts.index("Nome / Razão Social")
-                        uf_idx = header_texts.index("UF")
+                if "Nome / Razão Social" in header_texts and "UF" in header_texts:
+                    # Find the indices of our target columns
+                    nome_idx = header_texts.index("Nome / Razão Social")
+                    uf_idx = header_texts.index("UF")
 
-                        # Find the data row
-                        tbody = table.find("tbody")
-                        data_row = tbody.find("tr") if tbody else None
+                    # Find the data row
+                    tbody = table.find("tbody")
+                    data_row = tbody.find("tr") if tbody else None
 
-                        if not data_row:
-                            rows = table.find_all("tr")
-                            data_row = rows[1] if len(rows) > 1 else None
+                    if not data_row:
+                        rows = table.find_all("tr")
+                        data_row = rows[1] if len(rows) > 1 else None
 
-                        if data_row:
-                            cells = data_row.find_all(["td", "th"])
+                    if data_row:
+                        cells = data_row.find_all(["td", "th"])
 
-                            consumer_data = {}
+                        consumer_data = {}
 
-                            if nome_idx < len(cells):
-                                name_text = self._clean_text(cells[nome_idx].get_text())
-                                if name_text:  # Only add if not empty
-                                    consumer_data["name"] = name_text
+                        if nome_idx < len(cells):
+                            name_text = self._clean_text(cells[nome_idx].get_text())
+                            if name_text:  # Only add if not empty
+                                consumer_data["name"] = name_text
 
-                            if uf_idx < len(cells):
-                                uf_text = self._clean_text(cells[uf_idx].get_text())
-                                if uf_text:  # Only add if not empty
-                                    consumer_data["state"] = uf_text
+                        if uf_idx < len(cells):
+                            uf_text = self._clean_text(cells[uf_idx].get_text())
+                            if uf_text:  # Only add if not empty
+                                consumer_data["state"] = uf_text
 
-                            # Look for CPF in other tables in the same section
-                            # (Sometimes CPF might be in a different table)
-                            consumer_data.update(self._find_cpf_in_consumer_section(panel))
+                        # Look for CPF in other tables in the same section
+                        # (Sometimes CPF might be in a different table)
+                        consumer_data.update(self._find_cpf_in_consumer_section(panel))
 
-                            if consumer_data:  # Only return if we found some data
-                                self.logger.debug(f"Extracted consumer from table: {consumer_data}")
-                                return consumer_data
+                        if consumer_data:  # Only return if we found some data
+                            self.logger.debug(f"Extracted consumer from table: {consumer_data}")
+                            return consumer_data
 
             return None
 
@@ -777,7 +848,7 @@ class NFCeDataExtractor:
 
         try:
             # Find the specific product table
-            product_table = soup.find("table", class_="table table-striped")
+            product_table = self._index(soup).find("table", "table table-striped")
             if not product_table:
                 return items
 
@@ -919,22 +990,24 @@ class NFCeDataExtractor:
         try:
             taxes = TaxData()
 
-            # Look for tax-related text
+            index = self._index(soup)
+
+            # Look for tax-related text (tag, text it must contain), like 'span:contains("ICMS")'
             tax_selectors = [
-                'span:contains("ICMS")',
-                'td:contains("ICMS")',
-                'span:contains("PIS")',
-                'td:contains("PIS")',
-                'span:contains("COFINS")',
-                'td:contains("COFINS")',
-                'span:contains("Tributo")',
-                'td:contains("Tributo")',
+                ("span", "ICMS"),
+                ("td", "ICMS"),
+                ("span", "PIS"),
+                ("td", "PIS"),
+                ("span", "COFINS"),
+                ("td", "COFINS"),
+                ("span", "Tributo"),
+                ("td", "Tributo"),
             ]
 
-            for selector in tax_selectors:
-                elements = soup.select(selector)
+            for tag_name, term in tax_selectors:
+                elements = [element for element in index.tags(tag_name) if term in index.text(element)]
                 for element in elements:
-                    text = element.get_text()
+                    text = index.text(element)
 
                     # Extract tax values
                     if "ICMS" in text.upper():
@@ -1001,6 +1074,14 @@ class NFCeDataExtractor:
             invoice_data.add_error(f"Failed to extract financial data: {e}")
 
     # Helper methods
+    def _index(self, soup: BeautifulSoup) -> _PageIndex:
+        """Get the page index of soup, building it if soup is not the page being extracted"""
+        index = getattr(self._local, "index", None)
+        if index is None or index.soup is not soup:
+            index = _PageIndex(soup)
+            self._local.index = index
+        return index
+
     def _find_text_by_selectors(self, soup: BeautifulSoup, selectors: list[str]) -> str | None:
         """Find text using multiple CSS selectors"""
         for selector in selectors:
@@ -1016,12 +1097,18 @@ class NFCeDataExtractor:
             return None
 
         selectors = self.portuguese_selectors[portuguese_key]
+        contains_searched = False
 
         for selector in selectors:
             try:
-                # Handle :contains() selectors specially
+                # Handle :contains() selectors specially; they all search text nodes for the key
+                # itself, so the search only needs to run once
                 if ":contains(" in selector:
-                    elements = soup.find_all(text=lambda text: text and portuguese_key in text)
+                    if contains_searched:
+                        continue
+                    contains_searched = True
+
+                    elements = self._index(soup).strings_containing(portuguese_key)
                     for element in elements:
                         if element.parent:
                             # Get next sibling text or parent text
@@ -1106,9 +1193,10 @@ class NFCeDataExtractor:
         # Look for tables containing product-related Portuguese terms
         product_terms = ["Descrição", "Código", "Quantidade", "Valor", "Total", "UN"]
 
-        tables = soup.find_all("table")
+        index = self._index(soup)
+        tables = index.tags("table")
         for table in tables:
-            table_text = table.get_text()
+            table_text = index.text(table)
             # Count how many product terms appear in this table
             term_count = sum(1 for term in product_terms if term in table_text)
 
@@ -1179,7 +1267,7 @@ class NFCeDataExtractor:
 
         try:
             # Look for text elements containing the company name
-            company_elements = soup.find_all(text=lambda text: text and company_name in text)
+            company_elements = self._index(soup).strings_containing(company_name)
 
             for element in company_elements:
                 if element.parent:
@@ -1204,7 +1292,7 @@ class NFCeDataExtractor:
         """Find consumer name in various contexts"""
         try:
             # Look for "Nome" in consumer/CPF context
-            cpf_elements = soup.find_all(text=lambda text: text and "CPF" in text)
+            cpf_elements = self._index(soup).strings_containing("CPF")
 
             for element in cpf_elements:
                 if element.parent:
@@ -1232,7 +1320,7 @@ class NFCeDataExtractor:
                 r"R\$\s*([\d,.]+)",
             ]
 
-            page_text = soup.get_text()
+            page_text = self._index(soup).page_text
 
             for pattern in total_patterns:
                 matches = re.findall(pattern, page_text)
@@ -1404,11 +1492,13 @@ class NFCeDataExtractor:
             True if page appears to be empty/expired NFCe
         """
         try:
+            index = self._index(soup)
+
             # Check if we have the NFCe page structure but empty data
             has_nfce_structure = (
-                soup.find(string=lambda text: text and "Nota Fiscal de Consumidor Eletrônica" in text) is not None
-                or soup.find("title", string=lambda text: text and "SEF" in text) is not None
-                or soup.find("form", id="formPrincipal") is not None
+                bool(index.strings_containing("Nota Fiscal de Consumidor Eletrônica"))
+                or any(title.string and "SEF" in title.string for title in index.tags("title"))
+                or any(form.get("id") == "formPrincipal" for form in index.tags("form"))
             )
 
             if not has_nfce_structure:
@@ -1424,7 +1514,7 @@ class NFCeDataExtractor:
             )
 
             # Additional check: look for empty table cells in the main data table
-            main_data_tables = soup.find_all("table", class_="table table-hover")
+            main_data_tables = index.tags("table", "table table-hover")
             has_empty_data_tables = False
 
             for table in main_data_tables:
@@ -1445,3 +1535,45 @@ class NFCeDataExtractor:
         except Exception as e:
             self.logger.warning(f"Error checking for empty NFCe page: {e}")
             return False
+
+
+def compare_parsers(pages: list[tuple[str, str]], parsers: tuple[str, ...] = HTML_PARSERS) -> dict[str, Any]:
+    """Extract a corpus of saved NFCe pages with each parser and check the results are identical
+
+    Args:
+        pages: (html_content, url) pairs
+        parsers: Parsers to compare; the first one is the reference
+
+    Returns:
+        Per-parser extraction time and the URLs whose extracted data differ from the reference
+    """
+    parsers = tuple(parser for parser in parsers if parser != "lxml" or LXML_AVAILABLE)
+    timings = {}
+    outputs = {}
+
+    for parser in parsers:
+        extractor = NFCeDataExtractor(parser=parser)
+        started = time.perf_counter()
+        outputs[parser] = [extractor.extract_invoice_data(html, url) for html, url in pages]
+        timings[parser] = time.perf_counter() - started
+
+    def comparable(invoice_data: InvoiceData) -> dict[str, Any]:
+        data = invoice_data.to_dict()
+        data.pop("scraped_at", None)
+        return data
+
+    reference = parsers[0]
+    mismatches = {
+        parser: [
+            url
+            for (_, url), expected, actual in zip(pages, outputs[reference], outputs[parser], strict=True)
+            if comparable(expected) != comparable(actual)
+        ]
+        for parser in parsers[1:]
+    }
+
+    return {
+        "pages": len(pages),
+        "seconds": timings,
+        "mismatches": mismatches,
+    }
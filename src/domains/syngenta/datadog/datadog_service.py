@@ -4,6 +4,7 @@ import os
 from typing import Any
 
 from utils.cache_manager.cache_manager import CacheManager
+from utils.http.shared_budget import SharedRateBudget, budget_key
 from utils.logging.logging_manager import LogManager
 
 
@@ -363,6 +364,10 @@ class DatadogService:
             "DD-APPLICATION-KEY": self.app_key or "",
         }
 
+        # Datadog reports X-RateLimit-Reset in seconds, which the shared budget understands
+        budget = SharedRateBudget.get_instance()
+        key = budget_key(url, self.api_key)
+
         teams: list[dict[str, str]] = []
         offset = 0
         page_limit = min(100, max(1, limit))
@@ -376,7 +381,9 @@ class DatadogService:
             if me is not None:
                 params["filter[me]"] = "true" if me else "false"
 
+            budget.acquire(key)
             resp = requests.get(url, headers=headers, params=params, timeout=30)
+            budget.record(key, resp.status_code, resp.headers)
             resp.raise_for_status()
             data = resp.json() or {}
 
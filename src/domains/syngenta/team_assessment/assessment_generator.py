@@ -3,12 +3,12 @@ import re
 from datetime import UTC, datetime
 from pathlib import Path
 
-import openpyxl
-
 from domains.syngenta.team_assessment.processors.criteria_processor import CriteriaProcessor
+from domains.syngenta.team_assessment.services.chart_renderer import MANIFEST_FILENAME, ChartRenderer
 from domains.syngenta.team_assessment.services.member_analyzer import MemberAnalyzer
 from domains.syngenta.team_assessment.services.team_analyzer import TeamAnalyzer
 from utils.data.json_manager import JSONManager
+from utils.data.workbook_cache import WorkbookCache
 from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 from utils.string_utils import StringUtils
@@ -47,6 +47,9 @@ class AssessmentGenerator:
         member_slack_mapping: str | None = None,
         enable_kudos: bool = True,
         valyou_file: str | None = None,
+        chart_format: str = "png",
+        chart_dpi: int | None = None,
+        chart_workers: int | None = None,
     ):
         self.competency_matrix_file = competency_matrix_file
         self.feedback_folder = feedback_folder
@@ -56,6 +59,9 @@ class AssessmentGenerator:
         self.enable_kudos = enable_kudos
         self.member_slack_mapping_file = member_slack_mapping
         self.valyou_file = valyou_file
+        self.chart_format = chart_format
+        self.chart_dpi = chart_dpi
+        self.chart_workers = chart_workers
 
         # Initialize processors
         self.criteria_processor = CriteriaProcessor()
@@ -153,6 +159,14 @@ class AssessmentGenerator:
             if self.historical_feedback_data:
                 self._add_historical_context_to_stats(members_stats)
 
+            # Charts are queued by the analyzers and rendered in parallel once all are described
+            chart_renderer = ChartRenderer(
+                chart_format=self.chart_format,
+                dpi=self.chart_dpi,
+                max_workers=self.chart_workers,
+                manifest_path=os.path.join(self.output_path, MANIFEST_FILENAME),
+            )
+
             for member_name, member_data in members_stats.items():
                 if self._is_member_ignored(member_name):
                     continue
@@ -187,6 +201,7 @@ class AssessmentGenerator:
                     current_period_label=current_period_label,
                     raw_feedback=member_raw_feedback,
                     productivity_metrics=member_productivity,
+                    chart_renderer=chart_renderer,
                 )
                 member_analyzer.plot_all_charts()
 
@@ -200,8 +215,10 @@ class AssessmentGenerator:
                 self.output_path,
                 historical_stats=historical_stats,
                 current_period_label=current_period_label,
+                chart_renderer=chart_renderer,
             )
             team_analyzer.plot_all_charts()
+            chart_renderer.flush()
 
             self._generate_output(team_stats)
         else:
@@ -395,6 +412,13 @@ class AssessmentGenerator:
         """
         result = {"current": None, "historical": []}
 
+        # Parse the workbooks of every period in one parallel pass before processing them
+        periods = ([self.current_period] if self.current_period else []) + list(self.historical_periods)
+        WorkbookCache.get_instance().preload(
+            [file_path for period in periods for file_path in Path(period.folder_path).glob("*.xlsx")],
+            header=self.feedback_processor.workbook_header,
+        )
+
         # Process current period
         if self.current_period:
             self._logger.info(f"Processing current period: {self.current_period}")
@@ -489,8 +513,9 @@ class AssessmentGenerator:
 
         # Validate sheet structure
         try:
-            workbook = openpyxl.load_workbook(self.competency_matrix_file, read_only=True, data_only=True)
-            sheet_names = workbook.sheetnames
+            # Parsed once and shared with CriteriaProcessor through the workbook cache
+            sheets = WorkbookCache.get_instance().get_sheets(self.competency_matrix_file)
+            sheet_names = list(sheets)
 
             # Check for required sheet
             required_sheet = "Competencies and Levels"
@@ -506,8 +531,8 @@ class AssessmentGenerator:
                 )
 
             # Check minimum structure (at least 2 rows: header + 1 data row)
-            sheet = workbook[required_sheet]
-            if sheet.max_row < 2:
+            max_row, max_column = sheets[required_sheet].shape
+            if max_row < 2:
                 raise ValueError(
                     f"Invalid competency matrix file structure: {self.competency_matrix_file}\n\n"
                     f"Sheet '{required_sheet}' appears to be empty.\n"
@@ -515,19 +540,16 @@ class AssessmentGenerator:
                 )
 
             # Check minimum columns (Criterion, Indicator, + 5 levels = 7 columns)
-            if sheet.max_column < 7:
+            if max_column < 7:
                 raise ValueError(
                     f"Invalid competency matrix file structure: {self.competency_matrix_file}\n\n"
                     f"Sheet '{required_sheet}' has insufficient columns.\n"
-                    f"Found: {sheet.max_column} columns\n"
+                    f"Found: {max_column} columns\n"
                     f"Expected: At least 7 columns (Criterion, Indicator, Levels 1-5)"
                 )
 
-            workbook.close()
             self._logger.info("Competency matrix structure validated successfully")
 
-        except ImportError:
-            self._logger.warning("openpyxl not available - skipping detailed structure validation")
         except Exception as e:
             if isinstance(e, ValueError):
                 raise
@@ -552,8 +574,9 @@ class AssessmentGenerator:
 
         # Validate sheet structure
         try:
-            workbook = openpyxl.load_workbook(self.planning_file, read_only=True, data_only=True)
-            sheet_names = workbook.sheetnames
+            # Parsed once and shared with MembersTaskProcessor through the workbook cache
+            sheets = WorkbookCache.get_instance().get_sheets(self.planning_file)
+            sheet_names = list(sheets)
 
             # Check for sheets matching pattern Q[1-4]-C[1-2]
             pattern = r"Q[1-4]-C[1-2]"
@@ -572,36 +595,38 @@ class AssessmentGenerator:
                     f"  - Allocation matrix (rows 39-47)"
                 )
 
-            # Validate structure of first matching sheet
-            sheet = workbook[matching_sheets[0]]
+            # Validate structure of first matching sheet. calamine drops trailing empty rows
+            # and columns (openpyxl's max_row also counted formatted cells), so an allocation
+            # matrix with unused member rows is shorter than row 47. Only the rows and columns
+            # that always hold data are required: up to the days row above the matrix and the
+            # first allocation column; the task processor treats missing cells as empty.
+            max_row, max_column = sheets[matching_sheets[0]].shape
 
             # Check minimum rows
-            if sheet.max_row < 47:
+            min_rows = self.config.row_days + 1
+            if max_row < min_rows:
                 raise ValueError(
                     f"Invalid planning file structure: {self.planning_file}\n\n"
                     f"Sheet '{matching_sheets[0]}' has insufficient rows.\n"
-                    f"Found: {sheet.max_row} rows\n"
-                    f"Expected: At least 47 rows (for allocation matrix ending at row 47)"
+                    f"Found: {max_row} rows with data\n"
+                    f"Expected: At least {min_rows} rows (up to the days row of the allocation matrix)"
                 )
 
             # Check minimum columns (allocation matrix starts at column K)
-            min_columns = ord("K") - ord("A") + 1  # At least up to column K
-            if sheet.max_column < min_columns:
+            min_columns = self.config.col_epics_assignment_start_idx + 1
+            if max_column < min_columns:
                 raise ValueError(
                     f"Invalid planning file structure: {self.planning_file}\n\n"
                     f"Sheet '{matching_sheets[0]}' has insufficient columns.\n"
-                    f"Found: {sheet.max_column} columns\n"
-                    f"Expected: At least {min_columns} columns (up to column K for allocation)"
+                    f"Found: {max_column} columns with data\n"
+                    f"Expected: At least {min_columns} columns (up to the first allocation column)"
                 )
 
-            workbook.close()
             self._logger.info(
                 f"Planning file structure validated successfully. "
                 f"Found {len(matching_sheets)} valid sheets: {', '.join(matching_sheets)}"
             )
 
-        except ImportError:
-            self._logger.warning("openpyxl not available - skipping detailed structure validation")
         except Exception as e:
             if isinstance(e, ValueError):
                 raise
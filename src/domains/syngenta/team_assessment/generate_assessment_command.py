@@ -4,6 +4,7 @@ from log_config import LogManager
 from utils.command.base_command import BaseCommand
 
 from .assessment_generator import AssessmentGenerator
+from .services.chart_renderer import DEFAULT_CHART_DPI, DRAFT_CHART_DPI, SUPPORTED_CHART_FORMATS
 
 # Configure logger
 logger = LogManager.get_instance().get_logger("AssessmentGeneratorCommand")
@@ -92,6 +93,28 @@ class GenerateAssessmentCommand(BaseCommand):
             default=None,
             help="Path to Val-You recognition CSV export file.",
         )
+        parser.add_argument(
+            "--chartFormat",
+            type=str,
+            choices=SUPPORTED_CHART_FORMATS,
+            default="png",
+            help="Output format of the charts (default: png). Use svg for lightweight, scalable charts.",
+        )
+        parser.add_argument(
+            "--chartDpi",
+            type=int,
+            required=False,
+            default=None,
+            help=f"Resolution of every chart (default: each chart's own, up to {DEFAULT_CHART_DPI}). "
+            f"Use {DRAFT_CHART_DPI} for quick drafts.",
+        )
+        parser.add_argument(
+            "--chartWorkers",
+            type=int,
+            required=False,
+            default=None,
+            help="Number of processes rendering charts in parallel (default: CPU count, up to 4).",
+        )
 
     @staticmethod
     def main(args: Namespace) -> None:
@@ -114,6 +137,7 @@ class GenerateAssessmentCommand(BaseCommand):
         logger.info(f"  Kudos Integration: {'Enabled' if enable_kudos else 'Disabled'}")
         logger.info(f"  Member Slack Mapping: {args.memberSlackMapping or 'Default'}")
         logger.info(f"  Val-You File: {args.valyouFile or 'Not provided'}")
+        logger.info(f"  Charts: {args.chartFormat}, {args.chartDpi or 'default'} dpi")
 
         try:
             processor = AssessmentGenerator(
@@ -126,6 +150,9 @@ class GenerateAssessmentCommand(BaseCommand):
                 member_slack_mapping=args.memberSlackMapping,
                 enable_kudos=enable_kudos,
                 valyou_file=args.valyouFile,
+                chart_format=args.chartFormat,
+                chart_dpi=args.chartDpi,
+                chart_workers=args.chartWorkers,
             )
 
             processor.run()
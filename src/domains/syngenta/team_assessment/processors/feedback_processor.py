@@ -4,7 +4,7 @@ from typing import Any
 import pandas as pd
 
 from utils.base_processor import BaseProcessor
-from utils.data.excel_manager import ExcelManager
+from utils.data.workbook_cache import WorkbookCache
 from utils.file_manager import FileManager
 
 from ..core.indicators import Indicator
@@ -14,6 +14,9 @@ from ..core.validations import ValidationHelper
 class FeedbackProcessor(BaseProcessor):
     """Processor for extracting and validating competency data from Excel files."""
 
+    # Feedback sheets are read with their first row as column headers
+    workbook_header = 0
+
     def __init__(self):
         super().__init__(allowed_extensions=[".xlsx"])
 
@@ -35,9 +38,8 @@ class FeedbackProcessor(BaseProcessor):
         # Extract period metadata if provided
         period_metadata = kwargs.get("period_metadata", None)
 
-        excel_data = ExcelManager.read_excel(str(file_path))
-        for sheet_name in excel_data.sheet_names[1:]:
-            df = pd.read_excel(str(file_path), sheet_name=sheet_name)
+        sheets = WorkbookCache.get_instance().get_sheets(file_path, header=self.workbook_header)
+        for sheet_name, df in list(sheets.items())[1:]:
             evaluatee_name = sheet_name.strip()
 
             # Handle self-evaluation: if sheet is "Self-Evaluation", use evaluator name as evaluatee
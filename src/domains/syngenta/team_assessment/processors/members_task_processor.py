@@ -62,6 +62,7 @@ class MembersTaskProcessor(BaseProcessor):
             sheet_name (str | None): Name of the sheet being processed (e.g., Q1-C1, Q2-C2).
             **kwargs: Additional keyword arguments (for BaseProcessor compatibility).
         """
+        sheet_data = self._pad_sheet(sheet_data, sheet_name)
         header_idxs = self._extract_header(sheet_data)
 
         # Step 1: Extract list of members (for reference/validation)
@@ -113,6 +114,25 @@ class MembersTaskProcessor(BaseProcessor):
 
         self.logger.info(f"Task map built with {len(self.task_map)} members: {list(self.task_map.keys())}")
 
+    def _pad_sheet(self, sheet_data: list[list[str | None]], sheet_name: str | None) -> list[list[str | None]]:
+        """Pads the sheet with empty cells up to the last row and column the layout reads.
+
+        The workbook reader drops trailing empty rows and columns, e.g. unused member rows
+        at the end of the allocation matrix.
+        """
+        cycle_days = max(self._config.cycle_c1_days, self._config.cycle_c2_days)
+        min_columns = max(
+            self._config.col_epics_assignment_start_idx + cycle_days, max(map(len, sheet_data), default=0)
+        )
+        min_rows = max(self._config.row_epics_assignment_end, len(sheet_data))
+        if len(sheet_data) == min_rows and all(len(row) == min_columns for row in sheet_data):
+            return sheet_data
+
+        self.logger.debug(f"Padding sheet {sheet_name} to {min_rows} rows and {min_columns} columns")
+        padded = [list(row) + [""] * (min_columns - len(row)) for row in sheet_data]
+        padded.extend([""] * min_columns for _ in range(min_rows - len(padded)))
+        return padded
+
     def _extract_header(self, sheet_data: list[list[str | None]]) -> dict[str, int]:
         """Extracts the header row from the sheet data.
 
@@ -1,19 +1,397 @@
 import os
+from collections.abc import Callable
 from typing import Any
 
-import matplotlib.pyplot as plt
+import matplotlib
 import numpy as np
 import pandas as pd
-
+from matplotlib.figure import Figure
+
+from domains.syngenta.team_assessment.services.chart_renderer import (
+    DEFAULT_CHART_DPI,
+    ChartRenderer,
+    ChartSpec,
+    render_chart,
+)
 from utils.logging.logging_manager import LogManager
 
 
+def _generate_acronym(label: str) -> str:
+    """Generates an acronym from a label. Takes the first letter of each word up to 3 characters."""
+    words = label.split()
+    return "".join([w[0].upper() for w in words])[:3]  # Limit to 3 characters
+
+
+def _draw_boxplot_chart(
+    fig: Figure,
+    *,
+    data: dict[str, list[float]],
+    title: str | None,
+    x_col: str | None,
+    y_col: str | None,
+    box_colors: list[str] | None,
+) -> None:
+    series_labels = list(data.keys())
+    series_data = list(data.values())
+
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+    box = ax.boxplot(
+        series_data,
+        labels=series_labels,
+        patch_artist=True,
+        boxprops=dict(color="black"),
+        medianprops=dict(color="orange", linewidth=2),
+        whiskerprops=dict(color="black", linestyle="--"),
+        capprops=dict(color="black"),
+    )
+
+    ax.set_title(title if title else "Boxplot", fontsize=16, fontweight="bold")
+    ax.set_ylabel(y_col if y_col else "Values", fontsize=12)
+    ax.set_xlabel(x_col if x_col else "Series", fontsize=12)
+    ax.grid(True, linestyle="--", alpha=0.6)
+
+    if box_colors:
+        for patch, color in zip(box["boxes"], box_colors * len(series_labels)):
+            patch.set_facecolor(color)
+
+
+def _draw_horizontal_bar_chart(
+    fig: Figure,
+    *,
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    title: str | None,
+    group_col: str | None,
+    group_colors: dict[Any, str] | None,
+) -> None:
+    df_sorted = df.sort_values(by=x_col, ascending=True)
+
+    if group_col is not None:
+        if group_colors is None:
+            unique_groups = df_sorted[group_col].unique()
+            cmap = matplotlib.colormaps["tab10"]
+            group_colors = {group: cmap(i % cmap.N) for i, group in enumerate(unique_groups)}
+        colors = [group_colors.get(val, "skyblue") for val in df_sorted[group_col]]
+    else:
+        colors = "skyblue"
+
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+    ax.barh(df_sorted[y_col], df_sorted[x_col], color=colors)
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(title)
+    ax.grid(axis="x", linestyle="--", alpha=0.7)
+
+
+def _draw_grouped_bar_chart(
+    fig: Figure,
+    *,
+    df: pd.DataFrame,
+    x_col: str,
+    series: list[str],
+    series_labels: list[str],
+    colors: list[Any],
+    title: str | None,
+    xlabel: str | None,
+    ylabel: str | None,
+    bar_width: float,
+) -> None:
+    # Get the x-axis categories.
+    categories = df[x_col].tolist()
+    x = np.arange(len(categories))
+    n_series = len(series)
+
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+
+    # Calculate offsets so that the groups of bars are centered.
+    for i, col in enumerate(series):
+        offset = -((n_series - 1) / 2) * bar_width + i * bar_width
+        ax.bar(
+            x + offset,
+            df[col],
+            width=bar_width,
+            label=series_labels[i],
+            color=colors[i],
+        )
+
+    ax.set_xlabel(xlabel if xlabel else x_col, fontsize=12)
+    ax.set_ylabel(ylabel if ylabel else "Values", fontsize=12)
+    ax.set_title(title if title else "Grouped Bar Chart", fontsize=16, weight="bold")
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories, fontsize=10)
+    ax.legend()
+    ax.grid(True, axis="y", linestyle="--", alpha=0.6)
+
+
+def _draw_radar_chart(fig: Figure, *, labels: list[str], data: dict[str, list[float]], title: str | None) -> None:
+    num_vars = len(labels)
+    angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
+    angles += angles[:1]
+
+    label_map = {label: _generate_acronym(label) for label in labels}
+    short_labels = [label_map[label] for label in labels]
+
+    fig.set_size_inches(8, 8)
+    ax = fig.subplots(subplot_kw=dict(polar=True))
+    max_value = 0
+
+    for series_name, values in data.items():
+        main_values = values + values[:1]
+        max_value = max(max_value, max(main_values))
+        ax.plot(angles, main_values, label=series_name, linewidth=2)
+        ax.fill(angles, main_values, alpha=0.25)
+
+    ax.set_thetagrids(np.degrees(angles[:-1]), short_labels, fontsize=12, weight="bold")
+    ax.set_ylim(0, max_value * 1.1)
+    ax.set_title(title, fontsize=14, weight="bold", pad=30, loc="center")
+
+    ax.grid(color="gray", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    # Add legend for series (Individual, Team Average, Historical Avg)
+    # Positioned at the bottom center to avoid overlapping with title or side legend
+    ax.legend(
+        loc="upper center",
+        bbox_to_anchor=(0.5, -0.05),
+        fontsize=10,
+        frameon=True,
+        fancybox=True,
+        shadow=True,
+        ncol=3,
+    )
+
+    legend_text = "\n".join([f"{acronym}: {full_label}" for full_label, acronym in label_map.items()])
+
+    max_chars_per_line = max(len(line) for line in legend_text.split("\n"))
+    char_width_factor = 0.015
+    estimated_width = max_chars_per_line * char_width_factor
+
+    max_legend_width = min(0.15, estimated_width)
+
+    adjusted_right = max(0.45, 1 - max_legend_width)
+    fig.subplots_adjust(left=0.15, right=adjusted_right, top=0.85, bottom=0.2)
+
+    fig.text(
+        1 - max_legend_width / 2,
+        0.5,
+        legend_text,
+        fontsize=10,
+        ha="left",
+        va="center",
+        bbox=dict(boxstyle="round,pad=0.5", fc="w", ec="0.8"),
+    )
+
+
+def _draw_diverging_bar_chart(
+    fig: Figure,
+    *,
+    labels: list[str],
+    values: list[float],
+    title: str | None,
+    colors: list[str],
+    xlabel: str,
+    group_labels: list[str] | None,
+    annotations: list[str] | None,
+) -> None:
+    n = len(labels)
+    fig.set_size_inches(14, max(8, n * 0.55))
+    ax = fig.subplots()
+    y_positions = np.arange(n)
+
+    ax.barh(y_positions, values, color=colors, edgecolor="white", height=0.6)
+
+    # Draw group separators and headers
+    if group_labels:
+        current_group = None
+        for i, grp in enumerate(group_labels):
+            if grp != current_group:
+                if current_group is not None:
+                    sep_y = i - 0.5
+                    ax.axhline(y=sep_y, color="gray", linestyle="--", linewidth=0.8, alpha=0.5)
+                current_group = grp
+        # Add group name annotations on the right margin
+        current_group = None
+        group_positions: list[tuple[str, float, float]] = []
+        start_idx = 0
+        for i, grp in enumerate(group_labels):
+            if grp != current_group:
+                if current_group is not None:
+                    group_positions.append((current_group, start_idx, i - 1))
+                current_group = grp
+                start_idx = i
+        if current_group is not None:
+            group_positions.append((current_group, start_idx, n - 1))
+
+        for grp_name, s, e in group_positions:
+            mid_y = (s + e) / 2.0
+            ax.annotate(
+                grp_name,
+                xy=(1.02, mid_y),
+                xycoords=("axes fraction", "data"),
+                fontsize=8,
+                fontweight="bold",
+                va="center",
+                ha="left",
+                color="#555555",
+            )
+
+    # Annotations at end of bars
+    if annotations:
+        for i, (val, ann) in enumerate(zip(values, annotations, strict=False)):
+            x_offset = 0.02 if val >= 0 else -0.02
+            ha = "left" if val >= 0 else "right"
+            ax.text(val + x_offset, i, ann, va="center", ha=ha, fontsize=8, color="#333333")
+
+    ax.set_yticks(y_positions)
+    ax.set_yticklabels(labels, fontsize=10)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.axvline(x=0, color="black", linewidth=0.8)
+    ax.set_title(title or "Diverging Bar Chart", fontsize=14, fontweight="bold")
+    ax.grid(axis="x", linestyle="--", alpha=0.4)
+    ax.invert_yaxis()
+
+    fig.tight_layout()
+
+
+def _draw_dumbbell_chart(
+    fig: Figure,
+    *,
+    labels: list[str],
+    before_values: list[float],
+    after_values: list[float],
+    before_label: str,
+    after_label: str,
+    title: str | None,
+    colors: tuple[str, str, str],
+    threshold: float,
+    show_delta: bool,
+) -> None:
+    improve_color, decline_color, stable_color = colors
+
+    # Sort by delta descending (strengths first)
+    deltas = [a - b for a, b in zip(after_values, before_values, strict=False)]
+    sorted_indices = sorted(range(len(deltas)), key=lambda i: deltas[i], reverse=True)
+
+    sorted_labels = [labels[i] for i in sorted_indices]
+    sorted_before = [before_values[i] for i in sorted_indices]
+    sorted_after = [after_values[i] for i in sorted_indices]
+    sorted_deltas = [deltas[i] for i in sorted_indices]
+
+    n = len(sorted_labels)
+    fig.set_size_inches(12, max(6, n * 0.7))
+    ax = fig.subplots()
+    y_positions = np.arange(n)
+
+    for i in range(n):
+        delta = sorted_deltas[i]
+        if delta > threshold:
+            color = improve_color
+        elif delta < -threshold:
+            color = decline_color
+        else:
+            color = stable_color
+
+        # Connecting line
+        ax.plot(
+            [sorted_before[i], sorted_after[i]],
+            [i, i],
+            color=color,
+            linewidth=2.5,
+            zorder=1,
+        )
+        # Before dot
+        ax.scatter(sorted_before[i], i, color=color, s=100, zorder=2, edgecolors="white", linewidths=0.5)
+        # After dot
+        ax.scatter(sorted_after[i], i, color=color, s=100, zorder=2, marker="D", edgecolors="white", linewidths=0.5)
+
+        # Delta annotation
+        if show_delta:
+            x_pos = max(sorted_before[i], sorted_after[i]) + 0.15
+            if abs(delta) < threshold:
+                delta_text = "="
+            else:
+                delta_text = f"{delta:+.2f}"
+            ax.text(x_pos, i, delta_text, va="center", ha="left", fontsize=9, fontweight="bold", color=color)
+
+    ax.set_yticks(y_positions)
+    ax.set_yticklabels(sorted_labels, fontsize=10)
+    ax.set_xlim(0, 5.5)
+    ax.set_xlabel("Score", fontsize=12)
+    ax.set_title(title or "Dumbbell Chart", fontsize=14, fontweight="bold")
+    ax.grid(axis="x", linestyle="--", alpha=0.4)
+    ax.invert_yaxis()
+
+    # Legend
+    ax.scatter([], [], color="gray", s=80, label=before_label)
+    ax.scatter([], [], color="gray", s=80, marker="D", label=after_label)
+    ax.legend(loc="lower right", fontsize=10)
+
+    fig.tight_layout()
+
+
+def _draw_donut_chart(
+    fig: Figure,
+    *,
+    labels: list[str],
+    sizes: list[float],
+    title: str | None,
+    colors: list[Any],
+    center_text: str | None,
+    annotations: list[str] | None,
+) -> None:
+    fig.set_size_inches(10, 10)
+    ax = fig.subplots()
+
+    _wedges, _texts, autotexts = ax.pie(
+        sizes,
+        labels=labels,
+        autopct="%1.1f%%",
+        startangle=140,
+        colors=colors,
+        wedgeprops=dict(width=0.4, edgecolor="white"),
+        pctdistance=0.8,
+        textprops={"fontsize": 10},
+    )
+
+    for at in autotexts:
+        at.set_fontsize(9)
+        at.set_fontweight("bold")
+
+    if center_text:
+        ax.text(0, 0, center_text, ha="center", va="center", fontsize=14, fontweight="bold", color="#333333")
+
+    ax.set_title(title or "Donut Chart", fontsize=14, fontweight="bold", pad=20)
+
+    if annotations:
+        annotation_block = "\n".join(annotations)
+        fig.text(
+            0.5,
+            0.02,
+            annotation_block,
+            ha="center",
+            va="bottom",
+            fontsize=10,
+            family="monospace",
+            bbox=dict(boxstyle="round,pad=0.5", fc="#f9f9f9", ec="#cccccc"),
+        )
+
+    fig.tight_layout()
+
+
 class ChartMixin:
     """Generic mixin for generating charts. It does not know anything about domain-specific data
     (e.g., criteria). It expects that the caller provides the data in the expected format.
+
+    Charts are drawn by module-level functions on a Matplotlib Figure (object-oriented Agg
+    API). When `chart_renderer` is set they are queued there and rendered in parallel on
+    flush; otherwise each chart is rendered immediately.
     """
 
     _logger = None  # Can be overridden in subclasses
+    chart_renderer: ChartRenderer | None = None
 
     @property
     def logger(self):
@@ -49,6 +427,32 @@ class ChartMixin:
         self.logger.info(f"Plot saved to {file_path}")
         plt_instance.close()
 
+    def _render_chart(
+        self,
+        draw: Callable[..., None],
+        filename: str,
+        dpi: int = DEFAULT_CHART_DPI,
+        **kwargs: Any,
+    ) -> str:
+        """Renders a chart drawn by a module-level function, or queues it on the chart renderer.
+
+        Args:
+            draw (Callable): Function drawing onto a Figure, called as draw(fig, **kwargs).
+            filename (str): The file name to save the chart, relative to `output_path`.
+            dpi (int): Default resolution of the chart.
+            **kwargs: Data and options passed to the draw function.
+
+        Returns:
+            str: Path of the saved (or queued) chart.
+        """
+        spec = ChartSpec(draw, os.path.join(getattr(self, "output_path", None) or "", filename), kwargs, dpi)
+        if self.chart_renderer is not None:
+            return self.chart_renderer.submit(spec)
+
+        file_path = render_chart(spec)
+        self.logger.info(f"Plot saved to {file_path}")
+        return file_path
+
     def plot_boxplot_chart(
         self,
         data: dict[str, list[float]],
@@ -69,32 +473,16 @@ class ChartMixin:
             box_colors (Optional[List[str]]): List of colors to apply to each box.
         """
         self.logger.info("Generating generic boxplot.")
-
-        series_labels = list(data.keys())
-        series_data = list(data.values())
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        box = ax.boxplot(
-            series_data,
-            labels=series_labels,
-            patch_artist=True,
-            boxprops=dict(color="black"),
-            medianprops=dict(color="orange", linewidth=2),
-            whiskerprops=dict(color="black", linestyle="--"),
-            capprops=dict(color="black"),
+        self._render_chart(
+            _draw_boxplot_chart,
+            filename,
+            data=data,
+            title=title,
+            x_col=x_col,
+            y_col=y_col,
+            box_colors=box_colors,
         )
 
-        ax.set_title(title if title else "Boxplot", fontsize=16, fontweight="bold")
-        ax.set_ylabel(y_col if y_col else "Values", fontsize=12)
-        ax.set_xlabel(x_col if x_col else "Series", fontsize=12)
-        ax.grid(True, linestyle="--", alpha=0.6)
-
-        if box_colors:
-            for patch, color in zip(box["boxes"], box_colors * len(series_labels)):
-                patch.set_facecolor(color)
-
-        self._save_plot(plt, filename)
-
     def plot_horizontal_bar_chart(
         self,
         df: pd.DataFrame,
@@ -117,25 +505,16 @@ class ChartMixin:
             group_colors (Optional[Dict[Any, str]]): Mapping from group value to color.
         """
         self.logger.info("Generating generic horizontal bar chart.")
-
-        df_sorted = df.sort_values(by=x_col, ascending=True)
-
-        if group_col is not None:
-            if group_colors is None:
-                unique_groups = df_sorted[group_col].unique()
-                cmap = plt.get_cmap("tab10")
-                group_colors = {group: cmap(i % cmap.N) for i, group in enumerate(unique_groups)}
-            colors = [group_colors.get(val, "skyblue") for val in df_sorted[group_col]]
-        else:
-            colors = "skyblue"
-
-        plt.figure(figsize=(10, 6))
-        plt.barh(df_sorted[y_col], df_sorted[x_col], color=colors)
-        plt.xlabel(x_col)
-        plt.ylabel(y_col)
-        plt.title(title)
-        plt.grid(axis="x", linestyle="--", alpha=0.7)
-        self._save_plot(plt, filename)
+        self._render_chart(
+            _draw_horizontal_bar_chart,
+            filename,
+            df=df,
+            x_col=x_col,
+            y_col=y_col,
+            title=title,
+            group_col=group_col,
+            group_colors=group_colors,
+        )
 
     def plot_grouped_bar_chart(
         self,
@@ -168,10 +547,6 @@ class ChartMixin:
             bar_width (float): Width of each bar.
         """
         self.logger.info("Generating generic grouped vertical bar chart.")
-        # Get the x-axis categories.
-        categories = df[x_col].tolist()
-        x = np.arange(len(categories))
-        n_series = len(series)
 
         # Use provided series labels or default to series names.
         if series_labels is None:
@@ -179,37 +554,26 @@ class ChartMixin:
 
         # Generate default colors if not provided.
         if colors is None:
-            cmap = plt.get_cmap("tab10")
-            colors = [cmap(i % cmap.N) for i in range(n_series)]
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # Calculate offsets so that the groups of bars are centered.
-        for i, col in enumerate(series):
-            offset = -((n_series - 1) / 2) * bar_width + i * bar_width
-            ax.bar(
-                x + offset,
-                df[col],
-                width=bar_width,
-                label=series_labels[i],
-                color=colors[i],
-            )
-
-        ax.set_xlabel(xlabel if xlabel else x_col, fontsize=12)
-        ax.set_ylabel(ylabel if ylabel else "Values", fontsize=12)
-        ax.set_title(title if title else "Grouped Bar Chart", fontsize=16, weight="bold")
-        ax.set_xticks(x)
-        ax.set_xticklabels(categories, fontsize=10)
-        ax.legend()
-        ax.grid(True, axis="y", linestyle="--", alpha=0.6)
+            cmap = matplotlib.colormaps["tab10"]
+            colors = [cmap(i % cmap.N) for i in range(len(series))]
 
-        self._save_plot(plt, filename)
+        self._render_chart(
+            _draw_grouped_bar_chart,
+            filename,
+            df=df,
+            x_col=x_col,
+            series=series,
+            series_labels=series_labels,
+            colors=colors,
+            title=title,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            bar_width=bar_width,
+        )
 
     def _generate_acronym(self, label: str) -> str:
         """Generates an acronym from a label. Takes the first letter of each word up to 3 characters."""
-        words = label.split()
-        acronym = "".join([w[0].upper() for w in words])[:3]  # Limit to 3 characters
-        return acronym
+        return _generate_acronym(label)
 
     def plot_radar_chart(
         self,
@@ -229,68 +593,10 @@ class ChartMixin:
         """
         self.logger.info("Generating radar chart with improved legend positioning.")
 
-        num_vars = len(labels)
-        angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
-        angles += angles[:1]
-
-        label_map = {label: self._generate_acronym(label) for label in labels}
-        short_labels = [label_map[label] for label in labels]
-
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-        max_value = 0
-
-        for series_name, values in data.items():
-            if not values:
-                raise ValueError("Each series in data must have at least one set of values.")
-
-            main_values = values + values[:1]
-            max_value = max(max_value, max(main_values))
-            ax.plot(angles, main_values, label=series_name, linewidth=2)
-            ax.fill(angles, main_values, alpha=0.25)
-
-        ax.set_thetagrids(np.degrees(angles[:-1]), short_labels, fontsize=12, weight="bold")
-        ax.set_ylim(0, max_value * 1.1)
-        ax.set_title(title, fontsize=14, weight="bold", pad=30, loc="center")
+        if any(not values for values in data.values()):
+            raise ValueError("Each series in data must have at least one set of values.")
 
-        ax.grid(color="gray", linestyle="--", linewidth=0.5, alpha=0.7)
-
-        # Add legend for series (Individual, Team Average, Historical Avg)
-        # Positioned at the bottom center to avoid overlapping with title or side legend
-        ax.legend(
-            loc="upper center",
-            bbox_to_anchor=(0.5, -0.05),
-            fontsize=10,
-            frameon=True,
-            fancybox=True,
-            shadow=True,
-            ncol=3,
-        )
-
-        legend_text = "\n".join([f"{acronym}: {full_label}" for full_label, acronym in label_map.items()])
-
-        max_chars_per_line = max(len(line) for line in legend_text.split("\n"))
-        char_width_factor = 0.015
-        estimated_width = max_chars_per_line * char_width_factor
-
-        max_legend_width = min(0.15, estimated_width)
-
-        adjusted_right = max(0.45, 1 - max_legend_width)
-        fig.subplots_adjust(left=0.15, right=adjusted_right, top=0.85, bottom=0.2)
-
-        plt.figtext(
-            1 - max_legend_width / 2,
-            0.5,
-            legend_text,
-            fontsize=10,
-            ha="left",
-            va="center",
-            bbox=dict(boxstyle="round,pad=0.5", fc="w", ec="0.8"),
-        )
-
-        self._save_plot(
-            plt,
-            filename,
-        )
+        self._render_chart(_draw_radar_chart, filename, labels=labels, data=data, title=title)
 
     def plot_diverging_bar_chart(
         self,
@@ -323,7 +629,6 @@ class ChartMixin:
         """
         self.logger.info("Generating diverging bar chart.")
 
-        n = len(labels)
         colors = []
         for v in values:
             if v > threshold:
@@ -333,63 +638,17 @@ class ChartMixin:
             else:
                 colors.append(neutral_color)
 
-        _fig, ax = plt.subplots(figsize=(14, max(8, n * 0.55)))
-        y_positions = np.arange(n)
-
-        ax.barh(y_positions, values, color=colors, edgecolor="white", height=0.6)
-
-        # Draw group separators and headers
-        if group_labels:
-            current_group = None
-            for i, grp in enumerate(group_labels):
-                if grp != current_group:
-                    if current_group is not None:
-                        sep_y = i - 0.5
-                        ax.axhline(y=sep_y, color="gray", linestyle="--", linewidth=0.8, alpha=0.5)
-                    current_group = grp
-            # Add group name annotations on the right margin
-            current_group = None
-            group_positions: list[tuple[str, float, float]] = []
-            start_idx = 0
-            for i, grp in enumerate(group_labels):
-                if grp != current_group:
-                    if current_group is not None:
-                        group_positions.append((current_group, start_idx, i - 1))
-                    current_group = grp
-                    start_idx = i
-            if current_group is not None:
-                group_positions.append((current_group, start_idx, n - 1))
-
-            for grp_name, s, e in group_positions:
-                mid_y = (s + e) / 2.0
-                ax.annotate(
-                    grp_name,
-                    xy=(1.02, mid_y),
-                    xycoords=("axes fraction", "data"),
-                    fontsize=8,
-                    fontweight="bold",
-                    va="center",
-                    ha="left",
-                    color="#555555",
-                )
-
-        # Annotations at end of bars
-        if annotations:
-            for i, (val, ann) in enumerate(zip(values, annotations, strict=False)):
-                x_offset = 0.02 if val >= 0 else -0.02
-                ha = "left" if val >= 0 else "right"
-                ax.text(val + x_offset, i, ann, va="center", ha=ha, fontsize=8, color="#333333")
-
-        ax.set_yticks(y_positions)
-        ax.set_yticklabels(labels, fontsize=10)
-        ax.set_xlabel(xlabel, fontsize=12)
-        ax.axvline(x=0, color="black", linewidth=0.8)
-        ax.set_title(title or "Diverging Bar Chart", fontsize=14, fontweight="bold")
-        ax.grid(axis="x", linestyle="--", alpha=0.4)
-        ax.invert_yaxis()
-
-        plt.tight_layout()
-        self._save_plot(plt, filename)
+        self._render_chart(
+            _draw_diverging_bar_chart,
+            filename,
+            labels=labels,
+            values=values,
+            title=title,
+            colors=colors,
+            xlabel=xlabel,
+            group_labels=group_labels,
+            annotations=annotations,
+        )
 
     def plot_dumbbell_chart(
         self,
@@ -425,66 +684,19 @@ class ChartMixin:
             show_delta: Whether to annotate delta text on each row.
         """
         self.logger.info("Generating dumbbell chart.")
-
-        # Sort by delta descending (strengths first)
-        deltas = [a - b for a, b in zip(after_values, before_values, strict=False)]
-        sorted_indices = sorted(range(len(deltas)), key=lambda i: deltas[i], reverse=True)
-
-        sorted_labels = [labels[i] for i in sorted_indices]
-        sorted_before = [before_values[i] for i in sorted_indices]
-        sorted_after = [after_values[i] for i in sorted_indices]
-        sorted_deltas = [deltas[i] for i in sorted_indices]
-
-        n = len(sorted_labels)
-        _fig, ax = plt.subplots(figsize=(12, max(6, n * 0.7)))
-        y_positions = np.arange(n)
-
-        for i in range(n):
-            delta = sorted_deltas[i]
-            if delta > threshold:
-                color = improve_color
-            elif delta < -threshold:
-                color = decline_color
-            else:
-                color = stable_color
-
-            # Connecting line
-            ax.plot(
-                [sorted_before[i], sorted_after[i]],
-                [i, i],
-                color=color,
-                linewidth=2.5,
-                zorder=1,
-            )
-            # Before dot
-            ax.scatter(sorted_before[i], i, color=color, s=100, zorder=2, edgecolors="white", linewidths=0.5)
-            # After dot
-            ax.scatter(sorted_after[i], i, color=color, s=100, zorder=2, marker="D", edgecolors="white", linewidths=0.5)
-
-            # Delta annotation
-            if show_delta:
-                x_pos = max(sorted_before[i], sorted_after[i]) + 0.15
-                if abs(delta) < threshold:
-                    delta_text = "="
-                else:
-                    delta_text = f"{delta:+.2f}"
-                ax.text(x_pos, i, delta_text, va="center", ha="left", fontsize=9, fontweight="bold", color=color)
-
-        ax.set_yticks(y_positions)
-        ax.set_yticklabels(sorted_labels, fontsize=10)
-        ax.set_xlim(0, 5.5)
-        ax.set_xlabel("Score", fontsize=12)
-        ax.set_title(title or "Dumbbell Chart", fontsize=14, fontweight="bold")
-        ax.grid(axis="x", linestyle="--", alpha=0.4)
-        ax.invert_yaxis()
-
-        # Legend
-        ax.scatter([], [], color="gray", s=80, label=before_label)
-        ax.scatter([], [], color="gray", s=80, marker="D", label=after_label)
-        ax.legend(loc="lower right", fontsize=10)
-
-        plt.tight_layout()
-        self._save_plot(plt, filename)
+        self._render_chart(
+            _draw_dumbbell_chart,
+            filename,
+            labels=labels,
+            before_values=before_values,
+            after_values=after_values,
+            before_label=before_label,
+            after_label=after_label,
+            title=title,
+            colors=(improve_color, decline_color, stable_color),
+            threshold=threshold,
+            show_delta=show_delta,
+        )
 
     def plot_donut_chart(
         self,
@@ -520,43 +732,16 @@ class ChartMixin:
             # Filter colors to match non-zero entries
             f_colors = [colors[i] for i, sz in enumerate(sizes) if sz > 0]
         else:
-            cmap = plt.get_cmap("Set2")
+            cmap = matplotlib.colormaps["Set2"]
             f_colors = [cmap(i % cmap.N) for i in range(len(f_labels))]
 
-        fig, ax = plt.subplots(figsize=(10, 10))
-
-        _wedges, _texts, autotexts = ax.pie(
-            f_sizes,
-            labels=f_labels,
-            autopct="%1.1f%%",
-            startangle=140,
+        self._render_chart(
+            _draw_donut_chart,
+            filename,
+            labels=list(f_labels),
+            sizes=list(f_sizes),
+            title=title,
             colors=f_colors,
-            wedgeprops=dict(width=0.4, edgecolor="white"),
-            pctdistance=0.8,
-            textprops={"fontsize": 10},
+            center_text=center_text,
+            annotations=annotations,
         )
-
-        for at in autotexts:
-            at.set_fontsize(9)
-            at.set_fontweight("bold")
-
-        if center_text:
-            ax.text(0, 0, center_text, ha="center", va="center", fontsize=14, fontweight="bold", color="#333333")
-
-        ax.set_title(title or "Donut Chart", fontsize=14, fontweight="bold", pad=20)
-
-        if annotations:
-            annotation_block = "\n".join(annotations)
-            fig.text(
-                0.5,
-                0.02,
-                annotation_block,
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                family="monospace",
-                bbox=dict(boxstyle="round,pad=0.5", fc="#f9f9f9", ec="#cccccc"),
-            )
-
-        plt.tight_layout()
-        self._save_plot(plt, filename)
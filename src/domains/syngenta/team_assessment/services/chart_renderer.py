@@ -0,0 +1,226 @@
+"""Chart rendering queue for team assessments.
+
+Charts are described as ChartSpec objects (a module-level draw function plus its data)
+and rendered with the object-oriented Agg API, so specs can be rendered in worker
+processes without touching the pyplot state machine. The renderer keeps a manifest of
+each chart's input hash and skips charts whose data, format and DPI are unchanged.
+"""
+
+import hashlib
+import json
+import multiprocessing as mp
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from utils.data.json_manager import JSONManager
+from utils.logging.logging_manager import LogManager
+
+DEFAULT_CHART_DPI = 600
+DRAFT_CHART_DPI = 150
+SUPPORTED_CHART_FORMATS = ("png", "svg", "pdf")
+
+# A 600-dpi figure takes hundreds of MB while saving; more workers mostly add memory pressure
+DEFAULT_MAX_WORKERS = 4
+
+# File in the output folder holding the input hash of every rendered chart
+MANIFEST_FILENAME = ".chart_hashes.json"
+
+
+def _hashable(value: Any) -> Any:
+    """Converts chart inputs into JSON-serializable values with a stable representation."""
+    if isinstance(value, pd.DataFrame):
+        return {"columns": list(map(str, value.columns)), "data": _hashable(value.to_numpy().tolist())}
+    if isinstance(value, pd.Series | np.ndarray):
+        return _hashable(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(k): _hashable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_hashable(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """Description of one chart: what to draw, with which data, and where to save it.
+
+    Args:
+        draw: Module-level function drawing onto a Figure, called as draw(fig, **kwargs).
+        file_path: Output path; its extension is replaced by the renderer's format.
+        kwargs: Chart data and options passed to draw.
+        dpi: Resolution used when the renderer has no DPI override.
+    """
+
+    draw: Callable[..., None]
+    file_path: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    dpi: int = DEFAULT_CHART_DPI
+
+    def output_path(self, chart_format: str) -> str:
+        """Returns the output path with the extension of the given format."""
+        return f"{os.path.splitext(self.file_path)[0]}.{chart_format}"
+
+    def input_hash(self, chart_format: str, dpi: int) -> str:
+        """Hashes the draw function, data and output settings of the chart."""
+        payload = {
+            "draw": f"{self.draw.__module__}.{self.draw.__qualname__}",
+            "kwargs": _hashable(self.kwargs),
+            "format": chart_format,
+            "dpi": dpi,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def render_chart(spec: ChartSpec, chart_format: str = "png", dpi: int | None = None) -> str:
+    """Renders a chart spec to disk with the Agg canvas.
+
+    Args:
+        spec: Chart to render.
+        chart_format: Output format (png, svg or pdf).
+        dpi: Resolution; defaults to the spec's own DPI.
+
+    Returns:
+        str: Path of the saved file.
+    """
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    spec.draw(fig, **spec.kwargs)
+
+    file_path = spec.output_path(chart_format)
+    fig.savefig(file_path, dpi=dpi or spec.dpi, format=chart_format, bbox_inches="tight")
+    return file_path
+
+
+class ChartRenderer:
+    """Queue of chart specs rendered in a process pool on flush.
+
+    Args:
+        chart_format: Output format for every chart (png, svg or pdf).
+        dpi: Resolution override for every chart; None keeps each chart's default.
+        max_workers: Worker processes; 1 renders in the calling process.
+        manifest_path: JSON file with the input hash of each rendered chart. Charts whose
+            hash matches and whose file exists are skipped. None disables skipping.
+    """
+
+    def __init__(
+        self,
+        chart_format: str = "png",
+        dpi: int | None = None,
+        max_workers: int | None = None,
+        manifest_path: str | None = None,
+    ):
+        if chart_format not in SUPPORTED_CHART_FORMATS:
+            raise ValueError(
+                f"Unsupported chart format '{chart_format}'. Supported: {', '.join(SUPPORTED_CHART_FORMATS)}"
+            )
+        self.chart_format = chart_format
+        self.dpi = dpi
+        self.max_workers = max(1, max_workers or min(mp.cpu_count(), DEFAULT_MAX_WORKERS))
+        self.manifest_path = manifest_path
+        self.logger = LogManager.get_instance().get_logger("ChartRenderer")
+
+        self._pending: dict[str, tuple[ChartSpec, str]] = {}
+        self._manifest: dict[str, str] = JSONManager.read_json(manifest_path, default={}) if manifest_path else {}
+        self.stats = {"rendered": 0, "skipped": 0, "failed": 0}
+
+    def submit(self, spec: ChartSpec) -> str:
+        """Queues a chart unless its input hash is unchanged since the last render.
+
+        A later spec for the same output path replaces the queued one.
+
+        Returns:
+            str: Path the chart is (or will be) saved to.
+        """
+        output_path = spec.output_path(self.chart_format)
+        chart_hash = spec.input_hash(self.chart_format, self.dpi or spec.dpi)
+
+        if self.manifest_path and self._manifest.get(output_path) == chart_hash and os.path.exists(output_path):
+            self.logger.debug(f"Chart unchanged, skipping {output_path}")
+            self._pending.pop(output_path, None)
+            self.stats["skipped"] += 1
+            return output_path
+
+        self._pending[output_path] = (spec, chart_hash)
+        return output_path
+
+    def flush(self) -> dict[str, int]:
+        """Renders every queued chart and updates the hash manifest.
+
+        Failed charts are logged and left out of the manifest so the next run retries them.
+
+        Returns:
+            Dict[str, int]: Rendered, skipped and failed chart counts so far.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return dict(self.stats)
+
+        workers = min(self.max_workers, len(pending))
+        self.logger.info(f"Rendering {len(pending)} charts with {workers} worker(s)")
+
+        in_process = list(pending)
+        if workers > 1:
+            in_process = self._render_in_pool(pending, workers)
+            if in_process:
+                # A worker died (usually out of memory on high-DPI charts); render the rest here
+                self.logger.warning(f"Chart worker pool failed, rendering {len(in_process)} charts in-process")
+
+        for output_path in in_process:
+            spec, chart_hash = pending[output_path]
+            try:
+                render_chart(spec, self.chart_format, self.dpi)
+                self._mark_rendered(output_path, chart_hash)
+            except Exception as e:
+                self._mark_failed(output_path, e)
+
+        if self.manifest_path:
+            JSONManager.write_json(self._manifest, self.manifest_path)
+
+        self.logger.info(
+            f"Charts rendered: {self.stats['rendered']}, unchanged: {self.stats['skipped']}, "
+            f"failed: {self.stats['failed']}"
+        )
+        return dict(self.stats)
+
+    def _render_in_pool(self, pending: dict[str, tuple[ChartSpec, str]], workers: int) -> list[str]:
+        """Renders charts in worker processes.
+
+        Returns:
+            List[str]: Output paths left unrendered because the pool broke.
+        """
+        unrendered: list[str] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(render_chart, spec, self.chart_format, self.dpi): output_path
+                for output_path, (spec, _) in pending.items()
+            }
+            for future in as_completed(futures):
+                output_path = futures[future]
+                try:
+                    future.result()
+                    self._mark_rendered(output_path, pending[output_path][1])
+                except BrokenProcessPool:
+                    unrendered.append(output_path)
+                except Exception as e:
+                    self._mark_failed(output_path, e)
+        return unrendered
+
+    def _mark_rendered(self, output_path: str, chart_hash: str) -> None:
+        self._manifest[output_path] = chart_hash
+        self.stats["rendered"] += 1
+        self.logger.info(f"Plot saved to {output_path}")
+
+    def _mark_failed(self, output_path: str, error: Exception) -> None:
+        self._manifest.pop(output_path, None)
+        self.stats["failed"] += 1
+        self.logger.error(f"Failed to render chart {output_path}: {error}")
@@ -2,17 +2,143 @@ import os
 import statistics as stats_module
 from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 from matplotlib.patches import Patch
 
 from domains.syngenta.team_assessment.core.statistics import IndividualStatistics, TeamStatistics
 from domains.syngenta.team_assessment.services.chart_mixin import ChartMixin
+from domains.syngenta.team_assessment.services.chart_renderer import ChartRenderer
 from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
 
+def _draw_criteria_evolution(
+    fig: Figure, *, period_labels: list[str], criteria_data: dict[str, list[float | None]], title: str
+) -> None:
+    # Create figure
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+
+    # Plot each criterion
+    for criterion, values in criteria_data.items():
+        # Filter out None values for plotting
+        valid_indices = [i for i, v in enumerate(values) if v is not None]
+        valid_labels = [period_labels[i] for i in valid_indices]
+        valid_values = [values[i] for i in valid_indices]
+
+        if valid_values:
+            ax.plot(valid_labels, valid_values, marker="o", label=criterion, linewidth=2)
+
+    # Configure chart
+    ax.set_xlabel("Period", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Average Score", fontsize=12, fontweight="bold")
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.set_ylim(0, 5)
+    ax.legend(loc="best", fontsize=9)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    fig.tight_layout()
+
+
+def _draw_overall_evolution(
+    fig: Figure,
+    *,
+    valid_labels: list[str],
+    valid_values: list[float],
+    pct_change: float,
+    trend: str,
+    trend_color: str,
+    title: str,
+) -> None:
+    # Create figure
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+
+    # Plot line
+    ax.plot(valid_labels, valid_values, marker="o", linewidth=3, color=trend_color)
+
+    # Annotate start and end points
+    if len(valid_values) >= 2:
+        ax.annotate(
+            f"Start: {valid_values[0]:.2f}",
+            xy=(0, valid_values[0]),
+            xytext=(10, 10),
+            textcoords="offset points",
+            fontsize=10,
+            fontweight="bold",
+        )
+        ax.annotate(
+            f"Current: {valid_values[-1]:.2f}\n({pct_change:+.1f}%)",
+            xy=(len(valid_values) - 1, valid_values[-1]),
+            xytext=(10, -20),
+            textcoords="offset points",
+            fontsize=10,
+            fontweight="bold",
+        )
+
+    # Configure chart
+    ax.set_xlabel("Period", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Overall Average Score", fontsize=12, fontweight="bold")
+    ax.set_title(f"{title}\n{trend}", fontsize=14, fontweight="bold", color=trend_color)
+    ax.set_ylim(0, 5)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    fig.tight_layout()
+
+
+def _draw_evaluator_consistency_chart(
+    fig: Figure,
+    *,
+    labels: list[str],
+    std_devs: list[float],
+    member_avgs: list[float],
+    evaluator_counts: list[int],
+    colors: list[str],
+    title: str,
+) -> None:
+    n = len(labels)
+    fig.set_size_inches(14, max(8, n * 0.55))
+    ax = fig.subplots()
+    y_positions = np.arange(n)
+
+    ax.barh(y_positions, std_devs, color=colors, edgecolor="white", height=0.6)
+
+    # Annotate each bar with evaluator count and score range
+    for i in range(n):
+        ax.text(
+            std_devs[i] + 0.03,
+            i,
+            f"avg: {member_avgs[i]:.2f} | n={evaluator_counts[i]}",
+            va="center",
+            ha="left",
+            fontsize=8,
+            color="#333333",
+        )
+
+    ax.set_yticks(y_positions)
+    ax.set_yticklabels(labels, fontsize=10)
+    ax.set_xlabel("Standard Deviation (lower = more agreement)", fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.grid(axis="x", linestyle="--", alpha=0.4)
+    ax.invert_yaxis()
+
+    # Legend for color coding
+    legend_elements = [
+        Patch(facecolor="#2ecc71", label="High agreement (std < 0.5)"),
+        Patch(facecolor="#f39c12", label="Moderate (0.5 <= std < 1.0)"),
+        Patch(facecolor="#e74c3c", label="Low agreement (std >= 1.0)"),
+    ]
+    ax.legend(handles=legend_elements, loc="lower right", fontsize=9)
+
+    fig.tight_layout()
+
+
 class MemberAnalyzer(ChartMixin):
     """Analyzer para as estatísticas individuais de feedback de um membro.
 
@@ -33,6 +159,7 @@ class MemberAnalyzer(ChartMixin):
         current_period_label: str | None = None,
         raw_feedback: dict[str, Any] | None = None,
         productivity_metrics: dict[str, Any] | None = None,
+        chart_renderer: ChartRenderer | None = None,
     ):
         """Initializes the analyzer with individual member data and team data.
 
@@ -45,6 +172,8 @@ class MemberAnalyzer(ChartMixin):
             raw_feedback: Raw evaluator-level feedback dict
                 {evaluator_name: {criterion: [Indicator]}}.
             productivity_metrics: Productivity metrics dict from planning analysis.
+            chart_renderer: Queue that renders the charts in parallel; None renders each
+                chart immediately.
         """
         self.team_data = team_data
         self.name = member_name.split()[0]
@@ -52,6 +181,7 @@ class MemberAnalyzer(ChartMixin):
         self.current_period_label = current_period_label or "Current"
         self.raw_feedback = raw_feedback
         self.productivity_metrics = productivity_metrics
+        self.chart_renderer = chart_renderer
 
         self.output_path = os.path.join(output_path or "", "members", self.name)
         FileManager.create_folder(self.output_path)
@@ -478,34 +608,14 @@ class MemberAnalyzer(ChartMixin):
 
         self._logger.info(f"Generating criteria evolution chart for {self.name}")
 
-        # Create figure
-        _fig, ax = plt.subplots(figsize=(12, 6))
-
-        # Plot each criterion
-        for criterion, values in criteria_data.items():
-            # Filter out None values for plotting
-            valid_indices = [i for i, v in enumerate(values) if v is not None]
-            valid_labels = [period_labels[i] for i in valid_indices]
-            valid_values = [values[i] for i in valid_indices]
-
-            if valid_values:
-                ax.plot(valid_labels, valid_values, marker="o", label=criterion, linewidth=2)
-
-        # Configure chart
-        ax.set_xlabel("Period", fontsize=12, fontweight="bold")
-        ax.set_ylabel("Average Score", fontsize=12, fontweight="bold")
-        ax.set_title(title, fontsize=14, fontweight="bold")
-        ax.set_ylim(0, 5)
-        ax.legend(loc="best", fontsize=9)
-        ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        # Save chart
-        filepath = f"{self.output_path}/member_criteria_evolution.png"
-        plt.savefig(filepath, dpi=300, bbox_inches="tight")
-        self._logger.info(f"Saved criteria evolution chart to {filepath}")
-        plt.close()
+        self._render_chart(
+            _draw_criteria_evolution,
+            "member_criteria_evolution.png",
+            dpi=300,
+            period_labels=period_labels,
+            criteria_data=criteria_data,
+            title=title,
+        )
 
     def plot_overall_evolution(self, title: str = "Overall Performance Evolution") -> None:
         """Generates a line chart showing member's overall average progression over time.
@@ -566,45 +676,17 @@ class MemberAnalyzer(ChartMixin):
             trend = "→ Stable"
             trend_color = "gray"
 
-        # Create figure
-        _fig, ax = plt.subplots(figsize=(12, 6))
-
-        # Plot line
-        ax.plot(valid_labels, valid_values, marker="o", linewidth=3, color=trend_color)
-
-        # Annotate start and end points
-        if len(valid_values) >= 2:
-            ax.annotate(
-                f"Start: {valid_values[0]:.2f}",
-                xy=(0, valid_values[0]),
-                xytext=(10, 10),
-                textcoords="offset points",
-                fontsize=10,
-                fontweight="bold",
-            )
-            ax.annotate(
-                f"Current: {valid_values[-1]:.2f}\n({pct_change:+.1f}%)",
-                xy=(len(valid_values) - 1, valid_values[-1]),
-                xytext=(10, -20),
-                textcoords="offset points",
-                fontsize=10,
-                fontweight="bold",
-            )
-
-        # Configure chart
-        ax.set_xlabel("Period", fontsize=12, fontweight="bold")
-        ax.set_ylabel("Overall Average Score", fontsize=12, fontweight="bold")
-        ax.set_title(f"{title}\n{trend}", fontsize=14, fontweight="bold", color=trend_color)
-        ax.set_ylim(0, 5)
-        ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        # Save chart
-        filepath = f"{self.output_path}/member_overall_evolution.png"
-        plt.savefig(filepath, dpi=300, bbox_inches="tight")
-        self._logger.info(f"Saved overall evolution chart to {filepath}")
-        plt.close()
+        self._render_chart(
+            _draw_overall_evolution,
+            "member_overall_evolution.png",
+            dpi=300,
+            valid_labels=valid_labels,
+            valid_values=valid_values,
+            pct_change=pct_change,
+            trend=trend,
+            trend_color=trend_color,
+            title=title,
+        )
 
     def _get_evaluator_consistency_data(
         self,
@@ -679,7 +761,6 @@ class MemberAnalyzer(ChartMixin):
             return
 
         labels, std_devs, member_avgs, evaluator_counts = data
-        n = len(labels)
 
         # Color by agreement level
         colors = []
@@ -691,40 +772,16 @@ class MemberAnalyzer(ChartMixin):
             else:
                 colors.append("#e74c3c")  # red = low agreement
 
-        _fig, ax = plt.subplots(figsize=(14, max(8, n * 0.55)))
-        y_positions = np.arange(n)
-
-        ax.barh(y_positions, std_devs, color=colors, edgecolor="white", height=0.6)
-
-        # Annotate each bar with evaluator count and score range
-        for i in range(n):
-            ax.text(
-                std_devs[i] + 0.03,
-                i,
-                f"avg: {member_avgs[i]:.2f} | n={evaluator_counts[i]}",
-                va="center",
-                ha="left",
-                fontsize=8,
-                color="#333333",
-            )
-
-        ax.set_yticks(y_positions)
-        ax.set_yticklabels(labels, fontsize=10)
-        ax.set_xlabel("Standard Deviation (lower = more agreement)", fontsize=12)
-        ax.set_title(title, fontsize=14, fontweight="bold")
-        ax.grid(axis="x", linestyle="--", alpha=0.4)
-        ax.invert_yaxis()
-
-        # Legend for color coding
-        legend_elements = [
-            Patch(facecolor="#2ecc71", label="High agreement (std < 0.5)"),
-            Patch(facecolor="#f39c12", label="Moderate (0.5 <= std < 1.0)"),
-            Patch(facecolor="#e74c3c", label="Low agreement (std >= 1.0)"),
-        ]
-        ax.legend(handles=legend_elements, loc="lower right", fontsize=9)
-
-        plt.tight_layout()
-        self._save_plot(plt, "member_evaluator_consistency.png")
+        self._render_chart(
+            _draw_evaluator_consistency_chart,
+            "member_evaluator_consistency.png",
+            labels=labels,
+            std_devs=std_devs,
+            member_avgs=member_avgs,
+            evaluator_counts=evaluator_counts,
+            colors=colors,
+            title=title,
+        )
 
     def _get_growth_delta_data(self) -> tuple[list[str], list[float], list[float]] | None:
         """Extracts previous period vs current period averages per criterion.
@@ -2,12 +2,55 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 
 from domains.syngenta.team_assessment.core.statistics import TeamStatistics
 from domains.syngenta.team_assessment.services.chart_mixin import ChartMixin
+from domains.syngenta.team_assessment.services.chart_renderer import ChartRenderer
 from utils.logging.logging_manager import LogManager
 
 
+def _draw_temporal_evolution(fig: Figure, *, periods: list[str], criteria_evolution: dict[str, list[float]]) -> None:
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+
+    for criterion, values in criteria_evolution.items():
+        ax.plot(periods, values, marker="o", label=criterion, linewidth=2)
+
+    ax.set_xlabel("Period", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Average Level", fontsize=12, fontweight="bold")
+    ax.set_title("Team Skills Evolution Over Time", fontsize=14, fontweight="bold")
+    ax.legend(loc="best", fontsize=9)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    fig.tight_layout()
+
+
+def _draw_criteria_comparison_over_time(
+    fig: Figure, *, periods: list[str], criteria_data: dict[str, list[float]]
+) -> None:
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+
+    x = np.arange(len(periods))
+    width = 0.8 / len(criteria_data)
+
+    for i, (criterion, values) in enumerate(criteria_data.items()):
+        offset = width * i - (width * len(criteria_data) / 2) + width / 2
+        ax.bar(x + offset, values, width, label=criterion)
+
+    ax.set_xlabel("Period", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Average Level", fontsize=12, fontweight="bold")
+    ax.set_title("Criteria Comparison Across Periods", fontsize=14, fontweight="bold")
+    ax.set_xticks(x)
+    ax.set_xticklabels(periods, rotation=45, ha="right")
+    ax.legend(loc="best", fontsize=9)
+    ax.grid(True, alpha=0.3, axis="y")
+    fig.tight_layout()
+
+
 class TeamAnalyzer(ChartMixin):
     """Analyzer for team-level statistics.
     Transforms team-specific data (criteria_stats) into a generic format expected by ChartMixin
@@ -20,6 +63,7 @@ class TeamAnalyzer(ChartMixin):
         output_path: str | None = None,
         historical_stats: list[dict[str, Any]] | None = None,
         current_period_label: str = "Current",
+        chart_renderer: ChartRenderer | None = None,
     ):
         """Initializes the team analyzer.
 
@@ -28,12 +72,15 @@ class TeamAnalyzer(ChartMixin):
             output_path (Optional[str]): Path to save the generated charts.
             historical_stats (Optional[List[Dict]]): List of historical statistics with period info.
             current_period_label (str): Label for the current period (e.g., "Nov/2025").
+            chart_renderer (Optional[ChartRenderer]): Queue that renders the charts in parallel;
+                None renders each chart immediately.
         """
         self.team = team_stats
         self.criteria_stats: dict[str, Any] = self.team.criteria_stats
         self.output_path = output_path
         self.historical_stats = historical_stats or []
         self.current_period_label = current_period_label
+        self.chart_renderer = chart_renderer
         self._logger = LogManager.get_instance().get_logger("TeamAnalyzer")
 
     def _get_boxplot_data(self) -> dict[str, list[float]]:
@@ -181,8 +228,6 @@ class TeamAnalyzer(ChartMixin):
 
         self._logger.info("Generating temporal evolution chart")
 
-        import matplotlib.pyplot as plt
-
         # Prepare data: extract period labels and averages for each criterion
         periods = []
         criteria_evolution = {}
@@ -205,25 +250,14 @@ class TeamAnalyzer(ChartMixin):
                 criteria_evolution[criterion] = [0] * len(periods[:-1])
             criteria_evolution[criterion].append(stats.get("average", 0))
 
-        # Plot
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        for criterion, values in criteria_evolution.items():
-            ax.plot(periods, values, marker="o", label=criterion, linewidth=2)
-
-        ax.set_xlabel("Period", fontsize=12, fontweight="bold")
-        ax.set_ylabel("Average Level", fontsize=12, fontweight="bold")
-        ax.set_title("Team Skills Evolution Over Time", fontsize=14, fontweight="bold")
-        ax.legend(loc="best", fontsize=9)
-        ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
         if self.output_path:
-            filepath = f"{self.output_path}/team_temporal_evolution.png"
-            plt.savefig(filepath, dpi=300, bbox_inches="tight")
-            self._logger.info(f"Saved temporal evolution chart to {filepath}")
-        plt.close()
+            self._render_chart(
+                _draw_temporal_evolution,
+                "team_temporal_evolution.png",
+                dpi=300,
+                periods=periods,
+                criteria_evolution=criteria_evolution,
+            )
 
     def plot_criteria_comparison_over_time(self) -> None:
         """Generates grouped bar chart comparing each criterion across periods.
@@ -235,8 +269,6 @@ class TeamAnalyzer(ChartMixin):
 
         self._logger.info("Generating criteria comparison over time chart")
 
-        import matplotlib.pyplot as plt
-
         # Prepare data
         periods = []
         criteria_data = {}
@@ -259,30 +291,14 @@ class TeamAnalyzer(ChartMixin):
                 criteria_data[criterion] = [0] * len(periods[:-1])
             criteria_data[criterion].append(stats.get("average", 0))
 
-        # Plot grouped bar chart
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        x = np.arange(len(periods))
-        width = 0.8 / len(criteria_data)
-
-        for i, (criterion, values) in enumerate(criteria_data.items()):
-            offset = width * i - (width * len(criteria_data) / 2) + width / 2
-            ax.bar(x + offset, values, width, label=criterion)
-
-        ax.set_xlabel("Period", fontsize=12, fontweight="bold")
-        ax.set_ylabel("Average Level", fontsize=12, fontweight="bold")
-        ax.set_title("Criteria Comparison Across Periods", fontsize=14, fontweight="bold")
-        ax.set_xticks(x)
-        ax.set_xticklabels(periods, rotation=45, ha="right")
-        ax.legend(loc="best", fontsize=9)
-        ax.grid(True, alpha=0.3, axis="y")
-        plt.tight_layout()
-
         if self.output_path:
-            filepath = f"{self.output_path}/team_criteria_comparison.png"
-            plt.savefig(filepath, dpi=300, bbox_inches="tight")
-            self._logger.info(f"Saved criteria comparison chart to {filepath}")
-        plt.close()
+            self._render_chart(
+                _draw_criteria_comparison_over_time,
+                "team_criteria_comparison.png",
+                dpi=300,
+                periods=periods,
+                criteria_data=criteria_data,
+            )
 
     def plot_all_charts(self) -> None:
         """Calls all plot methods to generate all charts."""
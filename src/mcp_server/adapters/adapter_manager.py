@@ -164,15 +164,19 @@ class AdapterManager:
 
         return health_status
 
-    def clear_all_caches(self) -> dict[str, Any]:
+    def clear_all_caches(self, project: str | None = None) -> dict[str, Any]:
         """Clear caches for all initialized adapters.
 
+        Args:
+            project: Only clear entries of this project (or team), or None for all
+
         Returns:
             Status of cache clearing operations
         """
         clear_results = {
             "adapter_manager": {
                 "operation": "clear_all_caches",
+                "project": project,
                 "initialized_adapters": len(self._adapters),
             },
             "results": {},
@@ -181,7 +185,7 @@ class AdapterManager:
         for name, adapter in self._adapters.items():
             try:
                 self.logger.info(f"Clearing cache for {name} adapter")
-                result = adapter.clear_cache()
+                result = adapter.clear_cache(project=project)
                 clear_results["results"][name] = result
             except Exception as e:
                 self.logger.error(f"Failed to clear cache for {name} adapter: {e}")
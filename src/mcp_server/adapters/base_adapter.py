@@ -4,9 +4,17 @@ This module provides the base adapter class that all service adapters must inher
 It provides common functionality for logging, caching, error handling, and service integration.
 """
 
+import asyncio
+import contextvars
+import functools
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
+from mcp_server.revalidating_cache import RevalidatingCache, capture_cache_info, scope_tags, with_cache_info
+from mcp_server.server_config import MCPServerConfig
 from utils.cache_manager.cache_manager import CacheManager
 from utils.env_loader import ensure_env_loaded
 from utils.logging.logging_manager import LogManager
@@ -20,6 +28,7 @@ class BaseAdapter(ABC):
     - Intelligent caching
     - Error handling
     - Environment loading
+    - Off-loop execution of blocking service calls with a per-adapter concurrency cap
     """
 
     def __init__(self, adapter_name: str) -> None:
@@ -33,7 +42,11 @@ class BaseAdapter(ABC):
         self.adapter_name = adapter_name
         self.logger = LogManager.get_instance().get_logger("MCPAdapter", adapter_name)
         self.cache = CacheManager.get_instance()
+        self.revalidating_cache = RevalidatingCache(self.cache, self.logger)
         self._service = None
+        self._slots: asyncio.Semaphore | None = None
+        self._service_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._slot_holder = threading.local()
 
         self.logger.info(f"Initializing {adapter_name} adapter")
 
@@ -49,14 +62,95 @@ class BaseAdapter(ABC):
             self.logger.debug(f"Service initialized for {self.adapter_name}")
         return self._service
 
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of this adapter's calls running at once."""
+        return MCPServerConfig.get_adapter_max_concurrency(self.adapter_name)
+
+    @contextmanager
+    def service_slot(self) -> Iterator[None]:
+        """Hold one of the adapter's max_concurrency service slots, waiting for a free one.
+
+        Every uncached service call takes a slot, whether it comes from a tool, from a
+        prompt or resource collector thread or from a background cache refresh. Nested
+        operations of the same adapter in one thread reuse the slot already held.
+        """
+        if getattr(self._slot_holder, "held", False):
+            yield
+            return
+
+        with self._service_slots:
+            self._slot_holder.held = True
+            try:
+                yield
+            finally:
+                self._slot_holder.held = False
+
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking adapter call in a worker thread.
+
+        The event loop stays free for other requests while the call runs. At most
+        max_concurrency tool calls per adapter occupy a worker thread at once; the
+        service calls themselves are capped by service_slot(). If the awaiting task is
+        cancelled (e.g. by a tool timeout), the thread finishes in the background and
+        keeps its slot until then.
+
+        This is the tool response boundary: a dict result is returned as a copy carrying
+        "cache_info" with the age of the cached data it came from.
+
+        Args:
+            func: Blocking callable, usually a method of this adapter
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Result of func
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        slots = self._slots
+
+        await slots.acquire()
+        try:
+            context = contextvars.copy_context()
+            future = asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(context.run, self._call_with_cache_info, func, *args, **kwargs)
+            )
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _call_with_cache_info(func: Callable[..., Any], *args, **kwargs) -> Any:
+        with capture_cache_info() as cache_info:
+            result = func(*args, **kwargs)
+        return with_cache_info(result, cache_info)
+
     def get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate standardized cache key."""
         params = "_".join([f"{k}_{v}" for k, v in sorted(kwargs.items())])
         return f"{self.adapter_name}_{operation}_{params}"
 
+    def get_cache_tags(self, operation: str, **kwargs) -> list[str]:
+        """Generate invalidation tags for an operation's cache entry."""
+        return [
+            "namespace:adapter",
+            f"adapter:{self.adapter_name}",
+            f"operation:{operation}",
+            *scope_tags(kwargs),
+        ]
+
     def cached_operation(self, operation: str, func, expiration_minutes: int = 60, **kwargs) -> Any:
         """Execute operation with automatic caching.
 
+        Expired results are served for a grace window while a single background
+        refresh runs. Computing a result holds a service slot. The result is returned
+        as cached, so prompts and resources can embed it; tools get "cache_info" added
+        by run_blocking.
+
         Args:
             operation: Name of the operation
             func: Function to execute
@@ -65,23 +159,18 @@ class BaseAdapter(ABC):
         """
         cache_key = self.get_cache_key(operation, **kwargs)
 
-        # Try to load from cache
-        cached_result = self.cache.load(cache_key, expiration_minutes=expiration_minutes)
-        if cached_result is not None:
-            self.logger.debug(f"Cache hit for {operation}")
-            return cached_result
+        def _compute() -> Any:
+            with self.service_slot():
+                return func(**kwargs)
 
         try:
-            # Execute operation
-            self.logger.debug(f"Executing {operation} - cache miss")
-            result = func(**kwargs)
-
-            # Save to cache
-            self.cache.save(cache_key, result)
-            self.logger.debug(f"Cached result for {operation}")
-
-            return result
-
+            return self.revalidating_cache.get(
+                cache_key,
+                operation,
+                _compute,
+                expiration_minutes,
+                tags=self.get_cache_tags(operation, **kwargs),
+            )
         except Exception as e:
             self.logger.error(f"Error in {operation}: {e}")
             raise
@@ -106,32 +195,40 @@ class BaseAdapter(ABC):
                 "error": str(e),
             }
 
-    def clear_cache(self, operation: str | None = None) -> dict[str, Any]:
+    def clear_cache(self, operation: str | None = None, project: str | None = None) -> dict[str, Any]:
         """Clear cache for this adapter.
 
+        Entries are found through the tags written with them, so other adapters and
+        projects keep their cache.
+
         Args:
             operation: Specific operation to clear, or None for all
+            project: Only clear entries of this project (or team), or None for all
 
         Returns:
             Status of cache clearing operation
         """
         try:
+            tags = [f"adapter:{self.adapter_name}"]
             if operation:
-                # Clear specific operation cache
-                cache_pattern = f"{self.adapter_name}_{operation}_*"
-                self.logger.info(f"Clearing cache for operation: {operation}")
-            else:
-                # Clear all adapter cache
-                cache_pattern = f"{self.adapter_name}_*"
-                self.logger.info(f"Clearing all cache for adapter: {self.adapter_name}")
-
-            # Note: This is a simplified implementation
-            # CacheManager would need to support pattern-based clearing
+                tags.append(f"operation:{operation}")
+            if project:
+                tags.extend(scope_tags({"project": project}))
+
+            self.logger.info(f"Clearing cache for tags: {tags}")
+            cleared = self.cache.invalidate_by_tags(tags)
+
+            if not project:
+                # Entries written before tagging existed are matched by key prefix
+                prefix = f"{self.adapter_name}_{operation}_" if operation else f"{self.adapter_name}_"
+                cleared += self.cache.invalidate_by_prefix(prefix)
+
             return {
                 "adapter": self.adapter_name,
                 "operation": operation,
+                "project": project,
                 "status": "cache_cleared",
-                "message": f"Cache cleared for pattern: {cache_pattern}",
+                "entries_cleared": cleared,
             }
 
         except Exception as e:
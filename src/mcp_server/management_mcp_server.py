@@ -1,5 +1,6 @@
 # flake8: noqa: E402
 import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -33,6 +34,7 @@ from mcp_server.resources.quality_metrics_resources import QualityMetricsResourc
 # Import MCP Resources - Phase 4
 from mcp_server.resources.team_metrics_resources import TeamMetricsResourceHandler
 from mcp_server.resources.weekly_report_resources import WeeklyReportResourceHandler
+from mcp_server.revalidating_cache import scope_tags
 from mcp_server.server_config import MCPServerConfig
 from mcp_server.tools.circleci_tools import CircleCITools
 
@@ -112,6 +114,40 @@ class ManagementMCPServer:
                 )
             )
 
+            # Cache invalidation tool
+            tools.append(
+                Tool(
+                    name="cache_invalidate",
+                    description=(
+                        "Invalidate cached data by tag or key prefix. Filters are combined, e.g. "
+                        "adapter=jira and project=CWS clears only CWS JIRA data; project alone clears "
+                        "that project's adapter, resource and prompt caches."
+                    ),
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "adapter": {
+                                "type": "string",
+                                "enum": list(MCPServerConfig.ADAPTER_NAMES),
+                                "description": "Only entries of this adapter",
+                            },
+                            "operation": {"type": "string", "description": "Only entries of this operation"},
+                            "project": {"type": "string", "description": "Only entries of this project or team"},
+                            "tags": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Raw tags entries must all carry (e.g. 'namespace:jira')",
+                            },
+                            "prefix": {
+                                "type": "string",
+                                "description": "Also remove entries whose key starts with this",
+                            },
+                        },
+                        "required": [],
+                    },
+                )
+            )
+
             # Add all domain tools
             tools.extend(JiraTools.get_tool_definitions())
             tools.extend(SonarQubeTools.get_tool_definitions())
@@ -127,21 +163,32 @@ class ManagementMCPServer:
             """Execute specific tool based on prefix."""
             self.logger.info(f"Executing tool: {name} with args: {arguments}")
 
+            timeout = MCPServerConfig.get_tool_timeout(name)
+
             try:
                 if name == "health_check":
-                    return await self._health_check()
+                    execution = self._health_check()
+                elif name == "cache_invalidate":
+                    execution = self._invalidate_cache(arguments)
                 elif name.startswith("jira_"):
-                    return await self.jira_tools.execute_tool(name, arguments)
+                    execution = self.jira_tools.execute_tool(name, arguments)
                 elif name.startswith("sonar_"):
-                    return await self.sonarqube_tools.execute_tool(name, arguments)
+                    execution = self.sonarqube_tools.execute_tool(name, arguments)
                 elif name.startswith("circleci_"):
-                    return await self.circleci_tools.execute_tool(name, arguments)
+                    execution = self.circleci_tools.execute_tool(name, arguments)
                 elif name.startswith("linearb_"):
-                    return await self.linearb_tools.execute_tool(name, arguments)
+                    execution = self.linearb_tools.execute_tool(name, arguments)
                 else:
                     error_msg = f"Tool '{name}' not found"
                     self.logger.error(error_msg)
                     return [TextContent(type="text", text=f"Error: {error_msg}")]
+
+                # Adapter calls run in worker threads, so a slow tool only delays its own response
+                return await asyncio.wait_for(execution, timeout=timeout)
+            except TimeoutError:
+                error_msg = f"Tool {name} timed out after {timeout:.0f}s"
+                self.logger.error(error_msg)
+                return [TextContent(type="text", text=f"Error: {error_msg}")]
             except Exception as e:
                 error_msg = f"Error executing tool {name}: {e!s}"
                 self.logger.error(error_msg)
@@ -269,7 +316,7 @@ class ManagementMCPServer:
                     "sonarqube": 4,
                     "circleci": 3,
                     "linearb": 4,
-                    "total": 16,  # 15 domain tools + 1 health check
+                    "total": 17,  # 15 domain tools + health check + cache invalidation
                 },
                 "resources_available": {
                     "team": 4,
@@ -296,6 +343,30 @@ class ManagementMCPServer:
             self.logger.error(f"Health check failed: {e}")
             return [TextContent(type="text", text=f"Health check failed: {e!s}")]
 
+    async def _invalidate_cache(self, arguments: dict) -> list[TextContent]:
+        """Invalidate cache entries matching the given tags and/or key prefix."""
+        tags = list(arguments.get("tags") or [])
+        if arguments.get("adapter"):
+            tags.append(f"adapter:{MCPServerConfig.ADAPTER_NAMES[arguments['adapter']]}")
+        if arguments.get("operation"):
+            tags.append(f"operation:{arguments['operation']}")
+        if arguments.get("project"):
+            tags.extend(scope_tags({"project": arguments["project"]}))
+        prefix = arguments.get("prefix")
+
+        if not tags and not prefix:
+            return [TextContent(type="text", text="Error: provide adapter, operation, project, tags or prefix")]
+
+        cleared = 0
+        if tags:
+            cleared += await asyncio.to_thread(self.cache.invalidate_by_tags, tags)
+        if prefix:
+            cleared += await asyncio.to_thread(self.cache.invalidate_by_prefix, prefix)
+
+        self.logger.info(f"Invalidated {cleared} cache entries (tags={tags}, prefix={prefix})")
+        result = {"status": "cache_cleared", "tags": tags, "prefix": prefix, "entries_cleared": cleared}
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
     async def run_stdio(self):
         """Run server via stdio (for Claude Desktop)."""
         self.logger.info("Starting MCP server with stdio transport")
@@ -4,13 +4,18 @@ This module provides the base prompt handler class that all prompt handlers must
 It provides common functionality for generating parametrizable prompts with data integration.
 """
 
+import asyncio
+import functools
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from mcp.types import GetPromptResult, Prompt, PromptMessage, TextContent
 
+from mcp_server.revalidating_cache import RevalidatingCache, scope_tags, with_cache_info
+from mcp_server.source_collector import SourceCollector
 from utils.cache_manager.cache_manager import CacheManager
 from utils.logging.logging_manager import LogManager
 
@@ -35,6 +40,7 @@ class BasePromptHandler(ABC):
         self.prompt_category = prompt_category
         self.logger = LogManager.get_instance().get_logger("MCPPrompt", prompt_category)
         self.cache = CacheManager.get_instance()
+        self.revalidating_cache = RevalidatingCache(self.cache, self.logger)
 
         self.logger.info(f"Initializing {prompt_category} prompt handler")
 
@@ -55,9 +61,15 @@ class BasePromptHandler(ABC):
         params = "_".join([f"{k}_{v}" for k, v in sorted(kwargs.items())])
         return f"prompt_{self.prompt_category}_{prompt_name}_{params}"
 
-    def cached_prompt_generation(self, prompt_name: str, func, expiration_minutes: int = 30, **kwargs) -> Any:
+    async def cached_prompt_generation(self, prompt_name: str, func, expiration_minutes: int = 30, **kwargs) -> Any:
         """Generates prompt with cache (prompts are less durable than resources).
 
+        The lookup, and the blocking data collection on a miss, run in a worker thread
+        so the event loop keeps serving other requests. Expired prompts are served for
+        a grace window while a single background refresh runs. A dict result is
+        returned as a copy carrying "cache_info" with the data's age; the cached entry
+        never contains it.
+
         Args:
             prompt_name: Prompt name
             func: Function to generate prompt
@@ -66,27 +78,68 @@ class BasePromptHandler(ABC):
         """
         cache_key = self.get_cache_key(prompt_name, **kwargs)
 
-        # Try to load from cache
-        cached_result = self.cache.load(cache_key, expiration_minutes=expiration_minutes)
-        if cached_result is not None:
-            self.logger.debug(f"Prompt cache hit for {prompt_name}")
-            return cached_result
-
         try:
-            # Generate prompt
-            self.logger.info(f"Generating prompt {prompt_name} - cache miss")
-            result = func(**kwargs)
-
-            # Save to cache
-            self.cache.save(cache_key, result)
-            self.logger.info(f"Cached prompt result for {prompt_name}")
-
-            return result
-
+            data, cache_info = await asyncio.to_thread(
+                self.revalidating_cache.get_with_info,
+                cache_key,
+                f"prompt {prompt_name}",
+                functools.partial(func, **kwargs),
+                expiration_minutes,
+                should_cache=self._is_complete_result,
+                tags=["namespace:prompt", f"prompt:{self.prompt_category}", *scope_tags(kwargs)],
+            )
+            return with_cache_info(data, cache_info)
         except Exception as e:
             self.logger.error(f"Error generating prompt {prompt_name}: {e}")
             raise
 
+    def _is_complete_result(self, result: Any) -> bool:
+        """Partial results are not cached, so failed sources are retried on the next request."""
+        if isinstance(result, dict) and result.get("source_errors"):
+            self.logger.info("Not caching partial prompt result")
+            return False
+        return True
+
+    def collect_data_sources(
+        self,
+        data: dict[str, Any],
+        data_sources: dict[str, Callable[[], Any]],
+        timeouts: dict[str, float] | None = None,
+        unavailable_note: str = "Some data sources may be unavailable",
+    ) -> dict[str, Any]:
+        """Fetches independent data sources concurrently into a prompt data dict.
+
+        Source names may be dotted paths ("section.field") to build nested sections.
+        Failed or timed out sources are reported under "source_errors" without dropping
+        the others; "source_metadata" carries per-source status and latency.
+
+        Args:
+            data: Prompt data to fill (modified in place)
+            data_sources: Source name to zero-argument fetch function
+            timeouts: Optional per-source timeouts in seconds
+            unavailable_note: Note added when any source fails
+
+        Returns:
+            The filled data dict
+        """
+        collected = SourceCollector().collect(data_sources, timeouts=timeouts)
+
+        for source_name in data_sources:
+            if source_name not in collected["sources"]:
+                continue
+            *sections, field = source_name.split(".")
+            target = data
+            for section in sections:
+                target = target.setdefault(section, {})
+            target[field] = collected["sources"][source_name]
+
+        data["source_metadata"] = collected["source_metadata"]
+        if collected["errors"]:
+            data["source_errors"] = collected["errors"]
+            data["note"] = unavailable_note
+
+        return data
+
     def create_system_message(self, content: str) -> PromptMessage:
         """Creates standardized system message."""
         return PromptMessage(role="user", content=TextContent(type="text", text=f"System: {content}"))
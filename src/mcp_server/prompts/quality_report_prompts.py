@@ -117,7 +117,7 @@ class QualityReportPromptHandler(BasePromptHandler):
 
             return data
 
-        quality_data = self.cached_prompt_generation(
+        quality_data = await self.cached_prompt_generation(
             "code_quality_report",
             _collect_quality_data,
             expiration_minutes=90,
@@ -186,7 +186,7 @@ Provide actionable insights and prioritized recommendations."""
 
             return data
 
-        debt_data = self.cached_prompt_generation(
+        debt_data = await self.cached_prompt_generation(
             "technical_debt_prioritization",
             _collect_debt_data,
             expiration_minutes=120,
@@ -251,7 +251,7 @@ Provide ranked action plan with effort estimates and business impact assessment.
 
             return data
 
-        security_data = self.cached_prompt_generation(
+        security_data = await self.cached_prompt_generation(
             "security_assessment",
             _collect_security_data,
             expiration_minutes=60,
@@ -110,43 +110,40 @@ class QuarterlyReviewPromptHandler(BasePromptHandler):
                 "timestamp": self.get_current_timestamp(),
             }
 
-            try:
+            data_sources = {
                 # JIRA quarterly data
-                data["quarterly_jira_data"] = {
-                    "velocity": self.jira_adapter.get_velocity_analysis(project_key, time_period="last-quarter"),
-                    "cycle_time": self.jira_adapter.get_cycle_time_analysis(project_key, time_period="last-quarter"),
-                    "adherence": self.jira_adapter.get_adherence_analysis(project_key, time_period="last-quarter"),
-                }
-
+                "quarterly_jira_data.velocity": lambda: self.jira_adapter.get_velocity_analysis(
+                    project_key, time_period="last-quarter"
+                ),
+                "quarterly_jira_data.cycle_time": lambda: self.jira_adapter.get_cycle_time_analysis(
+                    project_key, time_period="last-quarter"
+                ),
+                "quarterly_jira_data.adherence": lambda: self.jira_adapter.get_adherence_analysis(
+                    project_key, time_period="last-quarter"
+                ),
                 # Cycle metrics
-                data["cycle_metrics"] = self.jira_adapter.get_cycle_time_analysis(
+                "cycle_metrics": lambda: self.jira_adapter.get_cycle_time_analysis(
                     project_key, time_period="last-3-months"
+                ),
+                # LinearB quarterly metrics
+                "linearb_quarterly_metrics.engineering_metrics": lambda: self.linearb_adapter.get_engineering_metrics(
+                    "last-quarter"
+                ),
+                "linearb_quarterly_metrics.team_performance": self.linearb_adapter.get_team_performance,
+            }
+
+            if include_recs:
+                # Historical comparison
+                data_sources["historical_comparison.velocity_6m"] = lambda: self.jira_adapter.get_velocity_analysis(
+                    project_key, time_period="last-6-months"
+                )
+                data_sources["historical_comparison.cycle_time_6m"] = lambda: self.jira_adapter.get_cycle_time_analysis(
+                    project_key, time_period="last-6-months"
                 )
 
-                # LinearB quarterly metrics
-                data["linearb_quarterly_metrics"] = {
-                    "engineering_metrics": self.linearb_adapter.get_engineering_metrics("last-quarter"),
-                    "team_performance": self.linearb_adapter.get_team_performance(),
-                }
-
-                if include_recs:
-                    # Historical comparison
-                    data["historical_comparison"] = {
-                        "velocity_6m": self.jira_adapter.get_velocity_analysis(
-                            project_key, time_period="last-6-months"
-                        ),
-                        "cycle_time_6m": self.jira_adapter.get_cycle_time_analysis(
-                            project_key, time_period="last-6-months"
-                        ),
-                    }
-
-            except Exception as e:
-                data["error"] = str(e)
-                data["note"] = "Some data sources may be unavailable"
-
-            return data
-
-        quarterly_data = self.cached_prompt_generation(
+            return self.collect_data_sources(data, data_sources)
+
+        quarterly_data = await self.cached_prompt_generation(
             "quarterly_cycle_analysis",
             _collect_quarterly_data,
             expiration_minutes=120,  # Longer cache for quarterly data
@@ -206,34 +203,31 @@ Focus on cycle-specific insights and recommendations for sustainable quarterly d
                 "timestamp": self.get_current_timestamp(),
             }
 
-            try:
+            data_sources = {
                 # JIRA cycle metrics for retrospective
-                data["cycle_metrics"] = {
-                    "velocity": self.jira_adapter.get_velocity_analysis(project_key, time_period="last-quarter"),
-                    "cycle_time": self.jira_adapter.get_cycle_time_analysis(project_key, time_period="last-quarter"),
-                    "completion_rate": self.jira_adapter.get_adherence_analysis(
-                        project_key, time_period="last-quarter"
-                    ),
-                }
-
+                "cycle_metrics.velocity": lambda: self.jira_adapter.get_velocity_analysis(
+                    project_key, time_period="last-quarter"
+                ),
+                "cycle_metrics.cycle_time": lambda: self.jira_adapter.get_cycle_time_analysis(
+                    project_key, time_period="last-quarter"
+                ),
+                "cycle_metrics.completion_rate": lambda: self.jira_adapter.get_adherence_analysis(
+                    project_key, time_period="last-quarter"
+                ),
                 # Quarterly progress analysis (using available epic monitoring)
-                data["quarterly_progress"] = {
-                    "epic_monitoring": self.jira_adapter.get_epic_monitoring_data(project_key)
-                }
-
+                "quarterly_progress.epic_monitoring": lambda: self.jira_adapter.get_epic_monitoring_data(project_key),
                 # LinearB team performance metrics
-                data["team_performance"] = {
-                    "engineering_metrics": self.linearb_adapter.get_engineering_metrics("last-quarter"),
-                    "team_productivity": self.linearb_adapter.get_team_performance(),
-                }
-
-            except Exception as e:
-                data["error"] = str(e)
-                data["note"] = "Some data sources may be unavailable for retrospective"
+                "team_performance.engineering_metrics": lambda: self.linearb_adapter.get_engineering_metrics(
+                    "last-quarter"
+                ),
+                "team_performance.team_productivity": self.linearb_adapter.get_team_performance,
+            }
 
-            return data
+            return self.collect_data_sources(
+                data, data_sources, unavailable_note="Some data sources may be unavailable for retrospective"
+            )
 
-        retro_data = self.cached_prompt_generation(
+        retro_data = await self.cached_prompt_generation(
             "quarterly_retrospective_data",
             _collect_retrospective_data,
             expiration_minutes=90,
@@ -283,33 +277,29 @@ Identify patterns and areas for improvement within the quarterly/cycle context."
                 "timestamp": self.get_current_timestamp(),
             }
 
-            try:
-                # Historical velocity data for planning
-                time_period = f"last-{cycles_history * 3}-months"  # Assuming 3-month cycles
-                data["velocity_history"] = {
-                    "historical_velocity": self.jira_adapter.get_velocity_analysis(project_key, time_period=time_period)
-                }
+            time_period = f"last-{cycles_history * 3}-months"  # Assuming 3-month cycles
 
+            data_sources = {
+                # Historical velocity data for planning
+                "velocity_history.historical_velocity": lambda: self.jira_adapter.get_velocity_analysis(
+                    project_key, time_period=time_period
+                ),
                 # Cycle performance trends
-                data["cycle_trends"] = {
-                    "cycle_time_analysis": self.jira_adapter.get_cycle_time_analysis(
-                        project_key, time_period=time_period
-                    )
-                }
-
+                "cycle_trends.cycle_time_analysis": lambda: self.jira_adapter.get_cycle_time_analysis(
+                    project_key, time_period=time_period
+                ),
                 # Quarterly patterns analysis (using available comprehensive dashboard)
-                data["quarterly_patterns"] = {
-                    "comprehensive_dashboard": self.jira_adapter.get_comprehensive_dashboard(project_key),
-                    "team_performance": self.linearb_adapter.get_team_performance(),
-                }
-
-            except Exception as e:
-                data["error"] = str(e)
-                data["note"] = "Some historical data may be unavailable for planning analysis"
+                "quarterly_patterns.comprehensive_dashboard": lambda: self.jira_adapter.get_comprehensive_dashboard(
+                    project_key
+                ),
+                "quarterly_patterns.team_performance": self.linearb_adapter.get_team_performance,
+            }
 
-            return data
+            return self.collect_data_sources(
+                data, data_sources, unavailable_note="Some historical data may be unavailable for planning analysis"
+            )
 
-        planning_data = self.cached_prompt_generation(
+        planning_data = await self.cached_prompt_generation(
             "cycle_planning_insights",
             _collect_planning_data,
             expiration_minutes=180,  # Planning data can have long cache
@@ -96,7 +96,7 @@ class TeamPerformancePromptHandler(BasePromptHandler):
 
             return health_data
 
-        health_data = self.cached_prompt_generation(
+        health_data = await self.cached_prompt_generation(
             "team_health_assessment",
             _collect_team_health_data,
             expiration_minutes=90,
@@ -174,7 +174,7 @@ Provide comprehensive health assessment with specific areas for improvement."""
 
             return productivity_data
 
-        productivity_data = self.cached_prompt_generation(
+        productivity_data = await self.cached_prompt_generation(
             "productivity_improvement_plan",
             _collect_productivity_data,
             expiration_minutes=120,
@@ -176,7 +176,7 @@ class WeeklyReportPromptHandler(BasePromptHandler):
             team_name = "FarmOps"
 
         # Collect weekly data with cache
-        weekly_data = self.cached_prompt_generation(
+        weekly_data = await self.cached_prompt_generation(
             "weekly_engineering_report",
             _collect_weekly_report_data,
             expiration_minutes=30,  # Short cache for weekly data
@@ -263,7 +263,7 @@ class WeeklyReportPromptHandler(BasePromptHandler):
         focus_areas = [area.strip() for area in focus_areas_str.split(",")] if focus_areas_str != "all" else ["all"]
         include_recommendations = args.get("include_recommendations", True)
 
-        analysis_data = self.cached_prompt_generation(
+        analysis_data = await self.cached_prompt_generation(
             "weekly_data_analysis",
             _collect_analysis_data,
             expiration_minutes=45,
@@ -344,7 +344,7 @@ Focus on actionable insights that can drive immediate improvements."""
         sections = [s.strip() for s in sections_str.split(",")] if sections_str != "all" else ["all"]
         week_range = args.get("week_range", "current_week")
 
-        section_data = self.cached_prompt_generation(
+        section_data = await self.cached_prompt_generation(
             "template_sections",
             _collect_section_data,
             expiration_minutes=30,
@@ -416,7 +416,7 @@ Output each section with its proper markdown formatting ready for copy-paste int
         priority_level = args.get("priority_level", "all")
         team_context = args.get("team_context", "")
 
-        actions_data = self.cached_prompt_generation(
+        actions_data = await self.cached_prompt_generation(
             "next_actions_generation",
             _collect_next_actions_data,
             expiration_minutes=60,
@@ -495,7 +495,7 @@ Format as markdown lists ready for insertion into report template."""
         metrics_focus_str = args.get("metrics_focus", "all")
         metrics_focus = [m.strip() for m in metrics_focus_str.split(",")] if metrics_focus_str != "all" else ["all"]
 
-        comparison_data = self.cached_prompt_generation(
+        comparison_data = await self.cached_prompt_generation(
             "weekly_metrics_comparison",
             _collect_comparison_data,
             expiration_minutes=90,
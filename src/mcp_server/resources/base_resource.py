@@ -4,6 +4,8 @@ This module provides the base resource handler class that all resource handlers
 It provides common functionality for aggregating data from multiple sources with robust error handling.
 """
 
+import asyncio
+import functools
 import json
 from abc import ABC, abstractmethod
 from collections.abc import Callable
@@ -12,6 +14,8 @@ from typing import Any
 
 from mcp.types import Resource, TextResourceContents
 
+from mcp_server.revalidating_cache import RevalidatingCache, scope_tags, with_cache_info
+from mcp_server.source_collector import SourceCollector
 from utils.cache_manager.cache_manager import CacheManager
 from utils.logging.logging_manager import LogManager
 
@@ -21,8 +25,7 @@ class BaseResourceHandler(ABC):
 
     Provides:
     - Optimized cache for heavy resources
-    - Standardized data aggregation
-    - Error handling for partial failures
+    - Concurrent data aggregation with error handling for partial failures
     - Structured logging
     - Support for quarters/cycles structure (Q1 C1, Q1 C2, etc.)
     """
@@ -36,6 +39,7 @@ class BaseResourceHandler(ABC):
         self.resource_name = resource_name
         self.logger = LogManager.get_instance().get_logger("MCPResource", resource_name)
         self.cache = CacheManager.get_instance()
+        self.revalidating_cache = RevalidatingCache(self.cache, self.logger)
 
         self.logger.info(f"Initializing {resource_name} resource handler")
 
@@ -52,9 +56,16 @@ class BaseResourceHandler(ABC):
         params = "_".join([f"{k}_{v}" for k, v in sorted(kwargs.items())])
         return f"resource_{self.resource_name}_{operation}_{params}"
 
-    def cached_resource_operation(self, operation: str, func, expiration_minutes: int = 120, **kwargs) -> Any:
+    async def cached_resource_operation(self, operation: str, func, expiration_minutes: int = 120, **kwargs) -> Any:
         """Executes resource operation with long cache (resources are heavier).
 
+        The lookup, and the blocking aggregation on a miss, run in a worker thread so
+        the event loop keeps serving other requests. Expired resources are served for
+        a grace window while a single background refresh runs. Partial results are
+        not cached, so failed sources are retried on the next request. A dict result
+        is returned as a copy carrying "cache_info" with the data's age; the cached
+        entry never contains it.
+
         Args:
             operation: Operation name
             func: Function to be executed
@@ -63,71 +74,56 @@ class BaseResourceHandler(ABC):
         """
         cache_key = self.get_cache_key(operation, **kwargs)
 
-        # Try to load from cache
-        cached_result = self.cache.load(cache_key, expiration_minutes=expiration_minutes)
-        if cached_result is not None:
-            self.logger.debug(f"Resource cache hit for {operation}")
-            return cached_result
-
         try:
-            # Execute operation
-            self.logger.info(f"Generating resource {operation} - cache miss")
-            result = func(**kwargs)
-
-            # Save to cache
-            self.cache.save(cache_key, result)
-            self.logger.info(f"Cached resource result for {operation}")
-
-            return result
-
+            data, cache_info = await asyncio.to_thread(
+                self.revalidating_cache.get_with_info,
+                cache_key,
+                f"resource {operation}",
+                functools.partial(func, **kwargs),
+                expiration_minutes,
+                should_cache=self._is_complete_result,
+                tags=["namespace:resource", f"resource:{self.resource_name}", *scope_tags(kwargs)],
+            )
+            return with_cache_info(data, cache_info)
         except Exception as e:
             self.logger.error(f"Error generating resource {operation}: {e}")
             raise
 
+    def _is_complete_result(self, result: Any) -> bool:
+        """Partial results are not cached, so failed sources are retried on the next request."""
+        if isinstance(result, dict) and result.get("status") == "partial":
+            self.logger.info("Not caching partial resource result")
+            return False
+        return True
+
     def aggregate_data_safely(
         self,
         data_sources: dict[str, Callable],
         required_sources: list[str] | None = None,
+        timeouts: dict[str, float] | None = None,
     ) -> dict[str, Any]:
-        """Aggregates data from multiple sources with partial failure handling.
+        """Aggregates data from multiple sources concurrently with partial failure handling.
 
         Args:
             data_sources: dict with source name and function to get data
             required_sources: Required sources (fail if they don't work)
+            timeouts: Optional per-source timeouts in seconds
         """
-        # Create explicit dictionaries for type clarity
-        sources: dict[str, Any] = {}
-        errors: dict[str, str] = {}
+        collected = SourceCollector().collect(data_sources, timeouts=timeouts)
 
         aggregated_data: dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
-            "sources": sources,
-            "errors": errors,
-            "status": "success",
+            "sources": collected["sources"],
+            "errors": collected["errors"],
+            "source_metadata": collected["source_metadata"],
+            "status": "partial" if collected["errors"] else "success",
         }
 
-        required_sources = required_sources or []
-
-        for source_name, fetch_func in data_sources.items():
-            try:
-                self.logger.debug(f"Fetching data from {source_name}")
-                data = fetch_func()
-                sources[source_name] = data
-                self.logger.debug(f"Successfully fetched data from {source_name}")
-
-            except Exception as e:
-                error_msg = f"Failed to fetch data from {source_name}: {e!s}"
-                self.logger.warning(error_msg)
-                errors[source_name] = error_msg
-
-                # If it's a required source, fail completely
-                if source_name in required_sources:
-                    aggregated_data["status"] = "failed"
-                    raise Exception(f"Required source {source_name} failed: {e}")
-
-        # If we have errors but they're not from required sources, mark as partial
-        if errors and aggregated_data["status"] == "success":
-            aggregated_data["status"] = "partial"
+        # If a required source failed, fail completely
+        for source_name in required_sources or []:
+            if source_name in collected["errors"]:
+                aggregated_data["status"] = "failed"
+                raise Exception(f"Required source {source_name} failed: {collected['errors'][source_name]}")
 
         return aggregated_data
 
@@ -139,9 +135,13 @@ class BaseResourceHandler(ABC):
 
 **Generated:** {data.get("timestamp", "Unknown")}
 **Status:** {data.get("status", "Unknown")}
-
-## Data Sources
 """
+        cache_info = data.get("cache_info")
+        if cache_info:
+            stale_note = " (stale)" if cache_info["stale"] else ""
+            formatted_content += f"**Cached:** {cache_info['cached_at']}{stale_note}\n"
+
+        formatted_content += "\n## Data Sources\n"
 
         # list data sources
         for source_name, source_data in data.get("sources", {}).items():
@@ -87,7 +87,7 @@ class PipelineResourceHandler(BaseResourceHandler):
 
             return self.aggregate_data_safely(data_sources)
 
-        pipeline_data = self.cached_resource_operation(
+        pipeline_data = await self.cached_resource_operation(
             "deployment_pipeline_status",
             _generate_pipeline_status,
             expiration_minutes=15,  # Pipelines change fast - short cache
@@ -125,7 +125,7 @@ class PipelineResourceHandler(BaseResourceHandler):
 
             return raw_data
 
-        success_data = self.cached_resource_operation(
+        success_data = await self.cached_resource_operation(
             "build_success_rates", _generate_success_rates, expiration_minutes=60
         )
 
@@ -155,7 +155,7 @@ class PipelineResourceHandler(BaseResourceHandler):
 
             return self.aggregate_data_safely(data_sources)
 
-        deployment_data = self.cached_resource_operation(
+        deployment_data = await self.cached_resource_operation(
             "deployment_frequency_trends",
             _generate_deployment_trends,
             expiration_minutes=180,  # Trends change slowly
@@ -194,7 +194,7 @@ class PipelineResourceHandler(BaseResourceHandler):
 
             return raw_data
 
-        health_data = self.cached_resource_operation(
+        health_data = await self.cached_resource_operation(
             "ci_cd_health_dashboard",
             _generate_ci_cd_health,
             expiration_minutes=45,  # Update frequently for dashboard
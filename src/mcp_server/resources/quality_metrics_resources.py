@@ -84,7 +84,7 @@ class QualityMetricsResourceHandler(BaseResourceHandler):
 
             return self.aggregate_data_safely(data_sources, required_sources=["sonarqube_overview"])
 
-        quality_data = self.cached_resource_operation(
+        quality_data = await self.cached_resource_operation(
             "code_quality_overview",
             _generate_quality_overview,
             expiration_minutes=90,  # Cache por 1.5 horas
@@ -123,7 +123,7 @@ class QualityMetricsResourceHandler(BaseResourceHandler):
 
             return raw_data
 
-        debt_data = self.cached_resource_operation(
+        debt_data = await self.cached_resource_operation(
             "technical_debt_analysis",
             _generate_debt_analysis,
             expiration_minutes=240,  # Cache for 4 hours (heavy analysis)
@@ -154,7 +154,7 @@ class QualityMetricsResourceHandler(BaseResourceHandler):
 
             return self.aggregate_data_safely(data_sources, required_sources=["vulnerabilities_by_severity"])
 
-        security_data = self.cached_resource_operation(
+        security_data = await self.cached_resource_operation(
             "security_vulnerabilities_summary",
             _generate_security_summary,
             expiration_minutes=60,  # Security needs to be more current
@@ -202,7 +202,7 @@ class QualityMetricsResourceHandler(BaseResourceHandler):
 
             return weekly_data
 
-        weekly_data = self.cached_resource_operation(
+        weekly_data = await self.cached_resource_operation(
             "weekly_quality_health",
             _generate_weekly_quality,
             expiration_minutes=60,  # Cache for 1 hour for weekly data
@@ -115,7 +115,7 @@ class TeamMetricsResourceHandler(BaseResourceHandler):
             return self.aggregate_data_safely(data_sources, required_sources=["current_cycle_velocity"])
 
         # Cache for 2 hours (dashboard is heavy)
-        dashboard_data = self.cached_resource_operation(
+        dashboard_data = await self.cached_resource_operation(
             "performance_dashboard", _generate_dashboard, expiration_minutes=120
         )
 
@@ -165,7 +165,7 @@ class TeamMetricsResourceHandler(BaseResourceHandler):
 
             return aggregated
 
-        quarterly_data = self.cached_resource_operation(
+        quarterly_data = await self.cached_resource_operation(
             "quarterly_summary",
             _generate_quarterly_summary,
             expiration_minutes=180,  # Cache for 3 hours for quarterly data
@@ -208,7 +208,7 @@ class TeamMetricsResourceHandler(BaseResourceHandler):
 
             return raw_data
 
-        health_data = self.cached_resource_operation(
+        health_data = await self.cached_resource_operation(
             "health_indicators",
             _generate_health_indicators,
             expiration_minutes=90,  # Cache por 1.5 horas
@@ -261,7 +261,7 @@ class TeamMetricsResourceHandler(BaseResourceHandler):
 
             return weekly_data
 
-        weekly_data = self.cached_resource_operation(
+        weekly_data = await self.cached_resource_operation(
             "weekly_metrics",
             _generate_weekly_metrics,
             expiration_minutes=30,  # Short cache for weekly data
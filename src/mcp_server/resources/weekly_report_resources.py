@@ -133,7 +133,7 @@ class WeeklyReportResourceHandler(BaseResourceHandler):
 
             return report_data
 
-        complete_report = self.cached_resource_operation(
+        complete_report = await self.cached_resource_operation(
             "complete_engineering_report",
             _generate_complete_report,
             expiration_minutes=30,  # Short cache for weekly data
@@ -168,7 +168,7 @@ Compatible with report_template.md structure""",
                 "formatted_for_template": True,
             }
 
-        jira_summary = self.cached_resource_operation(
+        jira_summary = await self.cached_resource_operation(
             "jira_metrics_summary", _generate_jira_summary, expiration_minutes=45
         )
 
@@ -201,7 +201,7 @@ Compatible with report_template.md structure""",
 
             return formatted_data
 
-        sonarqube_snapshot = self.cached_resource_operation(
+        sonarqube_snapshot = await self.cached_resource_operation(
             "sonarqube_quality_snapshot",
             _generate_sonarqube_snapshot,
             expiration_minutes=60,
@@ -237,7 +237,7 @@ Compatible with report_template.md structure""",
                 "linearb_time_range": date_ranges["linearb_range"],
             }
 
-        linearb_summary = self.cached_resource_operation(
+        linearb_summary = await self.cached_resource_operation(
             "linearb_engineering_summary",
             _generate_linearb_summary,
             expiration_minutes=90,
@@ -279,7 +279,7 @@ Compatible with report_template.md structure""",
 
             return template_data
 
-        template_data = self.cached_resource_operation(
+        template_data = await self.cached_resource_operation(
             "template_ready_data", _generate_template_data, expiration_minutes=30
         )
 
@@ -0,0 +1,275 @@
+"""Stale-while-revalidate caching for MCP adapters, resources and prompts.
+
+Once an entry's expiration passes, the first caller used to block on a full recompute
+(often minutes of JIRA/LinearB calls). RevalidatingCache keeps serving an expired entry
+for a grace window and refreshes it once in the background, so interactive latency
+stays flat across TTL boundaries.
+
+Cached values are returned exactly as stored. The age of the data ("cache_info") is
+attached only to the response sent to the MCP client, on a copy, so it never reaches
+the cache or callers that embed one cached result in another.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from logging import Logger
+from typing import Any
+
+from mcp_server.server_config import MCPServerConfig
+from utils.cache_manager.cache_manager import CacheManager
+
+# Operation parameters that scope cached data, mapped to the tag they produce
+SCOPE_PARAMS = {
+    "project_key": "project",
+    "project_keys": "project",
+    "project": "project",
+    "team": "team",
+    "team_ids": "team",
+    "squad": "team",
+}
+
+# Receives the cache info of the outermost lookup made inside capture_cache_info()
+_captured_cache_info: ContextVar[dict[str, Any] | None] = ContextVar("captured_cache_info", default=None)
+
+# Set while a background refresh computes, so nested lookups recompute expired entries
+# instead of serving them stale under the refreshed entry's new timestamp
+_refreshing_entry: ContextVar[bool] = ContextVar("refreshing_entry", default=False)
+
+
+def scope_tags(params: dict[str, Any]) -> list[str]:
+    """Build "project:<key>"/"team:<name>" cache tags from operation parameters."""
+    tags = []
+    for name, tag in SCOPE_PARAMS.items():
+        value = params.get(name)
+        if value in (None, "", []):
+            continue
+        if isinstance(value, str):
+            value = [v.strip() for v in value.split(",")] if "," in value else [value]
+        for item in value if isinstance(value, list | tuple | set) else [value]:
+            tags.append(f"{tag}:{item}")
+    return tags
+
+
+def with_cache_info(data: Any, cache_info: dict[str, Any]) -> Any:
+    """Return a copy of a dict response carrying "cache_info"; other values are returned as is."""
+    if not isinstance(data, dict) or not cache_info:
+        return data
+    return {**data, "cache_info": cache_info}
+
+
+@contextmanager
+def capture_cache_info() -> Iterator[dict[str, Any]]:
+    """Collect the cache info of the outermost RevalidatingCache lookup made in the block.
+
+    Lookups nested in that lookup's computation (e.g. adapter calls made by a prompt's
+    data collector) are not reported.
+    """
+    captured: dict[str, Any] = {}
+    token = _captured_cache_info.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured_cache_info.reset(token)
+
+
+class RevalidatingCache:
+    """CacheManager wrapper with stale-while-revalidate semantics.
+
+    - Fresh entry: returned as is.
+    - Expired entry within the grace window: returned immediately and a background
+      refresh is started, at most one per cache key across the process.
+    - Missing entry or beyond the grace window: computed synchronously.
+
+    Lookups nested in a background refresh (e.g. adapter calls of a prompt's collector)
+    never serve stale data: the refreshed entry gets a new timestamp, so everything it
+    embeds must be current.
+
+    Values are returned exactly as cached; get_with_info() also reports cached_at,
+    age_seconds and the stale/refreshing flags for the response boundary.
+    """
+
+    _refreshing: set[str] = set()
+    _lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+
+    def __init__(self, cache: CacheManager, logger: Logger) -> None:
+        """Initialize revalidating cache.
+
+        Args:
+            cache: Underlying cache manager
+            logger: Logger of the owning adapter or handler
+        """
+        self.cache = cache
+        self.logger = logger
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=MCPServerConfig.MAX_REFRESH_WORKERS, thread_name_prefix="mcp-refresh"
+                )
+            return cls._executor
+
+    @classmethod
+    def is_refreshing(cls, cache_key: str) -> bool:
+        """Check whether a background refresh is running for a cache key."""
+        with cls._lock:
+            return cache_key in cls._refreshing
+
+    def get(
+        self,
+        cache_key: str,
+        label: str,
+        compute: Callable[[], Any],
+        expiration_minutes: int,
+        should_cache: Callable[[Any], bool] | None = None,
+        tags: list[str] | None = None,
+    ) -> Any:
+        """Return the cached value for a key, serving stale data while it is refreshed.
+
+        Args:
+            cache_key: Cache key
+            label: Operation name used in log messages
+            compute: Zero-argument function producing a fresh value
+            expiration_minutes: Age after which the entry is stale
+            should_cache: Optional predicate; results it rejects are returned but not stored
+            tags: Tags stored with the entry for later invalidation
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        value, _ = self.get_with_info(
+            cache_key, label, compute, expiration_minutes, should_cache=should_cache, tags=tags
+        )
+        return value
+
+    def get_with_info(
+        self,
+        cache_key: str,
+        label: str,
+        compute: Callable[[], Any],
+        expiration_minutes: int,
+        should_cache: Callable[[Any], bool] | None = None,
+        tags: list[str] | None = None,
+    ) -> tuple[Any, dict[str, Any]]:
+        """Like get(), also returning the cache info of the value.
+
+        Returns:
+            tuple[Any, dict[str, Any]]: The value, unchanged, and its cached_at,
+            age_seconds, stale and refreshing flags
+        """
+        captured = _captured_cache_info.get()
+        token = _captured_cache_info.set(None)
+        try:
+            value, cache_info = self._lookup(
+                cache_key, label, compute, expiration_minutes, should_cache=should_cache, tags=tags
+            )
+        finally:
+            _captured_cache_info.reset(token)
+
+        if captured is not None and not captured:
+            captured.update(cache_info)
+        return value, cache_info
+
+    def _lookup(
+        self,
+        cache_key: str,
+        label: str,
+        compute: Callable[[], Any],
+        expiration_minutes: int,
+        *,
+        should_cache: Callable[[Any], bool] | None,
+        tags: list[str] | None,
+    ) -> tuple[Any, dict[str, Any]]:
+        entry = self.cache.load_entry(cache_key)
+        if entry is not None:
+            data, cached_at = entry
+            age_seconds = (datetime.now() - cached_at).total_seconds()
+            ttl_seconds = expiration_minutes * 60
+            grace_seconds = MCPServerConfig.get_stale_grace_minutes() * 60
+
+            if age_seconds <= ttl_seconds:
+                self.logger.debug(f"Cache hit for {label}")
+                return data, self._cache_info(cached_at, age_seconds, stale=False, refreshing=False)
+
+            if age_seconds <= ttl_seconds + grace_seconds and not _refreshing_entry.get():
+                refreshing = self._refresh_in_background(
+                    cache_key, label, compute, should_cache=should_cache, tags=tags
+                )
+                self.logger.info(f"Serving stale {label} ({age_seconds:.0f}s old) while refreshing")
+                return data, self._cache_info(cached_at, age_seconds, stale=True, refreshing=refreshing)
+
+        self.logger.debug(f"Executing {label} - cache miss")
+        result = self._compute_and_store(cache_key, label, compute, should_cache=should_cache, tags=tags)
+        return result, self._cache_info(datetime.now(), 0.0, stale=False, refreshing=False)
+
+    def _compute_and_store(
+        self,
+        cache_key: str,
+        label: str,
+        compute: Callable[[], Any],
+        *,
+        should_cache: Callable[[Any], bool] | None,
+        tags: list[str] | None,
+    ) -> Any:
+        result = compute()
+        if should_cache is None or should_cache(result):
+            self.cache.save(cache_key, result, tags=tags)
+            self.logger.debug(f"Cached result for {label}")
+        return result
+
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        label: str,
+        compute: Callable[[], Any],
+        *,
+        should_cache: Callable[[Any], bool] | None,
+        tags: list[str] | None,
+    ) -> bool:
+        """Start a refresh unless one is already running for the key.
+
+        Returns:
+            bool: True if a refresh is running for the key after the call
+        """
+        with self._lock:
+            if cache_key in self._refreshing:
+                return True
+            self._refreshing.add(cache_key)
+
+        def _refresh() -> None:
+            token = _refreshing_entry.set(True)
+            try:
+                self._compute_and_store(cache_key, label, compute, should_cache=should_cache, tags=tags)
+                self.logger.info(f"Refreshed stale cache for {label}")
+            except Exception as e:
+                # The stale entry stays in place and the next request retries
+                self.logger.warning(f"Background refresh of {label} failed: {e}")
+            finally:
+                _refreshing_entry.reset(token)
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+
+        try:
+            self._get_executor().submit(_refresh)
+        except RuntimeError as e:
+            # Executor already shut down (interpreter exit)
+            with self._lock:
+                self._refreshing.discard(cache_key)
+            self.logger.warning(f"Could not schedule refresh of {label}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _cache_info(cached_at: datetime, age_seconds: float, *, stale: bool, refreshing: bool) -> dict[str, Any]:
+        return {
+            "cached_at": cached_at.isoformat(),
+            "age_seconds": round(age_seconds, 1),
+            "stale": stale,
+            "refreshing": refreshing,
+        }
@@ -1,3 +1,4 @@
+import os
 from typing import Any
 
 
@@ -21,6 +22,64 @@ class MCPServerConfig:
     REUSE_PYTOOLKIT_CACHE = True
     REUSE_PYTOOLKIT_ENV = True
 
+    # Adapter names as used in cache keys and tags ("adapter:<name>")
+    ADAPTER_NAMES = {"jira": "JIRA", "sonarqube": "SonarQube", "circleci": "CircleCI", "linearb": "LinearB"}
+
+    # Tool Execution - blocking adapter calls run in worker threads
+    DEFAULT_ADAPTER_MAX_CONCURRENCY = 4
+    ADAPTER_MAX_CONCURRENCY = {"JIRA": 2, "SonarQube": 4, "CircleCI": 4, "LinearB": 2}
+    DEFAULT_TOOL_TIMEOUT_SECONDS = 120
+    TOOL_TIMEOUT_SECONDS = {
+        "health_check": 10,
+        "jira_get_cycle_time_metrics": 300,
+        "jira_get_team_velocity": 300,
+        "jira_get_issue_adherence": 300,
+        "linearb_export_report": 300,
+    }
+
+    # Data Collection - independent sources of prompts/resources are fetched concurrently
+    DEFAULT_SOURCE_TIMEOUT_SECONDS = 90
+    MAX_COLLECTOR_WORKERS = 8
+
+    # Caching - expired entries are served for a grace window while refreshed in the background
+    DEFAULT_STALE_GRACE_MINUTES = 240
+    MAX_REFRESH_WORKERS = 4
+
+    @classmethod
+    def get_adapter_max_concurrency(cls, adapter_name: str) -> int:
+        """Get how many calls of an adapter may run at once.
+
+        Args:
+            adapter_name: Adapter name as passed to BaseAdapter
+
+        Returns:
+            int: Concurrency cap, overridable with MCP_<ADAPTER>_MAX_CONCURRENCY
+        """
+        default = cls.ADAPTER_MAX_CONCURRENCY.get(adapter_name, cls.DEFAULT_ADAPTER_MAX_CONCURRENCY)
+        return max(1, int(os.getenv(f"MCP_{adapter_name.upper()}_MAX_CONCURRENCY", default)))
+
+    @classmethod
+    def get_tool_timeout(cls, tool_name: str) -> float:
+        """Get the timeout for a tool call.
+
+        Args:
+            tool_name: MCP tool name
+
+        Returns:
+            float: Timeout in seconds; MCP_TOOL_TIMEOUT_SECONDS overrides the default
+        """
+        default = float(os.getenv("MCP_TOOL_TIMEOUT_SECONDS", cls.DEFAULT_TOOL_TIMEOUT_SECONDS))
+        return float(cls.TOOL_TIMEOUT_SECONDS.get(tool_name, default))
+
+    @classmethod
+    def get_stale_grace_minutes(cls) -> int:
+        """Get how long an expired cache entry may still be served while it is refreshed.
+
+        Returns:
+            int: Grace window in minutes; MCP_STALE_GRACE_MINUTES overrides it, 0 disables stale serving
+        """
+        return max(0, int(os.getenv("MCP_STALE_GRACE_MINUTES", cls.DEFAULT_STALE_GRACE_MINUTES)))
+
     @classmethod
     def get_config(cls) -> dict[str, Any]:
         """Get complete server configuration.
@@ -38,4 +97,15 @@ class MCPServerConfig:
                 "cache": cls.REUSE_PYTOOLKIT_CACHE,
                 "env": cls.REUSE_PYTOOLKIT_ENV,
             },
+            "execution": {
+                "default_tool_timeout_seconds": cls.DEFAULT_TOOL_TIMEOUT_SECONDS,
+                "tool_timeout_seconds": cls.TOOL_TIMEOUT_SECONDS,
+                "adapter_max_concurrency": cls.ADAPTER_MAX_CONCURRENCY,
+                "default_source_timeout_seconds": cls.DEFAULT_SOURCE_TIMEOUT_SECONDS,
+                "max_collector_workers": cls.MAX_COLLECTOR_WORKERS,
+            },
+            "caching": {
+                "stale_grace_minutes": cls.get_stale_grace_minutes(),
+                "max_refresh_workers": cls.MAX_REFRESH_WORKERS,
+            },
         }
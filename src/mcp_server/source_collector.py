@@ -0,0 +1,130 @@
+"""Concurrent data source collection for MCP prompts and resources.
+
+Prompts and resources aggregate several independent adapter calls. SourceCollector
+runs them in worker threads with per-source timeouts, so generation takes as long as
+the slowest source instead of the sum, and one failing source no longer drops the rest.
+"""
+
+import contextvars
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from mcp_server.server_config import MCPServerConfig
+from utils.logging.logging_manager import LogManager
+
+
+class SourceCollector:
+    """Fan-out/fan-in collector for independent data sources.
+
+    Each source is a zero-argument callable. The result holds the data of every source
+    that finished, an error message for each one that failed or timed out, and per-source
+    status and latency metadata.
+    """
+
+    def __init__(self, timeout_seconds: float | None = None, max_workers: int | None = None) -> None:
+        """Initialize source collector.
+
+        Args:
+            timeout_seconds: Default time budget of each source, measured from the start of collection
+            max_workers: Maximum sources fetched at once
+        """
+        self.timeout_seconds = timeout_seconds or MCPServerConfig.DEFAULT_SOURCE_TIMEOUT_SECONDS
+        self.max_workers = max_workers or MCPServerConfig.MAX_COLLECTOR_WORKERS
+        self.logger = LogManager.get_instance().get_logger("MCPSourceCollector")
+
+    def collect(
+        self,
+        sources: dict[str, Callable[[], Any]],
+        timeouts: dict[str, float] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch all sources concurrently.
+
+        Args:
+            sources: Source name to zero-argument fetch function
+            timeouts: Optional per-source timeouts overriding the default
+
+        Returns:
+            dict with "sources" (name -> data), "errors" (name -> message),
+            "source_metadata" (name -> status and latency_ms) and overall "status"
+            ("success", "partial" or "failed")
+        """
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        metadata: dict[str, dict[str, Any]] = {}
+
+        if not sources:
+            return {"sources": results, "errors": errors, "source_metadata": metadata, "status": "success"}
+
+        timeouts = timeouts or {}
+        started_at = time.monotonic()
+        started: dict[str, float] = {}
+        deadlines = {name: started_at + timeouts.get(name, self.timeout_seconds) for name in sources}
+
+        def _timed(name: str, fetch_func: Callable[[], Any]) -> Any:
+            started[name] = time.monotonic()
+            return fetch_func()
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(sources)), thread_name_prefix="mcp-source")
+        try:
+            # Each source runs in a copy of the caller's context, so cache state set by the
+            # caller (e.g. a background refresh) reaches the adapter calls
+            pending: dict[Future, str] = {
+                executor.submit(contextvars.copy_context().run, _timed, name, fetch_func): name
+                for name, fetch_func in sources.items()
+            }
+
+            while pending:
+                next_deadline = min(deadlines[name] for name in pending.values())
+                done, _ = wait(pending, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = pending.pop(future)
+                    latency_ms = round((time.monotonic() - started.get(name, started_at)) * 1000, 1)
+                    try:
+                        results[name] = future.result()
+                        metadata[name] = {"status": "ok", "latency_ms": latency_ms}
+                        self.logger.debug(f"Fetched {name} in {latency_ms:.0f}ms")
+                    except Exception as e:
+                        errors[name] = f"Failed to fetch data from {name}: {e!s}"
+                        metadata[name] = {"status": "error", "latency_ms": latency_ms}
+                        self.logger.warning(errors[name])
+
+                self._expire_overdue(pending, deadlines, started_at, errors, metadata)
+        finally:
+            # Timed out sources keep running in the background; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not errors:
+            status = "success"
+        elif results:
+            status = "partial"
+        else:
+            status = "failed"
+
+        total_ms = round((time.monotonic() - started_at) * 1000, 1)
+        self.logger.info(f"Collected {len(results)}/{len(sources)} sources in {total_ms:.0f}ms ({status})")
+
+        return {"sources": results, "errors": errors, "source_metadata": metadata, "status": status}
+
+    def _expire_overdue(
+        self,
+        pending: dict[Future, str],
+        deadlines: dict[str, float],
+        started_at: float,
+        errors: dict[str, str],
+        metadata: dict[str, dict[str, Any]],
+    ) -> None:
+        """Drop pending sources whose deadline has passed, recording them as timed out."""
+        now = time.monotonic()
+        for future, name in list(pending.items()):
+            if future.done() or now < deadlines[name]:
+                continue
+
+            del pending[future]
+            future.cancel()
+            timeout = deadlines[name] - started_at
+            errors[name] = f"Timed out after {timeout:g}s"
+            metadata[name] = {"status": "timeout", "latency_ms": round((now - started_at) * 1000, 1)}
+            self.logger.warning(f"Source {name} timed out after {timeout:g}s")
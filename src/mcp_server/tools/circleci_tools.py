@@ -123,7 +123,7 @@ class CircleCITools:
         self.logger.info(f"Getting pipeline status for {project_slug}, limit: {limit}")
 
         try:
-            data = self.adapter.get_pipeline_status(project_slug, limit)
+            data = await self.adapter.run_blocking(self.adapter.get_pipeline_status, project_slug, limit)
 
             formatted_result = {
                 "project_slug": project_slug,
@@ -171,7 +171,7 @@ class CircleCITools:
         self.logger.info(f"Getting build metrics for {project_slug}, last {days} days")
 
         try:
-            data = self.adapter.get_build_metrics(project_slug, days)
+            data = await self.adapter.run_blocking(self.adapter.get_build_metrics, project_slug, days)
 
             formatted_result = {
                 "project_slug": project_slug,
@@ -221,7 +221,7 @@ class CircleCITools:
         try:
             # Reuse build metrics for deployment analysis
             # The CircleCI adapter can expand this in the future
-            build_data = self.adapter.get_build_metrics(project_slug, days)
+            build_data = await self.adapter.run_blocking(self.adapter.get_build_metrics, project_slug, days)
 
             # Create specific deployment analysis based on build data
             deployment_analysis = {
@@ -256,10 +256,10 @@ class JiraTools:
 
         try:
             if team:
-                data = self.adapter.get_epic_monitoring_data(project_key, team)
+                data = await self.adapter.run_blocking(self.adapter.get_epic_monitoring_data, project_key, team)
             else:
                 # Call without team parameter to get all teams
-                data = self.adapter.get_epic_monitoring_data(project_key)
+                data = await self.adapter.run_blocking(self.adapter.get_epic_monitoring_data, project_key)
 
             formatted_result = {
                 "project_key": project_key,
@@ -316,7 +316,8 @@ class JiraTools:
         self.logger.info(f"Getting cycle time metrics for {project_key}, period: {time_period}, team: {team}")
 
         try:
-            data = self.adapter.get_cycle_time_analysis(
+            data = await self.adapter.run_blocking(
+                self.adapter.get_cycle_time_analysis,
                 project_key=project_key,
                 time_period=time_period,
                 issue_types=issue_types,
@@ -384,7 +385,8 @@ class JiraTools:
         self.logger.info(f"Getting team velocity for {project_key}, period: {time_period}, team: {team}")
 
         try:
-            data = self.adapter.get_velocity_analysis(
+            data = await self.adapter.run_blocking(
+                self.adapter.get_velocity_analysis,
                 project_key=project_key,
                 time_period=time_period,
                 issue_types=issue_types,
@@ -449,7 +451,8 @@ class JiraTools:
         self.logger.info(f"Getting issue adherence analysis for {project_key}, period: {time_period}, team: {team}")
 
         try:
-            data = self.adapter.get_adherence_analysis(
+            data = await self.adapter.run_blocking(
+                self.adapter.get_adherence_analysis,
                 project_key=project_key,
                 time_period=time_period,
                 issue_types=issue_types,
@@ -517,7 +520,8 @@ class JiraTools:
         self.logger.info(f"Getting open issues for {project_key}, team: {team}")
 
         try:
-            data = self.adapter.get_open_issues(
+            data = await self.adapter.run_blocking(
+                self.adapter.get_open_issues,
                 project_key=project_key,
                 issue_types=issue_types,
                 team=team,
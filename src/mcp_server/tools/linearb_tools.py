@@ -308,7 +308,7 @@ class LinearBTools:
         )
 
         try:
-            data = self.adapter.get_engineering_metrics(time_range, team_ids)
+            data = await self.adapter.run_blocking(self.adapter.get_engineering_metrics, time_range, team_ids)
 
             formatted_result = {
                 "time_range": time_range,
@@ -363,7 +363,7 @@ class LinearBTools:
         )
 
         try:
-            data = self.adapter.get_team_performance(team_ids)
+            data = await self.adapter.run_blocking(self.adapter.get_team_performance, team_ids)
 
             formatted_result = {
                 "team_ids": team_ids,
@@ -411,7 +411,7 @@ class LinearBTools:
         try:
             # Reuse engineering metrics for PR analysis
             # The LinearB adapter can expand this in the future
-            data = self.adapter.get_engineering_metrics(time_range, team_ids)
+            data = await self.adapter.run_blocking(self.adapter.get_engineering_metrics, time_range, team_ids)
 
             # Create specific PR analysis based on engineering data
             pr_analysis = {
@@ -472,7 +472,7 @@ class LinearBTools:
         try:
             # Reuse engineering metrics for deployment analysis
             # The LinearB adapter can expand this in the future
-            data = self.adapter.get_engineering_metrics(time_range, team_ids)
+            data = await self.adapter.run_blocking(self.adapter.get_engineering_metrics, time_range, team_ids)
 
             # Create specific deployment analysis based on engineering data
             deployment_analysis = {
@@ -538,7 +538,7 @@ class LinearBTools:
         try:
             # Note: This would typically call the export report functionality
             # For now, we'll return a consolidated engineering metrics report
-            data = self.adapter.get_engineering_metrics(time_range, team_ids)
+            data = await self.adapter.run_blocking(self.adapter.get_engineering_metrics, time_range, team_ids)
 
             formatted_result = {
                 "export_parameters": {
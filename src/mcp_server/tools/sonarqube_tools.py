@@ -153,7 +153,7 @@ class SonarQubeTools:
         try:
             # Note: The underlying service currently doesn't support organization parameter
             # for individual project queries, only for project listing/filtering
-            data = self.adapter.get_project_details(project_key)
+            data = await self.adapter.run_blocking(self.adapter.get_project_details, project_key)
 
             formatted_result = {
                 "project_key": project_key,
@@ -203,7 +203,7 @@ class SonarQubeTools:
         try:
             # Note: The get_project_details method can include information about issues
             # We'll use this as a base and filter by type if necessary
-            data = self.adapter.get_project_details(project_key, include_issues=True)
+            data = await self.adapter.run_blocking(self.adapter.get_project_details, project_key, include_issues=True)
 
             # Filter issues by type if available
             issues_data = data.get("issues", {})
@@ -267,13 +267,17 @@ class SonarQubeTools:
         try:
             if project_keys:
                 # Get metrics for specific projects by passing project_keys parameter
-                data = self.adapter.get_all_projects_with_metrics(organization=organization, project_keys=project_keys)
+                data = await self.adapter.run_blocking(
+                    self.adapter.get_all_projects_with_metrics, organization=organization, project_keys=project_keys
+                )
             elif use_project_list:
                 # Use predefined project list
-                data = self.adapter.get_all_projects_with_metrics(organization=organization)
+                data = await self.adapter.run_blocking(
+                    self.adapter.get_all_projects_with_metrics, organization=organization
+                )
             else:
                 # Fallback to general dashboard
-                data = self.adapter.get_quality_dashboard()
+                data = await self.adapter.run_blocking(self.adapter.get_quality_dashboard)
 
             formatted_result = {
                 "quality_overview": data,
@@ -323,7 +327,7 @@ class SonarQubeTools:
 
             for project_key in project_keys:
                 self.logger.info(f"Getting metrics for project: {project_key}")
-                project_data = self.adapter.get_project_details(project_key)
+                project_data = await self.adapter.run_blocking(self.adapter.get_project_details, project_key)
                 comparison_data[project_key] = project_data
 
             # Create comparative summary
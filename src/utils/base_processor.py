@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from utils.data.workbook_cache import WorkbookCache
 from utils.file_manager import FileManager
 from utils.logging.logging_manager import LogManager
 
@@ -13,6 +14,9 @@ warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 class BaseProcessor(ABC):
     """Base class for processing data from files and directories."""
 
+    # Header row used when preloading the workbooks of a folder (None: every row is data)
+    workbook_header: int | None = None
+
     def __init__(self, allowed_extensions: list[str] | None = None):
         """Initializes the BaseProcessor with optional file extensions and a logger.
 
@@ -41,12 +45,18 @@ class BaseProcessor(ABC):
         # Validate the folder
         FileManager.validate_folder(folder_path)
 
-        data = {}
+        file_paths = []
         for file_path in folder_path.glob("*.*"):
             if not self._is_allowed_extension(file_path):
                 self.logger.warning(f"Skipping file with unsupported extension: {file_path}")
                 continue
+            file_paths.append(file_path)
 
+        # Parse every workbook of the folder in parallel up front; files are then processed from the cache
+        WorkbookCache.get_instance().preload(file_paths, header=self.workbook_header)
+
+        data = {}
+        for file_path in file_paths:
             try:
                 self.logger.info(f"Processing file: {file_path} with {self.__class__.__name__}")
                 file_data = self.process_file(file_path, **kwargs)
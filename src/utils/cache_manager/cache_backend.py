@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 
@@ -8,13 +9,29 @@ class CacheBackend(ABC):
         pass
 
     @abstractmethod
-    def save(self, key: str, data: Any):
+    def load_entry(self, key: str) -> tuple[Any, datetime] | None:
+        pass
+
+    @abstractmethod
+    def save(self, key: str, data: Any, tags: list[str] | None = None):
         pass
 
     @abstractmethod
     def invalidate(self, key: str):
         pass
 
+    @abstractmethod
+    def invalidate_by_tags(self, tags: list[str]) -> int:
+        pass
+
+    @abstractmethod
+    def invalidate_by_prefix(self, prefix: str) -> int:
+        pass
+
+    @abstractmethod
+    def get_tags(self, key: str) -> list[str]:
+        pass
+
     @abstractmethod
     def clear_all(self):
         pass
@@ -1,5 +1,6 @@
 import hashlib
 import os
+from datetime import datetime
 from typing import Any
 
 from log_config import log_manager
@@ -106,16 +107,36 @@ class CacheManager:
             self._logger.error(f"Failed to load cache for key '{key}': {e}")
             raise CacheManagerError(f"Error loading cache for key '{key}'", error=str(e))
 
-    def save(self, key: str, data: Any):
+    def load_entry(self, key: str) -> tuple[Any, datetime] | None:
+        """Load data from the cache together with the time it was cached, ignoring expiration.
+
+        Unlike load, an expired entry is neither discarded nor invalidated, so callers can
+        decide themselves whether it is still usable (e.g. serve it while refreshing).
+
+        Args:
+            key (str): The cache key to retrieve data for.
+
+        Returns:
+            Optional[tuple[Any, datetime]]: The cached data and its cache time, or None if missing.
+        """
+        try:
+            self._logger.debug(f"Loading cache entry for key: {key}")
+            return self._backend.load_entry(key)
+        except Exception as e:
+            self._logger.error(f"Failed to load cache entry for key '{key}': {e}")
+            raise CacheManagerError(f"Error loading cache entry for key '{key}'", error=str(e))
+
+    def save(self, key: str, data: Any, tags: list[str] | None = None):
         """Save data to the cache using the provided key.
 
         Args:
             key (str): The cache key to store data for.
             data (Any): The data to be cached.
+            tags (Optional[list[str]]): Tags for later invalidation (e.g. "adapter:JIRA", "project:CWS").
         """
         try:
             self._logger.debug(f"Saving data to cache for key: {key}")
-            self._backend.save(key, data)
+            self._backend.save(key, data, tags=tags)
         except Exception as e:
             self._logger.error(f"Failed to save cache for key '{key}': {e}")
             raise CacheManagerError(f"Error saving cache for key '{key}'", error=str(e))
@@ -133,6 +154,49 @@ class CacheManager:
             self._logger.error(f"Failed to invalidate cache for key '{key}': {e}")
             raise CacheManagerError(f"Error invalidating cache for key '{key}'", error=str(e))
 
+    def invalidate_by_tags(self, tags: list[str]) -> int:
+        """Invalidate every cache entry carrying all of the given tags.
+
+        Args:
+            tags (list[str]): Tags the entries must all have.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        try:
+            self._logger.debug(f"Invalidating cache entries tagged: {tags}")
+            return self._backend.invalidate_by_tags(tags)
+        except Exception as e:
+            self._logger.error(f"Failed to invalidate cache for tags {tags}: {e}")
+            raise CacheManagerError(f"Error invalidating cache for tags {tags}", error=str(e))
+
+    def invalidate_by_prefix(self, prefix: str) -> int:
+        """Invalidate every cache entry whose key starts with a prefix.
+
+        Args:
+            prefix (str): Key prefix.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        try:
+            self._logger.debug(f"Invalidating cache entries with prefix: {prefix}")
+            return self._backend.invalidate_by_prefix(prefix)
+        except Exception as e:
+            self._logger.error(f"Failed to invalidate cache for prefix '{prefix}': {e}")
+            raise CacheManagerError(f"Error invalidating cache for prefix '{prefix}'", error=str(e))
+
+    def get_tags(self, key: str) -> list[str]:
+        """Get the tags of a cache entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            list[str]: Tags attached when the entry was saved.
+        """
+        return self._backend.get_tags(key)
+
     def clear_all(self):
         """Clears all cache entries for the backend."""
         try:
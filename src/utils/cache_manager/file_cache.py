@@ -5,6 +5,7 @@ from typing import Any
 from log_config import log_manager
 from utils.cache_manager.cache_backend import CacheBackend
 from utils.cache_manager.error import FileCacheError
+from utils.cache_manager.tag_index import CacheTagIndex
 from utils.data.json_manager import JSONManager
 from utils.file_manager import FileManager
 
@@ -12,6 +13,8 @@ from utils.file_manager import FileManager
 class FileCacheBackend(CacheBackend):
     """File-based caching backend for managing cached data as JSON files.
 
+    Entry tags are kept in a SQLite index next to the files (see CacheTagIndex).
+
     Args:
         cache_dir (str): Directory where cached files are stored.
     """
@@ -22,6 +25,7 @@ class FileCacheBackend(CacheBackend):
         try:
             self.cache_dir = cache_dir
             FileManager.create_folder(cache_dir)
+            self._tag_index = CacheTagIndex(os.path.join(cache_dir, "_tag_index.sqlite3"))
         except Exception as e:
             raise FileCacheError(
                 f"Failed to initialize cache directory: {cache_dir}",
@@ -56,11 +60,33 @@ class FileCacheBackend(CacheBackend):
                 error=str(e),
             )
 
-    def save(self, key: str, data: Any):
+    def load_entry(self, key: str) -> tuple[Any, datetime] | None:
+        file_path = self._get_file_path(key)
+        try:
+            if not FileManager.file_exists(file_path):
+                return None
+
+            cache_data = JSONManager.read_json(file_path, default={})
+            if "_cached_at" not in cache_data:
+                return None
+
+            return cache_data.get("data"), datetime.fromisoformat(cache_data["_cached_at"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            raise FileCacheError(
+                f"Failed to load cache entry for key '{key}'",
+                key=key,
+                error=str(e),
+            )
+
+    def save(self, key: str, data: Any, tags: list[str] | None = None):
         file_path = self._get_file_path(key)
         try:
             cache_data = {"data": data, "_cached_at": datetime.now().isoformat()}
             JSONManager.write_json(cache_data, file_path)
+            if tags:
+                self._tag_index.set_tags(key, tags)
         except Exception as e:
             raise FileCacheError(
                 f"Failed to save cache for key '{key}'",
@@ -73,6 +99,7 @@ class FileCacheBackend(CacheBackend):
         file_path = self._get_file_path(key)
         try:
             FileManager.delete_file(file_path)
+            self._tag_index.remove([key])
         except FileNotFoundError:
             self._logger.warning(f"Cache key '{key}' not found for invalidation.")
         except Exception as e:
@@ -82,6 +109,63 @@ class FileCacheBackend(CacheBackend):
                 error=str(e),
             )
 
+    def invalidate_by_tags(self, tags: list[str]) -> int:
+        """Removes every entry carrying all of the given tags.
+
+        Returns:
+            int: Number of cache files removed.
+        """
+        try:
+            keys = self._tag_index.keys_with_tags(tags)
+            return self._remove_entries(keys)
+        except Exception as e:
+            raise FileCacheError(
+                "Failed to invalidate cache by tags",
+                tags=tags,
+                error=str(e),
+            )
+
+    def invalidate_by_prefix(self, prefix: str) -> int:
+        """Removes every entry whose key starts with the prefix.
+
+        Only file names are matched, cache files are not opened.
+
+        Returns:
+            int: Number of cache files removed.
+        """
+        try:
+            if not prefix or not os.path.exists(self.cache_dir):
+                return 0
+
+            with os.scandir(self.cache_dir) as entries:
+                keys = [
+                    entry.name[: -len(".json")]
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(".json")
+                ]
+            return self._remove_entries(keys)
+        except Exception as e:
+            raise FileCacheError(
+                f"Failed to invalidate cache for prefix '{prefix}'",
+                prefix=prefix,
+                error=str(e),
+            )
+
+    def get_tags(self, key: str) -> list[str]:
+        return self._tag_index.get_tags(key)
+
+    def _remove_entries(self, keys: list[str]) -> int:
+        removed = 0
+        for key in keys:
+            try:
+                os.remove(self._get_file_path(key))
+                removed += 1
+            except FileNotFoundError:
+                pass
+        self._tag_index.remove(keys)
+        self._logger.info(f"Invalidated {removed} cache entries")
+        return removed
+
     def clear_all(self):
         """Clears all cache files from the cache directory."""
         try:
@@ -99,6 +183,7 @@ class FileCacheBackend(CacheBackend):
                     except Exception as e:
                         self._logger.warning(f"Failed to delete cache file '{filename}': {e}")
 
+            self._tag_index.clear()
             self._logger.info("All cache files have been cleared.")
         except Exception as e:
             raise FileCacheError(
@@ -0,0 +1,101 @@
+import os
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+
+from log_config import log_manager
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_tags (
+    key TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (key, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_tags_tag ON cache_tags (tag);
+"""
+
+
+class CacheTagIndex:
+    """SQLite index of the tags attached to cache entries.
+
+    Tags are written alongside each entry (e.g. "adapter:JIRA", "project:CWS"), so the
+    entries to invalidate are found with one indexed query instead of opening every
+    cache file. The index is shared by all processes using the same cache directory.
+    Storage errors are logged and never fail a cache operation.
+
+    Args:
+        db_path (str): SQLite file holding the index.
+    """
+
+    _logger = log_manager.get_logger("CacheTagIndex")
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def set_tags(self, key: str, tags: Iterable[str]):
+        """Replaces the tags of a cache entry."""
+        unique_tags = sorted(set(tags))
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+                conn.executemany("INSERT INTO cache_tags (key, tag) VALUES (?, ?)", [(key, t) for t in unique_tags])
+                conn.execute("COMMIT")
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Could not index tags for cache key '{key}': {e}")
+
+    def keys_with_tags(self, tags: Iterable[str]) -> list[str]:
+        """Returns the keys carrying every one of the given tags."""
+        unique_tags = sorted(set(tags))
+        if not unique_tags:
+            return []
+
+        placeholders = ", ".join("?" for _ in unique_tags)
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT key FROM cache_tags WHERE tag IN ({placeholders}) "
+                    "GROUP BY key HAVING COUNT(DISTINCT tag) = ?",
+                    (*unique_tags, len(unique_tags)),
+                ).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Could not query cache tag index: {e}")
+            return []
+        return [row[0] for row in rows]
+
+    def get_tags(self, key: str) -> list[str]:
+        """Returns the tags of a cache entry."""
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT tag FROM cache_tags WHERE key = ? ORDER BY tag", (key,)).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Could not read tags for cache key '{key}': {e}")
+            return []
+        return [row[0] for row in rows]
+
+    def remove(self, keys: Iterable[str]):
+        """Drops the index rows of the given keys."""
+        try:
+            with closing(self._connect()) as conn:
+                conn.executemany("DELETE FROM cache_tags WHERE key = ?", [(key,) for key in keys])
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Could not remove keys from cache tag index: {e}")
+
+    def clear(self):
+        """Drops every index row."""
+        if not os.path.exists(self.db_path):
+            return
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("DELETE FROM cache_tags")
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Could not clear cache tag index: {e}")
@@ -4,6 +4,8 @@ import warnings
 
 import pandas as pd
 
+from utils.data.workbook_cache import WorkbookCache
+
 # Suppress openpyxl Data Validation warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 
@@ -56,9 +58,7 @@ class ExcelManager:
         Raises:
             FileNotFoundError: If the file does not exist.
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Excel file not found: {file_path}")
-        return pd.ExcelFile(file_path).sheet_names
+        return WorkbookCache.get_instance().sheet_names(file_path)
 
     @staticmethod
     def load_multiple_excel_files(
@@ -159,6 +159,9 @@ class ExcelManager:
     def read_excel_as_list(file_path: str, sheet_name: str) -> list[list[str | None]]:
         """Reads an Excel sheet and returns its data as a list of lists.
 
+        The workbook is parsed once and shared through the WorkbookCache, so reading
+        several sheets of the same file does not reopen it.
+
         Args:
             file_path (str): Path to the Excel file.
             sheet_name (str): Name of the sheet to read.
@@ -166,6 +169,6 @@ class ExcelManager:
         Returns:
             List[List[Union[str, None]]]: Sheet data as rows of values.
         """
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, engine="calamine")
+        df = WorkbookCache.get_instance().get_sheet(file_path, sheet_name)
         df_filled = df.fillna("")
         return df_filled.values.tolist()
@@ -0,0 +1,153 @@
+"""Process-wide cache of parsed Excel workbooks.
+
+Each workbook is opened once and every sheet is parsed in a single calamine pass, so
+processors reading several sheets (or the same file again for another period) share
+the parsed frames instead of reopening and re-parsing the file per sheet.
+"""
+
+import multiprocessing as mp
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from utils.logging.logging_manager import LogManager
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+# Parsing is CPU bound and holds the GIL, so folders are loaded by worker processes
+DEFAULT_MAX_WORKERS = 8
+
+
+def _read_workbook(file_path: str, header: int | None) -> dict[str, pd.DataFrame]:
+    """Parses every sheet of a workbook in one pass."""
+    return pd.read_excel(file_path, sheet_name=None, header=header, engine="calamine")
+
+
+class WorkbookCache:
+    """Parsed workbooks keyed by path, modification time, size and header row.
+
+    Entries are invalidated when the file changes on disk. Frames are shared between
+    callers, so they must be copied before being modified in place.
+    """
+
+    _instance = None
+
+    def __init__(self, max_workers: int | None = None):
+        """Initialize workbook cache
+
+        Args:
+            max_workers: Worker processes used by preload (default: CPU count, up to 8)
+        """
+        self.logger = LogManager.get_instance().get_logger("WorkbookCache")
+        self.max_workers = max(1, max_workers or min(mp.cpu_count(), DEFAULT_MAX_WORKERS))
+        self._lock = threading.Lock()
+        self._workbooks: dict[tuple[str, int | None], tuple[tuple[int, int], dict[str, pd.DataFrame]]] = {}
+        self.files_loaded = 0
+
+    @classmethod
+    def get_instance(cls, *args, **kwargs) -> "WorkbookCache":
+        """Get the process-wide workbook cache"""
+        if cls._instance is None:
+            cls._instance = cls(*args, **kwargs)
+        return cls._instance
+
+    @staticmethod
+    def _key(file_path: str | Path, header: int | None) -> tuple[tuple[str, int | None], tuple[int, int]]:
+        path = os.path.abspath(file_path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        stat = os.stat(path)
+        return (path, header), (stat.st_mtime_ns, stat.st_size)
+
+    def _lookup(self, key: tuple[str, int | None], version: tuple[int, int]) -> dict[str, pd.DataFrame] | None:
+        with self._lock:
+            entry = self._workbooks.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        return None
+
+    def _store(self, key: tuple[str, int | None], version: tuple[int, int], sheets: dict[str, pd.DataFrame]) -> None:
+        with self._lock:
+            self._workbooks[key] = (version, sheets)
+            self.files_loaded += 1
+
+    def get_sheets(self, file_path: str | Path, header: int | None = None) -> dict[str, pd.DataFrame]:
+        """Returns every sheet of a workbook, parsing the file on first use.
+
+        Args:
+            file_path (Union[str, Path]): Path to the Excel file.
+            header (Optional[int]): Header row passed to pandas (None keeps every row as data).
+
+        Returns:
+            Dict[str, pd.DataFrame]: Frames by sheet name, in workbook order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key, version = self._key(file_path, header)
+        sheets = self._lookup(key, version)
+        if sheets is None:
+            self.logger.debug(f"Parsing workbook: {file_path}")
+            sheets = _read_workbook(key[0], header)
+            self._store(key, version, sheets)
+        return sheets
+
+    def get_sheet(self, file_path: str | Path, sheet_name: str, header: int | None = None) -> pd.DataFrame:
+        """Returns one sheet of a workbook.
+
+        Raises:
+            ValueError: If the sheet does not exist.
+        """
+        sheets = self.get_sheets(file_path, header=header)
+        if sheet_name not in sheets:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found in {file_path}")
+        return sheets[sheet_name]
+
+    def sheet_names(self, file_path: str | Path) -> list[str]:
+        """Lists the sheet names of a workbook, reusing any parsed copy of the file."""
+        key, version = self._key(file_path, None)
+        for header in (None, 0):
+            sheets = self._lookup((key[0], header), version)
+            if sheets is not None:
+                return list(sheets)
+        return list(self.get_sheets(file_path))
+
+    def preload(self, file_paths: Iterable[str | Path], header: int | None = None) -> None:
+        """Parses workbooks in parallel worker processes and caches them.
+
+        Files already cached, missing or not Excel are skipped; files that fail to parse
+        are left for the caller to load (and report) on first use.
+
+        Args:
+            file_paths (Iterable[Union[str, Path]]): Workbooks to load.
+            header (Optional[int]): Header row passed to pandas.
+        """
+        pending = {}
+        for file_path in file_paths:
+            if Path(file_path).suffix.lower() not in EXCEL_EXTENSIONS or not os.path.exists(file_path):
+                continue
+            key, version = self._key(file_path, header)
+            if self._lookup(key, version) is None:
+                pending[key] = version
+
+        workers = min(self.max_workers, len(pending))
+        if workers < 2:
+            return
+
+        self.logger.info(f"Loading {len(pending)} workbooks with {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {key: executor.submit(_read_workbook, key[0], header) for key in pending}
+            for key, future in futures.items():
+                try:
+                    self._store(key, pending[key], future.result())
+                except Exception as e:
+                    self.logger.warning(f"Could not preload workbook {key[0]}: {e}")
+
+    def clear(self) -> None:
+        """Drops every cached workbook."""
+        with self._lock:
+            self._workbooks.clear()
@@ -77,6 +77,10 @@ def is_available(name: str) -> bool:
 # These are computed once at module load time
 SKLEARN_AVAILABLE = is_available("sklearn")
 SCIPY_AVAILABLE = is_available("scipy")
+RAPIDFUZZ_AVAILABLE = is_available("rapidfuzz")
+FAISS_AVAILABLE = is_available("faiss")
+LXML_AVAILABLE = is_available("lxml")
+HTTPX_AVAILABLE = is_available("httpx")
 SENTENCE_TRANSFORMERS_AVAILABLE = is_available("sentence_transformers")
 TORCH_AVAILABLE = is_available("torch")
 TRANSFORMERS_AVAILABLE = is_available("transformers")
@@ -0,0 +1,245 @@
+import asyncio
+import random
+from collections.abc import Iterable
+from typing import Any
+
+from utils.dependencies import require_optional
+from utils.http.rate_limited_client import BROWSER_HEADERS, JITTER_RANGE
+from utils.http.rate_limiter import THROTTLE_STATUSES, HostRateLimiter
+from utils.logging.logging_manager import LogManager
+
+# Default number of requests allowed in flight at once, independent of the rate limit
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncRateLimitedHTTPClient:
+    """Asyncio sibling of RateLimitedHTTPClient built on httpx
+
+    Requests wait for their host's token bucket with asyncio.sleep, so a single thread
+    can keep many requests in flight and reach the allowed rate. The concurrency cap
+    bounds open connections and outstanding reservations; the rate limit is enforced
+    separately by the per-host limiter.
+    """
+
+    def __init__(
+        self,
+        rate_limit_seconds: float = 3.0,
+        max_retries: int = 3,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: HostRateLimiter | None = None,
+        backoff_factor: float = 1.0,
+        jitter: bool = True,
+    ):
+        """Initialize async HTTP client
+
+        Args:
+            rate_limit_seconds: Nominal seconds between requests to the same host
+                (ignored when rate_limiter is given)
+            max_retries: Maximum number of retries for failed or throttled requests
+            max_concurrency: Maximum requests in flight across all hosts
+            rate_limiter: Optional shared per-host limiter (default: one built from rate_limit_seconds)
+            backoff_factor: Base of the exponential back-off between retries after connection errors
+            jitter: Add random jitter to every rate limit wait, like the sync client
+        """
+        self.httpx = require_optional("httpx", "scraping")
+
+        self.rate_limit = rate_limit_seconds
+        self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or HostRateLimiter(1.0 / rate_limit_seconds)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.logger = LogManager.get_instance().get_logger("AsyncRateLimitedHTTPClient")
+
+        # Created lazily so they bind to the running event loop
+        self._client = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+        # Statistics
+        self.requests_made = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.rate_limit_delays = 0
+
+    def _get_client(self):
+        """Get the shared httpx client, creating its connection pool on first use"""
+        if self._client is None:
+            headers = dict(BROWSER_HEADERS)
+            # httpx only decodes brotli when the optional brotli package is installed
+            headers["Accept-Encoding"] = "gzip, deflate"
+
+            self._client = self.httpx.AsyncClient(
+                headers=headers,
+                follow_redirects=True,
+                limits=self.httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def _apply_rate_limit(self, url: str) -> None:
+        """Wait for the host's rate limit, with jitter"""
+        waited = await self.rate_limiter.acquire_async(url)
+        if waited > 0:
+            self.rate_limit_delays += 1
+            if self.jitter:
+                await asyncio.sleep(random.uniform(*JITTER_RANGE))
+
+    async def get(self, url: str, timeout: int = 30, **kwargs) -> Any:
+        """Make GET request with rate limiting
+
+        Args:
+            url: URL to request
+            timeout: Request timeout in seconds
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: If request fails after all retries
+        """
+        return await self.request("GET", url, timeout=timeout, **kwargs)
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: int = 30,
+        **kwargs,
+    ) -> Any:
+        """Make POST request with rate limiting
+
+        Args:
+            url: URL to request
+            data: Form data to send
+            json: JSON data to send
+            timeout: Request timeout in seconds
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: If request fails after all retries
+        """
+        return await self.request("POST", url, data=data, json=json, timeout=timeout, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """Make a rate limited request, retrying connection errors and throttled responses"""
+        client = self._get_client()
+
+        try:
+            self.logger.debug(f"Making {method} request to: {url}")
+            self.requests_made += 1
+
+            async with self._semaphore:
+                response = await self._send(client, method, url, **kwargs)
+
+            self._handle_response_status(response)
+
+            self.successful_requests += 1
+            self.logger.debug(f"Successful {method} request: {url} (status: {response.status_code})")
+
+            return response
+
+        except self.httpx.HTTPError as e:
+            self.failed_requests += 1
+            self.logger.error(f"Failed {method} request to {url}: {e}")
+            raise
+
+    async def _send(self, client, method: str, url: str, **kwargs) -> Any:
+        """Send a request, retrying through the limiter on 429/5xx and with back-off on connection errors"""
+        for attempt in range(self.max_retries + 1):
+            await self._apply_rate_limit(url)
+
+            try:
+                response = await client.request(method, url, **kwargs)
+            except self.httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_factor * 2**attempt
+                self.logger.debug(f"{type(e).__name__} for {url}, retry {attempt + 1}/{self.max_retries} in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self.rate_limiter.record_response(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code not in THROTTLE_STATUSES:
+                break
+
+            if attempt < self.max_retries:
+                self.logger.debug(
+                    f"Throttled ({response.status_code}) by {url}, retry {attempt + 1}/{self.max_retries}"
+                )
+
+        return response
+
+    def _handle_response_status(self, response) -> None:
+        """Handle HTTP response status codes"""
+        if response.status_code == 429:
+            self.logger.warning(f"Rate limited (429) for URL: {response.url}")
+        elif response.status_code == 403:
+            self.logger.warning(f"Access forbidden (403) for URL: {response.url}")
+        elif response.status_code == 404:
+            self.logger.warning(f"Page not found (404) for URL: {response.url}")
+        elif response.status_code >= 500:
+            self.logger.warning(f"Server error ({response.status_code}) for URL: {response.url}")
+        elif response.status_code >= 400:
+            self.logger.warning(f"Client error ({response.status_code}) for URL: {response.url}")
+
+        response.raise_for_status()
+
+    async def get_many(self, urls: Iterable[str], timeout: int = 30, **kwargs) -> list[Any]:
+        """GET many URLs concurrently within the rate and concurrency limits
+
+        Args:
+            urls: URLs to request
+            timeout: Request timeout in seconds
+            **kwargs: Additional arguments for each request
+
+        Returns:
+            One httpx.Response or raised exception per URL, in input order
+        """
+        return await asyncio.gather(
+            *(self.get(url, timeout=timeout, **kwargs) for url in urls),
+            return_exceptions=True,
+        )
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get client statistics"""
+        return {
+            "requests_made": self.requests_made,
+            "successful_requests": self.successful_requests,
+            "failed_requests": self.failed_requests,
+            "success_rate": (self.successful_requests / max(self.requests_made, 1)) * 100,
+            "rate_limit_delays": self.rate_limit_delays,
+            "max_concurrency": self.max_concurrency,
+            "host_rates": self.rate_limiter.get_statistics(),
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset statistics counters"""
+        self.requests_made = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.rate_limit_delays = 0
+
+    async def aclose(self) -> None:
+        """Close the connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+            self.logger.info("Async HTTP client closed")
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
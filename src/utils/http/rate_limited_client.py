@@ -6,23 +6,55 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from utils.http.rate_limiter import THROTTLE_STATUSES, HostRateLimiter
+from utils.http.shared_budget import SharedRateBudget, budget_key
 from utils.logging.logging_manager import LogManager
 
+# Browser-like default headers shared by the sync and async clients
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# Random jitter (seconds) added to every rate limit sleep to avoid synchronized requests
+JITTER_RANGE = (0.1, 0.5)
+
 
 class RateLimitedHTTPClient:
     """HTTP client with rate limiting, retry logic, and session management
     Generic implementation for ethical web scraping with rate limiting
     """
 
-    def __init__(self, rate_limit_seconds: float = 3.0, max_retries: int = 3):
+    def __init__(
+        self,
+        rate_limit_seconds: float = 3.0,
+        max_retries: int = 3,
+        rate_limiter: HostRateLimiter | None = None,
+        shared_budget: SharedRateBudget | None = None,
+    ):
         """Initialize HTTP client
 
         Args:
             rate_limit_seconds: Minimum seconds between requests
             max_retries: Maximum number of retries for failed requests
+            rate_limiter: Optional per-host adaptive limiter replacing the fixed global delay;
+                throttled (429/5xx) responses are then retried through it
+            shared_budget: Optional cross-process budget; requests to a host are then also
+                spaced by rate_limit_seconds across every process sharing it
         """
         self.rate_limit = rate_limit_seconds
         self.max_retries = max_retries
+        self.rate_limiter = rate_limiter
+        self.shared_budget = shared_budget
         self.last_request_time = 0.0
         self.logger = LogManager.get_instance().get_logger("RateLimitedHTTPClient")
 
@@ -39,10 +71,11 @@ class RateLimitedHTTPClient:
         """Create requests session with retry strategy and proper headers"""
         session = requests.Session()
 
-        # Configure retry strategy
+        # Configure retry strategy (throttled statuses are retried through the limiter when present,
+        # so it can see them and back off)
         retry_strategy = Retry(
             total=self.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[] if self.rate_limiter else sorted(THROTTLE_STATUSES),
             backoff_factor=1,
             allowed_methods=["GET", "POST"],
         )
@@ -58,29 +91,22 @@ class RateLimitedHTTPClient:
 
     def _get_browser_headers(self) -> dict[str, str]:
         """Get browser-like headers to avoid detection"""
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
+        return dict(BROWSER_HEADERS)
 
-    def _apply_rate_limit(self) -> None:
+    def _apply_rate_limit(self, url: str) -> None:
         """Apply rate limiting with jitter"""
+        if self.rate_limiter:
+            if self.rate_limiter.acquire(url) > 0:
+                self.rate_limit_delays += 1
+            return
+
         current_time = time.time()
         time_since_last_request = current_time - self.last_request_time
 
         if time_since_last_request < self.rate_limit:
             # Add small random jitter to avoid synchronized requests
             sleep_time = self.rate_limit - time_since_last_request
-            jitter = random.uniform(0.1, 0.5)
+            jitter = random.uniform(*JITTER_RANGE)
             total_sleep = sleep_time + jitter
 
             self.logger.debug(f"Rate limiting: sleeping for {total_sleep:.2f} seconds")
@@ -103,13 +129,11 @@ class RateLimitedHTTPClient:
         Raises:
             requests.RequestException: If request fails after all retries
         """
-        self._apply_rate_limit()
-
         try:
             self.logger.debug(f"Making GET request to: {url}")
             self.requests_made += 1
 
-            response = self.session.get(url, timeout=timeout, **kwargs)
+            response = self._send("GET", url, timeout=timeout, **kwargs)
 
             # Handle response status
             self._handle_response_status(response)
@@ -147,13 +171,11 @@ class RateLimitedHTTPClient:
         Raises:
             requests.RequestException: If request fails after all retries
         """
-        self._apply_rate_limit()
-
         try:
             self.logger.debug(f"Making POST request to: {url}")
             self.requests_made += 1
 
-            response = self.session.post(url, data=data, json=json, timeout=timeout, **kwargs)
+            response = self._send("POST", url, data=data, json=json, timeout=timeout, **kwargs)
 
             # Handle response status
             self._handle_response_status(response)
@@ -168,6 +190,34 @@ class RateLimitedHTTPClient:
             self.logger.error(f"Failed POST request to {url}: {e}")
             raise
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a rate limited request, retrying throttled responses through the per-host limiter"""
+        attempts = self.max_retries + 1 if self.rate_limiter else 1
+
+        for attempt in range(attempts):
+            self._apply_rate_limit(url)
+            if self.shared_budget:
+                self.shared_budget.acquire(budget_key(url), min_interval=self.rate_limit)
+
+            response = self.session.request(method, url, **kwargs)
+
+            if self.shared_budget:
+                self.shared_budget.record(budget_key(url), response.status_code, response.headers)
+
+            if self.rate_limiter is None:
+                break
+
+            self.rate_limiter.record_response(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code not in THROTTLE_STATUSES:
+                break
+
+            if attempt < attempts - 1:
+                self.logger.debug(
+                    f"Throttled ({response.status_code}) by {url}, retry {attempt + 1}/{self.max_retries}"
+                )
+
+        return response
+
     def _handle_response_status(self, response: requests.Response) -> None:
         """Handle HTTP response status codes"""
         if response.status_code == 429:
@@ -204,6 +254,7 @@ class RateLimitedHTTPClient:
             "success_rate": (self.successful_requests / max(self.requests_made, 1)) * 100,
             "rate_limit_delays": self.rate_limit_delays,
             "current_rate_limit": self.rate_limit,
+            "host_rates": self.rate_limiter.get_statistics() if self.rate_limiter else {},
         }
 
     def reset_statistics(self) -> None:
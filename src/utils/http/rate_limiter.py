@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from utils.logging.logging_manager import LogManager
+
+# Multiplicative decrease applied to a host's rate on 429/5xx responses
+BACKOFF_FACTOR = 0.5
+
+# Additive increase (fraction of the configured rate) applied on every successful response
+RECOVERY_STEP = 0.1
+
+# Statuses that signal the host is overloaded or throttling us
+THROTTLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds from now"""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to server feedback
+
+    Callers reserve a token and sleep outside the lock until it is available, so
+    concurrent workers queue up at the bucket's rate instead of serializing on it.
+    The token count is tracked as of updated_at, which a Retry-After pause moves into
+    the future: callers queued behind the pause then get one slot each after it.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float = 1.0,
+        min_rate_per_second: float | None = None,
+        max_rate_per_second: float | None = None,
+    ):
+        """Initialize token bucket
+
+        Args:
+            rate_per_second: Initial and nominal refill rate
+            capacity: Maximum burst of requests allowed after an idle period
+            min_rate_per_second: Floor for the rate after repeated backoffs (default: rate / 16)
+            max_rate_per_second: Ceiling for the rate while recovering (default: rate)
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"Rate must be positive: {rate_per_second}")
+
+        self.nominal_rate = rate_per_second
+        self.rate = rate_per_second
+        self.capacity = max(1.0, capacity)
+        self.min_rate = min_rate_per_second or rate_per_second / 16
+        self.max_rate = max_rate_per_second or rate_per_second
+
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # Nothing refills before the end of a Retry-After pause
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+
+            wait = max(0.0, self.updated_at - now)
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a token is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait without blocking the event loop until a token is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Recover the rate additively towards its ceiling"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.nominal_rate * RECOVERY_STEP)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Back off multiplicatively and pause the bucket for Retry-After seconds if given
+
+        After the pause the bucket resumes with at most one token, so queued callers are
+        released one slot apart at the lowered rate instead of all at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+            if retry_after and now + retry_after > self.updated_at:
+                self.updated_at = now + retry_after
+                self.tokens = min(self.tokens, 1.0)
+
+
+class HostRateLimiter:
+    """Per-host token buckets sharing one configuration
+
+    Each host gets its own budget, so a throttling server only slows down requests to
+    itself. Buckets adapt to responses reported through record_response().
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        min_rate_per_second: float | None = None,
+        max_rate_per_second: float | None = None,
+    ):
+        """Initialize per-host rate limiter
+
+        Args:
+            rate_per_second: Nominal requests per second for each host
+            burst: Requests allowed back to back after an idle period
+            min_rate_per_second: Floor for a host's rate after repeated backoffs
+            max_rate_per_second: Ceiling for a host's rate while recovering
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.min_rate_per_second = min_rate_per_second
+        self.max_rate_per_second = max_rate_per_second
+        self.logger = LogManager.get_instance().get_logger("HostRateLimiter")
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Get the bucket key (network location) for a URL"""
+        return urlparse(url).netloc.lower()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Get or create the token bucket for a URL's host"""
+        host = self.host_of(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(
+                    self.rate_per_second,
+                    capacity=self.burst,
+                    min_rate_per_second=self.min_rate_per_second,
+                    max_rate_per_second=self.max_rate_per_second,
+                )
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to the URL's host is allowed
+
+        Returns:
+            Seconds spent waiting
+        """
+        return self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> float:
+        """Wait without blocking the event loop until a request to the URL's host is allowed
+
+        Returns:
+            Seconds spent waiting
+        """
+        return await self.bucket(url).acquire_async()
+
+    def record_response(self, url: str, status_code: int, retry_after: str | None = None) -> None:
+        """Adapt the host's rate to a response status"""
+        bucket = self.bucket(url)
+
+        if status_code in THROTTLE_STATUSES:
+            bucket.on_throttle(parse_retry_after(retry_after))
+            self.logger.warning(
+                f"Host {self.host_of(url)} answered {status_code}, rate lowered to {bucket.rate:.3f} req/s"
+            )
+        elif status_code < 400:
+            bucket.on_success()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get current rate per host"""
+        with self._lock:
+            return {host: {"rate_per_second": bucket.rate} for host, bucket in self._buckets.items()}
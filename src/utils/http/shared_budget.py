@@ -0,0 +1,275 @@
+import hashlib
+import os
+import sqlite3
+import time
+from collections.abc import Mapping
+from contextlib import closing
+from typing import Any
+from urllib.parse import urlparse
+
+from utils.http.rate_limiter import parse_retry_after
+from utils.logging.logging_manager import LogManager
+
+# Remaining calls kept in reserve; below this every process waits for the window reset
+DEFAULT_RESERVE = 1
+
+# Once less than this fraction of the quota is left, requests are spread evenly until the reset
+LOW_WATERMARK = 0.1
+
+# Pause applied to a key on 429 responses that carry no Retry-After header
+DEFAULT_THROTTLE_SECONDS = 5.0
+
+# Reset headers below this are relative seconds rather than epoch timestamps
+_EPOCH_THRESHOLD = 1_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_budget (
+    key TEXT PRIMARY KEY,
+    remaining INTEGER,
+    quota INTEGER,
+    reset_at REAL,
+    blocked_until REAL NOT NULL DEFAULT 0,
+    next_slot REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def budget_key(url: str, credential: str | None = None) -> str:
+    """Build the budget key for a host and (hashed) credential
+
+    Args:
+        url: Any URL on the rate limited host
+        credential: Token or API key the quota belongs to; only a hash prefix is stored
+    """
+    host = urlparse(url).netloc.lower() or url
+    if not credential:
+        return host
+    return f"{host}:{hashlib.sha256(credential.encode()).hexdigest()[:12]}"
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value not in (None, ""):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class SharedRateBudget:
+    """Rate limit budget shared by every process on the machine through a SQLite file
+
+    Each key (host plus hashed token) stores the remaining quota, its reset time, a
+    throttle pause and the next free request slot. Clients reserve a slot before each
+    request and record the response headers afterwards, so concurrent report runs and
+    MCP sessions pace themselves against the same quota instead of each assuming they
+    own all of it. Storage errors are logged and never block requests.
+    """
+
+    _instance = None
+
+    def __init__(self, db_path: str | None = None, reserve: int = DEFAULT_RESERVE):
+        """Initialize shared budget store
+
+        Args:
+            db_path: SQLite file (default: RATE_BUDGET_PATH or cache/rate_budget.sqlite3)
+            reserve: Remaining calls kept in reserve before waiting for the reset
+        """
+        self.logger = LogManager.get_instance().get_logger("SharedRateBudget")
+        self.db_path = db_path or os.getenv(
+            "RATE_BUDGET_PATH",
+            os.path.join(os.path.dirname(__file__), "../../../cache/rate_budget.sqlite3"),
+        )
+        self.reserve_calls = reserve
+        self._initialized = False
+
+    @classmethod
+    def get_instance(cls, *args, **kwargs) -> "SharedRateBudget":
+        """Get the process-wide budget store"""
+        if cls._instance is None:
+            cls._instance = cls(*args, **kwargs)
+        return cls._instance
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def reserve(self, key: str, min_interval: float = 0.0, cost: int = 1) -> float:
+        """Take the next request slot for a key
+
+        Args:
+            key: Budget key (see budget_key)
+            min_interval: Minimum seconds between requests for this key across all processes
+            cost: Quota units the request consumes (e.g. GitHub GraphQL query points)
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    wait = self._reserve_slot(conn, key, min_interval, max(1, cost))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                return wait
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Shared rate budget unavailable ({e}), continuing without it")
+            return 0.0
+
+    def _reserve_slot(self, conn: sqlite3.Connection, key: str, min_interval: float, cost: int) -> float:
+        now = time.time()
+        row = conn.execute(
+            "SELECT remaining, quota, reset_at, blocked_until, next_slot FROM rate_budget WHERE key = ?", (key,)
+        ).fetchone()
+        remaining, quota, reset_at, blocked_until, next_slot = row or (None, None, None, 0.0, 0.0)
+
+        start = max(now, next_slot, blocked_until)
+        interval = min_interval
+
+        if remaining is not None and reset_at is not None and reset_at > start:
+            if remaining - cost < self.reserve_calls:
+                self.logger.warning(f"Rate budget for {key} exhausted, waiting {reset_at - now:.0f}s for reset")
+                start = reset_at
+            elif quota and remaining < quota * LOW_WATERMARK:
+                interval = max(interval, (reset_at - start) * cost / remaining)
+
+        if reset_at is not None and start >= reset_at:
+            # The window has rolled over; the next response reports the fresh quota
+            remaining, reset_at = None, None
+
+        conn.execute(
+            """
+            INSERT INTO rate_budget (key, remaining, quota, reset_at, blocked_until, next_slot, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                remaining = excluded.remaining,
+                reset_at = excluded.reset_at,
+                next_slot = excluded.next_slot,
+                updated_at = excluded.updated_at
+            """,
+            (
+                key,
+                None if remaining is None else remaining - cost,
+                quota,
+                reset_at,
+                blocked_until,
+                start + interval,
+                now,
+            ),
+        )
+        return start - now
+
+    def acquire(self, key: str, min_interval: float = 0.0, cost: int = 1) -> float:
+        """Block until the key's budget allows a request
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(key, min_interval, cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, key: str, status_code: int, headers: Mapping[str, str] | None = None) -> None:
+        """Update a key's budget from a response
+
+        Reads X-RateLimit-Remaining/Limit/Reset (also the RateLimit-* draft names) and
+        Retry-After. Within the same window the lowest remaining value wins, since
+        responses from different processes arrive out of order.
+        """
+        headers = headers or {}
+        now = time.time()
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        quota = _header_float(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        reset = _header_float(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        reset_at = None if reset is None else (reset if reset > _EPOCH_THRESHOLD else now + reset)
+
+        pause = parse_retry_after(headers.get("Retry-After"))
+        if pause is None and status_code == 429:
+            pause = DEFAULT_THROTTLE_SECONDS
+        blocked_until = now + pause if pause else 0.0
+
+        if remaining is None and not blocked_until:
+            return
+
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO rate_budget (key, remaining, quota, reset_at, blocked_until, next_slot, updated_at)
+                    VALUES (?, ?, ?, ?, ?, 0, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        remaining = CASE
+                            WHEN excluded.remaining IS NULL THEN rate_budget.remaining
+                            WHEN rate_budget.remaining IS NULL OR rate_budget.reset_at IS NULL
+                                OR excluded.reset_at IS NULL OR excluded.reset_at > rate_budget.reset_at + 1
+                                THEN excluded.remaining
+                            ELSE MIN(rate_budget.remaining, excluded.remaining)
+                        END,
+                        quota = COALESCE(excluded.quota, rate_budget.quota),
+                        reset_at = COALESCE(excluded.reset_at, rate_budget.reset_at),
+                        blocked_until = MAX(rate_budget.blocked_until, excluded.blocked_until),
+                        updated_at = excluded.updated_at
+                    """,
+                    (
+                        key,
+                        None if remaining is None else int(remaining),
+                        None if quota is None else int(quota),
+                        reset_at,
+                        blocked_until,
+                        now,
+                    ),
+                )
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Could not record rate budget for {key}: {e}")
+            return
+
+        if pause:
+            self.logger.warning(f"{key} throttled ({status_code}), pausing all processes for {pause:.1f}s")
+
+    def block(self, key: str, seconds: float) -> bool:
+        """Pause every process using a key for the given number of seconds
+
+        Returns:
+            True if the pause was stored; callers should wait locally otherwise
+        """
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO rate_budget (key, blocked_until, next_slot, updated_at) VALUES (?, ?, 0, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        blocked_until = MAX(rate_budget.blocked_until, excluded.blocked_until),
+                        updated_at = excluded.updated_at
+                    """,
+                    (key, time.time() + seconds, time.time()),
+                )
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Could not block rate budget for {key}: {e}")
+            return False
+        return True
+
+    def get_budget(self, key: str) -> dict[str, Any] | None:
+        """Get the stored budget for a key"""
+        try:
+            with closing(self._connect()) as conn:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute("SELECT * FROM rate_budget WHERE key = ?", (key,)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Could not read rate budget for {key}: {e}")
+            return None
+        return dict(row) if row else None
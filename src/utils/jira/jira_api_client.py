@@ -1,9 +1,13 @@
 import requests
 from requests.auth import HTTPBasicAuth
 
+from utils.http.shared_budget import SharedRateBudget, budget_key
 from utils.jira.error import JiraApiRequestError
 from utils.logging.logging_manager import LogManager
 
+# Retries for 429 responses; the wait comes from Retry-After through the shared rate budget
+MAX_THROTTLE_RETRIES = 3
+
 
 class JiraApiClient:
     """A robust Jira API Client to handle basic API operations with enhanced error handling and logging"""
@@ -23,6 +27,9 @@ class JiraApiClient:
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+        self.budget = SharedRateBudget.get_instance()
+        # Same key shape as the other clients: host plus a hash of the credential
+        self.budget_key = budget_key(base_url, api_token)
 
     def _handle_response(self, response):
         """Handle the HTTP response from the Jira API.
@@ -59,6 +66,18 @@ class JiraApiClient:
         self.logger.warning(f"Unexpected content type: {response.headers.get('Content-Type')}")
         return {"raw_response": response.content.decode("utf-8", errors="replace")}
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request within the shared rate budget, retrying throttled (429) responses"""
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            self.budget.acquire(self.budget_key)
+            response = requests.request(method, url, headers=self.headers, auth=self.auth, **kwargs)
+            self.budget.record(self.budget_key, response.status_code, response.headers)
+
+            if response.status_code != 429 or attempt == MAX_THROTTLE_RETRIES:
+                return response
+            self.logger.warning(f"Jira throttled {method.upper()} {url}, retry {attempt + 1}/{MAX_THROTTLE_RETRIES}")
+        return response
+
     def _request(self, method: str, endpoint: str, **kwargs):
         """Make an HTTP request to the Jira API.
 
@@ -75,7 +94,7 @@ class JiraApiClient:
         url = f"{self.base_url}{endpoint}"
         try:
             self.logger.info(f"Sending {method.upper()} request to {url} with kwargs {kwargs}")
-            response = requests.request(method, url, headers=self.headers, auth=self.auth, **kwargs)
+            response = self._send(method, url, **kwargs)
             response.raise_for_status()
             return self._handle_response(response)
         except requests.RequestException as e:
@@ -1,4 +1,5 @@
 import hashlib
+import re
 from datetime import datetime
 
 from utils.cache_manager.cache_manager import CacheManager
@@ -16,6 +17,9 @@ from utils.jira.jira_api_client import JiraApiClient
 from utils.jira.jira_config import JiraConfig
 from utils.logging.logging_manager import LogManager
 
+# Project clause of a JQL query, e.g. "project = CWS" or "project in (CWS, 'ABC')"
+_JQL_PROJECT_PATTERN = re.compile(r"\bproject\s*(?:=|in)\s*\(?([^)]*?)\)?(?:\s+(?:AND|OR|ORDER)\b|$)", re.IGNORECASE)
+
 
 class JiraAssistant:
     """A generic assistant for interacting with Jira APIs.
@@ -76,15 +80,48 @@ class JiraAssistant:
             self._logger.warning(f"Cache miss or load failure for key '{cache_key}': {e}")
             return None
 
-    def _save_to_cache(self, cache_key: str, data: dict):
+    @staticmethod
+    def _cache_tags(
+        project_key: str | None = None,
+        jql: str | None = None,
+        team_name: str | None = None,
+        issue_key: str | None = None,
+    ) -> list[str]:
+        """Builds invalidation tags for a cache entry.
+
+        Args:
+            project_key (Optional[str]): Project the data belongs to.
+            jql (Optional[str]): JQL query; its project clause is used when present.
+            team_name (Optional[str]): Team (squad) the data belongs to.
+            issue_key (Optional[str]): Issue key; its project prefix is used.
+
+        Returns:
+            List[str]: Tags such as "namespace:jira" and "project:CWS".
+        """
+        tags = ["namespace:jira"]
+        projects = []
+        if project_key:
+            projects.append(project_key)
+        if issue_key and "-" in issue_key:
+            projects.append(issue_key.rsplit("-", 1)[0])
+        if jql:
+            for match in _JQL_PROJECT_PATTERN.findall(jql):
+                projects.extend(p.strip().strip("'\"") for p in match.split(",") if p.strip())
+        tags.extend(f"project:{project}" for project in projects)
+        if team_name:
+            tags.append(f"team:{team_name}")
+        return tags
+
+    def _save_to_cache(self, cache_key: str, data: dict, tags: list[str] | None = None):
         """Saves data to the cache.
 
         Args:
             cache_key (str): The cache key to store data for.
             data (Dict): The data to be cached.
+            tags (Optional[List[str]]): Invalidation tags (see _cache_tags).
         """
         try:
-            self.cache_manager.save(cache_key, data)
+            self.cache_manager.save(cache_key, data, tags=tags or self._cache_tags())
             self._logger.info(f"Data cached under key: {cache_key}")
         except Exception as e:
             self._logger.error(f"Failed to cache data for key '{cache_key}': {e}")
@@ -132,25 +169,27 @@ class JiraAssistant:
 
             # Ensure response is a list for cache and return
             if isinstance(response, list):
-                self._save_to_cache(cache_key, {"components": response})
+                self._save_to_cache(cache_key, {"components": response}, self._cache_tags(project_key=project_key))
                 return response
             elif isinstance(response, dict) and "components" in response:
                 components = response["components"]
                 if isinstance(components, list):
-                    self._save_to_cache(cache_key, {"components": components})
+                    self._save_to_cache(
+                        cache_key, {"components": components}, self._cache_tags(project_key=project_key)
+                    )
                     return components
                 else:
                     self._logger.warning(
                         f"Response 'components' for project '{project_key}' is not a list. Returning empty list."
                     )
-                    self._save_to_cache(cache_key, {"components": []})
+                    self._save_to_cache(cache_key, {"components": []}, self._cache_tags(project_key=project_key))
                     return []
             else:
                 self._logger.warning(
                     f"Response for project '{project_key}' is not a list or dict "
                     f"with 'components'. Returning empty list."
                 )
-                self._save_to_cache(cache_key, {"components": []})
+                self._save_to_cache(cache_key, {"components": []}, self._cache_tags(project_key=project_key))
                 return []
         except JiraComponentFetchError as e:
             self._logger.error(e)
@@ -458,7 +497,7 @@ class JiraAssistant:
                     issue_type_id=issue_type_id,
                 )
 
-            self._save_to_cache(cache_key, response)
+            self._save_to_cache(cache_key, response, self._cache_tags(project_key=project_key))
 
             return response
         except JiraMetadataFetchError as e:
@@ -513,7 +552,7 @@ class JiraAssistant:
             epics = self.fetch_issues(jql_query)
 
             if epics:
-                self._save_to_cache(cache_key, {"epics": epics})
+                self._save_to_cache(cache_key, {"epics": epics}, self._cache_tags(team_name=team_name))
 
             return epics
         except Exception as e:
@@ -566,7 +605,9 @@ class JiraAssistant:
             open_issues = self.fetch_issues(jql_query)
 
             if open_issues:
-                self._save_to_cache(cache_key, {"issues": open_issues})
+                self._save_to_cache(
+                    cache_key, {"issues": open_issues}, self._cache_tags(jql=jql_query, team_name=team_name)
+                )
 
             return open_issues
         except Exception as e:
@@ -671,7 +712,7 @@ class JiraAssistant:
                 if not response:
                     raise JiraQueryError("No response received from Jira API.", jql=jql_query)
 
-                self._save_to_cache(cache_key, response)
+                self._save_to_cache(cache_key, response, self._cache_tags(jql=jql_query))
                 if isinstance(response, dict):
                     current_issues = response.get("issues", [])
                     issues.extend(current_issues)
@@ -787,7 +828,7 @@ class JiraAssistant:
                 comments.append(processed_comment)
 
             # Cache as dict to match cache_manager expectations
-            self._save_to_cache(cache_key, {"comments": comments})
+            self._save_to_cache(cache_key, {"comments": comments}, self._cache_tags(issue_key=issue_key))
             self._logger.info(f"Fetched {len(comments)} comments for issue {issue_key}")
             return comments
 
@@ -818,7 +859,7 @@ class JiraAssistant:
             if not response:
                 raise JiraMetadataFetchError(f"No metadata found for project {project_key}")
 
-            self._save_to_cache(cache_key, response)
+            self._save_to_cache(cache_key, response, self._cache_tags(project_key=project_key))
             return response
         except JiraMetadataFetchError as e:
             self._logger.error(e)
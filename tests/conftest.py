@@ -0,0 +1,32 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from utils.logging.logging_manager import LogManager
+
+# Modules importing log_config create LOG_DIR on import; keep it out of the working tree
+os.environ.setdefault("LOG_DIR", os.path.join(tempfile.gettempdir(), "pytoolkit-tests", "logs"))
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def log_manager(tmp_path_factory):
+    """Initialize the LogManager singleton, logging to a temporary directory."""
+    return LogManager.initialize(str(tmp_path_factory.mktemp("logs")), "tests.log", 1, log_output="file")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_manager(tmp_path_factory, log_manager):
+    """Point the CacheManager singleton at a temporary directory."""
+    from utils.cache_manager.cache_manager import CacheManager  # noqa: PLC0415 - imported after LOG_DIR is set
+
+    return CacheManager.get_instance(cache_dir=str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture(scope="session")
+def nfce_pages() -> dict[str, str]:
+    """Saved NFCe pages by file name (without extension)."""
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted((FIXTURES_DIR / "nfce").glob("*.html"))}
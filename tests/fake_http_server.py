@@ -0,0 +1,124 @@
+"""Local HTTP server standing in for external APIs and portals in tests."""
+
+import json
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class FakeResponse:
+    status: int = 200
+    body: str | bytes | dict | list = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+@dataclass
+class FakeRequest:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    connection: tuple[str, int]
+    attempt: int
+
+
+class FakeHTTPServer:
+    """Threaded HTTP/1.1 server answering every request through a route callable.
+
+    The route receives a FakeRequest and returns a FakeResponse. The server records every
+    request, the client connections used (to check keep-alive reuse) and the highest number
+    of requests handled at the same time (to check concurrency caps).
+    """
+
+    def __init__(self, route: Callable[[FakeRequest], FakeResponse]):
+        self.route = route
+        self.requests: list[FakeRequest] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._attempts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def connections(self) -> set[tuple[str, int]]:
+        return {request.connection for request in self.requests}
+
+    def __enter__(self) -> "FakeHTTPServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_POST(self) -> None:
+                self._handle("POST")
+
+            def _handle(self, method: str) -> None:
+                if self.headers.get("Content-Length"):
+                    self.rfile.read(int(self.headers["Content-Length"]))
+
+                parsed = urlparse(self.path)
+                with server._lock:
+                    server._attempts[self.path] += 1
+                    request = FakeRequest(
+                        method=method,
+                        path=parsed.path,
+                        query=parse_qs(parsed.query),
+                        headers=dict(self.headers),
+                        connection=self.client_address,
+                        attempt=server._attempts[self.path],
+                    )
+                    server.requests.append(request)
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+
+                try:
+                    response = server.route(request)
+                    if response.delay:
+                        time.sleep(response.delay)
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+                body = response.body
+                content_type = "text/html; charset=utf-8"
+                if isinstance(body, dict | list):
+                    body = json.dumps(body)
+                    content_type = "application/json"
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+
+                self.send_response(response.status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
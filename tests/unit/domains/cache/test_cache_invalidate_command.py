@@ -0,0 +1,18 @@
+import re
+
+from domains.cache import cache_invalidate_command
+from domains.github.github_api_client import GitHubApiClient
+
+
+def test_documented_github_prefix_matches_page_cache_keys(cache_manager):
+    documented = re.search(r"--prefix (\S+)", cache_invalidate_command.__doc__).group(1)
+    prefix = GitHubApiClient.page_cache_prefix("/repos/my-org/my-repo/pulls")
+
+    assert documented == prefix
+    for params in ({"state": "open", "per_page": 100, "page": 1}, {"state": "all", "per_page": 100, "page": 2}):
+        cache_manager.save(cache_manager.generate_cache_key(prefix, **params), [{"number": 1}])
+    cache_manager.save(
+        cache_manager.generate_cache_key(GitHubApiClient.page_cache_prefix("/repos/my-org/other/pulls")), []
+    )
+
+    assert cache_manager.invalidate_by_prefix(documented) == 2
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+import requests
+
+from domains.circleci import circleci_api_client
+from domains.circleci.circleci_api_client import CircleCIApiClient
+from tests.fake_http_server import FakeHTTPServer, FakeResponse
+
+PIPELINES = [{"id": f"pipeline-{i}", "number": 100 - i} for i in range(45)]
+PAGE_SIZE = 20
+
+
+def pipeline_pages(request) -> FakeResponse:
+    start = int(request.query.get("page-token", ["0"])[0])
+    items = PIPELINES[start : start + PAGE_SIZE]
+    next_start = start + PAGE_SIZE
+    return FakeResponse(
+        body={"items": items, "next_page_token": str(next_start) if next_start < len(PIPELINES) else None}
+    )
+
+
+def test_paginate_follows_next_page_token_and_stops_at_limit():
+    with FakeHTTPServer(pipeline_pages) as server:
+        client = CircleCIApiClient("token", base_url=server.base_url)
+
+        everything = client.paginate("/project/gh/org/repo/pipeline", params={"branch": "main"})
+        first_requests = len(server.requests)
+        limited = client.paginate("/project/gh/org/repo/pipeline", limit=25)
+        client.close()
+
+    assert everything == PIPELINES
+    assert first_requests == 3
+    assert [request.query.get("page-token") for request in server.requests[:3]] == [None, ["20"], ["40"]]
+    assert server.requests[1].query["branch"] == ["main"]
+    # The limit is reached on the second page, so the third is never requested
+    assert limited == PIPELINES[:25]
+    assert len(server.requests) == first_requests + 2
+
+
+def test_concurrent_requests_stay_within_max_concurrency():
+    def route(request):
+        return FakeResponse(body={"items": [{"id": request.path.split("/")[2]}]}, delay=0.05)
+
+    with FakeHTTPServer(route) as server:
+        client = CircleCIApiClient("token", base_url=server.base_url, max_concurrency=3)
+
+        # Nested pools must still share the same three slots
+        def workflows_and_jobs(pipeline_id: str) -> list:
+            workflows = client.get(f"/pipeline/{pipeline_id}/workflow")["items"]
+            return client.map_concurrent(lambda w: client.get(f"/workflow/{w['id']}/job"), workflows * 2)
+
+        results = client.map_concurrent(workflows_and_jobs, [f"p{i}" for i in range(12)])
+        client.close()
+
+    assert not [result for result in results if isinstance(result, Exception)]
+    assert len(server.requests) == 36
+    assert 2 <= server.max_in_flight <= 3
+    assert len(server.connections) <= 3
+
+
+def test_throttled_response_pauses_the_shared_budget_before_retrying(budget):
+    def route(request):
+        if request.path == "/pipeline/p1/workflow" and request.attempt == 1:
+            return FakeResponse(status=429, body={"message": "Rate limit exceeded"}, headers={"Retry-After": "1"})
+        return FakeResponse(body={"items": []})
+
+    with FakeHTTPServer(route) as server:
+        client = CircleCIApiClient("token", base_url=server.base_url)
+
+        start = time.monotonic()
+        assert client.get("/pipeline/p1/workflow") == {"items": []}
+        elapsed = time.monotonic() - start
+        blocked_until = budget.get_budget(client.budget_key)["blocked_until"]
+        client.close()
+
+    assert len(server.requests) == 2
+    assert elapsed >= 0.9
+    assert blocked_until > 0
+    assert client.get_statistics()["throttled_responses"] == 1
+
+
+def test_throttle_pause_applies_to_other_clients_of_the_same_token(monkeypatch):
+    monkeypatch.setattr(circleci_api_client, "MAX_THROTTLE_RETRIES", 0)
+
+    def route(request):
+        if request.path == "/pipeline/p1/workflow":
+            return FakeResponse(status=429, headers={"Retry-After": "1"})
+        return FakeResponse(body={"items": []})
+
+    with FakeHTTPServer(route) as server:
+        throttled = CircleCIApiClient("token", base_url=server.base_url)
+        other = CircleCIApiClient("token", base_url=server.base_url)
+        other_token = CircleCIApiClient("other-token", base_url=server.base_url)
+
+        with pytest.raises(requests.HTTPError):
+            throttled.get("/pipeline/p1/workflow")
+
+        start = time.monotonic()
+        other_token.get("/pipeline/p2/workflow")
+        other_token_elapsed = time.monotonic() - start
+        other.get("/pipeline/p2/workflow")
+        other_elapsed = time.monotonic() - start
+
+        for client in (throttled, other, other_token):
+            client.close()
+
+    assert other_token_elapsed < 0.5
+    assert other_elapsed >= 0.9
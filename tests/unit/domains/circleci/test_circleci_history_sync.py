@@ -0,0 +1,93 @@
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from domains.circleci.circleci_history_store import CircleCIHistoryStore
+from domains.circleci.circleci_service import CircleCIService
+from tests.fake_http_server import FakeHTTPServer, FakeResponse
+
+PROJECT = "gh/org/repo"
+PAGE_SIZE = 10
+NOW = datetime.now(UTC)
+
+
+def _pipeline(number: int) -> dict:
+    created_at = (NOW - timedelta(hours=100 - number)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"id": f"p{number}", "number": number, "state": "created", "created_at": created_at}
+
+
+class FakeCircleCI:
+    """Pipelines newest first, one finished workflow and job each; can fail one listing page"""
+
+    def __init__(self, newest: int):
+        self.newest = newest
+        self.failing_page_token: str | None = None
+
+    def __call__(self, request) -> FakeResponse:
+        parts = request.path.strip("/").split("/")
+        if parts[-1] == "pipeline":
+            token = request.query.get("page-token", ["0"])[0]
+            if token == self.failing_page_token:
+                return FakeResponse(status=404, body={"message": "Not Found"})
+            start = int(token)
+            numbers = list(range(self.newest - start, max(self.newest - start - PAGE_SIZE, 0), -1))
+            next_token = str(start + PAGE_SIZE) if start + PAGE_SIZE < self.newest else None
+            return FakeResponse(body={"items": [_pipeline(n) for n in numbers], "next_page_token": next_token})
+        if parts[0] == "pipeline":
+            pipeline_id = parts[1]
+            workflow = {"id": f"w-{pipeline_id}", "name": "build", "status": "success", "created_at": None}
+            return FakeResponse(body={"items": [workflow], "next_page_token": None})
+        return FakeResponse(body={"items": [{"id": f"j-{parts[1]}", "name": "test", "status": "success"}]})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CircleCIHistoryStore(str(tmp_path / "circleci_history.sqlite3"))
+
+
+def test_interrupted_listing_does_not_advance_the_watermark(store):
+    api = FakeCircleCI(newest=10)
+    since = NOW - timedelta(days=30)
+
+    with FakeHTTPServer(api) as server:
+        service = CircleCIService("token", PROJECT, base_url=server.base_url)
+        service.sync_history(store, since)
+        assert store.get_coverage(PROJECT)[0] == 10
+
+        # 30 new pipelines; the second listing page fails after the newest 10 were stored
+        api.newest = 40
+        api.failing_page_token = "10"
+        interrupted = service.sync_history(store, since)
+        assert interrupted["new_pipelines"] == 10
+        assert store.get_coverage(PROJECT)[0] == 10
+
+        api.failing_page_token = None
+        resumed = service.sync_history(store, since)
+        service.client.close()
+
+    # The gap between the old watermark and the pipelines stored by the interrupted sync is filled
+    assert resumed["new_pipelines"] == 20
+    assert store.get_coverage(PROJECT)[0] == 40
+    assert store.get_pipeline_ids(PROJECT) == {f"p{n}" for n in range(1, 41)}
+    assert store.get_statistics(PROJECT)["complete_pipelines"] == 40
+
+
+def test_sync_state_without_watermark_triggers_a_full_sync(tmp_path):
+    db_path = tmp_path / "circleci_history.sqlite3"
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("CREATE TABLE sync_state (project_slug TEXT PRIMARY KEY, synced_since TEXT, synced_at TEXT)")
+        conn.execute("INSERT INTO sync_state VALUES (?, ?, ?)", (PROJECT, "2024-01-01T00:00:00+00:00", "x"))
+        conn.commit()
+
+    store = CircleCIHistoryStore(str(db_path))
+    assert store.get_coverage(PROJECT) == (None, None)
+
+    since = NOW - timedelta(days=30)
+    with FakeHTTPServer(FakeCircleCI(newest=5)) as server:
+        service = CircleCIService("token", PROJECT, base_url=server.base_url)
+        service.sync_history(store, since)
+        service.client.close()
+
+    assert store.get_coverage(PROJECT) == (5, since.isoformat())
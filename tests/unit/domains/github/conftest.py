@@ -0,0 +1,11 @@
+import pytest
+
+from utils.http.shared_budget import SharedRateBudget
+
+
+@pytest.fixture(autouse=True)
+def budget(tmp_path, monkeypatch):
+    budget = SharedRateBudget(db_path=str(tmp_path / "rate_budget.sqlite3"))
+    monkeypatch.setattr(SharedRateBudget, "_instance", budget)
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    return budget
@@ -0,0 +1,197 @@
+import time
+
+import pytest
+
+from domains.github import github_api_client
+from domains.github.github_api_client import GitHubApiClient
+from tests.fake_http_server import FakeHTTPServer, FakeResponse
+from utils.http.shared_budget import SharedRateBudget
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sleeps instead of waiting them out."""
+    recorded = []
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    return recorded
+
+
+def rate_limited_until_attempt(successful_attempt: int):
+    def route(request):
+        if request.attempt < successful_attempt:
+            # Reset already passed, so the client waits its minimum of one second
+            headers = {"X-RateLimit-Reset": str(int(time.time()) - 60)}
+            return FakeResponse(status=403, body="API rate limit exceeded for user", headers=headers)
+        return FakeResponse(body={"full_name": "org/repo"})
+
+    return route
+
+
+def test_rate_limit_waits_do_not_use_up_retries(monkeypatch, sleeps):
+    # More rate limited responses than max_retries (5)
+    with FakeHTTPServer(rate_limited_until_attempt(8)) as server:
+        monkeypatch.setenv("GITHUB_BASE_URL", server.base_url)
+        client = GitHubApiClient()
+
+        data = client._make_request("GET", "/repos/org/repo")
+
+    assert data == {"full_name": "org/repo"}
+    assert len(server.requests) == 8
+    # Every wait went through the shared budget
+    assert len(sleeps) == 7
+    assert all(0 < seconds <= 1 for seconds in sleeps)
+
+
+def test_rate_limit_wait_falls_back_to_local_sleep_without_budget(tmp_path, monkeypatch, sleeps):
+    # A directory cannot be opened as SQLite database, so every budget call fails
+    monkeypatch.setattr(SharedRateBudget, "_instance", SharedRateBudget(db_path=str(tmp_path)))
+
+    with FakeHTTPServer(rate_limited_until_attempt(3)) as server:
+        monkeypatch.setenv("GITHUB_BASE_URL", server.base_url)
+        client = GitHubApiClient()
+
+        data = client._make_request("GET", "/repos/org/repo")
+
+    assert data == {"full_name": "org/repo"}
+    assert sleeps == [1, 1]
+
+
+class FakeGraphQL:
+    """post_graphql stand-in serving aliased repository queries from in-memory PR lists.
+
+    Cursors are offsets into a repository's PRs (updatedAt DESC); each query costs
+    cost_per_repo points per repository in it.
+    """
+
+    def __init__(self, prs_by_repo: dict[str, list[str]], missing=(), max_batch_size=None, cost_per_repo=1):
+        self.prs_by_repo = prs_by_repo
+        self.missing = set(missing)
+        self.max_batch_size = max_batch_size
+        self.cost_per_repo = cost_per_repo
+        self.batches: list[list[str]] = []
+        self.expected_costs: list[int | None] = []
+
+    def __call__(self, query, variables, expected_cost=None, **kwargs):
+        batch = []
+        while f"owner{len(batch)}" in variables:
+            batch.append(f"{variables[f'owner{len(batch)}']}/{variables[f'name{len(batch)}']}")
+        self.batches.append(batch)
+        self.expected_costs.append(expected_cost)
+
+        if self.max_batch_size and len(batch) > self.max_batch_size:
+            return {"errors": [{"message": "Something went wrong while executing your query (timeout)"}]}
+
+        data: dict = {"rateLimit": {"cost": self.cost_per_repo * len(batch), "remaining": 4000}}
+        errors = []
+        for index, full_name in enumerate(batch):
+            if full_name in self.missing:
+                data[f"r{index}"] = None
+                errors.append({"path": [f"r{index}"], "message": f"Could not resolve to a Repository {full_name}"})
+                continue
+            start = int(variables[f"cursor{index}"] or 0)
+            updated = self.prs_by_repo[full_name]
+            page = updated[start : start + variables["pageSize"]]
+            data[f"r{index}"] = {
+                "pullRequests": {
+                    "nodes": [
+                        {"number": start + offset + 1, "updatedAt": updated_at, "createdAt": updated_at}
+                        for offset, updated_at in enumerate(page)
+                    ],
+                    "pageInfo": {"hasNextPage": start + len(page) < len(updated), "endCursor": str(start + len(page))},
+                }
+            }
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+def _updated(count: int, day: int = 28) -> list[str]:
+    return [f"2024-03-{day - index // 24:02d}T{23 - index % 24:02d}:00:00Z" for index in range(count)]
+
+
+def _numbers(prs_by_repo: dict) -> dict[str, list[int]]:
+    return {full_name: [pr["number"] for pr in prs] for full_name, prs in prs_by_repo.items()}
+
+
+def test_batched_fetch_follows_each_repository_cursor(monkeypatch):
+    fake = FakeGraphQL({"org/big": _updated(7), "org/small": _updated(2), "org/empty": []})
+    client = GitHubApiClient()
+    monkeypatch.setattr(client, "post_graphql", fake)
+
+    results = client.fetch_pull_requests_graphql_batched(
+        [("org", "big"), ("org", "small"), ("org", "empty")], page_size=3
+    )
+
+    assert _numbers(results) == {"org/big": [1, 2, 3, 4, 5, 6, 7], "org/small": [1, 2], "org/empty": []}
+    # Finished repositories leave the batch while the big one keeps paging
+    assert fake.batches == [["org/big", "org/small", "org/empty"], ["org/big"], ["org/big"]]
+
+
+def test_batched_fetch_stops_each_repository_at_its_own_since(monkeypatch):
+    fake = FakeGraphQL({"org/api": _updated(48), "org/web": _updated(48)})
+    client = GitHubApiClient()
+    monkeypatch.setattr(client, "post_graphql", fake)
+
+    results = client.fetch_pull_requests_graphql_batched(
+        [("org", "api"), ("org", "web")],
+        since_iso="2024-03-27T00:00:00Z",
+        page_size=10,
+        since_by_repo={"org/api": "2024-03-28T20:00:00Z"},
+    )
+
+    assert _numbers(results) == {"org/api": [1, 2, 3, 4], "org/web": list(range(1, 49))}
+    assert fake.batches == [["org/api", "org/web"]] + [["org/web"]] * 4
+
+
+def test_alias_error_drops_only_that_repository(monkeypatch):
+    fake = FakeGraphQL({"org/api": _updated(2), "org/gone": _updated(2), "org/web": _updated(2)}, missing={"org/gone"})
+    client = GitHubApiClient()
+    monkeypatch.setattr(client, "post_graphql", fake)
+
+    results = client.fetch_pull_requests_graphql_batched([("org", "api"), ("org", "gone"), ("org", "web")])
+
+    assert _numbers(results) == {"org/api": [1, 2], "org/web": [1, 2]}
+    assert len(fake.batches) == 1
+
+
+def test_failed_query_halves_the_batch(monkeypatch):
+    repos = [("org", f"repo{index}") for index in range(8)]
+    fake = FakeGraphQL({f"org/repo{index}": _updated(1) for index in range(8)}, max_batch_size=3)
+    client = GitHubApiClient()
+    monkeypatch.setattr(client, "post_graphql", fake)
+
+    results = client.fetch_pull_requests_graphql_batched(repos, max_batch_size=8)
+
+    assert sorted(results) == [f"org/repo{index}" for index in range(8)]
+    assert [len(batch) for batch in fake.batches] == [8, 4, 2, 2, 2, 2]
+
+
+def test_batch_size_follows_the_reported_cost(monkeypatch):
+    repos = [("org", f"repo{index}") for index in range(12)]
+    # 25 points per repository, so the 50 point target fits two of them
+    fake = FakeGraphQL({f"org/repo{index}": _updated(1) for index in range(12)}, cost_per_repo=25)
+    client = GitHubApiClient()
+    monkeypatch.setattr(client, "post_graphql", fake)
+
+    results = client.fetch_pull_requests_graphql_batched(repos, max_batch_size=4)
+
+    assert len(results) == 12
+    assert [len(batch) for batch in fake.batches] == [4, 2, 2, 2, 2]
+    # Each batch reserves its own expected cost from the shared budget
+    assert fake.expected_costs == [None, 50, 50, 50, 50]
+
+
+def test_graphql_reserves_the_cost_of_the_same_query_shape(monkeypatch, budget):
+    def route(request):
+        # Odd requests run the expensive query, even ones the cheap query
+        return FakeResponse(body={"data": {"rateLimit": {"cost": 30 if request.attempt % 2 else 1}}})
+
+    reserved = []
+    monkeypatch.setattr(budget, "acquire", lambda key, min_interval=0.0, cost=1: reserved.append(cost) or 0.0)
+
+    with FakeHTTPServer(route) as server:
+        monkeypatch.setattr(github_api_client, "GRAPHQL_ENDPOINT", f"{server.base_url}/graphql")
+        client = GitHubApiClient()
+        for query in ["query Expensive", "query Cheap", "query Expensive", "query Cheap"]:
+            client.post_graphql(query, {})
+        client.post_graphql("query Expensive", {}, expected_cost=5)
+
+    assert reserved == [1, 1, 30, 1, 5]
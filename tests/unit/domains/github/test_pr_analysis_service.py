@@ -0,0 +1,55 @@
+import threading
+import time
+from argparse import ArgumentParser
+
+from domains.github.pr_analysis_command import PrAnalysisCommand
+from domains.github.pr_analysis_service import PrAnalysisService
+
+
+def _args(*argv: str):
+    parser = ArgumentParser()
+    PrAnalysisCommand.get_arguments(parser)
+    return parser.parse_args(["--org", "org", *argv])
+
+
+def _node(number: int) -> dict:
+    return {
+        "number": number,
+        "state": "MERGED",
+        "createdAt": "2024-03-01T08:00:00Z",
+        "mergedAt": "2024-03-02T08:00:00Z",
+        "updatedAt": "2024-03-02T08:00:00Z",
+        "author": {"login": "dev"},
+    }
+
+
+def test_repositories_are_merged_in_order_and_failures_stay_isolated(monkeypatch):
+    service = PrAnalysisService()
+    client = service.github_client
+    # The first repository finishes last; "broken" fails
+    delays = {"slow": 0.3, "broken": 0.0, "medium": 0.15, "fast": 0.0}
+    completed = []
+    lock = threading.Lock()
+
+    def fetch(owner, repo, since_iso=None, until_iso=None, page_size=50):
+        time.sleep(delays[repo])
+        with lock:
+            completed.append(repo)
+        if repo == "broken":
+            raise RuntimeError("GraphQL query failed")
+        return [client._map_graphql_pr_with_approvers(owner, repo, _node(number)) for number in (1, 2)]
+
+    monkeypatch.setattr(client, "fetch_pull_requests_graphql_with_reviews", fetch)
+    repos = [{"name": name, "owner": {"login": "org"}} for name in delays]
+
+    pr_data = service._collect_pr_data(repos, set(), _args("--repos", *delays, "--repo-workers", "4"))
+
+    assert completed[-1] == "slow"
+    assert [(pr["repo"], pr["pr_number"]) for pr in pr_data] == [
+        ("org/slow", 1),
+        ("org/slow", 2),
+        ("org/medium", 1),
+        ("org/medium", 2),
+        ("org/fast", 1),
+        ("org/fast", 2),
+    ]
@@ -0,0 +1,128 @@
+import sqlite3
+from argparse import Namespace
+from contextlib import closing
+
+import pytest
+
+from domains.github.github_api_client import GitHubApiClient
+from domains.github.pr_analysis_service import PrAnalysisService
+from domains.github.pr_history_store import PrHistoryStore
+
+
+def _node(number: int, updated_at: str, reviews: list[tuple[str, str, str]]) -> dict:
+    """GraphQL PR node with (login, state, submittedAt) reviews and two commits."""
+    review_nodes = [
+        {"state": state, "submittedAt": submitted_at, "author": {"login": login}}
+        for login, state, submitted_at in reviews
+    ]
+    return {
+        "number": number,
+        "state": "MERGED",
+        "createdAt": "2024-03-01T08:00:00Z",
+        "mergedAt": updated_at,
+        "updatedAt": updated_at,
+        "author": {"login": "dev"},
+        "commits": {"totalCount": 2},
+        "reviews": {"nodes": review_nodes},
+        "latestOpinionatedReviews": {"nodes": [node for node in review_nodes if node["state"] == "APPROVED"]},
+        "timelineItems": {
+            "nodes": [
+                {"__typename": "PullRequestCommit", "commit": {"committedDate": "2024-03-01T09:00:00Z"}},
+                {"__typename": "PullRequestCommit", "commit": {"committedDate": "2024-03-02T09:00:00Z"}},
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def client():
+    return GitHubApiClient()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PrHistoryStore(str(tmp_path / "prs.sqlite3"))
+
+
+def _rows(store: PrHistoryStore, query: str) -> list[tuple]:
+    with closing(sqlite3.connect(store.db_path)) as conn:
+        return conn.execute(query).fetchall()
+
+
+def test_sync_since_follows_the_watermark_once_history_covers_the_window(store):
+    assert store.get_sync_since("org/api", "2024-03-01T00:00:00Z") == "2024-03-01T00:00:00Z"
+
+    store.upsert("org/api", [{"number": 1, "updated_at": "2024-03-05T10:00:00Z"}], "2024-03-01T00:00:00Z")
+
+    assert store.get_sync_since("org/api", "2024-03-01T00:00:00Z") == "2024-03-05T10:00:00Z"
+    # A later window starts after the watermark
+    assert store.get_sync_since("org/api", "2024-03-10T00:00:00Z") == "2024-03-10T00:00:00Z"
+    # An earlier window is not covered by the stored history and is fetched in full
+    assert store.get_sync_since("org/api", "2024-02-01T00:00:00Z") == "2024-02-01T00:00:00Z"
+    assert store.get_sync_since("org/api", None) == "1970-01-01T00:00:00Z"
+    assert store.get_sync_since("org/web", "2024-03-01T00:00:00Z") == "2024-03-01T00:00:00Z"
+
+
+def test_watermark_never_moves_back(store):
+    store.upsert("org/api", [{"number": 1, "updated_at": "2024-03-05T10:00:00+00:00"}], "2024-03-01T00:00:00Z")
+    store.upsert("org/api", [{"number": 2, "updated_at": "2024-03-04T10:00:00Z"}], "2024-03-05T10:00:00Z")
+    store.upsert("org/api", [], "2024-03-05T10:00:00Z")
+
+    statistics = store.get_statistics("org/api")
+    assert statistics["watermark"] == "2024-03-05T10:00:00Z"
+    assert statistics["synced_since"] == "2024-03-01T00:00:00Z"
+    assert statistics["pull_requests"] == 2
+
+
+def test_refetched_prs_replace_their_reviews_and_approvals(client, store):
+    first = client._map_graphql_pr_with_approvers(
+        "org",
+        "api",
+        _node(
+            1,
+            "2024-03-03T10:00:00Z",
+            [("ana", "COMMENTED", "2024-03-01T10:00:00Z"), ("bo", "APPROVED", "2024-03-03T09:00:00Z")],
+        ),
+    )
+    store.upsert("org/api", [first], "2024-03-01T00:00:00Z")
+    refetched = client._map_graphql_pr_with_approvers(
+        "org", "api", _node(1, "2024-03-04T10:00:00Z", [("ana", "APPROVED", "2024-03-04T09:00:00Z")])
+    )
+    store.upsert("org/api", [refetched], "2024-03-03T10:00:00Z")
+
+    assert _rows(store, "SELECT login, state, submitted_at FROM reviews") == [
+        ("ana", "APPROVED", "2024-03-04T09:00:00Z")
+    ]
+    assert _rows(store, "SELECT login FROM approvals") == [("ana",)]
+    assert store.load("org/api") == [refetched]
+
+
+def test_sync_stores_review_rounds_and_keeps_failed_repos_watermark(client, store, monkeypatch):
+    service = PrAnalysisService()
+    store.upsert("org/web", [{"number": 7, "updated_at": "2024-03-02T10:00:00Z"}], "2024-03-01T00:00:00Z")
+    requested = {}
+
+    def fetch_batched(repos, *args, since_by_repo=None, **kwargs):
+        requested.update(since_by_repo)
+        node = _node(
+            1,
+            "2024-03-06T10:00:00Z",
+            [("ana", "CHANGES_REQUESTED", "2024-03-01T10:00:00Z"), ("ana", "APPROVED", "2024-03-03T10:00:00Z")],
+        )
+        # org/web failed to fetch, so it is left out
+        return {"org/api": [client._map_graphql_pr_with_approvers("org", "api", node)]}
+
+    monkeypatch.setattr(service.github_client, "fetch_pull_requests_graphql_batched", fetch_batched)
+    args = Namespace(org="org", since="2024-03-01T00:00:00Z", until=None, pr_store_db=store.db_path)
+
+    loaded = service._sync_pr_store([{"name": "api"}, {"name": "web"}], args)
+
+    assert requested == {"org/api": "2024-03-01T00:00:00Z", "org/web": "2024-03-02T10:00:00Z"}
+    assert _rows(
+        store,
+        "SELECT number, review_rounds, synchronize_after_first_review, re_review_pushes "
+        "FROM pull_requests WHERE repo = 'org/api'",
+    ) == [(1, 1, 1, 1)]
+    assert store.get_statistics("org/api")["watermark"] == "2024-03-06T10:00:00Z"
+    assert store.get_statistics("org/web")["watermark"] == "2024-03-02T10:00:00Z"
+    assert [pr["number"] for pr in loaded["org/web"]] == [7]
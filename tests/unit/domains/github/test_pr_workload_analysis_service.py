@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from domains.github.pr_workload_analysis_service import PrWorkloadAnalysisService, business_duration_days
+
+HOLIDAYS = ["2024-01-01", "2024-02-12", "2024-02-13", "2024-12-25"]
+
+
+def _reference_business_days(start: pd.Timestamp, end: pd.Timestamp, holidays: set) -> float:
+    """Business time of one row, summing its overlap with each business day it touches."""
+    total = pd.Timedelta(0)
+    for day in pd.date_range(start.normalize(), end.normalize()):
+        if day.weekday() < 5 and day.date() not in holidays:
+            total += min(end, day + pd.Timedelta(days=1)) - max(start, day)
+    return total / pd.Timedelta(days=1)
+
+
+def _random_prs(num_prs: int, seed: int, at_midnight: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    created_at = pd.Timestamp("2024-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 365 * 86400, num_prs), "s")
+    merged_at = created_at + pd.to_timedelta(rng.integers(0, 30 * 86400, num_prs), "s")
+    prs = pd.DataFrame({"created_at": created_at, "merged_at": merged_at})
+    return prs.apply(lambda column: column.dt.floor("D")) if at_midnight else prs
+
+
+def test_whole_days_match_per_row_business_date_ranges():
+    prs = _random_prs(2_000, seed=42, at_midnight=True)
+
+    # Business days from the creation day up to, but excluding, the merge day
+    per_row = prs.apply(
+        lambda row: len(pd.bdate_range(row["created_at"].date(), row["merged_at"].date() - pd.Timedelta(days=1))),
+        axis=1,
+    )
+
+    assert business_duration_days(prs["created_at"], prs["merged_at"]).tolist() == per_row.astype(float).tolist()
+
+
+def test_fractional_days_match_per_row_reference_with_holidays():
+    prs = _random_prs(500, seed=7)
+    calendar = np.busdaycalendar(holidays=np.array(HOLIDAYS, dtype="datetime64[D]"))
+    holidays = {pd.Timestamp(day).date() for day in HOLIDAYS}
+
+    expected = [_reference_business_days(row.created_at, row.merged_at, holidays) for row in prs.itertuples()]
+
+    assert business_duration_days(prs["created_at"], prs["merged_at"], calendar).tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        # Same business day: only the hours in between
+        ("2024-03-04 09:00", "2024-03-04 15:00", 0.25),
+        ("2024-03-04 00:00", "2024-03-05 00:00", 1.0),
+        # Weekends count as zero
+        ("2024-03-09 09:00", "2024-03-09 15:00", 0.0),
+        ("2024-03-09 09:00", "2024-03-10 18:00", 0.0),
+        ("2024-03-08 18:00", "2024-03-11 06:00", 0.5),
+        ("2024-03-04 12:00", "2024-03-11 12:00", 5.0),
+        # Holidays count as zero: Carnival Monday and Tuesday
+        ("2024-02-12 09:00", "2024-02-13 18:00", 0.0),
+        ("2024-02-09 12:00", "2024-02-14 12:00", 1.0),
+    ],
+)
+def test_business_duration_cases(start, end, expected):
+    calendar = np.busdaycalendar(holidays=np.array(HOLIDAYS, dtype="datetime64[D]"))
+
+    result = business_duration_days(pd.Series([pd.Timestamp(start)]), pd.Series([pd.Timestamp(end)]), calendar)
+
+    assert result.tolist() == pytest.approx([expected])
+
+
+def test_missing_or_reversed_timestamps_are_nan():
+    start = pd.Series(pd.to_datetime(["2024-03-04 09:00", None, "2024-03-05 09:00"], utc=True))
+    # Timezone-aware columns are compared in UTC: 12:00+02:00 is one hour after the start
+    end = pd.Series(
+        pd.to_datetime(["2024-03-04 12:00+02:00", "2024-03-05 09:00", "2024-03-04 09:00"], utc=True, format="ISO8601")
+    )
+
+    result = business_duration_days(start, end)
+
+    assert result.iloc[0] == pytest.approx(1 / 24)
+    assert result.iloc[1:].isna().all()
+
+
+def test_monthly_business_days_exclude_holidays(tmp_path):
+    holidays_file = tmp_path / "holidays.txt"
+    holidays_file.write_text("# Carnival\n2024-02-12\n2024-02-13,Carnival\n", encoding="utf-8")
+    service = PrWorkloadAnalysisService()
+    service.business_calendar = service._load_business_calendar(str(holidays_file))
+
+    months = pd.Series(pd.period_range("2024-01", "2024-03", freq="M"))
+
+    assert service._get_monthly_business_days(months).tolist() == [23, 19, 21]
@@ -0,0 +1,164 @@
+import itertools
+import json
+import os
+import subprocess
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from domains.linearb.linearb_api_client import (
+    LinearBApiClient,
+    LinearBMetricsManager,
+    LinearBRollup,
+    LinearBTimeRangeHelper,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[4] / "src"
+
+# Builds the cache keys in a fresh interpreter; the request itself is replaced by returning its key
+KEY_SCRIPT = """
+import json
+import sys
+
+from utils.logging.logging_manager import LogManager
+
+LogManager.initialize(sys.argv[1], "keys.log", 1, log_output="file")
+
+from domains.linearb.linearb_api_client import LinearBApiClient
+from utils.cache_manager.cache_manager import CacheManager
+
+CacheManager.get_instance(cache_dir=sys.argv[2])
+LinearBApiClient._make_request = lambda self, method, endpoint, cache_key=None, **kwargs: cache_key
+client = LinearBApiClient()
+
+metrics = [{"name": "branch.computed.cycle_time", "agg": "p75"}, {"name": "pr.merged"}]
+time_ranges = [{"after": "2024-01-01", "before": "2024-01-31"}]
+print(
+    json.dumps(
+        {
+            "teams": client.get_teams(),
+            "teams_search": client.get_teams(search_term="platform", page_size=20),
+            "metrics": client.get_metrics(metrics, time_ranges, team_ids=[12, 7]),
+            "metrics_contributor": client.get_metrics(metrics, time_ranges, group_by="contributor"),
+        }
+    )
+)
+"""
+
+
+def _cache_keys(tmp_path: Path, hash_seed: str) -> dict[str, str]:
+    env = {
+        **os.environ,
+        "PYTHONHASHSEED": hash_seed,
+        "PYTHONPATH": str(SRC_DIR),
+        "LINEARB_API_KEY": "test-key",
+        "LOG_DIR": str(tmp_path / "logs"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", KEY_SCRIPT, str(tmp_path / "logs"), str(tmp_path / "cache")],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cache_keys_are_stable_across_hash_seeds(tmp_path):
+    keys = [_cache_keys(tmp_path, seed) for seed in ("0", "1", "4242")]
+
+    assert keys[0] == keys[1] == keys[2]
+    assert len(set(keys[0].values())) == len(keys[0])
+    assert keys[0]["teams"].startswith("linearb_teams_")
+    assert keys[0]["metrics"].startswith("linearb_metrics_")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("LINEARB_API_KEY", "test-key")
+    return LinearBApiClient()
+
+
+def test_chunked_custom_roll_up_sums_only_additive_counts(client, monkeypatch):
+    calls = []
+
+    def get_metrics(requested_metrics, time_ranges, cache_expiration=60, **kwargs):
+        names = [metric["name"] for metric in requested_metrics]
+        calls.append((names, time_ranges[0], cache_expiration))
+        row = {"id": 1, "name": "Platform", "type": "team"}
+        for name in names:
+            # Whole-range requests report distinct counts and averages over the full range
+            row[name] = {"pr.reviewed": 5, "branch.review_time": 42.0}.get(name, 3)
+        return [{**time_ranges[0], "metrics": [row]}]
+
+    monkeypatch.setattr(client, "get_metrics", get_metrics)
+    metrics = [
+        {"name": LinearBMetricsManager.PR_MERGED, "agg": "default"},
+        {"name": LinearBMetricsManager.PR_REVIEWED, "agg": "default"},
+        {"name": LinearBMetricsManager.REVIEW_TIME, "agg": "avg"},
+    ]
+    time_range = {"after": "2024-01-01", "before": "2024-03-31"}
+
+    result = client.get_metrics_chunked(metrics, [time_range], roll_up=LinearBRollup.CUSTOM, chunk="month")
+
+    chunk_calls = [call for call in calls if call[0] == ["pr.merged"]]
+    whole_calls = [call for call in calls if call[0] != ["pr.merged"]]
+    assert len(chunk_calls) == 3
+    assert whole_calls == [(["pr.reviewed", "branch.review_time"], time_range, None)]
+    assert result[0]["metrics"] == [
+        {"id": 1, "name": "Platform", "type": "team", "pr.reviewed": 5, "branch.review_time": 42.0, "pr.merged": 9}
+    ]
+
+
+def test_open_whole_range_requests_keep_a_short_cache(client, monkeypatch):
+    expirations = []
+
+    def get_metrics(requested_metrics, time_ranges, cache_expiration=60, **kwargs):
+        expirations.append(([metric["name"] for metric in requested_metrics], cache_expiration))
+        return []
+
+    monkeypatch.setattr(client, "get_metrics", get_metrics)
+    today = date.today()
+    time_range = {"after": (today - timedelta(days=70)).isoformat(), "before": today.isoformat()}
+
+    client.get_metrics_chunked(
+        [{"name": LinearBMetricsManager.PR_REVIEWED, "agg": "default"}], [time_range], roll_up=LinearBRollup.CUSTOM
+    )
+
+    assert expirations == [(["pr.reviewed"], 60)]
+
+
+@pytest.mark.parametrize(
+    ("roll_up", "chunk", "expected"),
+    [
+        (
+            LinearBRollup.CUSTOM,
+            "month",
+            [("2024-01-15", "2024-01-31"), ("2024-02-01", "2024-02-29"), ("2024-03-01", "2024-03-10")],
+        ),
+        (
+            LinearBRollup.DAILY,
+            "week",
+            [("2024-01-03", "2024-01-07"), ("2024-01-08", "2024-01-14"), ("2024-01-15", "2024-01-15")],
+        ),
+        (LinearBRollup.WEEKLY, "week", [("2024-01-03", "2024-01-09"), ("2024-01-10", "2024-01-15")]),
+    ],
+)
+def test_split_time_range_chunks_do_not_overlap(roll_up, chunk, expected):
+    first_day, last_day = expected[0][0], expected[-1][1]
+
+    chunks = LinearBTimeRangeHelper.split_time_range({"after": first_day, "before": last_day}, chunk, roll_up)
+
+    assert [(c["after"], c["before"]) for c in chunks] == expected
+    for previous, following in itertools.pairwise(chunks):
+        assert date.fromisoformat(following["after"]) - date.fromisoformat(previous["before"]) == timedelta(days=1)
+
+
+def test_split_time_range_keeps_a_single_day():
+    time_range = {"after": "2024-05-02", "before": "2024-05-02"}
+
+    assert LinearBTimeRangeHelper.split_time_range(time_range, "month") == [time_range]
@@ -0,0 +1,211 @@
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from domains.personal_finance.nfce.database.nfce_database_manager import NFCeDatabaseManager
+from domains.personal_finance.nfce.models.invoice_data import EstablishmentData, InvoiceData, ProductData
+
+# (cnpj as printed on the invoice, business name); None names are completed from CNAE data
+ESTABLISHMENTS = [
+    ("11.111.111/0001-11", "MERCADO UM - MATRIZ"),
+    ("11.111.111/0002-92", "MERCADO UM - FILIAL"),
+    ("22222222000122", None),
+    ("22222222000203", "LOJA B - CENTRO"),
+    ("33333333000133", "PADARIA TRES"),
+    ("4444444400014", "FARMACIA QUATRO"),
+    ("55.555.555/0003-55", "ATACADO CINCO - LOJA 3"),
+]
+
+PRODUCTS = [
+    ("001", "ARROZ TIPO 1 5KG", "UN"),
+    ("002", "FEIJAO CARIOCA 1KG", "UN"),
+    ("003", "LEITE INTEGRAL 1L", None),
+    ("004", "PAO FRANCES", "KG"),
+    (None, "SACOLA PLASTICA", "UN"),
+    ("005", "CAFE TORRADO 500G", "PCT"),
+]
+
+
+class FakeCNAEClassifier:
+    """CNAE lookups without the Receita Federal API."""
+
+    def get_establishment_info(self, cnpj: str) -> dict | None:
+        if cnpj.startswith("4444"):
+            return None
+
+        return {
+            "business_name": f"API NAME {cnpj[:8]}",
+            "establishment_type": "Supermercado",
+            "cnae_principal": "4711302",
+            "address": f"RUA {cnpj[:4]}",
+            "city": "BELO HORIZONTE",
+            "state": "MG",
+        }
+
+
+def _invoice(number: int, rng: random.Random, establishments: list[tuple] = ESTABLISHMENTS) -> InvoiceData:
+    cnpj, name = rng.choice(establishments)
+    establishment = None
+    if rng.random() > 0.05:
+        establishment = EstablishmentData(
+            cnpj=cnpj,
+            business_name=name if rng.random() > 0.2 else None,
+            address=rng.choice([None, f"AV {number}"]),
+            city=rng.choice([None, "CONTAGEM"]),
+        )
+
+    items = []
+    for item_number, (code, description, unit) in enumerate(rng.sample(PRODUCTS, rng.randint(0, 4)), start=1):
+        quantity = Decimal(rng.randint(1, 5))
+        unit_price = Decimal(rng.randint(100, 5000)) / 100
+        items.append(
+            ProductData(
+                item_number=item_number,
+                product_code=code,
+                description=description,
+                unit=unit if rng.random() > 0.3 else None,
+                quantity=quantity,
+                unit_price=unit_price,
+                total_amount=quantity * unit_price,
+            )
+        )
+
+    digits = "".join(filter(str.isdigit, cnpj)).zfill(14)
+    return InvoiceData(
+        access_key=f"3124{number % 100:02d}{digits}65001{number:09d}1{number:09d}",
+        invoice_number=str(number),
+        series="1",
+        issue_date=datetime(2024, 1, 1) + timedelta(hours=number),
+        total_amount=sum((item.total_amount for item in items), Decimal(0)),
+        establishment=establishment,
+        items=items,
+        source_url=f"https://portal.example/nfce?p={number}",
+    )
+
+
+def _invoices(count: int, seed: int, establishments: list[tuple] = ESTABLISHMENTS) -> list[InvoiceData]:
+    rng = random.Random(seed)
+    invoices = [_invoice(number, rng, establishments) for number in range(count)]
+    # Repeated access keys within the batch are skipped like already stored ones
+    invoices.extend(_invoice(number, random.Random(number), establishments) for number in rng.sample(range(count), 10))
+    return invoices
+
+
+def _manager(tmp_path, name: str) -> NFCeDatabaseManager:
+    manager = NFCeDatabaseManager(str(tmp_path / name / "nfce.duckdb"))
+    manager.cnae_classifier = FakeCNAEClassifier()
+    return manager
+
+
+def _table_contents(manager: NFCeDatabaseManager) -> dict[str, list[tuple]]:
+    """Table rows with generated ids replaced by natural keys."""
+    conn = manager.db_manager.get_connection("nfce_db")
+    queries = {
+        "establishments": """
+            SELECT cnpj, business_name, establishment_type, address, city, state, cnae_code,
+                cnpj_root, branch_number, is_main_office, company_group_id
+            FROM establishments
+        """,
+        "company_groups": "SELECT id, company_name, total_establishments, main_office_cnpj FROM company_groups",
+        "products": """
+            SELECT e.cnpj, p.product_code, p.description, p.unit, p.occurrence_count
+            FROM products p JOIN establishments e ON p.establishment_id = e.id
+        """,
+        "invoices": """
+            SELECT access_key, invoice_number, series, issuer_cnpj, issue_date, total_amount, items_count
+            FROM invoices
+        """,
+        "invoice_items": """
+            SELECT ii.access_key, e.cnpj, p.product_code, p.description, ii.quantity, ii.unit_price, ii.total_amount
+            FROM invoice_items ii
+            LEFT JOIN products p ON ii.product_id = p.id
+            LEFT JOIN establishments e ON p.establishment_id = e.id
+        """,
+        "processing_log": "SELECT access_key, url, status, error_message FROM processing_log",
+    }
+    return {
+        table: sorted(conn.execute(sql).fetchall(), key=lambda row: tuple(str(value) for value in row))
+        for table, sql in queries.items()
+    }
+
+
+def test_batch_path_matches_row_by_row_path(tmp_path, monkeypatch):
+    def invoices():
+        # Fresh objects per path; the last five were already stored by both databases
+        return _invoices(300, seed=2) + _invoices(30, seed=1, establishments=ESTABLISHMENTS[:3])[:5]
+
+    # Both databases start from the same stored invoices, so the batch updates existing rows and
+    # inserts the remaining establishments
+    row_by_row = _manager(tmp_path, "row_by_row")
+    batched = _manager(tmp_path, "batched")
+    for manager in (row_by_row, batched):
+        for invoice_data in _invoices(30, seed=1, establishments=ESTABLISHMENTS[:3]):
+            manager.store_invoice_data(invoice_data)
+
+    stored = [row_by_row.store_invoice_data(invoice_data) for invoice_data in invoices()]
+    # Every invoice must go through the set-based statements, not the one-by-one fallback
+    monkeypatch.setattr(batched, "_store_in_transaction", lambda conn, invoice_data: pytest.fail("batch fell back"))
+    report = batched.store_invoices_batch(invoices())
+
+    assert report["errors"] == []
+    assert len(report["stored"]) == sum(stored)
+    assert len(report["skipped"]) == len(stored) - sum(stored)
+
+    expected = _table_contents(row_by_row)
+    actual = _table_contents(batched)
+    for table, rows in expected.items():
+        assert actual[table] == rows, table
+
+
+def test_batch_path_names_company_groups_like_row_by_row_path(tmp_path):
+    def invoices():
+        # The first invoice has no business name; a later one names the establishment
+        return [
+            InvoiceData(
+                access_key=f"312405222222220001226500100000000{number}1000000001",
+                invoice_number=str(number),
+                series="1",
+                establishment=EstablishmentData(cnpj="22222222000122", business_name=name),
+            )
+            for number, name in enumerate([None, "LOJA B - CENTRO"])
+        ]
+
+    row_by_row = _manager(tmp_path, "row_by_row")
+    batched = _manager(tmp_path, "batched")
+    for invoice_data in invoices():
+        row_by_row.store_invoice_data(invoice_data)
+    batched.store_invoices_batch(invoices())
+
+    query = "SELECT company_name FROM company_groups WHERE id = '22222222'"
+    expected = row_by_row.db_manager.get_connection("nfce_db").execute(query).fetchall()
+    assert expected == [("API NAME 22222222",)]
+    assert batched.db_manager.get_connection("nfce_db").execute(query).fetchall() == expected
+
+
+def test_batch_path_leaves_caller_establishments_untouched(tmp_path):
+    invoice_data = _invoice(1, random.Random(3))
+    invoice_data.establishment = EstablishmentData(cnpj="11.111.111/0001-11", business_name=None)
+
+    report = _manager(tmp_path, "batched").store_invoices_batch([invoice_data])
+
+    assert report["stored"] == [invoice_data.access_key]
+    assert invoice_data.establishment == EstablishmentData(cnpj="11.111.111/0001-11", business_name=None)
+
+
+def test_batch_falls_back_to_row_by_row_when_processing_log_fails(tmp_path, monkeypatch):
+    manager = _manager(tmp_path, "batched")
+
+    def failing_log(conn, invoices):
+        raise RuntimeError("processing_log unavailable")
+
+    monkeypatch.setattr(manager, "_log_processing_results_batch", failing_log)
+    invoices = _invoices(20, seed=4)
+
+    report = manager.store_invoices_batch(invoices)
+
+    assert report["errors"] == []
+    conn = manager.db_manager.get_connection("nfce_db")
+    assert conn.execute("SELECT COUNT(*) FROM processing_log").fetchone()[0] == len(report["stored"])
+    assert conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0] == len(report["stored"])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from domains.personal_finance.nfce.similarity.embedding_index import EmbeddingIndex, stack_embeddings
+
+
+def test_stack_embeddings_resizes_placeholders_to_real_dimension():
+    # EmbeddingSimilarity (512) and AdvancedEmbeddingEngine (768) zero placeholders next to 384-d embeddings
+    matrix = stack_embeddings([np.ones(384), np.zeros(512), np.full(384, 2.0), np.zeros(768)])
+
+    assert matrix.shape == (4, 384)
+    assert not matrix[1].any()
+    assert not matrix[3].any()
+    np.testing.assert_array_equal(matrix[2], np.full(384, 2.0))
+
+
+def test_stack_embeddings_placeholder_first():
+    matrix = stack_embeddings([np.zeros(768), np.ones(384)])
+
+    assert matrix.shape == (2, 384)
+
+
+def test_stack_embeddings_all_placeholders_use_widest():
+    assert stack_embeddings([np.zeros(512), np.zeros(768)]).shape == (2, 768)
+
+
+def test_stack_embeddings_rejects_mismatched_real_embeddings():
+    with pytest.raises(ValueError, match="different dimensions"):
+        stack_embeddings([np.ones(384), np.ones(512)])
+
+
+def test_index_placeholders_score_zero():
+    index = EmbeddingIndex([np.array([1.0, 0.0]), np.zeros(512), np.array([0.6, 0.8])])
+
+    results = index.search(np.array([1.0, 0.0]), top_k=3)[0]
+
+    assert [i for i, _ in results] == [0, 2, 1]
+    assert results[-1][1] == 0.0
+    assert list(index.iter_pairs_above(0.5)) == [(0, 2, pytest.approx(0.6))]
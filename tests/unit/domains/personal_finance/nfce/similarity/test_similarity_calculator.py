@@ -0,0 +1,146 @@
+import math
+from itertools import combinations
+
+import pytest
+
+from domains.personal_finance.nfce.similarity.distance_backend import SCORE_TOLERANCE, get_distance_backend
+from domains.personal_finance.nfce.similarity.enhanced_similarity_calculator import EnhancedSimilarityCalculator
+from domains.personal_finance.nfce.similarity.feature_extractor import FeatureExtractor
+from domains.personal_finance.nfce.similarity.similarity_calculator import SimilarityCalculator
+from utils.dependencies import RAPIDFUZZ_AVAILABLE
+
+DESCRIPTIONS = [
+    "LEITE UHT INTEGRAL PIRACANJUBA 1L",
+    "LEITE INTEGRAL PIRACANJUBA 1 LITRO",
+    "LEITE DESNATADO ITALAC 1L",
+    "ARROZ BRANCO TIO JOAO 5KG",
+    "ARROZ TIO JOAO TIPO 1 5KG",
+    "FEIJAO CARIOCA CAMIL 1KG",
+    "REFRIGERANTE COCA COLA 2L",
+    "REFRIG COCA-COLA ZERO 2L",
+    "CHOCOLATE AO LEITE LACTA 90G",
+    "BISCOITO CHOCOLATE CHOCOLATE RECHEADO 140G",
+    "BANANA PRATA KG",
+    "BANANA NANICA KG",
+]
+
+BACKENDS = ["python", "rapidfuzz"] if RAPIDFUZZ_AVAILABLE else ["python"]
+
+
+def _reference_levenshtein(s1: str, s2: str) -> int:
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(min(previous_row[j + 1] + 1, current_row[j] + 1, previous_row[j] + (c1 != c2)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _reference_components(features1, features2) -> dict[str, float]:
+    """Component scores as computed before token sets and counters were cached per product."""
+    tokens1, tokens2 = features1.tokens, features2.tokens
+
+    set1, set2 = set(tokens1), set(tokens2)
+    if not set1 and not set2:
+        jaccard = 1.0
+    elif not set1 or not set2:
+        jaccard = 0.0
+    else:
+        jaccard = len(set1.intersection(set2)) / len(set1.union(set2))
+
+    all_tokens = set(tokens1 + tokens2)
+    if not all_tokens:
+        cosine = 1.0
+    else:
+        vector1 = [tokens1.count(token) for token in all_tokens]
+        vector2 = [tokens2.count(token) for token in all_tokens]
+        magnitude1 = math.sqrt(sum(v * v for v in vector1))
+        magnitude2 = math.sqrt(sum(v * v for v in vector2))
+        dot_product = sum(v1 * v2 for v1, v2 in zip(vector1, vector2, strict=True))
+        cosine = dot_product / (magnitude1 * magnitude2) if magnitude1 and magnitude2 else 0.0
+
+    text1, text2 = features1.normalized_description, features2.normalized_description
+    if text1 == text2:
+        levenshtein = 1.0
+    elif not text1 or not text2:
+        levenshtein = 0.0
+    else:
+        levenshtein = 1.0 - _reference_levenshtein(text1, text2) / max(len(text1), len(text2))
+
+    if not tokens1 and not tokens2:
+        overlap = 1.0
+    elif not tokens1 or not tokens2:
+        overlap = 0.0
+    else:
+        overlap = sum(1 for token in set(tokens1) if token in tokens2) / len(set(tokens1 + tokens2))
+
+    return {"jaccard": jaccard, "cosine": cosine, "levenshtein": levenshtein, "token_overlap": overlap}
+
+
+def _reference_final_score(calculator, features1, features2, components: dict[str, float]) -> float:
+    score = sum(components[name] * weight for name, weight in calculator.weights.items())
+    same_category = features1.category == features2.category
+    if features1.brand is not None and features1.brand == features2.brand:
+        score += calculator.bonuses["same_brand"]
+    if same_category:
+        score += calculator.bonuses["same_category"]
+    if features1.core_key and features2.core_key:
+        core1, core2 = set(features1.core_key.split()), set(features2.core_key.split())
+        union = core1.union(core2)
+        if union and len(core1.intersection(core2)) / len(union) > 0.7:
+            score += calculator.bonuses["core_key_match"]
+    if not same_category:
+        score += calculator.penalties["different_category"]
+    if not set(features1.tokens).intersection(features2.tokens):
+        score += calculator.penalties["no_token_overlap"]
+    return max(0.0, min(1.0, score))
+
+
+@pytest.fixture(scope="module")
+def features():
+    extractor = FeatureExtractor()
+    return [extractor.extract(description) for description in DESCRIPTIONS]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_scores_match_reference_implementation(features, backend):
+    calculator = SimilarityCalculator(distance_backend=backend)
+
+    for features1, features2 in combinations(features, 2):
+        result = calculator.calculate_similarity(features1, features2)
+        expected = _reference_components(features1, features2)
+
+        assert result.jaccard_score == pytest.approx(expected["jaccard"], abs=SCORE_TOLERANCE)
+        assert result.cosine_score == pytest.approx(expected["cosine"], abs=SCORE_TOLERANCE)
+        assert result.levenshtein_score == pytest.approx(expected["levenshtein"], abs=SCORE_TOLERANCE)
+        assert result.token_overlap_score == pytest.approx(expected["token_overlap"], abs=SCORE_TOLERANCE)
+        assert result.final_score == pytest.approx(
+            _reference_final_score(calculator, features1, features2, expected), abs=SCORE_TOLERANCE
+        )
+        assert sorted(result.matching_tokens) == sorted(set(features1.tokens) & set(features2.tokens))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_enhanced_traditional_scores_match_reference_implementation(features, backend):
+    calculator = EnhancedSimilarityCalculator(use_hybrid=False, distance_backend=backend)
+
+    for features1, features2 in combinations(features, 2):
+        result = calculator.calculate_similarity(features1, features2)
+        expected = _reference_components(features1, features2)
+
+        assert result.jaccard_score == pytest.approx(expected["jaccard"], abs=SCORE_TOLERANCE)
+        assert result.cosine_score == pytest.approx(expected["cosine"], abs=SCORE_TOLERANCE)
+        assert result.levenshtein_score == pytest.approx(expected["levenshtein"], abs=SCORE_TOLERANCE)
+        assert result.token_overlap_score == pytest.approx(expected["token_overlap"], abs=SCORE_TOLERANCE)
+
+
+def test_backends_agree_on_edit_distance():
+    pairs = [(a, b) for a, b in combinations(DESCRIPTIONS, 2)]
+    for backend in BACKENDS:
+        distance = get_distance_backend(backend)
+        assert [distance.levenshtein_distance(a, b) for a, b in pairs] == [
+            _reference_levenshtein(a, b) for a, b in pairs
+        ]
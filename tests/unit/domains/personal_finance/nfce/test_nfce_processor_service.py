@@ -0,0 +1,160 @@
+import threading
+from argparse import ArgumentParser
+
+import pytest
+
+from domains.personal_finance.nfce.http_client import AsyncPortalSpedClient, PortalSpedClient
+from domains.personal_finance.nfce.nfce_processor_command import NFCeCommand
+from domains.personal_finance.nfce.nfce_processor_service import NFCeService
+from tests.fake_http_server import FakeHTTPServer, FakeResponse
+
+ACCESS_KEY = "31240565124307001626650010001234561000000001"
+
+
+@pytest.fixture
+def portal(nfce_pages):
+    def route(request):
+        return FakeResponse(body=nfce_pages["supermercado"], delay=0.05)
+
+    with FakeHTTPServer(route) as server:
+        yield server
+
+
+def _urls(base_url: str, count: int) -> list[str]:
+    return [f"{base_url}/portalnfce/sistema/qrcode.xhtml?p={ACCESS_KEY}|2|1|{i}|HASH" for i in range(count)]
+
+
+def test_process_urls_reuses_connections_within_concurrency_limit(portal):
+    client = PortalSpedClient(rate_limit_seconds=0.001, burst=20, base_url=portal.base_url)
+    service = NFCeService(http_client=client)
+    streamed = []
+
+    try:
+        result = service._process_urls_batch(
+            _urls(portal.base_url, 24), batch_size=3, timeout=10, force_refresh=True, on_invoice=streamed.append
+        )
+    finally:
+        service.close()
+
+    assert result["successful"] == 24
+    assert len(streamed) == 24
+    assert len(portal.requests) == 24
+    # Requests overlap, but never more than the worker count
+    assert 2 <= portal.max_in_flight <= 3
+    # Pooled keep-alive connections: at most one per worker
+    assert len(portal.connections) <= 3
+
+
+def test_persistent_pool_is_reused_across_calls(portal):
+    service = NFCeService(http_client=PortalSpedClient(rate_limit_seconds=0.001, burst=20, base_url=portal.base_url))
+
+    try:
+        service._process_urls_batch(_urls(portal.base_url, 3), batch_size=2, force_refresh=True)
+        executor = service._executor
+        service._process_urls_batch(_urls(portal.base_url, 3), batch_size=2, force_refresh=True)
+
+        assert service._executor is executor
+    finally:
+        service.close()
+
+    assert service._executor is None
+
+
+def test_async_client_fetches_from_one_thread_within_concurrency_cap(nfce_pages):
+    pytest.importorskip("httpx")
+
+    def route(request):
+        # Throttle the first attempt of one URL to exercise the limiter's retry
+        if request.query["p"][0].endswith("|7|HASH") and request.attempt == 1:
+            return FakeResponse(status=429, headers={"Retry-After": "0"})
+        return FakeResponse(body=nfce_pages["supermercado"], delay=0.05)
+
+    with FakeHTTPServer(route) as portal:
+        client = AsyncPortalSpedClient(rate_limit_seconds=0.001, burst=50, max_concurrency=4, base_url=portal.base_url)
+        service = NFCeService(http_client=PortalSpedClient(base_url=portal.base_url), async_http_client=client)
+        streamed = []
+
+        result = service._process_urls_batch(
+            _urls(portal.base_url, 30),
+            batch_size=8,
+            force_refresh=True,
+            on_invoice=lambda invoice: streamed.append(threading.get_ident()),
+        )
+        service.close()
+
+    assert result["successful"] == 30
+    assert "errors" not in result
+    assert len(streamed) == 30
+    assert len(portal.requests) == 31
+    assert 2 <= portal.max_in_flight <= 4
+    assert len(portal.connections) <= 4
+    # No worker pool: every result was handled on the calling thread's event loop
+    assert service._executor is None
+    assert set(streamed) == {threading.get_ident()}
+    assert client.get_statistics()["successful_requests"] == 30
+
+
+def test_async_client_reports_failed_pages(nfce_pages):
+    pytest.importorskip("httpx")
+
+    def route(request):
+        if request.query["p"][0].endswith("|1|HASH"):
+            return FakeResponse(status=404)
+        return FakeResponse(body=nfce_pages["supermercado"])
+
+    with FakeHTTPServer(route) as portal:
+        client = AsyncPortalSpedClient(rate_limit_seconds=0.001, burst=10, base_url=portal.base_url)
+        service = NFCeService(async_http_client=client)
+
+        first = service._process_urls_batch(_urls(portal.base_url, 3), force_refresh=True)
+        # A second run opens a new connection pool on its own event loop
+        second = service._process_urls_batch(_urls(portal.base_url, 3), force_refresh=True)
+        service.close()
+
+    for result in (first, second):
+        assert (result["successful"], result["failed"]) == (2, 1)
+        assert result["errors"][0]["url"].endswith("|1|HASH")
+
+
+def test_command_builds_async_client_with_batch_size_as_cap(monkeypatch, tmp_path):
+    services = []
+
+    def process_urls_from_file(self, *args, **kwargs):
+        services.append(self)
+        return {"total_processed": 0, "successful": 0, "failed": 0, "invoices": []}
+
+    monkeypatch.setattr(NFCeService, "process_urls_from_file", process_urls_from_file)
+    monkeypatch.setattr(NFCeService, "save_results", lambda self, result, path: None)
+
+    input_file = tmp_path / "urls.json"
+    input_file.write_text('{"urls": []}')
+    parser = ArgumentParser()
+    NFCeCommand.get_arguments(parser)
+    args = parser.parse_args(["--input", str(input_file), "--async-http", "--batch-size", "7"])
+
+    NFCeCommand.main(args)
+
+    assert isinstance(services[0].async_http_client, AsyncPortalSpedClient)
+    assert services[0].async_http_client.max_concurrency == 7
+
+
+def test_command_closes_service_when_processing_fails(monkeypatch):
+    closed = []
+
+    def fail(self, *args, **kwargs):
+        raise RuntimeError("portal exploded")
+
+    def close(self):
+        closed.append(self)
+
+    monkeypatch.setattr(NFCeService, "process_single_url", fail)
+    monkeypatch.setattr(NFCeService, "close", close)
+
+    parser = ArgumentParser()
+    NFCeCommand.get_arguments(parser)
+    args = parser.parse_args(["--url", "https://portalsped.fazenda.mg.gov.br/portalnfce/sistema/qrcode.xhtml?p=1"])
+
+    with pytest.raises(SystemExit):
+        NFCeCommand.main(args)
+
+    assert len(closed) == 1
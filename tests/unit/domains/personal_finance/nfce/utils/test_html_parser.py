@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+import pytest
+
+from domains.personal_finance.nfce.utils.html_parser import HTML_PARSERS, NFCeDataExtractor, compare_parsers
+from utils.dependencies import LXML_AVAILABLE
+
+AVAILABLE_PARSERS = [parser for parser in HTML_PARSERS if parser != "lxml" or LXML_AVAILABLE]
+
+
+def test_parsers_extract_identical_data_from_saved_pages(nfce_pages):
+    if not LXML_AVAILABLE:
+        pytest.skip("lxml not installed")
+
+    report = compare_parsers([(html, f"https://portal/{name}") for name, html in nfce_pages.items()])
+
+    assert report["pages"] == len(nfce_pages)
+    assert report["mismatches"] == {"lxml": []}
+
+
+@pytest.mark.parametrize("parser", AVAILABLE_PARSERS)
+def test_extracts_supermarket_invoice(nfce_pages, parser):
+    invoice = NFCeDataExtractor(parser=parser).extract_invoice_data(nfce_pages["supermercado"], "https://portal/1")
+
+    assert invoice.scraping_success
+    assert invoice.invoice_number == "123456"
+    assert invoice.series == "1"
+    assert invoice.total_amount == Decimal("111.21")
+    assert invoice.establishment.cnpj == "65124307001626"
+    assert invoice.consumer.cpf == "12345678909"
+    assert invoice.taxes.icms_total == Decimal("4.87")
+    assert [item.description for item in invoice.items][:2] == [
+        "LEITE UHT ITALAC INTEGRAL 1L",
+        "ARROZ TIO JOAO T1 5KG",
+    ]
+    assert len(invoice.items) == 5
+
+
+@pytest.mark.parametrize("parser", AVAILABLE_PARSERS)
+def test_extracts_consumer_and_taxes_from_reformatted_page(nfce_pages, parser):
+    invoice = NFCeDataExtractor(parser=parser).extract_invoice_data(nfce_pages["farmacia"], "https://portal/2")
+
+    assert invoice.invoice_number == "98765"
+    assert invoice.establishment.cnpj == "17256512000116"
+    assert invoice.consumer.cpf == "98765432100"
+    assert invoice.taxes.pis_total == Decimal("0.45")
+    assert len(invoice.items) == 2
+
+
+@pytest.mark.parametrize("parser", AVAILABLE_PARSERS)
+def test_page_without_invoice_is_not_successful(nfce_pages, parser):
+    invoice = NFCeDataExtractor(parser=parser).extract_invoice_data(nfce_pages["sem_nota"], "https://portal/3")
+
+    assert not invoice.scraping_success
+    assert invoice.items == []
@@ -0,0 +1,68 @@
+import openpyxl
+import pytest
+from openpyxl.styles import Border, Side
+
+from domains.syngenta.team_assessment.assessment_generator import AssessmentGenerator
+from domains.syngenta.team_assessment.core.config import Config
+from domains.syngenta.team_assessment.processors.members_task_processor import MembersTaskProcessor
+from utils.data.workbook_cache import WorkbookCache
+
+
+@pytest.fixture
+def planning_file(tmp_path):
+    """Q1-C1 sheet with one allocated member; the other allocation rows are only formatted."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Q1-C1"
+    sheet["C4"] = "Ana"
+    sheet["J6"], sheet["L6"], sheet["S6"] = "E1", "Checkout redesign", "Epic"
+    for day in range(1, 31):
+        sheet.cell(row=38, column=10 + day, value=day)
+    sheet["J39"] = "Ana"
+    for column in range(11, 16):
+        sheet.cell(row=39, column=column, value="E1")
+
+    border = Border(top=Side(style="thin"))
+    for row in range(40, 48):
+        for column in range(10, 41):
+            sheet.cell(row=row, column=column).border = border
+
+    path = tmp_path / "planning.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_trimmed_allocation_matrix_passes_validation(planning_file):
+    # calamine drops the formatted but empty rows 40-47 that openpyxl counted
+    assert WorkbookCache.get_instance().get_sheet(planning_file, "Q1-C1").shape[0] == 39
+
+    generator = AssessmentGenerator.__new__(AssessmentGenerator)
+    generator.planning_file = str(planning_file)
+    generator.config = Config()
+
+    generator._validate_planning_file()
+
+
+def test_sheet_ending_above_the_days_row_is_rejected(tmp_path):
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Q2-C1"
+    workbook.active["K20"] = "E1"
+    path = tmp_path / "short.xlsx"
+    workbook.save(path)
+
+    generator = AssessmentGenerator.__new__(AssessmentGenerator)
+    generator.planning_file = str(path)
+    generator.config = Config()
+
+    with pytest.raises(ValueError, match="insufficient rows"):
+        generator._validate_planning_file()
+
+
+def test_task_processor_reads_trimmed_allocation_matrix(planning_file):
+    task_map = MembersTaskProcessor().process_file(planning_file)
+
+    days_by_code = {task.code: task.executed.issue_total_days for task in task_map["Ana"]}
+    assert list(task_map) == ["Ana"]
+    assert days_by_code["e1"] == 5
+    # Unallocated days of the 30-day cycle
+    assert days_by_code["idle"] == 25
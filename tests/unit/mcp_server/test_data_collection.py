@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+import uuid
+
+from mcp_server.adapters.base_adapter import BaseAdapter
+from mcp_server.prompts.base_prompt import BasePromptHandler
+from mcp_server.resources.base_resource import BaseResourceHandler
+
+
+class SlowAdapter(BaseAdapter):
+    """Adapter whose service calls take a while and record how many overlap."""
+
+    def __init__(self, delay: float = 0.1, name: str | None = None):
+        super().__init__(name or f"slow_{uuid.uuid4().hex}")
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def initialize_service(self):
+        return object()
+
+    def get_metrics(self, team: str) -> dict:
+        def _fetch(team: str) -> dict:
+            with self._lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            try:
+                time.sleep(self.delay)
+                if team in self.failing:
+                    raise RuntimeError(f"{team} unavailable")
+                return {"team": team}
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return self.cached_operation("metrics", _fetch, team=team)
+
+
+class TeamsPrompt(BasePromptHandler):
+    def __init__(self, adapter: SlowAdapter, teams: list[str]):
+        super().__init__(f"teams_{uuid.uuid4().hex}")
+        self.adapter = adapter
+        self.teams = teams
+
+    def get_prompt_definitions(self):
+        return []
+
+    async def get_prompt_content(self, name, arguments):
+        raise NotImplementedError
+
+    async def generate(self) -> dict:
+        def _collect() -> dict:
+            sources = {team: (lambda team=team: self.adapter.get_metrics(team)) for team in self.teams}
+            return self.collect_data_sources({}, sources)
+
+        return await self.cached_prompt_generation("teams", _collect)
+
+
+class TeamsResource(BaseResourceHandler):
+    def __init__(self, adapter: SlowAdapter, teams: list[str]):
+        super().__init__(f"teams_{uuid.uuid4().hex}")
+        self.adapter = adapter
+        self.teams = teams
+
+    def get_resource_definitions(self):
+        return []
+
+    async def get_resource_content(self, uri):
+        raise NotImplementedError
+
+    async def generate(self) -> dict:
+        def _aggregate() -> dict:
+            sources = {team: (lambda team=team: self.adapter.get_metrics(team)) for team in self.teams}
+            return self.aggregate_data_safely(sources)
+
+        return await self.cached_resource_operation("teams", _aggregate)
+
+
+def test_collector_sources_share_the_adapter_concurrency_cap(monkeypatch):
+    name = f"slow_{uuid.uuid4().hex}"
+    monkeypatch.setenv(f"MCP_{name.upper()}_MAX_CONCURRENCY", "2")
+    adapter = SlowAdapter(name=name)
+    prompt = TeamsPrompt(adapter, [f"team{i}" for i in range(6)])
+    resource = TeamsResource(adapter, [f"squad{i}" for i in range(6)])
+
+    async def _both():
+        return await asyncio.gather(prompt.generate(), resource.generate())
+
+    prompt_data, resource_data = asyncio.run(_both())
+
+    assert len(prompt_data["source_metadata"]) == 6
+    assert resource_data["status"] == "success"
+    assert adapter.peak == 2
+
+
+def test_generation_runs_off_the_event_loop():
+    prompt = TeamsPrompt(SlowAdapter(delay=0.3), ["alpha"])
+    ticks = []
+
+    async def _ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def _generate_while_ticking():
+        ticker = asyncio.create_task(_ticker())
+        try:
+            return await prompt.generate()
+        finally:
+            ticker.cancel()
+
+    data = asyncio.run(_generate_while_ticking())
+
+    assert data["alpha"] == {"team": "alpha"}
+    assert len(ticks) > 10
+
+
+def test_partial_results_are_not_cached():
+    adapter = SlowAdapter(delay=0)
+    adapter.failing = {"beta"}
+    prompt = TeamsPrompt(adapter, ["alpha", "beta"])
+    resource = TeamsResource(adapter, ["alpha", "beta"])
+
+    partial_prompt = asyncio.run(prompt.generate())
+    partial_resource = asyncio.run(resource.generate())
+    adapter.failing.clear()
+
+    assert "beta" in partial_prompt["source_errors"]
+    assert partial_resource["status"] == "partial"
+    assert asyncio.run(prompt.generate())["beta"] == {"team": "beta"}
+    assert asyncio.run(resource.generate())["sources"]["beta"] == {"team": "beta"}
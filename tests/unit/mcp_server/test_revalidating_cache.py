@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_server import revalidating_cache as revalidating_cache_module
+from mcp_server.adapters.base_adapter import BaseAdapter
+from mcp_server.revalidating_cache import RevalidatingCache, capture_cache_info, with_cache_info
+from mcp_server.source_collector import SourceCollector
+
+
+class FakeAdapter(BaseAdapter):
+    def __init__(self):
+        super().__init__(f"fake_{uuid.uuid4().hex}")
+        self.calls = 0
+
+    def initialize_service(self):
+        return object()
+
+    def get_metrics(self, team: str) -> dict:
+        def _compute(team: str) -> dict:
+            self.calls += 1
+            return {"team": team, "lead_time": 3.5}
+
+        return self.cached_operation("metrics", _compute, team=team)
+
+
+@pytest.fixture
+def revalidating_cache(cache_manager):
+    return RevalidatingCache(cache_manager, logging.getLogger("test"))
+
+
+def test_values_are_returned_and_stored_without_cache_info(cache_manager, revalidating_cache):
+    key = f"test_{uuid.uuid4().hex}"
+
+    first = revalidating_cache.get(key, "op", lambda: {"value": 1}, expiration_minutes=5)
+    second, cache_info = revalidating_cache.get_with_info(key, "op", lambda: {"value": 2}, expiration_minutes=5)
+
+    assert first == second == {"value": 1}
+    assert cache_manager.load(key) == {"value": 1}
+    assert cache_info["stale"] is False
+    assert set(cache_info) == {"cached_at", "age_seconds", "stale", "refreshing"}
+
+
+def test_nested_adapter_results_stay_clean_in_outer_cache(cache_manager, revalidating_cache):
+    adapter = FakeAdapter()
+    outer_key = f"prompt_{uuid.uuid4().hex}"
+
+    def _collect() -> dict:
+        return {"metrics": adapter.get_metrics("alpha")}
+
+    with capture_cache_info() as captured:
+        data, cache_info = revalidating_cache.get_with_info(outer_key, "prompt", _collect, expiration_minutes=5)
+
+    assert data == {"metrics": {"team": "alpha", "lead_time": 3.5}}
+    assert cache_manager.load(outer_key) == data
+    # Only the outermost lookup is reported
+    assert captured == cache_info
+
+    response = with_cache_info(data, cache_info)
+    assert response["cache_info"] == cache_info
+    assert "cache_info" not in data
+
+
+def test_run_blocking_attaches_cache_info_to_a_copy():
+    adapter = FakeAdapter()
+
+    first = asyncio.run(adapter.run_blocking(adapter.get_metrics, "beta"))
+    second = asyncio.run(adapter.run_blocking(adapter.get_metrics, "beta"))
+    direct = adapter.get_metrics("beta")
+
+    assert adapter.calls == 1
+    assert first["cache_info"]["age_seconds"] == 0.0
+    assert second["cache_info"]["stale"] is False
+    assert direct == {"team": "beta", "lead_time": 3.5}
+    assert "cache_info" not in adapter.cache.load(adapter.get_cache_key("metrics", team="beta"))
+
+
+def test_background_refresh_recomputes_stale_nested_entries(cache_manager, revalidating_cache, monkeypatch):
+    adapter = FakeAdapter()
+    outer_key = f"prompt_{uuid.uuid4().hex}"
+
+    def _fetch(team: str) -> dict:
+        adapter.calls += 1
+        return {"team": team, "version": adapter.calls}
+
+    def _collect() -> dict:
+        # Fetched in a collector thread, as prompts and resources do
+        sources = {"metrics": lambda: adapter.cached_operation("versioned", _fetch, team="gamma")}
+        return SourceCollector().collect(sources)["sources"]
+
+    revalidating_cache.get(outer_key, "prompt", _collect, expiration_minutes=5)
+
+    class _TwoHoursLater(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(hours=2)
+
+    # Both the prompt (5 min) and the adapter entry (60 min) are now expired but within the grace window
+    monkeypatch.setattr(revalidating_cache_module, "datetime", _TwoHoursLater)
+    stale, cache_info = revalidating_cache.get_with_info(outer_key, "prompt", _collect, expiration_minutes=5)
+
+    deadline = time.monotonic() + 5
+    while RevalidatingCache.is_refreshing(outer_key) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert stale == {"metrics": {"team": "gamma", "version": 1}}
+    assert cache_info["stale"] is True
+    # The refreshed prompt must not embed the stale adapter result under its new timestamp
+    assert adapter.calls == 2
+    assert cache_manager.load(outer_key) == {"metrics": {"team": "gamma", "version": 2}}
@@ -0,0 +1,34 @@
+import pytest
+
+from utils.http.rate_limiter import TokenBucket
+
+
+def test_waiters_after_retry_after_get_spaced_slots():
+    bucket = TokenBucket(rate_per_second=10, capacity=4)
+
+    bucket.on_throttle(retry_after=1.0)
+    waits = [bucket.reserve() for _ in range(4)]
+
+    # The rate was halved to 5/s: the first caller goes when the pause ends, the rest 0.2s apart
+    assert waits == pytest.approx([1.0, 1.2, 1.4, 1.6], abs=0.02)
+
+
+def test_longer_retry_after_extends_the_pause():
+    bucket = TokenBucket(rate_per_second=10)
+
+    bucket.on_throttle(retry_after=0.5)
+    bucket.on_throttle(retry_after=2.0)
+    bucket.on_throttle(retry_after=1.0)
+
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.02)
+
+
+def test_throttle_without_retry_after_only_lowers_the_rate():
+    bucket = TokenBucket(rate_per_second=10, capacity=2)
+
+    bucket.on_throttle()
+
+    assert bucket.rate == 5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)